@@ -0,0 +1,83 @@
+"""
+Benchmark: per-value vs batch evaluation of the leaf specifications.
+
+For every user and patient_profile leaf specification, builds a column of
+``--values`` candidates (``--invalid-ratio`` of them invalid) and evaluates
+it with ``[spec.is_satisfied_by(v) for v in column]`` and with
+``spec.is_satisfied_by_many(column)``, checking that both agree. Reports
+millions of values per second for each.
+
+Usage:
+    python benchmarks/bench_batch_specifications.py
+    python benchmarks/bench_batch_specifications.py --values 1000000 --invalid-ratio 0.1
+"""
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+from user_management.domain.enums import UserRole, UserStatus
+from user_management.domain.specifications import patient_profile, user
+
+NOW = datetime.now(timezone.utc)
+SAMPLES = {
+    "uuid": (lambda i: uuid4(), lambda i: str(uuid4())),
+    "email": (lambda i: f"patient.{i}@clinic-example.com", lambda i: f"patient..{i}@clinic-example.com"),
+    "name": (lambda i: "Mary Jane", lambda i: "O'Connor"),
+    "phone": (lambda i: f"+1555{i % 10_000_000:07d}", lambda i: f"555-{i}"),
+    "date_of_birth": (lambda i: date(1950, 1, 1) + timedelta(days=i % 20_000), lambda i: date(1800, 1, 1)),
+    "user_role": (lambda i: UserRole.PATIENT, lambda i: "PATIENT"),
+    "user_status": (lambda i: UserStatus.ACTIVE, lambda i: "ACTIVE"),
+    "created_at": (lambda i: NOW - timedelta(seconds=i), lambda i: NOW.replace(tzinfo=None)),
+    "updated_at": (lambda i: NOW - timedelta(seconds=i), lambda i: NOW + timedelta(hours=1)),
+    "emergency_contact_name": (lambda i: "Will Magalhaes", lambda i: "Will  Magalhaes"),
+    "emergency_contact_phone": (lambda i: f"+5521{i % 100_000_000:08d}", lambda i: "+0"),
+    "insurance_info": (lambda i: "Forever Healthy Insurance", lambda i: "#1 Insurance"),
+    "preferred_language": (lambda i: "English", lambda i: "en"),
+    "medical_history_summary": (lambda i: "Arterial hypertension, controlled.", lambda i: "Allergy: 2 drugs"),
+}
+
+
+def _column(kind: str, count: int, invalid_ratio: float, rng: random.Random) -> list:
+    valid, invalid = SAMPLES[kind]
+    return [invalid(i) if rng.random() < invalid_ratio else valid(i) for i in range(count)]
+
+
+def _kind(spec) -> str:
+    module = type(spec).__module__.rsplit(".", 1)[-1]
+    kind = module.removesuffix("_is_valid")
+    return "uuid" if kind == "user_uuid" else kind
+
+
+def main(args) -> None:
+    rng = random.Random(args.seed)
+    leaves = [getattr(user, name)() for name in user.__all__] + \
+             [getattr(patient_profile, name)() for name in patient_profile.__all__
+              if name != "ValidUpdatedAtRelativeToCreatedAtSpecification"]
+
+    print(f"{'specification':<58}{'per value':>12}{'batch':>12}{'speedup':>10}   (M values/s)")
+    for spec in leaves:
+        column = _column(_kind(spec), args.values, args.invalid_ratio, rng)
+        is_satisfied_by = spec.is_satisfied_by
+
+        started = time.perf_counter()
+        expected = [is_satisfied_by(value) for value in column]
+        per_value = time.perf_counter() - started
+
+        started = time.perf_counter()
+        mask = spec.is_satisfied_by_many(column)
+        batch = time.perf_counter() - started
+
+        assert mask == expected, f"{type(spec).__name__} disagrees"
+        label = f"{type(spec).__module__.split('.')[-2]}.{type(spec).__name__}"
+        print(f"{label:<58}{args.values / per_value / 1e6:>12.2f}{args.values / batch / 1e6:>12.2f}"
+              f"{per_value / batch:>9.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--values", type=int, default=200_000)
+    parser.add_argument("--invalid-ratio", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=42)
+    main(parser.parse_args())
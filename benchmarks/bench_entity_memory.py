@@ -0,0 +1,105 @@
+"""
+Benchmark: memory per User, PatientProfile and UserCredentials instance.
+
+Allocates ``--count`` instances of each class, with ``_rehydrate`` as the
+repositories do, and reports the bytes each one adds according to
+tracemalloc. Field values are shared between instances, so the figures are
+the cost of the objects themselves, not of their strings and UUIDs. Each
+class is compared with an equivalent that keeps its attributes in a
+per-instance ``__dict__``, as the entities did before ``__slots__``.
+
+Usage:
+    python benchmarks/bench_entity_memory.py
+    python benchmarks/bench_entity_memory.py --count 100000
+"""
+import argparse
+import gc
+import tracemalloc
+from datetime import date, datetime, timezone
+from uuid import uuid4
+
+from user_management.domain.entities import PatientProfile, User
+from user_management.domain.enums import UserRole, UserStatus
+from user_management.domain.value_objects import UserCredentials
+
+HASHED_PASSWORD = "0" * 64
+
+
+class DictUser:
+    def __init__(self, uuid, email, first_name, last_name, phone, date_of_birth, user_role, user_status,
+                 created_at, updated_at, credentials):
+        self.uuid = uuid
+        self.email = email
+        self.first_name = first_name
+        self.last_name = last_name
+        self.phone = phone
+        self.date_of_birth = date_of_birth
+        self.user_role = user_role
+        self.user_status = user_status
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self._credentials = credentials
+
+
+class DictPatientProfile:
+    def __init__(self, user_uuid, emergency_contact_name, emergency_contact_phone, insurance_info,
+                 preferred_language, medical_history_summary, created_at, updated_at):
+        self.user_uuid = user_uuid
+        self.emergency_contact_name = emergency_contact_name
+        self.emergency_contact_phone = emergency_contact_phone
+        self.insurance_info = insurance_info
+        self.preferred_language = preferred_language
+        self.medical_history_summary = medical_history_summary
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+
+class DictUserCredentials:
+    def __init__(self, hashed_password):
+        self._hashed_password = hashed_password
+
+
+def _bytes_per_instance(factory, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding the instances costs one pointer per entry.
+    per_instance = (after - before) / count - 8
+    del instances
+    return per_instance
+
+
+def main(args) -> None:
+    now = datetime.now(timezone.utc)
+    credentials = UserCredentials._from_hashed(HASHED_PASSWORD)
+    user_fields = dict(uuid=uuid4(), email="patient@clinic-example.com", first_name="Bench", last_name="User",
+                       phone="+15551234567", date_of_birth=date(1990, 1, 1), user_role=UserRole.PATIENT,
+                       user_status=UserStatus.ACTIVE, created_at=now, updated_at=now, credentials=credentials)
+    profile_fields = dict(user_uuid=uuid4(), emergency_contact_name="Jane Doe",
+                          emergency_contact_phone="+15551234567", insurance_info="Forever Healthy Insurance",
+                          preferred_language="English", medical_history_summary="Arterial hypertension",
+                          created_at=now, updated_at=now)
+
+    cases = [
+        ("User", lambda: User._rehydrate(**user_fields), lambda: DictUser(**user_fields)),
+        ("PatientProfile", lambda: PatientProfile._rehydrate(**profile_fields),
+         lambda: DictPatientProfile(**profile_fields)),
+        ("UserCredentials", lambda: UserCredentials._from_hashed(HASHED_PASSWORD),
+         lambda: DictUserCredentials(HASHED_PASSWORD)),
+    ]
+    print(f"bytes per instance over {args.count:,} instances:")
+    for label, slotted, with_dict in cases:
+        slotted_bytes = _bytes_per_instance(slotted, args.count)
+        dict_bytes = _bytes_per_instance(with_dict, args.count)
+        print(f"  {label:<16} __dict__={dict_bytes:7.1f}  __slots__={slotted_bytes:7.1f}  "
+              f"saved={1 - slotted_bytes / dict_bytes:6.1%}  "
+              f"({(dict_bytes - slotted_bytes) * args.count / 2**20:,.0f} MiB over {args.count:,})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    main(parser.parse_args())
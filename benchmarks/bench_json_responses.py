@@ -0,0 +1,188 @@
+"""
+Benchmark: cost of the JSON response pipeline of the user routes.
+
+Compares ways of turning users into a response body, for one user
+(``GET /users/uuid/{uuid}``) and a search page of ``--page-size`` users:
+
+- ``validated``: the DTO is returned to FastAPI, which validates it again
+  against ``response_model`` and encodes it with ``jsonable_encoder`` and the
+  stdlib ``json`` (how the routes worked before)
+- ``fast``: the DTO is returned as a FastJSONResponse (orjson), as
+  ``api.routes.user_routes`` does now
+- ``construct``: like ``fast``, but with DTOs built by ``model_construct``
+  instead of their constructors (pipeline only), to show it does not pay off
+
+It reports the pipeline alone (microseconds per response) and requests/sec
+through the whole FastAPI stack, in process via httpx's ASGI transport, with
+in-memory repositories and otherwise identical routes. Every pipeline must
+produce the same body.
+
+Usage:
+    python benchmarks/bench_json_responses.py
+    python benchmarks/bench_json_responses.py --requests 20000 --page-size 50
+"""
+import argparse
+import asyncio
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Annotated, Optional
+from uuid import UUID, uuid4
+
+import httpx
+from fastapi import Depends, FastAPI, Header, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from api.dependencies import get_find_user_by_uuid_use_case, get_search_users_use_case
+from api.http_caching import USER_CACHE_CONTROL, USER_LIST_CACHE_CONTROL, etag_matches, not_modified, weak_etag
+from api.responses import FastJSONResponse, UserSearchResponse, UserSummaryResponse
+from api.routes.user_routes import router
+from user_management.application.use_cases.find_user_by_uuid import FindUserByUUIDQuery, FindUserByUUIDUseCase
+from user_management.application.use_cases.search_users import SearchUsersQuery, SearchUsersUseCase
+from user_management.domain.entities import User
+from user_management.domain.enums import UserRole, UserStatus
+from user_management.domain.value_objects import UserCredentials
+from user_management.infrastructure.repositories import InMemoryUserRepository
+
+
+def _users(count: int):
+    created_at = datetime.now(timezone.utc) - timedelta(days=1)
+    credentials = UserCredentials.create("Str0ng!Passw0rd")
+    return [
+        User(uuid=uuid4(), email=f"patient.{i}@clinic-example.com", first_name="Bench", last_name="User",
+             phone="+15551234567", date_of_birth=date(1990, 1, 1), user_role=UserRole.PATIENT,
+             user_status=UserStatus.ACTIVE, created_at=created_at + timedelta(seconds=i),
+             updated_at=created_at + timedelta(seconds=i), credentials=credentials)
+        for i in range(count)
+    ]
+
+
+def _constructed_summary(user: User) -> UserSummaryResponse:
+    fields = {name: getattr(user, name) for name in UserSummaryResponse.model_fields}
+    return UserSummaryResponse.model_construct(**fields)
+
+
+def _page(users) -> UserSearchResponse:
+    return UserSearchResponse(items=[UserSummaryResponse.from_user_entity(user) for user in users])
+
+
+def _constructed_page(users) -> UserSearchResponse:
+    return UserSearchResponse.model_construct(items=[_constructed_summary(user) for user in users], next_cursor=None)
+
+
+def _validated_app(repository: InMemoryUserRepository) -> FastAPI:
+    """The user routes as they were before: DTOs returned through ``response_model``."""
+    app = FastAPI()
+
+    @app.get("/users/uuid/{uuid}", response_model=UserSummaryResponse)
+    async def find_user_by_uuid(
+            response: Response,
+            use_case: Annotated[FindUserByUUIDUseCase, Depends(lambda: FindUserByUUIDUseCase(repository))],
+            uuid: UUID, if_none_match: Optional[str] = Header(None)):
+        query = FindUserByUUIDQuery(uuid=uuid)
+        if if_none_match:
+            updated_at = await use_case.last_modified(query)
+            etag = weak_etag(uuid, updated_at) if updated_at is not None else None
+            if etag is not None and etag_matches(if_none_match, etag):
+                return not_modified(etag, USER_CACHE_CONTROL)
+        user = await use_case.execute(query)
+        response.headers["Cache-Control"] = USER_CACHE_CONTROL
+        response.headers["ETag"] = weak_etag(user.uuid, user.updated_at)
+        return UserSummaryResponse.from_user_entity(user)
+
+    @app.get("/users/search", response_model=UserSearchResponse)
+    async def search_users(
+            response: Response,
+            use_case: Annotated[SearchUsersUseCase, Depends(lambda: SearchUsersUseCase(repository))],
+            limit: int = 20):
+        result = await use_case.execute(SearchUsersQuery(limit=limit))
+        response.headers["Cache-Control"] = USER_LIST_CACHE_CONTROL
+        return UserSearchResponse.from_result(result)
+
+    return app
+
+
+def _fast_app(repository: InMemoryUserRepository) -> FastAPI:
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_find_user_by_uuid_use_case] = lambda: FindUserByUUIDUseCase(repository)
+    app.dependency_overrides[get_search_users_use_case] = lambda: SearchUsersUseCase(repository)
+    return app
+
+
+async def _microseconds_per_response(response_model, build, build_constructed, content, repeat: int) -> dict:
+    """Times DTO construction plus serialization, without the HTTP stack."""
+    field = create_response_field(name="response", type_=response_model, mode="serialization")
+
+    async def validated():
+        body = await serialize_response(field=field, response_content=build(content), is_coroutine=True)
+        return JSONResponse(body).body
+
+    async def fast():
+        return FastJSONResponse(build(content)).body
+
+    async def construct():
+        return FastJSONResponse(build_constructed(content)).body
+
+    pipelines = {"validated": validated, "fast": fast, "construct": construct}
+    bodies = {await pipeline() for pipeline in pipelines.values()}
+    assert len(bodies) == 1, "pipelines produce different bodies"
+
+    timings = {}
+    for name, pipeline in pipelines.items():
+        started = time.perf_counter()
+        for _ in range(repeat):
+            await pipeline()
+        timings[name] = (time.perf_counter() - started) / repeat * 1e6
+    return timings
+
+
+async def _requests_per_second(app: FastAPI, path: str, requests: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(min(requests, 200)):
+            (await client.get(path)).raise_for_status()
+        started = time.perf_counter()
+        for _ in range(requests):
+            (await client.get(path)).raise_for_status()
+        return requests / (time.perf_counter() - started)
+
+
+async def main(args) -> None:
+    repository = InMemoryUserRepository()
+    users = _users(args.page_size)
+    await repository.save_many(users)
+
+    cases = [
+        ("find_user_by_uuid", f"/users/uuid/{users[0].uuid}", UserSummaryResponse, users[0],
+         UserSummaryResponse.from_user_entity, _constructed_summary),
+        (f"search ({args.page_size} users)", f"/users/search?limit={args.page_size}", UserSearchResponse, users,
+         _page, _constructed_page),
+    ]
+
+    print("pipeline only (DTO + serialization), microseconds per response:")
+    for label, _, response_model, content, build, build_constructed in cases:
+        timings = await _microseconds_per_response(response_model, build, build_constructed, content, args.requests)
+        print(f"  {label:<22} validated={timings['validated']:8.1f}  fast={timings['fast']:8.1f}  "
+              f"construct={timings['construct']:8.1f}  speedup={timings['validated'] / timings['fast']:.2f}x")
+
+    print("full request through FastAPI, requests per second:")
+    apps = {"validated": _validated_app(repository), "fast": _fast_app(repository)}
+    for label, path, *_ in cases:
+        bodies = set()
+        for app in apps.values():
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+                bodies.add((await client.get(path)).content)
+        assert len(bodies) == 1, f"{label}: responses differ"
+
+        results = {name: await _requests_per_second(app, path, args.requests) for name, app in apps.items()}
+        print(f"  {label:<22} validated={results['validated']:8.0f}  fast={results['fast']:8.0f}  "
+              f"speedup={results['fast'] / results['validated']:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    asyncio.run(main(parser.parse_args()))
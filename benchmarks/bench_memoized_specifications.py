@@ -0,0 +1,108 @@
+"""
+Benchmark: memoized insurance and language specifications.
+
+Builds ``--profiles`` patient profiles whose insurance provider comes from a
+pool of ``--providers`` names and whose language comes from a dozen, both
+drawn with Zipf-like weights (a few values cover most rows, as in real
+imports). Validates them with PatientProfileValidator in two configurations:
+
+- ``plain``: the insurance and language rules call the wrapped
+  specifications directly, recomputing every result
+- ``memoized``: the rules as shipped, with INSURANCE_INFO_SPECIFICATION and
+  PREFERRED_LANGUAGE_SPECIFICATION caching results in a bounded LRU
+
+It reports the cost of the two rules alone, whole validations per second
+(best of three passes) and the cache statistics of the first pass.
+
+Usage:
+    python benchmarks/bench_memoized_specifications.py
+    python benchmarks/bench_memoized_specifications.py --profiles 500000 --providers 5000 --cache-size 1024
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from user_management.domain.specifications import memoized
+from user_management.domain.validation.patient_profile import patient_profile_validator
+from user_management.domain.validation.validator_generation import generate_validator
+
+LANGUAGES = ["English", "Português", "Español", "Français", "Deutsch", "Italiano", "Nederlands", "Polski",
+             "Türkçe", "Svenska", "Norsk", "Dansk"]
+
+
+def _zipf_choices(rng: random.Random, pool: list, count: int) -> list:
+    return rng.choices(pool, weights=[1 / rank for rank in range(1, len(pool) + 1)], k=count)
+
+
+def _validator(insurance_info, preferred_language):
+    rules = []
+    for rule in patient_profile_validator.PATIENT_PROFILE_VALIDATION_RULES:
+        if rule.field == "insurance_info":
+            rule = rule._replace(specification=insurance_info)
+        elif rule.field == "preferred_language":
+            rule = rule._replace(specification=preferred_language)
+        rules.append(rule)
+    return generate_validator("validate_patient_profile", patient_profile_validator._PATIENT_PROFILE_PARAMETERS,
+                              rules)
+
+
+def _seconds(function, rows, repeat: int = 3) -> float:
+    """Best of ``repeat`` passes over the rows."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for row in rows:
+            function(*row)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(args) -> None:
+    rng = random.Random(args.seed)
+    providers = [f"Provider {chr(65 + i % 26)}{i} Health" for i in range(args.providers)]
+    now = datetime.now(timezone.utc) - timedelta(minutes=5)
+    user_uuid = uuid4()
+    rows = [
+        (user_uuid, "Jane Doe", "+15551234567", insurance, language, "Arterial hypertension", now, now)
+        for insurance, language in zip(_zipf_choices(rng, providers, args.profiles),
+                                       _zipf_choices(rng, LANGUAGES, args.profiles))
+    ]
+
+    insurance = memoized(patient_profile_validator.INSURANCE_INFO_SPECIFICATION.specification, args.cache_size)
+    language = memoized(patient_profile_validator.PREFERRED_LANGUAGE_SPECIFICATION.specification, args.cache_size)
+    configurations = {
+        "plain": (insurance.specification, language.specification),
+        "memoized": (insurance, language),
+    }
+
+    first_pass = {}
+    print(f"{args.profiles:,} profiles, {args.providers:,} providers, cache size {args.cache_size:,}:")
+    for label, (insurance_spec, language_spec) in configurations.items():
+        check_insurance, check_language = insurance_spec.compile(), language_spec.compile()
+
+        def check_rules(user_uuid, name, phone, insurance_info, preferred_language, *rest):
+            check_insurance(insurance_info)
+            check_language(preferred_language)
+
+        if label == "memoized":
+            _seconds(check_rules, rows, repeat=1)
+            first_pass = {name: memo.statistics() for name, memo in (("insurance", insurance), ("language", language))}
+        rules_only = _seconds(check_rules, rows)
+        validate = _validator(insurance_spec, language_spec)
+        whole = _seconds(validate, rows)
+        print(f"  {label:<9} insurance+language={rules_only / len(rows) * 1e9:6.0f} ns/profile  "
+              f"validator={len(rows) / whole:10,.0f} profiles/s")
+
+    for name, statistics in first_pass.items():
+        print(f"  {name:<9} hit rate={statistics['hit_rate']:.3f}  size={statistics['size']:,}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=200_000)
+    parser.add_argument("--providers", type=int, default=1_000)
+    parser.add_argument("--cache-size", type=int, default=4_096)
+    parser.add_argument("--seed", type=int, default=42)
+    main(parser.parse_args())
@@ -0,0 +1,128 @@
+"""
+Benchmark: validating a registration payload from request body to entity.
+
+Times ``Command.model_validate(payload)`` followed by the factory, for users
+and patient profiles, in two configurations:
+
+- ``two passes``: the commands as they were before, with Python field
+  validators calling the domain specifications, and a factory that runs the
+  entity's full validator on the same values again
+- ``single pass``: the current commands, whose regex rules run inside
+  pydantic-core and which issue a ValidatedFields token, so the factory only
+  checks the fields the command did not (uuid, status, timestamps) and the
+  cross-field rules
+
+Both configurations must build the same entities.
+
+Usage:
+    python benchmarks/bench_registration_validation.py
+    python benchmarks/bench_registration_validation.py --payloads 100000
+"""
+import argparse
+import time
+from datetime import date
+from uuid import uuid4
+
+from pydantic import BaseModel, field_validator
+
+from user_management.application.use_cases.register_patient_profile import RegisterPatientProfileCommand
+from user_management.application.use_cases.register_user import RegisterUserCommand
+from user_management.domain.enums import UserRole
+from user_management.domain.exceptions import DomainError
+from user_management.domain.factories.patient_profile_factory import PatientProfileFactory
+from user_management.domain.factories.user_factory import UserFactory
+from user_management.domain.specifications.patient_profile import ValidEmergencyContactNameSpecification, \
+    ValidEmergencyContactPhoneSpecification, ValidInsuranceInfoSpecification, ValidMedicalHistorySummarySpecification, \
+    ValidPreferredLanguageSpecification
+from user_management.domain.specifications.user import ValidDateOfBirthSpecification, ValidEmailSpecification, \
+    ValidNameSpecification, ValidPhoneE164Specification, ValidUserRoleSpecification
+
+
+def _checked(specification):
+    predicate = specification.compile()
+
+    def check(cls, value):
+        if not predicate(value):
+            raise DomainError(f"Invalid value: {value}")
+        return value
+
+    return classmethod(check)
+
+
+class TwoPassRegisterUserCommand(BaseModel):
+    """RegisterUserCommand before: every rule is a Python validator, and no token is issued."""
+    email: str
+    first_name: str
+    last_name: str
+    phone: str
+    date_of_birth: date
+    user_role: UserRole
+    password: str
+
+    validate_name = field_validator("first_name", "last_name")(_checked(ValidNameSpecification()))
+    validate_email = field_validator("email")(_checked(ValidEmailSpecification()))
+    validate_phone = field_validator("phone")(_checked(ValidPhoneE164Specification()))
+    validate_date_of_birth = field_validator("date_of_birth")(_checked(ValidDateOfBirthSpecification()))
+    validate_user_role = field_validator("user_role")(_checked(ValidUserRoleSpecification()))
+
+    @field_validator("password")
+    @classmethod
+    def validate_password(cls, v: str) -> str:
+        if len(v) < 8:
+            raise ValueError("Password must be at least 8 characters long.")
+        return v
+
+
+class TwoPassRegisterPatientProfileCommand(BaseModel):
+    """RegisterPatientProfileCommand before."""
+    user_uuid: object
+    emergency_contact_name: str
+    emergency_contact_phone: str
+    insurance_info: str
+    preferred_language: str
+    medical_history_summary: str
+
+    validate_name = field_validator("emergency_contact_name")(_checked(ValidEmergencyContactNameSpecification()))
+    validate_phone = field_validator("emergency_contact_phone")(_checked(ValidEmergencyContactPhoneSpecification()))
+    validate_insurance = field_validator("insurance_info")(_checked(ValidInsuranceInfoSpecification()))
+    validate_language = field_validator("preferred_language")(_checked(ValidPreferredLanguageSpecification()))
+    validate_summary = field_validator("medical_history_summary")(_checked(ValidMedicalHistorySummarySpecification()))
+
+
+def _rate(command_type, create, payloads) -> float:
+    started = time.perf_counter()
+    for payload in payloads:
+        create(command_type.model_validate(payload))
+    return len(payloads) / (time.perf_counter() - started)
+
+
+def main(args) -> None:
+    users = [{"email": f"patient.{i}@clinic-example.com", "first_name": "Bench", "last_name": "User",
+              "phone": "+15551234567", "date_of_birth": "1990-01-01", "user_role": "PATIENT",
+              "password": "Str0ng!Passw0rd"} for i in range(args.payloads)]
+    profiles = [{"user_uuid": uuid4(), "emergency_contact_name": "Jane Doe", "emergency_contact_phone": "+15551234567",
+                 "insurance_info": "Forever Healthy Insurance", "preferred_language": "English",
+                 "medical_history_summary": "Arterial hypertension"} for _ in range(args.payloads)]
+
+    cases = [
+        ("User", users, TwoPassRegisterUserCommand, RegisterUserCommand, UserFactory.create_from_command,
+         ("email", "first_name", "last_name", "phone", "date_of_birth", "user_role")),
+        ("PatientProfile", profiles, TwoPassRegisterPatientProfileCommand, RegisterPatientProfileCommand,
+         PatientProfileFactory.create_from_command,
+         ("user_uuid", "emergency_contact_name", "insurance_info", "preferred_language", "medical_history_summary")),
+    ]
+    print(f"registrations per second over {args.payloads:,} payloads (command validation + factory):")
+    for label, payloads, two_pass, single_pass, create, compared in cases:
+        before = create(two_pass.model_validate(payloads[0]))
+        after = create(single_pass.model_validate(payloads[0]))
+        assert all(getattr(before, name) == getattr(after, name) for name in compared), f"{label}: entities differ"
+
+        slow = _rate(two_pass, create, payloads)
+        fast = _rate(single_pass, create, payloads)
+        print(f"  {label:<16} two passes={slow:10,.0f}  single pass={fast:10,.0f}  speedup={fast / slow:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--payloads", type=int, default=50_000)
+    main(parser.parse_args())
@@ -0,0 +1,91 @@
+"""
+Benchmark: interpreted vs compiled specification trees.
+
+Times, in nanoseconds per evaluation over ``--candidates`` generated values
+(``--invalid-ratio`` of them invalid names):
+
+- ``leaf``: ``ValidNameSpecification().is_satisfied_by(v)``, instantiating the
+  leaf on every call as the validators used to, against the compiled leaf
+- ``tree``: a nested AND/OR/NOT tree through ``is_satisfied_by``, compiled,
+  and compiled with adaptive clause ordering; the tree declares an expensive
+  always-passing clause before a cheap one that rejects the invalid values
+- ``UserValidator.validate`` on valid data, which now uses compiled leaves
+
+Usage:
+    python benchmarks/bench_specifications.py
+    python benchmarks/bench_specifications.py --candidates 200000 --invalid-ratio 0.5
+"""
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+from user_management.domain.enums import UserRole, UserStatus
+from user_management.domain.specifications import Specification
+from user_management.domain.specifications.user import ValidEmailSpecification, ValidNameSpecification, \
+    ValidPhoneE164Specification
+from user_management.domain.validation.user import UserValidator
+
+
+class KnownNameSpecification(Specification):
+    """An expensive clause: a linear scan over a deny list that never matches."""
+
+    DENIED = [f"Denied Name {i}" for i in range(200)]
+
+    def is_satisfied_by(self, name) -> bool:
+        return all(name != denied for denied in self.DENIED)
+
+
+def _candidates(count: int, invalid_ratio: float, seed: int) -> list:
+    rng = random.Random(seed)
+    return [f"Name{i}!" if rng.random() < invalid_ratio else "Patient Name" for i in range(count)]
+
+
+def _ns_per_call(predicate, candidates) -> float:
+    started = time.perf_counter_ns()
+    for candidate in candidates:
+        predicate(candidate)
+    return (time.perf_counter_ns() - started) / len(candidates)
+
+
+def main(args) -> None:
+    candidates = _candidates(args.candidates, args.invalid_ratio, args.seed)
+
+    print("leaf, ns per evaluation:")
+    interpreted = _ns_per_call(lambda name: ValidNameSpecification().is_satisfied_by(name), candidates)
+    compiled = _ns_per_call(ValidNameSpecification().compile(), candidates)
+    print(f"  instantiated={interpreted:8.0f}  compiled={compiled:8.0f}  speedup={interpreted / compiled:.2f}x")
+
+    tree = (KnownNameSpecification()
+            .and_(ValidNameSpecification())
+            .and_(ValidEmailSpecification().not_().not_().not_())
+            .and_(ValidPhoneE164Specification().not_().or_(ValidEmailSpecification())))
+    variants = {
+        "interpreted": tree.is_satisfied_by,
+        "compiled": tree.compile(),
+        "adaptive": tree.compile(adaptive=True),
+    }
+    results = {name: [predicate(candidate) for candidate in candidates[:1000]] for name, predicate in variants.items()}
+    assert len({tuple(result) for result in results.values()}) == 1, "variants disagree"
+
+    print(f"tree ({args.invalid_ratio:.0%} invalid), ns per evaluation:")
+    timings = {name: _ns_per_call(predicate, candidates) for name, predicate in variants.items()}
+    print("  " + "  ".join(f"{name}={ns:8.0f}" for name, ns in timings.items())
+          + f"  speedup={timings['interpreted'] / timings['adaptive']:.2f}x")
+
+    now = datetime.now(timezone.utc)
+    fields = (uuid4(), "patient@clinic-example.com", "Bench", "User", "+15551234567", date(1990, 1, 1),
+              UserRole.PATIENT, UserStatus.ACTIVE, now - timedelta(days=1), now)
+    started = time.perf_counter_ns()
+    for _ in range(args.candidates):
+        UserValidator.validate(*fields)
+    print(f"UserValidator.validate: {(time.perf_counter_ns() - started) / args.candidates:8.0f} ns per user")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=100_000)
+    parser.add_argument("--invalid-ratio", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=42)
+    main(parser.parse_args())
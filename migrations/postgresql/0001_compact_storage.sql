@@ -0,0 +1,66 @@
+-- Converts the users, user_credentials and patient_profiles tables from the
+-- legacy layout to compact storage (DB_STORAGE_MODE=compact):
+--
+--   * uuid / user_uuid      VARCHAR(36)        -> native uuid (16 bytes)
+--   * hashed_password       hex text as BYTEA  -> raw 32-byte SHA-256 digest
+--   * user_role/user_status named enum types   -> SMALLINT codes
+--
+-- The codes must match USER_ROLE_CODES / USER_STATUS_CODES in
+-- src/user_management/infrastructure/models/user_model.py.
+--
+-- Run with the application stopped, then restart it with
+-- DB_STORAGE_MODE=compact. The digest column is readable in either layout,
+-- but UUID and enum columns are not, so the mode and the schema must change
+-- together. Every statement runs in one transaction; on error nothing changes.
+
+BEGIN;
+
+ALTER TABLE user_credentials DROP CONSTRAINT IF EXISTS user_credentials_user_uuid_fkey;
+ALTER TABLE patient_profiles DROP CONSTRAINT IF EXISTS patient_profiles_user_uuid_fkey;
+
+ALTER TABLE users ALTER COLUMN uuid TYPE uuid USING uuid::uuid;
+ALTER TABLE user_credentials ALTER COLUMN user_uuid TYPE uuid USING user_uuid::uuid;
+ALTER TABLE patient_profiles ALTER COLUMN user_uuid TYPE uuid USING user_uuid::uuid;
+
+ALTER TABLE user_credentials
+    ADD CONSTRAINT user_credentials_user_uuid_fkey FOREIGN KEY (user_uuid) REFERENCES users (uuid);
+ALTER TABLE patient_profiles
+    ADD CONSTRAINT patient_profiles_user_uuid_fkey FOREIGN KEY (user_uuid) REFERENCES users (uuid);
+
+ALTER TABLE user_credentials
+    ALTER COLUMN hashed_password TYPE bytea
+    USING CASE
+        WHEN length(hashed_password) = 64 THEN decode(convert_from(hashed_password, 'UTF8'), 'hex')
+        ELSE hashed_password
+    END;
+
+ALTER TABLE users
+    ALTER COLUMN user_role TYPE smallint
+    USING CASE user_role::text
+        WHEN 'PATIENT' THEN 1
+        WHEN 'NURSE' THEN 2
+        WHEN 'DOCTOR' THEN 3
+        WHEN 'ADMINISTRATOR' THEN 4
+    END;
+
+ALTER TABLE users
+    ALTER COLUMN user_status TYPE smallint
+    USING CASE user_status::text
+        WHEN 'ACTIVE' THEN 1
+        WHEN 'INACTIVE' THEN 2
+        WHEN 'LOCKED' THEN 3
+    END;
+
+DROP TYPE IF EXISTS userrole;
+DROP TYPE IF EXISTS userstatus;
+
+-- Rewritten columns leave the old index pages bloated.
+REINDEX TABLE users;
+REINDEX TABLE user_credentials;
+REINDEX TABLE patient_profiles;
+
+ANALYZE users;
+ANALYZE user_credentials;
+ANALYZE patient_profiles;
+
+COMMIT;
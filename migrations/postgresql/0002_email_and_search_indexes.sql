@@ -0,0 +1,42 @@
+-- Creates the indexes declared on UserModel that existing databases lack:
+--
+--   * uq_users_email_lower  unique index on lower(email), replacing the
+--                           case-sensitive users_email_key constraint
+--   * ix_users_*_created_at_uuid and ix_users_*_name_lower
+--                           keyset pagination and prefix search indexes
+--
+-- Stops with an error, changing nothing, if two users share an email
+-- ignoring case; merge or rename those accounts first. The query in the
+-- error message lists them.
+--
+-- Works in either storage mode. The index builds lock writes to users, so
+-- run it when the application is quiet. Every statement runs in one
+-- transaction; on error nothing changes.
+
+BEGIN;
+
+DO $$
+DECLARE
+    duplicates integer;
+BEGIN
+    SELECT count(*) INTO duplicates
+    FROM (SELECT lower(email) FROM users GROUP BY lower(email) HAVING count(*) > 1) AS duplicated;
+    IF duplicates > 0 THEN
+        RAISE EXCEPTION '% emails are registered more than once ignoring case', duplicates
+            USING HINT = 'SELECT lower(email), array_agg(uuid) FROM users GROUP BY 1 HAVING count(*) > 1';
+    END IF;
+END
+$$;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_users_email_lower ON users (lower(email) text_pattern_ops);
+ALTER TABLE users DROP CONSTRAINT IF EXISTS users_email_key;
+
+CREATE INDEX IF NOT EXISTS ix_users_created_at_uuid ON users (created_at, uuid);
+CREATE INDEX IF NOT EXISTS ix_users_role_created_at_uuid ON users (user_role, created_at, uuid);
+CREATE INDEX IF NOT EXISTS ix_users_status_created_at_uuid ON users (user_status, created_at, uuid);
+CREATE INDEX IF NOT EXISTS ix_users_first_name_lower ON users (lower(first_name) text_pattern_ops);
+CREATE INDEX IF NOT EXISTS ix_users_last_name_lower ON users (lower(last_name) text_pattern_ops);
+
+ANALYZE users;
+
+COMMIT;
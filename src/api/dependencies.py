@@ -5,29 +5,119 @@ Imports dependency factories from the infrastructure layer to avoid
 exposing infrastructure details directly to the presentation layer.
 """
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
 
-from fastapi import Depends
+from fastapi import Depends, HTTPException, status
 
 from user_management.application.use_cases.register_patient_profile import RegisterPatientProfileUseCase
 from user_management.application.use_cases.register_user import RegisterUserUseCase
+from user_management.application.use_cases.register_users_batch import RegisterUsersBatchUseCase
 from user_management.application.use_cases.find_user_by_email import FindUserByEmailUseCase
 from user_management.application.use_cases.find_user_by_uuid import FindUserByUUIDUseCase
-from user_management.infrastructure.database.postgres_dependencies import get_postgres_user_repository, \
-    get_postgres_patient_profile_repository
+from user_management.application.use_cases.search_users import SearchUsersUseCase
+from user_management.application.use_cases.export_users import ExportUsersUseCase
+from user_management.application.use_cases.import_patient_profiles import ImportPatientProfilesUseCase
+from user_management.application.use_cases.find_patient_profile_by_user_uuid import FindPatientProfileByUserUUIDUseCase
+from user_management.domain.identifiers import id_generator_for, set_default_id_generator
+from user_management.domain.validation import RehydrationSampler, set_rehydration_sampler
+from user_management.infrastructure.importing import RejectsStore
+from user_management.infrastructure.database.postgres_dependencies import get_postgres_user_read_repository, \
+    get_postgres_user_read_repository_scope, get_unit_of_work, get_database_pool_statistics, \
+    get_user_cache_statistics, get_postgres_patient_profile_read_repository, start_cache_invalidation, \
+    stop_cache_invalidation, get_registered_email_filter, get_registered_email_filter_statistics, \
+    start_registered_email_filter_loading, stop_registered_email_filter_loading, READ_YOUR_WRITES_COOKIE, \
+    READ_YOUR_WRITES_SECONDS, READ_YOUR_WRITES_STATE
 
 logger = logging.getLogger(__name__)
 
-def get_register_user_use_case(user_repo = Depends(get_postgres_user_repository)):
+USER_BATCH_CHUNK_SIZE = int(os.getenv("USER_BATCH_CHUNK_SIZE", "500"))
+
+# uuid4 (random) or uuid7 (time-ordered, friendlier to the primary key index).
+USER_ID_STRATEGY = os.getenv("USER_ID_STRATEGY", "uuid4")
+set_default_id_generator(id_generator_for(USER_ID_STRATEGY))
+
+# Fraction of users and profiles loaded from storage that are re-validated (0 trusts every row).
+REHYDRATION_VALIDATION_SAMPLE_RATE = float(os.getenv("REHYDRATION_VALIDATION_SAMPLE_RATE", "0"))
+set_rehydration_sampler(RehydrationSampler(REHYDRATION_VALIDATION_SAMPLE_RATE))
+
+# Processes validating rows of POST /patient/import; 0 validates in the event loop.
+PATIENT_IMPORT_WORKERS = int(os.getenv("PATIENT_IMPORT_WORKERS", str(os.cpu_count() or 1)))
+PATIENT_IMPORT_BATCH_SIZE = int(os.getenv("PATIENT_IMPORT_BATCH_SIZE", "1000"))
+
+_patient_import_executor: Optional[ProcessPoolExecutor] = None
+
+def get_patient_import_executor() -> Optional[ProcessPoolExecutor]:
+    """Returns the process pool shared by patient imports, started on first use."""
+    global _patient_import_executor
+    if PATIENT_IMPORT_WORKERS > 0 and _patient_import_executor is None:
+        _patient_import_executor = ProcessPoolExecutor(max_workers=PATIENT_IMPORT_WORKERS,
+                                                       mp_context=multiprocessing.get_context("spawn"))
+    return _patient_import_executor
+
+def shutdown_patient_import_executor() -> None:
+    """Stops the patient import process pool, if it was started."""
+    global _patient_import_executor
+    if _patient_import_executor is not None:
+        _patient_import_executor.shutdown()
+        _patient_import_executor = None
+
+# Private directory the rejected rows of each import are kept in; imports are refused until it is set.
+PATIENT_IMPORT_REJECTS_DIR = os.getenv("PATIENT_IMPORT_REJECTS_DIR")
+PATIENT_IMPORT_REJECTS_RETENTION_SECONDS = float(os.getenv("PATIENT_IMPORT_REJECTS_RETENTION_SECONDS", "86400"))
+
+_patient_import_rejects_store: Optional[RejectsStore] = None
+
+def get_patient_import_rejects_store() -> RejectsStore:
+    """Returns the store holding the rejected rows of patient imports, created on first use."""
+    global _patient_import_rejects_store
+    if not PATIENT_IMPORT_REJECTS_DIR:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail="Patient import is disabled: PATIENT_IMPORT_REJECTS_DIR is not configured.")
+    if _patient_import_rejects_store is None:
+        _patient_import_rejects_store = RejectsStore(PATIENT_IMPORT_REJECTS_DIR,
+                                                     PATIENT_IMPORT_REJECTS_RETENTION_SECONDS)
+    return _patient_import_rejects_store
+
+def get_register_user_use_case(unit_of_work = Depends(get_unit_of_work),
+                               email_filter = Depends(get_registered_email_filter)):
     """Factory function to provide RegisterUserUseCase via API dependency injection."""
-    return RegisterUserUseCase(user_repository=user_repo)
+    return RegisterUserUseCase(unit_of_work=unit_of_work, email_filter=email_filter)
+
+def get_register_users_batch_use_case(unit_of_work = Depends(get_unit_of_work),
+                                      email_filter = Depends(get_registered_email_filter)):
+    """Factory function to provide RegisterUsersBatchUseCase via API dependency injection."""
+    return RegisterUsersBatchUseCase(unit_of_work=unit_of_work, chunk_size=USER_BATCH_CHUNK_SIZE,
+                                     email_filter=email_filter)
 
-def get_find_user_by_email_use_case(user_repo = Depends(get_postgres_user_repository)):
+def get_find_user_by_email_use_case(user_repo = Depends(get_postgres_user_read_repository)):
     return FindUserByEmailUseCase(user_repository=user_repo)
 
 
-def get_find_user_by_uuid_use_case(user_repo = Depends(get_postgres_user_repository)):
+def get_find_user_by_uuid_use_case(user_repo = Depends(get_postgres_user_read_repository)):
     return FindUserByUUIDUseCase(user_repository=user_repo)
 
 
-def get_register_patient_profile_use_case(patient_profile_repo = Depends(get_postgres_patient_profile_repository)):
-    return RegisterPatientProfileUseCase(patient_profile_repository=patient_profile_repo)
+def get_search_users_use_case(user_repo = Depends(get_postgres_user_read_repository)):
+    return SearchUsersUseCase(user_repository=user_repo)
+
+
+def get_export_users_use_case(repository_scope = Depends(get_postgres_user_read_repository_scope)):
+    return ExportUsersUseCase(repository_scope=repository_scope)
+
+
+def get_find_patient_profile_by_user_uuid_use_case(
+        patient_profile_repo = Depends(get_postgres_patient_profile_read_repository)):
+    return FindPatientProfileByUserUUIDUseCase(patient_profile_repository=patient_profile_repo)
+
+
+def get_register_patient_profile_use_case(unit_of_work = Depends(get_unit_of_work)):
+    return RegisterPatientProfileUseCase(unit_of_work=unit_of_work)
+
+def get_import_patient_profiles_use_case(unit_of_work = Depends(get_unit_of_work),
+                                         executor = Depends(get_patient_import_executor)):
+    return ImportPatientProfilesUseCase(unit_of_work=unit_of_work, executor=executor,
+                                        batch_size=PATIENT_IMPORT_BATCH_SIZE,
+                                        max_in_flight=2 * max(PATIENT_IMPORT_WORKERS, 1))
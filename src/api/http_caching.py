@@ -0,0 +1,71 @@
+"""
+HTTP validators and Cache-Control hints for read endpoints.
+
+Resources carry a weak ETag derived from their UUID and ``updated_at``. Every
+write bumps ``updated_at``, so a matching ``If-None-Match`` means the client's
+copy is current and a 304 can be sent without building or serializing the
+resource; routes check it against ``last_modified`` lookups before loading
+anything.
+
+Responses contain personal data, so shared caches (proxies, CDNs) must not
+store them: point lookups are ``private, no-cache`` (the client may keep them
+but has to revalidate) and list endpoints are ``no-store``.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+from uuid import UUID
+
+from fastapi import Response, status
+
+# Point lookups: clients keep them but revalidate every time with If-None-Match.
+USER_CACHE_CONTROL = "private, no-cache"
+PATIENT_PROFILE_CACHE_CONTROL = "private, no-cache"
+# Searches and exports change with every write to any user and are not worth revalidating.
+USER_LIST_CACHE_CONTROL = "private, no-store"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def weak_etag(uuid: UUID, updated_at: datetime) -> str:
+    """
+    Builds the weak ETag of a resource version, e.g. ``W/"<uuid hex>-<microseconds>"``.
+
+    Naive timestamps are taken as UTC, so the value does not depend on
+    whether the storage layer returned an aware datetime.
+    """
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    microseconds = (updated_at - _EPOCH) // _ONE_MICROSECOND
+    return f'W/"{uuid.hex}-{microseconds:x}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Weak comparison of ``etag`` against an If-None-Match header (RFC 9110 13.1.2).
+    """
+    if not if_none_match:
+        return False
+    opaque = _opaque_tag(etag)
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or _opaque_tag(candidate) == opaque:
+            return True
+    return False
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    """Returns an empty 304 response carrying the current validators."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(cache_control, etag))
+
+
+def cache_headers(cache_control: str, etag: Optional[str] = None) -> Dict[str, str]:
+    """Returns the Cache-Control header, and the ETag when there is one, for a route's response."""
+    headers = {"Cache-Control": cache_control}
+    if etag is not None:
+        headers["ETag"] = etag
+    return headers
+
+
+def _opaque_tag(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
@@ -8,11 +8,15 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
+from src.api.routes.health_routes import health_router
 from src.api.routes.patient_profile_routes import patient_router
 from src.api.routes.user_routes import router as user_router
 
 import logging
 
+from api.dependencies import shutdown_patient_import_executor, start_cache_invalidation, stop_cache_invalidation, \
+    start_registered_email_filter_loading, stop_registered_email_filter_loading, READ_YOUR_WRITES_SECONDS
+from api.read_your_writes import ReadYourWritesCookieMiddleware
 from user_management.infrastructure.database.postgres_config import engine
 from user_management.infrastructure.models.user_model import Base as UserBase
 from user_management.infrastructure.models.user_credentials_model import Base as CredentialsBase
@@ -36,8 +40,13 @@ async def lifespan(app: FastAPI):
     #     await conn.run_sync(UserBase.metadata.create_all)
     #     await conn.run_sync(CredentialsBase.metadata.create_all)
     #     await conn.run_sync(PatientProfileBase.metadata.create_all)
+    await start_cache_invalidation()
+    start_registered_email_filter_loading()
     yield
     logger.info("Shutting down NextGenHealth API...")
+    await stop_registered_email_filter_loading()
+    await stop_cache_invalidation()
+    shutdown_patient_import_executor()
 
 
 app = FastAPI(
@@ -47,8 +56,11 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+app.add_middleware(ReadYourWritesCookieMiddleware, max_age_seconds=READ_YOUR_WRITES_SECONDS)
+
 app.include_router(user_router)
 app.include_router(patient_router)
+app.include_router(health_router)
 
 @app.get("/")
 async def root():
@@ -0,0 +1,55 @@
+"""
+Read-your-writes cookie.
+
+A request that commits a write leaves a signed token in ``request.state``
+(see get_write_db_session). This middleware returns it to the client in the
+``read_your_writes`` cookie, so the client's next reads, on any worker, are
+served by the primary until the token expires.
+
+The token only routes reads and carries no identity, so the cookie is not
+marked Secure; it is HttpOnly and expires with the token.
+"""
+from http.cookies import SimpleCookie
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.dependencies import READ_YOUR_WRITES_COOKIE, READ_YOUR_WRITES_STATE
+
+
+class ReadYourWritesCookieMiddleware:
+    """
+    Sets the read-your-writes cookie on responses to requests that committed a write.
+
+    Args:
+        app: The wrapped ASGI application.
+        max_age_seconds (float): Lifetime of the cookie, the read-your-writes window.
+    """
+
+    def __init__(self, app: ASGIApp, max_age_seconds: float):
+        self.app = app
+        self.max_age_seconds = max_age_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                token = scope.get("state", {}).get(READ_YOUR_WRITES_STATE)
+                if token:
+                    MutableHeaders(scope=message).append("set-cookie", self._cookie(token))
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+    def _cookie(self, token: str) -> str:
+        cookie = SimpleCookie()
+        cookie[READ_YOUR_WRITES_COOKIE] = token
+        morsel = cookie[READ_YOUR_WRITES_COOKIE]
+        morsel["max-age"] = max(1, round(self.max_age_seconds))
+        morsel["path"] = "/"
+        morsel["httponly"] = True
+        morsel["samesite"] = "Lax"
+        return morsel.OutputString()
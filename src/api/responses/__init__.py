@@ -1,5 +1,19 @@
 from .user_responses import UserSummaryResponse
+from .user_batch_responses import UserBatchItemResponse, UserBatchRegistrationResponse
+from .user_search_responses import UserSearchResponse
+from .user_export_responses import NDJSON_MEDIA_TYPE, iter_user_summaries_ndjson
+from .patient_import_responses import PatientImportResponse
+from .patient_profile_responses import PatientProfileResponse
+from .json_responses import FastJSONResponse
 
 __all__ = [
-    "UserSummaryResponse"
-]
\ No newline at end of file
+    "UserSummaryResponse",
+    "UserBatchItemResponse",
+    "UserBatchRegistrationResponse",
+    "UserSearchResponse",
+    "NDJSON_MEDIA_TYPE",
+    "iter_user_summaries_ndjson",
+    "PatientImportResponse",
+    "PatientProfileResponse",
+    "FastJSONResponse"
+]
@@ -0,0 +1,46 @@
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+
+from user_management.application.use_cases.import_patient_profiles import ImportPatientProfilesResult
+
+
+class PatientImportResponse(BaseModel):
+    """
+    DTO for the bulk patient profile import endpoint.
+
+    Reports totals and throughput; rejected rows are available under
+    ``import_id``, and the first few reported are echoed in ``sample_rejects``.
+    Neither is in source order; each reject carries its line number.
+    """
+    rows_read: int
+    imported: int
+    rejected: int
+    elapsed_seconds: float
+    rows_per_second: float
+    import_id: str
+    sample_rejects: List[Dict[str, Any]]
+
+    @classmethod
+    def from_result(cls, result: ImportPatientProfilesResult, import_id: str,
+                    sample_rejects: List[Dict[str, Any]]) -> 'PatientImportResponse':
+        """
+        Creates the response DTO from the use case result.
+
+        Args:
+            result (ImportPatientProfilesResult): Outcome of the import.
+            import_id (str): Id the rejected rows can be fetched by.
+            sample_rejects: The first rejected rows reported, as stored for the import.
+
+        Returns:
+            PatientImportResponse: The response DTO.
+        """
+        return cls(
+            rows_read=result.rows_read,
+            imported=result.imported,
+            rejected=result.rejected,
+            elapsed_seconds=round(result.elapsed_seconds, 6),
+            rows_per_second=round(result.rows_per_second, 2),
+            import_id=import_id,
+            sample_rejects=sample_rejects,
+        )
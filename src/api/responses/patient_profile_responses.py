@@ -0,0 +1,42 @@
+import uuid
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from user_management.domain.entities import PatientProfile
+
+
+class PatientProfileResponse(BaseModel):
+    """
+    DTO for patient profile data returned by API endpoints.
+    """
+    user_uuid: uuid.UUID
+    emergency_contact_name: str
+    emergency_contact_phone: str
+    insurance_info: str
+    preferred_language: str
+    medical_history_summary: str
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_patient_profile_entity(cls, patient_profile: PatientProfile) -> 'PatientProfileResponse':
+        """
+        Creates a PatientProfileResponse instance from a PatientProfile domain entity.
+
+        Args:
+            patient_profile (PatientProfile): The domain entity to convert.
+
+        Returns:
+            PatientProfileResponse: The response DTO.
+        """
+        return cls(
+            user_uuid=patient_profile.user_uuid,
+            emergency_contact_name=patient_profile.emergency_contact_name,
+            emergency_contact_phone=patient_profile.emergency_contact_phone,
+            insurance_info=patient_profile.insurance_info,
+            preferred_language=patient_profile.preferred_language,
+            medical_history_summary=patient_profile.medical_history_summary,
+            created_at=patient_profile.created_at,
+            updated_at=patient_profile.updated_at,
+        )
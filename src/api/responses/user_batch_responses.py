@@ -0,0 +1,69 @@
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from user_management.application.use_cases.register_users_batch import (
+    BatchItemStatus,
+    RegisterUsersBatchResult,
+)
+
+
+class UserBatchItemResponse(BaseModel):
+    """
+    DTO describing the outcome of one item of a bulk registration request.
+    """
+    index: int
+    status: BatchItemStatus
+    uuid: Optional[UUID] = None
+    email: Optional[str] = None
+    error: Optional[str] = None
+
+
+class UserBatchRegistrationResponse(BaseModel):
+    """
+    DTO for the bulk registration endpoint.
+
+    Reports per-item results in submission order together with totals and throughput.
+    """
+    total: int
+    created: int
+    rejected: int
+    duplicates: int
+    failed: int
+    chunk_size: int
+    elapsed_seconds: float
+    users_per_second: float
+    items: List[UserBatchItemResponse]
+
+    @classmethod
+    def from_result(cls, result: RegisterUsersBatchResult) -> 'UserBatchRegistrationResponse':
+        """
+        Creates the response DTO from the use case result.
+
+        Args:
+            result (RegisterUsersBatchResult): Outcome of the batch registration.
+
+        Returns:
+            UserBatchRegistrationResponse: The response DTO.
+        """
+        return cls(
+            total=len(result.items),
+            created=result.count(BatchItemStatus.CREATED),
+            rejected=result.count(BatchItemStatus.REJECTED),
+            duplicates=result.count(BatchItemStatus.DUPLICATE),
+            failed=result.count(BatchItemStatus.FAILED),
+            chunk_size=result.chunk_size,
+            elapsed_seconds=round(result.elapsed_seconds, 6),
+            users_per_second=round(result.users_per_second, 2),
+            items=[
+                UserBatchItemResponse(
+                    index=item.index,
+                    status=item.status,
+                    uuid=item.uuid,
+                    email=item.email,
+                    error=item.error,
+                )
+                for item in result.items
+            ],
+        )
@@ -0,0 +1,30 @@
+from typing import AsyncIterator
+
+from api.responses.user_responses import UserSummaryResponse
+from user_management.domain.entities import User
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def iter_user_summaries_ndjson(users: AsyncIterator[User], lines_per_chunk: int = 1000) -> AsyncIterator[bytes]:
+    """
+    Encodes a stream of users as NDJSON, one UserSummaryResponse per line.
+
+    Lines are grouped into chunks of ``lines_per_chunk`` to limit the number of
+    writes to the socket, so at most one chunk is held in memory at a time.
+
+    Args:
+        users: The users to encode, typically from UserRepository.iter_all.
+        lines_per_chunk (int): Number of lines per yielded chunk.
+
+    Yields:
+        bytes: UTF-8 encoded NDJSON lines, each terminated by a newline.
+    """
+    chunk = []
+    async for user in users:
+        chunk.append(UserSummaryResponse.from_user_entity(user).model_dump_json())
+        if len(chunk) >= lines_per_chunk:
+            yield ("\n".join(chunk) + "\n").encode("utf-8")
+            chunk = []
+    if chunk:
+        yield ("\n".join(chunk) + "\n").encode("utf-8")
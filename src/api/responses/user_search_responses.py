@@ -0,0 +1,24 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from api.responses.user_responses import UserSummaryResponse
+from user_management.application.use_cases.search_users import SearchUsersResult
+
+
+class UserSearchResponse(BaseModel):
+    """
+    DTO for one page of user search results.
+
+    ``next_cursor`` is omitted on the last page; pass it back as ``cursor``
+    to fetch the following page.
+    """
+    items: List[UserSummaryResponse]
+    next_cursor: Optional[str] = None
+
+    @classmethod
+    def from_result(cls, result: SearchUsersResult) -> 'UserSearchResponse':
+        return cls(
+            items=[UserSummaryResponse.from_user_entity(user) for user in result.users],
+            next_cursor=result.next_cursor,
+        )
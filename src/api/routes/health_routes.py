@@ -0,0 +1,54 @@
+"""
+API routes exposing operational health and telemetry.
+
+Intended for dashboards and load-test tooling; returns live infrastructure
+statistics rather than business data.
+"""
+
+import logging
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, status
+
+from api.dependencies import get_database_pool_statistics, get_registered_email_filter_statistics, \
+    get_user_cache_statistics
+
+logger = logging.getLogger(__name__)
+
+health_router = APIRouter(
+    prefix="/health",
+    tags=["health"]
+)
+
+
+@health_router.get("/database/pool", status_code=status.HTTP_200_OK)
+async def database_pool_statistics(
+    statistics: Dict[str, Any] = Depends(get_database_pool_statistics),
+):
+    """
+    Returns checked-out/overflow counts and the checkout wait time histogram
+    of the primary database connection pool.
+    """
+    return statistics
+
+
+@health_router.get("/cache/users", status_code=status.HTTP_200_OK)
+async def user_cache_statistics(
+    statistics: Dict[str, Any] = Depends(get_user_cache_statistics),
+):
+    """
+    Returns hit/miss/eviction/expiration counters and the size of this
+    worker's user cache.
+    """
+    return statistics
+
+
+@health_router.get("/email-filter", status_code=status.HTTP_200_OK)
+async def registered_email_filter_statistics(
+    statistics: Dict[str, Any] = Depends(get_registered_email_filter_statistics),
+):
+    """
+    Returns whether this worker's registered email filter has finished
+    loading, how many emails it holds and its estimated false positive rate.
+    """
+    return statistics
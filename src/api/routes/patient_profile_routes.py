@@ -18,19 +18,29 @@
 # ):
 #     pass
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import Annotated
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Request, status
+from fastapi.responses import FileResponse
+from typing import Annotated, Optional
 import logging
+from uuid import UUID
 
 from user_management.application.use_cases.register_patient_profile import RegisterPatientProfileCommand
 from user_management.application.use_cases.register_patient_profile import RegisterPatientProfileUseCase
-from api.dependencies import get_register_patient_profile_use_case
+from user_management.application.use_cases.import_patient_profiles import ImportPatientProfilesUseCase
+from user_management.application.use_cases.find_patient_profile_by_user_uuid import \
+    FindPatientProfileByUserUUIDUseCase
+from user_management.infrastructure.importing import IMPORT_FORMATS, RejectsStore, detect_import_format, read_records
+from api.dependencies import get_register_patient_profile_use_case, get_import_patient_profiles_use_case, \
+    get_find_patient_profile_by_user_uuid_use_case, get_patient_import_rejects_store
+from api.http_caching import PATIENT_PROFILE_CACHE_CONTROL, cache_headers, etag_matches, not_modified, weak_etag
+from api.responses import FastJSONResponse, PatientImportResponse, PatientProfileResponse
 
 logger = logging.getLogger(__name__)
 
 patient_router = APIRouter(
     prefix="/patient",
-    tags=["patient"]
+    tags=["patient"],
+    default_response_class=FastJSONResponse
 )
 
 @patient_router.post("/", status_code=status.HTTP_201_CREATED)
@@ -42,14 +52,104 @@ async def register_patient_profile(
     try:
         patient_profile = await use_case.execute(command)
         logger.info("Patient profile registered successfully for user UUID: %s", command.user_uuid)
-        return {
-            "user_uuid": str(patient_profile.user_uuid),
+        return FastJSONResponse({
+            "user_uuid": patient_profile.user_uuid,
             "emergency_contact_name": patient_profile.emergency_contact_name,
             # ou só: "message": "Patient profile created"
-        }
+        }, status_code=status.HTTP_201_CREATED)
     except Exception as e:
         logger.error("Error registering patient profile for user %s: %s", command.user_uuid, e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to register patient profile."
-        )
\ No newline at end of file
+        )
+
+
+@patient_router.post("/import", status_code=status.HTTP_200_OK, response_model=PatientImportResponse)
+async def import_patient_profiles(
+    request: Request,
+    use_case: Annotated[ImportPatientProfilesUseCase, Depends(get_import_patient_profiles_use_case)],
+    rejects_store: Annotated[RejectsStore, Depends(get_patient_import_rejects_store)],
+    import_format: Optional[str] = Query(None, alias="format",
+                                         description=f"One of {', '.join(IMPORT_FORMATS)}; "
+                                                     f"defaults to the request Content-Type"),
+):
+    """
+    Bulk imports patient profiles from a CSV (with header) or NDJSON request body.
+
+    The body is parsed as it arrives and valid rows are inserted in batches;
+    invalid rows are kept aside instead of failing the import, and can be
+    fetched from ``GET /patient/import/{import_id}/rejects``.
+    """
+    fmt = (import_format or detect_import_format(content_type=request.headers.get("content-type")) or "").lower()
+    if fmt not in IMPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported import format. Use ?format= with one of {', '.join(IMPORT_FORMATS)}, "
+                   f"or a text/csv or application/x-ndjson Content-Type."
+        )
+
+    try:
+        with rejects_store.writer() as (import_id, rejects):
+            result = await use_case.execute(read_records(request.stream(), fmt), on_reject=rejects)
+        logger.info("Patient import processed %d rows in %.3fs (%.1f rows/s): %d imported, %d rejected",
+                    result.rows_read, result.elapsed_seconds, result.rows_per_second,
+                    result.imported, result.rejected)
+        return FastJSONResponse(PatientImportResponse.from_result(result, import_id, rejects.samples))
+
+    except Exception as e:
+        logger.error("Error importing patient profiles: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to import patient profiles."
+        )
+
+
+@patient_router.get("/import/{import_id}/rejects", status_code=status.HTTP_200_OK, response_class=FileResponse)
+async def get_patient_import_rejects(
+    rejects_store: Annotated[RejectsStore, Depends(get_patient_import_rejects_store)],
+    import_id: str = Path(..., description="Id returned by POST /patient/import"),
+):
+    """
+    Returns the rejected rows of an import as NDJSON, until they pass their retention.
+
+    Rows are in the order they were rejected, not source order; each carries its line number.
+    """
+    rejects_file = rejects_store.find(import_id)
+    if rejects_file is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Import rejects not found")
+    return FileResponse(rejects_file, media_type="application/x-ndjson")
+
+
+@patient_router.get("/{user_uuid}", status_code=status.HTTP_200_OK, response_model=PatientProfileResponse)
+async def find_patient_profile(
+    use_case: Annotated[FindPatientProfileByUserUUIDUseCase, Depends(get_find_patient_profile_by_user_uuid_use_case)],
+    user_uuid: UUID = Path(..., description="UUID of the user the patient profile belongs to"),
+    if_none_match: Optional[str] = Header(None, description="ETag of the copy the client already has"),
+):
+    """
+    Returns a patient profile, with a weak ETag.
+
+    When ``If-None-Match`` carries the current ETag, a 304 is returned after
+    looking up only ``updated_at``, without loading the profile.
+    """
+    try:
+        if if_none_match:
+            updated_at = await use_case.last_modified(user_uuid)
+            etag = weak_etag(user_uuid, updated_at) if updated_at is not None else None
+            if etag is not None and etag_matches(if_none_match, etag):
+                return not_modified(etag, PATIENT_PROFILE_CACHE_CONTROL)
+
+        patient_profile = await use_case.execute(user_uuid)
+    except Exception as e:
+        logger.error("Error retrieving patient profile for user %s: %s", user_uuid, e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve patient profile."
+        )
+
+    if patient_profile is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Patient profile not found")
+    etag = weak_etag(patient_profile.user_uuid, patient_profile.updated_at)
+    return FastJSONResponse(PatientProfileResponse.from_patient_profile_entity(patient_profile),
+                            headers=cache_headers(PATIENT_PROFILE_CACHE_CONTROL, etag))
@@ -6,22 +6,34 @@ Follows REST principles and integrates with domain use cases.
 """
 
 import logging
-from typing import Annotated
+from typing import Annotated, Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Path
-from api.dependencies import get_register_user_use_case, get_find_user_by_email_use_case, get_find_user_by_uuid_use_case
-from api.responses import UserSummaryResponse
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, status, Path, Query
+from fastapi.responses import StreamingResponse
+from api.http_caching import USER_CACHE_CONTROL, USER_LIST_CACHE_CONTROL, cache_headers, etag_matches, \
+    not_modified, weak_etag
+from api.dependencies import get_register_user_use_case, get_find_user_by_email_use_case, \
+    get_find_user_by_uuid_use_case, get_register_users_batch_use_case, get_search_users_use_case, \
+    get_export_users_use_case
+from api.responses import FastJSONResponse, UserSummaryResponse, UserBatchRegistrationResponse, UserSearchResponse, \
+    NDJSON_MEDIA_TYPE, iter_user_summaries_ndjson
+from user_management.application.use_cases.export_users import ExportUsersUseCase
 from user_management.application.use_cases.find_user_by_email import FindUserByEmailUseCase
 from user_management.application.use_cases.find_user_by_email.query import FindUserByEmailQuery
 from user_management.application.use_cases.find_user_by_uuid import FindUserByUUIDUseCase, FindUserByUUIDQuery
 from user_management.application.use_cases.register_user import RegisterUserUseCase, RegisterUserCommand
+from user_management.application.use_cases.register_users_batch import RegisterUsersBatchUseCase
+from user_management.application.use_cases.search_users import SearchUsersUseCase, SearchUsersQuery
+from user_management.domain.enums import UserRole, UserStatus
+from user_management.domain.exceptions import EmailAlreadyRegisteredError
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/users",
-    tags=["users"]
+    tags=["users"],
+    default_response_class=FastJSONResponse
 )
 
 
@@ -33,7 +45,13 @@ async def register_user(
 
     try:
         user = await use_case.execute(command)
-        return {"uuid": str(user.uuid), "email": user.email}
+        return FastJSONResponse({"uuid": user.uuid, "email": user.email}, status_code=status.HTTP_201_CREATED)
+
+    except EmailAlreadyRegisteredError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
 
     except ValueError as e:
         raise HTTPException(
@@ -47,18 +65,111 @@ async def register_user(
             detail="Internal server error occurred during user registration."
         )
 
+@router.post("/batch", status_code=status.HTTP_200_OK, response_model=UserBatchRegistrationResponse)
+async def register_users_batch(
+    use_case: Annotated[RegisterUsersBatchUseCase, Depends(get_register_users_batch_use_case)],
+    payloads: List[Dict[str, Any]] = Body(..., description="Array of RegisterUserCommand payloads"),
+    chunk_size: Optional[int] = Query(None, ge=1, le=10000, description="Users persisted per transaction"),
+):
+    """
+    Registers many users at once.
+
+    Items are validated individually, so invalid rows are reported in the
+    response instead of failing the whole request. Emails that are already
+    registered, or repeated within the batch, are reported as DUPLICATE
+    while the rest of their chunk is stored.
+    """
+    try:
+        result = await use_case.execute(payloads, chunk_size=chunk_size)
+        logger.info("Batch registration processed %d items in %.3fs (%.1f users/s)",
+                    len(result.items), result.elapsed_seconds, result.users_per_second)
+        return FastJSONResponse(UserBatchRegistrationResponse.from_result(result))
+
+    except Exception as e:
+        logger.error("Error during batch user registration: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error occurred during batch user registration."
+        )
+
+@router.get("/search", status_code=status.HTTP_200_OK, response_model=UserSearchResponse)
+async def search_users(
+        use_case: Annotated[SearchUsersUseCase, Depends(get_search_users_use_case)],
+        q: Optional[str] = Query(None, max_length=100, description="Prefix of first name, last name or email"),
+        role: Optional[str] = Query(None, description=f"One of {', '.join(r.value for r in UserRole)}"),
+        user_status: Optional[str] = Query(None, alias="status",
+                                           description=f"One of {', '.join(s.value for s in UserStatus)}"),
+        limit: int = Query(20, ge=1, le=100, description="Maximum number of users per page"),
+        cursor: Optional[str] = Query(None, description="Cursor returned by the previous page"),
+):
+    """
+    Searches users by name/email prefix, role and status.
+
+    Results are ordered by creation time and paged with ``next_cursor``.
+    """
+    try:
+        query = SearchUsersQuery(q=q, role=role, status=user_status, limit=limit, cursor=cursor)
+        result = await use_case.execute(query)
+        return FastJSONResponse(UserSearchResponse.from_result(result),
+                                headers=cache_headers(USER_LIST_CACHE_CONTROL))
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    except Exception as e:
+        logger.error("Error during user search: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error occurred during user search."
+        )
+
+@router.get("/export", status_code=status.HTTP_200_OK, response_class=StreamingResponse)
+async def export_users(
+        use_case: Annotated[ExportUsersUseCase, Depends(get_export_users_use_case)],
+        batch_size: int = Query(1000, ge=1, le=10000, description="Rows fetched from the database per round trip"),
+):
+    """
+    Streams every user as NDJSON, one UserSummaryResponse per line.
+
+    Rows are read through a server-side cursor, so memory use does not grow
+    with the number of users.
+    """
+    return StreamingResponse(
+        iter_user_summaries_ndjson(use_case.execute(batch_size), lines_per_chunk=batch_size),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"Content-Disposition": 'attachment; filename="users.ndjson"',
+                 "Cache-Control": USER_LIST_CACHE_CONTROL},
+    )
+
 @router.get("/uuid/{uuid}", status_code=status.HTTP_200_OK, response_model=UserSummaryResponse)
 async def find_user_by_uuid(
         use_case: Annotated[FindUserByUUIDUseCase, Depends(get_find_user_by_uuid_use_case)],
-        uuid: UUID = Path(..., description="UUID of the user to find"),):
-
+        uuid: UUID = Path(..., description="UUID of the user to find"),
+        if_none_match: Optional[str] = Header(None, description="ETag of the copy the client already has"),):
+    """
+    Returns a user, with a weak ETag.
+
+    When ``If-None-Match`` carries the current ETag, a 304 is returned after
+    looking up only ``updated_at``, without loading the user.
+    """
     try:
         query = FindUserByUUIDQuery(uuid=uuid)
+        if if_none_match:
+            updated_at = await use_case.last_modified(query)
+            etag = weak_etag(uuid, updated_at) if updated_at is not None else None
+            if etag is not None and etag_matches(if_none_match, etag):
+                return not_modified(etag, USER_CACHE_CONTROL)
+
         user_entity = await use_case.execute(query)
         if not user_entity:
             raise HTTPException(status_code=404, detail="User not found")
 
-        return UserSummaryResponse.from_user_entity(user_entity)
+        etag = weak_etag(user_entity.uuid, user_entity.updated_at)
+        return FastJSONResponse(UserSummaryResponse.from_user_entity(user_entity),
+                                headers=cache_headers(USER_CACHE_CONTROL, etag))
 
     except ValueError as e:
         raise HTTPException(
@@ -76,14 +187,26 @@ async def find_user_by_uuid(
 async def find_user_by_email(
         use_case: Annotated[FindUserByEmailUseCase, Depends(get_find_user_by_email_use_case)],
         email: str = Path(..., description="Email address of the user to find"),
+        if_none_match: Optional[str] = Header(None, description="ETag of the copy the client already has"),
 ):
+    """
+    Returns a user, with a weak ETag.
+
+    The ETag is keyed by UUID, so the user is loaded before ``If-None-Match``
+    is compared; a match still skips serializing the body.
+    """
     try:
         query = FindUserByEmailQuery(email=email)
         user_entity = await use_case.execute(query)
         if not user_entity:
             raise HTTPException(status_code=404, detail="User not found")
 
-        return UserSummaryResponse.from_user_entity(user_entity)
+        etag = weak_etag(user_entity.uuid, user_entity.updated_at)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, USER_CACHE_CONTROL)
+
+        return FastJSONResponse(UserSummaryResponse.from_user_entity(user_entity),
+                                headers=cache_headers(USER_CACHE_CONTROL, etag))
 
     except ValueError as e:
         raise HTTPException(
@@ -0,0 +1,5 @@
+from .registered_email_filter import RegisteredEmailFilter
+
+__all__ = [
+    "RegisteredEmailFilter"
+]
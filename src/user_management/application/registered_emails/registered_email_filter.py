@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+
+
+class RegisteredEmailFilter(ABC):
+    """
+    Approximate, in-memory set of the emails already registered.
+
+    Answers "might this email be registered?" without a database round trip.
+    A False answer must be reliable for the emails the filter has seen; a
+    True answer may be a false positive and is confirmed with one indexed
+    lookup. The database unique index stays the source of truth, so a filter
+    missing recent writes from other workers only costs a failed insert.
+    """
+
+    @abstractmethod
+    def might_be_registered(self, email: str) -> bool:
+        ...
+
+    @abstractmethod
+    def add(self, email: str) -> None:
+        """
+        Records an email that was just registered.
+        """
+        ...
@@ -1,5 +1,7 @@
 from .user_repository import UserRepository
+from .patient_profile_repository import PatientProfileRepository
 
 __all__ = [
-    "UserRepository"
+    "UserRepository",
+    "PatientProfileRepository"
 ]
\ No newline at end of file
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import Iterable, Optional, Sequence, Set
 from uuid import UUID
 
 from user_management.domain.entities.patient_profile import PatientProfile
@@ -10,6 +11,36 @@ class PatientProfileRepository(ABC):
     def save(self, patient: PatientProfile) -> None:
         ...
 
+    @abstractmethod
+    def save_many(self, patients: Sequence[PatientProfile]) -> None:
+        """
+        Stages several new patient profiles as one batch.
+
+        The profiles become visible when the surrounding unit of work commits.
+        """
+        ...
+
+    @abstractmethod
+    def find_by_user_uuid(self, user_uuid: UUID) -> Optional[PatientProfile]:
+        """
+        Returns the patient profile of the given user, or None if they have none.
+        """
+        ...
+
+    @abstractmethod
+    def find_updated_at_by_user_uuid(self, user_uuid: UUID) -> Optional[datetime]:
+        """
+        Returns when the user's patient profile was last modified, or None if they have none.
+        """
+        ...
+
+    @abstractmethod
+    def find_existing_user_uuids(self, user_uuids: Iterable[UUID]) -> Set[UUID]:
+        """
+        Returns the subset of ``user_uuids`` that already have a patient profile.
+        """
+        ...
+
     # @abstractmethod
     # def find_by_email(self, email: str) -> Optional[User]:
     #     ...
@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import AsyncIterator, Iterable, List, Optional, Sequence, Set, Tuple
 from uuid import UUID
 
 from user_management.domain.entities.user import User
+from user_management.domain.enums import UserRole, UserStatus
 
 
 class UserRepository(ABC):
@@ -10,10 +12,97 @@ class UserRepository(ABC):
     def save(self, user: User) -> None:
         ...
 
+    @abstractmethod
+    def save_many(self, users: Sequence[User]) -> None:
+        """
+        Stages several new users as one batch.
+
+        The users become visible when the surrounding unit of work commits;
+        either every user in ``users`` is stored or none of them is.
+        """
+        ...
+
     @abstractmethod
     def find_by_email(self, email: str) -> Optional[User]:
         ...
 
     @abstractmethod
     def find_by_uuid(self, uuid: UUID) -> Optional[User]:
-        ...
\ No newline at end of file
+        ...
+
+    @abstractmethod
+    def find_updated_at(self, uuid: UUID) -> Optional[datetime]:
+        """
+        Returns when the user was last modified, or None if there is no such user.
+
+        Lets callers decide whether their copy is current without loading
+        the whole user.
+        """
+        ...
+
+    @abstractmethod
+    def find_many_by_uuids(self, uuids: Iterable[UUID]) -> List[User]:
+        """
+        Loads every user whose UUID is in ``uuids`` in a single round trip.
+
+        Unknown UUIDs are skipped. Users are returned in the order their UUIDs
+        were first requested, without duplicates.
+        """
+        ...
+
+    @abstractmethod
+    def find_existing_uuids(self, uuids: Iterable[UUID]) -> Set[UUID]:
+        """
+        Returns the subset of ``uuids`` that belong to registered users.
+
+        Cheaper than ``find_many_by_uuids`` when only existence matters.
+        """
+        ...
+
+    @abstractmethod
+    def find_registered_emails(self, emails: Iterable[str]) -> Set[str]:
+        """
+        Returns the lowercased form of every email in ``emails`` that is already registered.
+
+        Emails are compared case-insensitively, as in ``find_by_email``, in a
+        single round trip.
+        """
+        ...
+
+    @abstractmethod
+    def search(
+        self,
+        text: Optional[str] = None,
+        role: Optional[UserRole] = None,
+        status: Optional[UserStatus] = None,
+        limit: int = 20,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[User]:
+        """
+        Returns up to ``limit`` users ordered by ``(created_at, uuid)``.
+
+        ``text`` matches, case-insensitively, the start of the first name,
+        last name or email. ``after`` is the ``(created_at, uuid)`` of the last
+        user of the previous page; only users strictly after it are returned.
+        """
+        ...
+
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        """
+        Streams every user ordered by ``(created_at, uuid)``.
+
+        Implemented as an async generator that holds at most about
+        ``batch_size`` rows in memory at a time, whatever the table size.
+        """
+        ...
+
+    @abstractmethod
+    def iter_emails(self, batch_size: int = 10000) -> AsyncIterator[str]:
+        """
+        Streams the email of every user, in no particular order.
+
+        Like ``iter_all`` it holds about ``batch_size`` rows in memory, but
+        loads a single column and builds no entities.
+        """
+        ...
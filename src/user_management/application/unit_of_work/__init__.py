@@ -0,0 +1,5 @@
+from .unit_of_work import UnitOfWork
+
+__all__ = [
+    "UnitOfWork"
+]
@@ -0,0 +1,54 @@
+"""
+Unit of Work abstraction for the application layer.
+
+A use case runs one business operation inside a UnitOfWork. Repositories
+reached through the unit of work only stage changes; nothing is persisted
+until the use case calls ``commit()``, so every operation costs a single
+commit and either all of its changes are stored or none are.
+
+Usage:
+    async with self.unit_of_work as uow:
+        await uow.users.save(user)
+        await uow.patient_profiles.save(profile)
+        await uow.commit()
+
+Leaving the block without committing, or because of an exception, rolls
+back everything staged inside it.
+"""
+from abc import ABC, abstractmethod
+
+from user_management.application.repositories import PatientProfileRepository, UserRepository
+
+
+class UnitOfWork(ABC):
+    """
+    Transaction boundary shared by the repositories of one business operation.
+
+    Attributes:
+        users: Repository staging User changes in this unit of work.
+        patient_profiles: Repository staging PatientProfile changes in this unit of work.
+    """
+
+    users: UserRepository
+    patient_profiles: PatientProfileRepository
+
+    async def __aenter__(self) -> 'UnitOfWork':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        # After a successful commit there is nothing left to roll back.
+        await self.rollback()
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """
+        Persists every change staged since the unit of work was entered.
+        """
+        ...
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """
+        Discards every change staged since the last commit.
+        """
+        ...
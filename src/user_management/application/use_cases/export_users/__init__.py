@@ -0,0 +1,5 @@
+from .use_case import ExportUsersUseCase
+
+__all__ = [
+    "ExportUsersUseCase"
+]
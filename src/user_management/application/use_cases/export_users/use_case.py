@@ -0,0 +1,38 @@
+"""
+Application service to stream every user, e.g. for compliance exports.
+
+Users are pulled from UserRepository.iter_all one batch at a time, so memory
+use stays constant however many users exist.
+"""
+from typing import AsyncContextManager, AsyncIterator, Callable
+
+from user_management.application.repositories import UserRepository
+from user_management.domain.entities import User
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class ExportUsersUseCase:
+    """
+    Streams all users ordered by creation time.
+
+    The repository is opened through ``repository_scope`` when iteration
+    starts and closed when it ends, because a streamed export outlives the
+    request handler that created the use case.
+    """
+
+    def __init__(self, repository_scope: Callable[[], AsyncContextManager[UserRepository]]):
+        """
+        Args:
+            repository_scope: Returns an async context manager yielding a UserRepository
+                              whose session stays open for the whole export.
+        """
+        self.repository_scope = repository_scope
+
+    async def execute(self, batch_size: int = DEFAULT_BATCH_SIZE) -> AsyncIterator[User]:
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        async with self.repository_scope() as user_repository:
+            async for user in user_repository.iter_all(batch_size):
+                yield user
@@ -0,0 +1,5 @@
+from .use_case import FindPatientProfileByUserUUIDUseCase
+
+__all__ = [
+    "FindPatientProfileByUserUUIDUseCase"
+]
@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from user_management.application.repositories import PatientProfileRepository
+from user_management.domain.entities import PatientProfile
+
+
+class FindPatientProfileByUserUUIDUseCase:
+    def __init__(self, patient_profile_repository: PatientProfileRepository):
+        self.patient_profile_repository = patient_profile_repository
+
+    async def execute(self, user_uuid: UUID) -> Optional[PatientProfile]:
+        return await self.patient_profile_repository.find_by_user_uuid(user_uuid)
+
+    async def last_modified(self, user_uuid: UUID) -> Optional[datetime]:
+        """
+        Returns when the patient profile was last modified, without loading it.
+
+        Used to answer conditional requests; None if the user has no profile.
+        """
+        return await self.patient_profile_repository.find_updated_at_by_user_uuid(user_uuid)
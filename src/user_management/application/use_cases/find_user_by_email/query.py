@@ -5,6 +5,8 @@ from pydantic import BaseModel, Field, field_validator
 from user_management.domain.exceptions import InvalidEmailError
 from user_management.domain.specifications.user import ValidEmailSpecification
 
+_valid_email = ValidEmailSpecification().compile()
+
 
 class FindUserByEmailQuery(BaseModel):
 
@@ -25,7 +27,7 @@ class FindUserByEmailQuery(BaseModel):
         Raises:
             InvalidEmailError: If the email does not meet the specification criteria.
         """
-        if not ValidEmailSpecification().is_satisfied_by(v):
+        if not _valid_email(v):
             raise InvalidEmailError(f"Invalid email: {v}")
         return v
 
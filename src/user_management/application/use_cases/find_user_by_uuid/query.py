@@ -6,6 +6,8 @@ from pydantic import BaseModel, Field, field_validator
 from user_management.domain.exceptions import InvalidUUIDError
 from user_management.domain.specifications.user import ValidUUIDSpecification
 
+_valid_uuid = ValidUUIDSpecification().compile()
+
 
 class FindUserByUUIDQuery(BaseModel):
     uuid: UUID = Field(..., description="Valid uuid for the user")
@@ -13,7 +15,7 @@ class FindUserByUUIDQuery(BaseModel):
     @field_validator('uuid')
     @classmethod
     def validate_uuid(cls, v: str) -> str:
-        if not ValidUUIDSpecification().is_satisfied_by(v):
+        if not _valid_uuid(v):
             raise InvalidUUIDError(f"Invalid uuid: {v}")
         return v
 
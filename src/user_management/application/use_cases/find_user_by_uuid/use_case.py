@@ -1,4 +1,5 @@
 import logging
+from datetime import datetime
 from typing import Optional
 
 from user_management.application.repositories import UserRepository
@@ -14,3 +15,11 @@ class FindUserByUUIDUseCase:
     async def execute(self, query: FindUserByUUIDQuery) -> Optional[User]:
         user = await self.user_repository.find_by_uuid(query.uuid)
         return user
+
+    async def last_modified(self, query: FindUserByUUIDQuery) -> Optional[datetime]:
+        """
+        Returns when the user was last modified, without loading the user.
+
+        Used to answer conditional requests; None if there is no such user.
+        """
+        return await self.user_repository.find_updated_at(query.uuid)
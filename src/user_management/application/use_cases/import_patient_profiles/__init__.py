@@ -0,0 +1,12 @@
+from .use_case import ImportPatientProfilesUseCase
+from .records import MalformedRecord, RejectedRow
+from .result import ImportPatientProfilesResult
+from .validation import validate_patient_profile_rows
+
+__all__ = [
+    "ImportPatientProfilesUseCase",
+    "MalformedRecord",
+    "RejectedRow",
+    "ImportPatientProfilesResult",
+    "validate_patient_profile_rows"
+]
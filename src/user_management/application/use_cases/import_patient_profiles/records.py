@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import Any, Mapping, Union
+
+
+@dataclass(frozen=True)
+class MalformedRecord:
+    """
+    A source record that could not be parsed into fields (e.g. invalid JSON).
+
+    Readers emit it in place of the row so the pipeline can reject it with a
+    reason instead of aborting the whole import.
+    """
+    raw: str
+    reason: str
+
+
+Record = Union[Mapping[str, Any], MalformedRecord]
+
+
+@dataclass(frozen=True)
+class RejectedRow:
+    """
+    A row left out of the import, with the line it started on and why.
+    """
+    line: int
+    reason: str
+    record: Record
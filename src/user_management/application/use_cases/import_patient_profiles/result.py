@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ImportPatientProfilesResult:
+    """
+    Running totals of a patient profile import.
+
+    The same object is reported as progress while the import runs and
+    returned as the final outcome.
+    """
+    rows_read: int = 0
+    imported: int = 0
+    rejected: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.rows_read / self.elapsed_seconds
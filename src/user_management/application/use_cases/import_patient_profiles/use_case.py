@@ -0,0 +1,178 @@
+"""
+Application service to bulk import patient profiles from a stream of rows.
+
+The pipeline has three stages that overlap:
+
+1. Rows are pulled from an async iterator, so the source (a file, an HTTP
+   request body) is parsed incrementally and never held in memory.
+2. Chunks of rows are validated by validate_patient_profile_rows, in a
+   process pool when an executor is given. At most ``max_in_flight`` chunks
+   are outstanding, which bounds memory and applies back-pressure to the reader.
+3. Valid profiles are written in batches of ``batch_size`` with multi-row
+   inserts, one unit of work (one commit) per batch.
+
+Rows that fail validation, reference an unknown user, duplicate a profile
+that already exists, or belong to a batch the database refused are handed
+to ``on_reject`` with a reason; the import itself carries on. Rejects are
+reported as each stage finds them, so rows refused by the database arrive
+after validation rejects of later rows: use the line number to correlate.
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import Executor
+from dataclasses import replace
+from typing import AsyncIterable, Callable, Deque, List, Optional, Tuple
+
+from user_management.application.unit_of_work import UnitOfWork
+from user_management.domain.entities import PatientProfile
+
+from .records import Record, RejectedRow
+from .result import ImportPatientProfilesResult
+from .validation import validate_patient_profile_rows
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_VALIDATION_CHUNK_SIZE = 500
+DEFAULT_MAX_IN_FLIGHT = 8
+
+PendingRow = Tuple[int, Record, PatientProfile]
+
+
+class ImportPatientProfilesUseCase:
+    """
+    Streams, validates and persists patient profile rows in bulk.
+    """
+
+    def __init__(self,
+                 unit_of_work: UnitOfWork,
+                 executor: Optional[Executor] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 validation_chunk_size: int = DEFAULT_VALIDATION_CHUNK_SIZE,
+                 max_in_flight: int = DEFAULT_MAX_IN_FLIGHT):
+        """
+        Initializes the use case.
+
+        Args:
+            unit_of_work: Unit of work entered once per inserted batch.
+            executor: Pool running the validation; rows are validated inline when None.
+            batch_size (int): Profiles inserted per transaction.
+            validation_chunk_size (int): Rows sent to a worker per task.
+            max_in_flight (int): Validation tasks outstanding at any time.
+        """
+        if min(batch_size, validation_chunk_size, max_in_flight) < 1:
+            raise ValueError("batch_size, validation_chunk_size and max_in_flight must be positive integers")
+        self.unit_of_work = unit_of_work
+        self.executor = executor
+        self.batch_size = batch_size
+        self.validation_chunk_size = validation_chunk_size
+        self.max_in_flight = max_in_flight
+
+    async def execute(self,
+                      records: AsyncIterable[Tuple[int, Record]],
+                      on_reject: Callable[[RejectedRow], None],
+                      on_progress: Optional[Callable[[ImportPatientProfilesResult], None]] = None,
+                      ) -> ImportPatientProfilesResult:
+        """
+        Runs the import to completion.
+
+        Args:
+            records: ``(line number, row)`` pairs in source order.
+            on_reject: Called once for every rejected row, in no particular order;
+                use the line number to correlate.
+            on_progress: Called with a snapshot of the totals after every inserted batch.
+
+        Returns:
+            ImportPatientProfilesResult: Final totals and throughput.
+        """
+        started = time.perf_counter()
+        result = ImportPatientProfilesResult()
+        in_flight: Deque[Tuple[List[Tuple[int, Record]], asyncio.Future]] = deque()
+        pending: List[PendingRow] = []
+
+        def reject(line: int, record: Record, reason: str) -> None:
+            result.rejected += 1
+            on_reject(RejectedRow(line=line, reason=reason, record=record))
+
+        async def collect_oldest() -> None:
+            chunk, future = in_flight.popleft()
+            for (line, record), (profile, reason) in zip(chunk, await future):
+                if profile is None:
+                    reject(line, record, reason)
+                else:
+                    pending.append((line, record, profile))
+            while len(pending) >= self.batch_size:
+                await self._persist(pending[:self.batch_size], result, reject)
+                del pending[:self.batch_size]
+                self._report(result, started, on_progress)
+
+        chunk: List[Tuple[int, Record]] = []
+        async for line, record in records:
+            result.rows_read += 1
+            chunk.append((line, record))
+            if len(chunk) >= self.validation_chunk_size:
+                in_flight.append((chunk, self._validate(chunk)))
+                chunk = []
+                if len(in_flight) >= self.max_in_flight:
+                    await collect_oldest()
+
+        if chunk:
+            in_flight.append((chunk, self._validate(chunk)))
+        while in_flight:
+            await collect_oldest()
+        if pending:
+            await self._persist(pending, result, reject)
+
+        self._report(result, started, on_progress)
+        return result
+
+    def _validate(self, chunk: List[Tuple[int, Record]]) -> asyncio.Future:
+        records = [record for _, record in chunk]
+        loop = asyncio.get_running_loop()
+        if self.executor is not None:
+            return loop.run_in_executor(self.executor, validate_patient_profile_rows, records)
+
+        future = loop.create_future()
+        future.set_result(validate_patient_profile_rows(records))
+        return future
+
+    async def _persist(self, batch: List[PendingRow], result: ImportPatientProfilesResult,
+                       reject: Callable[[int, Record, str], None]) -> None:
+        async with self.unit_of_work as uow:
+            user_uuids = [profile.user_uuid for _, _, profile in batch]
+            known_users = await uow.users.find_existing_uuids(user_uuids)
+            existing_profiles = await uow.patient_profiles.find_existing_user_uuids(user_uuids)
+
+            accepted: List[PendingRow] = []
+            batch_uuids = set()
+            for line, record, profile in batch:
+                if profile.user_uuid not in known_users:
+                    reject(line, record, f"User not found: {profile.user_uuid}")
+                elif profile.user_uuid in existing_profiles or profile.user_uuid in batch_uuids:
+                    reject(line, record, f"Patient profile already exists for user: {profile.user_uuid}")
+                else:
+                    batch_uuids.add(profile.user_uuid)
+                    accepted.append((line, record, profile))
+
+            if not accepted:
+                return
+
+            try:
+                await uow.patient_profiles.save_many([profile for _, _, profile in accepted])
+                await uow.commit()
+            except Exception as e:
+                logger.error("Failed to persist patient profile batch of %d rows: %s", len(accepted), e, exc_info=True)
+                for line, record, _ in accepted:
+                    reject(line, record, "Failed to persist batch.")
+                return
+
+        result.imported += len(accepted)
+
+    @staticmethod
+    def _report(result: ImportPatientProfilesResult, started: float,
+                on_progress: Optional[Callable[[ImportPatientProfilesResult], None]]) -> None:
+        result.elapsed_seconds = time.perf_counter() - started
+        if on_progress is not None:
+            on_progress(replace(result))
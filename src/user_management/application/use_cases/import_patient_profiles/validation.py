@@ -0,0 +1,53 @@
+"""
+Row validation for the patient profile import, runnable in worker processes.
+
+validate_patient_profile_rows is a module-level function taking and returning
+only picklable values, so it can be submitted to a ProcessPoolExecutor.
+Each row goes through RegisterPatientProfileCommand, i.e. the same
+patient_profile specifications as ``POST /patient/``, and then
+PatientProfileFactory. Valid rows come back as PatientProfile entities,
+which unpickle without running their validation again.
+"""
+from typing import List, Optional, Sequence, Tuple
+
+from pydantic import ValidationError
+
+from user_management.application.use_cases.import_patient_profiles.records import MalformedRecord, Record
+from user_management.application.use_cases.register_patient_profile.command import RegisterPatientProfileCommand
+from user_management.domain.entities import PatientProfile
+from user_management.domain.factories import PatientProfileFactory
+
+ValidationOutcome = Tuple[Optional[PatientProfile], Optional[str]]
+
+
+def validate_patient_profile_rows(records: Sequence[Record]) -> List[ValidationOutcome]:
+    """
+    Validates a chunk of import rows.
+
+    Args:
+        records: Parsed rows (field name to value) or MalformedRecord placeholders.
+
+    Returns:
+        List[ValidationOutcome]: For every record, in order, either
+        ``(profile, None)`` or ``(None, reason)``.
+    """
+    outcomes = []
+    for record in records:
+        if isinstance(record, MalformedRecord):
+            outcomes.append((None, record.reason))
+            continue
+        try:
+            command = RegisterPatientProfileCommand.model_validate(record)
+            outcomes.append((PatientProfileFactory.create_from_command(command), None))
+        except Exception as e:
+            outcomes.append((None, _describe(e)))
+    return outcomes
+
+
+def _describe(error: Exception) -> str:
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in detail['loc']) or 'row'}: {detail['msg']}"
+            for detail in error.errors()
+        )
+    return str(error) or error.__class__.__name__
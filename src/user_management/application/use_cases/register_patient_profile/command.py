@@ -1,23 +1,26 @@
 # src/user_management/application/use_cases/register_patient_profile/register_patient_profile_command.py
 
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
-from user_management.domain.specifications.patient_profile import (
-    ValidEmergencyContactNameSpecification,
-    ValidEmergencyContactPhoneSpecification,
-    ValidInsuranceInfoSpecification,
-    ValidPreferredLanguageSpecification,
-    ValidMedicalHistorySummarySpecification,
-)
 from user_management.domain.exceptions import (
-    InvalidPatientProfileEmergencyContactNameError,
-    InvalidPatientProfileEmergencyContactPhoneError,
     InvalidPatientProfileInsuranceInfoError,
     InvalidPatientProfilePreferredLanguageError,
-    InvalidPatientProfileMedicalHistorySummaryError,
 )
+from user_management.domain.validation import ValidatedFields
+
+# Checked natively by pydantic-core; each pattern is as strict as the named
+# specification or stricter (no lookarounds, ``$`` only at the very end).
+_NAME_PATTERN = r"^[A-Za-z]+(?: [A-Za-z]+)*$"  # ValidEmergencyContactNameSpecification
+_PHONE_E164_PATTERN = r"^\+[1-9][0-9]{1,14}$"  # ValidEmergencyContactPhoneSpecification
+_SUMMARY_PATTERN = r"^[A-Za-zÀ-ÿ\s,.;:()-]+$"  # ValidMedicalHistorySummarySpecification
+# Allowed characters with at least one letter; the length of the stripped value
+# (3 to 100) is checked in Python. ValidInsuranceInfoSpecification and
+# ValidPreferredLanguageSpecification.
+_LABEL_PATTERN = r"^[A-Za-zÀ-ÿ0-9\s\-'.]*[A-Za-zÀ-ÿ][A-Za-zÀ-ÿ0-9\s\-'.]*$"
+_LABEL_MIN_LENGTH, _LABEL_MAX_LENGTH = 3, 100
 
 
 class RegisterPatientProfileCommand(BaseModel):
@@ -27,49 +30,56 @@ class RegisterPatientProfileCommand(BaseModel):
     Contains all required data to create a PatientProfile entity.
     Validated automatically by Pydantic using domain specifications.
     Timestamps (created_at, updated_at) are generated by the system.
+
+    Once validated it carries a ValidatedFields token (``validated_fields``);
+    PatientProfileFactory then only checks the timestamps.
     """
 
     user_uuid: UUID = Field(..., description="UUID of the associated User entity (must already exist).")
-    emergency_contact_name: str = Field(..., description="Full name of the emergency contact.")
-    emergency_contact_phone: str = Field(..., description="Emergency contact phone in E.164 format.")
-    insurance_info: str = Field(..., description="Name of the insurance provider.")
-    preferred_language: str = Field(..., description="Preferred language in BCP 47 format (e.g., 'pt-BR').")
-    medical_history_summary: str = Field(..., description="Brief, plain-text medical history summary.")
+    emergency_contact_name: str = Field(..., pattern=_NAME_PATTERN,
+                                        description="Full name of the emergency contact.")
+    emergency_contact_phone: str = Field(..., pattern=_PHONE_E164_PATTERN,
+                                         description="Emergency contact phone in E.164 format.")
+    insurance_info: str = Field(..., pattern=_LABEL_PATTERN, description="Name of the insurance provider.")
+    preferred_language: str = Field(..., pattern=_LABEL_PATTERN,
+                                    description="Preferred language in BCP 47 format (e.g., 'pt-BR').")
+    medical_history_summary: str = Field(..., pattern=_SUMMARY_PATTERN,
+                                         description="Brief, plain-text medical history summary.")
 
-    @field_validator('emergency_contact_name')
-    @classmethod
-    def validate_emergency_contact_name(cls, v: str) -> str:
-        if not ValidEmergencyContactNameSpecification().is_satisfied_by(v):
-            raise InvalidPatientProfileEmergencyContactNameError(f"Invalid emergency contact name: {v}")
-        return v
-
-    @field_validator('emergency_contact_phone')
-    @classmethod
-    def validate_emergency_contact_phone(cls, v: str) -> str:
-        if not ValidEmergencyContactPhoneSpecification().is_satisfied_by(v):
-            raise InvalidPatientProfileEmergencyContactPhoneError(f"Invalid emergency contact phone: {v}")
-        return v
+    # Accessed through __pydantic_private__, see RegisterUserCommand.
+    _validated_fields: Optional[ValidatedFields] = PrivateAttr(default=None)
 
     @field_validator('insurance_info')
     @classmethod
     def validate_insurance_info(cls, v: str) -> str:
-        if not ValidInsuranceInfoSpecification().is_satisfied_by(v):
+        if not _LABEL_MIN_LENGTH <= len(v.strip()) <= _LABEL_MAX_LENGTH:
             raise InvalidPatientProfileInsuranceInfoError(f"Invalid insurance info: {v}")
         return v
 
     @field_validator('preferred_language')
     @classmethod
     def validate_preferred_language(cls, v: str) -> str:
-        if not ValidPreferredLanguageSpecification().is_satisfied_by(v):
+        if not _LABEL_MIN_LENGTH <= len(v.strip()) <= _LABEL_MAX_LENGTH:
             raise InvalidPatientProfilePreferredLanguageError(f"Invalid preferred language: {v}")
         return v
 
-    @field_validator('medical_history_summary')
-    @classmethod
-    def validate_medical_history_summary(cls, v: str) -> str:
-        if not ValidMedicalHistorySummarySpecification().is_satisfied_by(v):
-            raise InvalidPatientProfileMedicalHistorySummaryError(f"Invalid medical history summary: {v}")
-        return v
+    @model_validator(mode="after")
+    def issue_validated_fields(self) -> "RegisterPatientProfileCommand":
+        """Records the values that passed the checks above (never run by ``model_construct``)."""
+        self.__pydantic_private__["_validated_fields"] = ValidatedFields(
+            user_uuid=self.user_uuid,
+            emergency_contact_name=self.emergency_contact_name,
+            emergency_contact_phone=self.emergency_contact_phone,
+            insurance_info=self.insurance_info,
+            preferred_language=self.preferred_language,
+            medical_history_summary=self.medical_history_summary,
+        )
+        return self
+
+    @property
+    def validated_fields(self) -> Optional[ValidatedFields]:
+        """The fields checked with the PatientProfile specifications, or None for an unvalidated command."""
+        return self.__pydantic_private__["_validated_fields"]
 
     class Config:
         from_attributes = True
@@ -1,15 +1,16 @@
 from typing import Any, Dict
 
 
+from user_management.application.unit_of_work import UnitOfWork
 from user_management.domain.factories import PatientProfileFactory
 
 
 class RegisterPatientProfileUseCase:
 
 
-    def __init__(self, patient_profile_repository): # Type hint: UserRepository
+    def __init__(self, unit_of_work: UnitOfWork):
 
-        self.patient_profile_repository = patient_profile_repository
+        self.unit_of_work = unit_of_work
 
 
     async def execute(self, command):
@@ -25,7 +26,9 @@ class RegisterPatientProfileUseCase:
 
         # --- STEP 2: Persist the user using the injected repository ---
         try:
-            await self.patient_profile_repository.save(patient)
+            async with self.unit_of_work as uow:
+                await uow.patient_profiles.save(patient)
+                await uow.commit()
         except Exception as e:
             # Re-raise repository errors (e.g., database connection issues)
             raise
@@ -7,24 +7,26 @@ those generated internally (uuid, created_at, updated_at).
 """
 
 from datetime import date
-from pydantic import BaseModel, Field, field_validator
+from typing import Optional
+
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
 from user_management.domain.enums import UserRole
 # Importing domain specifications and exceptions for reuse
-from user_management.domain.specifications.user import (
-    ValidNameSpecification,
-    ValidEmailSpecification,
-    ValidPhoneE164Specification,
-    ValidDateOfBirthSpecification,
-    ValidUserRoleSpecification,
-)
-from user_management.domain.exceptions import (
-    InvalidNameError,
-    InvalidEmailError,
-    InvalidPhoneNumberError,
-    InvalidDateOfBirthError,
-    InvalidUserRoleError,
-)
+from user_management.domain.specifications.user import ValidDateOfBirthSpecification
+from user_management.domain.exceptions import InvalidDateOfBirthError
+from user_management.domain.validation import ValidatedFields
+
+_valid_date_of_birth = ValidDateOfBirthSpecification().compile()
+
+# Checked natively by pydantic-core instead of calling the specifications from
+# Python validators. Its regex engine has no lookarounds and its ``$`` only
+# matches at the very end, so each pattern is as strict as the specification
+# named next to it or stricter: a value the command accepts is never rejected
+# by the entity, which is what lets it issue ValidatedFields.
+_NAME_PATTERN = r"^[A-Za-z]+(?: [A-Za-z]+)*$"  # ValidNameSpecification
+_EMAIL_PATTERN = r"^[^ @.]+(?:\.[^ @.]+)*@[^ @.]+(?:\.[^ @.]+)+$"  # ValidEmailSpecification
+_PHONE_E164_PATTERN = r"^\+[1-9][0-9]{1,14}$"  # ValidPhoneE164Specification
 
 
 class RegisterUserCommand(BaseModel):
@@ -34,81 +36,34 @@ class RegisterUserCommand(BaseModel):
     Contains all data required to instantiate a User entity, validated by Pydantic
     and leveraging domain specifications for consistency.
     Internal fields like uuid, created_at, updated_at are generated by the system.
+
+    Once validated it carries a ValidatedFields token (``validated_fields``), so
+    UserFactory does not check the same fields again.
     """
 
     # --- User Identity and Contact ---
-    email: str = Field(..., description="Valid email address for the user")
-    first_name: str = Field(..., description="User's first name")
-    last_name: str = Field(..., description="User's last name")
-    phone: str = Field(..., description="User's phone number in E.164 format")
+    email: str = Field(..., pattern=_EMAIL_PATTERN, description="Valid email address for the user")
+    first_name: str = Field(..., pattern=_NAME_PATTERN, description="User's first name")
+    last_name: str = Field(..., pattern=_NAME_PATTERN, description="User's last name")
+    phone: str = Field(..., pattern=_PHONE_E164_PATTERN, description="User's phone number in E.164 format")
 
     # --- Personal Details ---
     date_of_birth: date = Field(..., description="User's date of birth (YYYY-MM-DD)")
 
     # --- Access Control ---
+    # Parsing into the enum is all ValidUserRoleSpecification asks for.
     user_role: UserRole = Field(..., description="String representation of the user's role (e.g., PATIENT, DOCTOR)")
 
     # --- Security ---
-    password: str = Field(..., description="User's chosen password")
-
-    # --- Validators ---
-    @field_validator('first_name', 'last_name')
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        """
-        Validate first and last names using domain specification.
-
-        Args:
-            v (str): The name value to validate.
-
-        Returns:
-            str: The validated name.
-
-        Raises:
-            InvalidNameError: If the name does not meet the specification criteria.
-        """
-        if not ValidNameSpecification().is_satisfied_by(v):
-            raise InvalidNameError(f"Invalid name: {v}")
-        return v
-
-    @field_validator('email')
-    @classmethod
-    def validate_email(cls, v: str) -> str:
-        """
-        Validate email address using domain specification.
-
-        Args:
-            v (str): The email value to validate.
-
-        Returns:
-            str: The validated email.
-
-        Raises:
-            InvalidEmailError: If the email does not meet the specification criteria.
-        """
-        if not ValidEmailSpecification().is_satisfied_by(v):
-            raise InvalidEmailError(f"Invalid email: {v}")
-        return v
-
-    @field_validator('phone')
-    @classmethod
-    def validate_phone(cls, v: str) -> str:
-        """
-        Validate phone number using domain specification.
-
-        Args:
-            v (str): The phone number value to validate.
+    # Strength rules are enforced by UserCredentials.create.
+    password: str = Field(..., min_length=8, description="User's chosen password")
 
-        Returns:
-            str: The validated phone number.
-
-        Raises:
-            InvalidPhoneNumberError: If the phone number does not meet the specification criteria.
-        """
-        if not ValidPhoneE164Specification().is_satisfied_by(v):
-            raise InvalidPhoneNumberError(f"Invalid phone number: {v}")
-        return v
+    # Read and written through __pydantic_private__: plain attribute access to a
+    # private attribute goes through BaseModel.__getattr__/__setattr__, which
+    # costs more than the checks the token saves.
+    _validated_fields: Optional[ValidatedFields] = PrivateAttr(default=None)
 
+    # --- Validators ---
     @field_validator('date_of_birth')
     @classmethod
     def validate_date_of_birth(cls, v: date) -> date:
@@ -124,54 +79,27 @@ class RegisterUserCommand(BaseModel):
         Raises:
             InvalidDateOfBirthError: If the date of birth does not meet the specification criteria.
         """
-        if not ValidDateOfBirthSpecification().is_satisfied_by(v):
+        if not _valid_date_of_birth(v):
             raise InvalidDateOfBirthError(f"Invalid date of birth: {v}")
         return v
 
-    @field_validator('user_role')
-    @classmethod
-    def validate_user_role(cls, v: str) -> str:
-        """
-        Validate user role string against known roles.
-
-        Args:
-            v (str): The user role string to validate.
-
-        Returns:
-            str: The validated and normalized user role string.
-
-        Raises:
-            InvalidUserRoleError: If the user role is not a recognized value.
-        """
-        # Normalize input first to check against specification
-        # normalized_v = v.upper()
-        if not ValidUserRoleSpecification().is_satisfied_by(v):
-             raise InvalidUserRoleError(f"Invalid user role: {v}")
-        return v # Return the normalized version
-
-    @field_validator('password')
-    @classmethod
-    def validate_password(cls, v: str) -> str:
+    @model_validator(mode="after")
+    def issue_validated_fields(self) -> "RegisterUserCommand":
         """
-        Basic password validation.
+        Records the values that passed the checks above.
 
-        Note: More complex validation might occur in UserCredentials.create.
-
-        Args:
-            v (str): The password value to validate.
-
-        Returns:
-            str: The validated password.
-
-        Raises:
-            ValueError: If the password is too short. (Consider custom exception if needed)
+        Runs only after every field validated, and not for ``model_construct``,
+        so a command built without validation carries no token.
         """
-        if len(v) < 8:
-            # You can also define and use a custom exception like InvalidPasswordError
-            # if it exists in your domain.
-            # raise InvalidPasswordError("Password must be at least 8 characters long.")
-            raise ValueError("Password must be at least 8 characters long.")
-        return v
+        self.__pydantic_private__["_validated_fields"] = ValidatedFields(
+            email=self.email, first_name=self.first_name, last_name=self.last_name, phone=self.phone,
+            date_of_birth=self.date_of_birth, user_role=self.user_role)
+        return self
+
+    @property
+    def validated_fields(self) -> Optional[ValidatedFields]:
+        """The fields checked with the User specifications, or None for an unvalidated command."""
+        return self.__pydantic_private__["_validated_fields"]
 
     class Config:
         """
@@ -6,11 +6,11 @@ Delegates validation and state management to the domain via UserFactory.
 """
 
 
-from typing import Any, Dict
-
-# Assume UserRepository is correctly defined elsewhere and imported
-# from user_management.application.repositories.user_repository import UserRepository
+from typing import Any, Dict, Optional
 
+from user_management.application.registered_emails import RegisteredEmailFilter
+from user_management.application.unit_of_work import UnitOfWork
+from user_management.domain.exceptions import EmailAlreadyRegisteredError
 from user_management.domain.factories import UserFactory
 
 
@@ -22,16 +22,20 @@ class RegisterUserUseCase:
     Delegates validation and state management to the domain via UserFactory.
     """
 
-    def __init__(self, user_repository): # Type hint: UserRepository
+    def __init__(self, unit_of_work: UnitOfWork, email_filter: Optional[RegisteredEmailFilter] = None):
         """
-        Initializes the use case with a user repository.
+        Initializes the use case with a unit of work.
 
         Args:
-            user_repository: Repository to persist the user.
-                             This should be an instance of a class implementing
-                             the UserRepository interface/protocol.
+            unit_of_work: Unit of work whose ``users`` repository stages the
+                          new user and whose ``commit`` persists it.
+            email_filter: Optional in-memory filter of registered emails. When
+                          it reports an email as possibly registered, one
+                          indexed lookup confirms it before anything is written;
+                          when it reports it as new, the lookup is skipped.
         """
-        self.user_repository = user_repository
+        self.unit_of_work = unit_of_work
+        self.email_filter = email_filter
 
 
     async def execute(self, command):
@@ -40,8 +44,9 @@ class RegisterUserUseCase:
 
         This method orchestrates the process:
         1. Delegates the creation of the User entity to the UserFactory.
-        2. Saves the created user using the injected repository.
-        3. Returns the persisted user instance.
+        2. Rejects emails the email filter flags and a lookup confirms as taken.
+        3. Stages the user in the unit of work and commits it once.
+        4. Returns the persisted user instance.
 
         Args:
             command: A validated RegisterUserCommand containing user registration data.
@@ -52,6 +57,7 @@ class RegisterUserUseCase:
         Raises:
             ValueError: If role is invalid (delegated from UserFactory).
             InvalidPasswordError: If password doesn't meet requirements (delegated from UserFactory/UserCredentials).
+            EmailAlreadyRegisteredError: If another user already has the email.
             # Other exceptions might propagate from the repository (e.g., database errors).
         """
 
@@ -65,12 +71,21 @@ class RegisterUserUseCase:
             # Re-raise any domain-specific or validation errors encountered during creation
             raise
 
-        # --- STEP 2: Persist the user using the injected repository ---
+        # --- STEP 2: Persist the user in a single commit ---
         try:
-            await self.user_repository.save(user)
+            async with self.unit_of_work as uow:
+                if self.email_filter is not None and self.email_filter.might_be_registered(user.email):
+                    if await uow.users.find_by_email(user.email) is not None:
+                        raise EmailAlreadyRegisteredError(f"Email already registered: {user.email}")
+
+                await uow.users.save(user)
+                await uow.commit()
         except Exception as e:
             # Re-raise repository errors (e.g., database connection issues)
             raise
 
+        if self.email_filter is not None:
+            self.email_filter.add(user.email)
+
         # --- STEP 3: Return the created and persisted user ---
         return user
@@ -0,0 +1,5 @@
+
+from .result import BatchItemStatus, BatchItemResult, RegisterUsersBatchResult
+from .use_case import RegisterUsersBatchUseCase
+
+__all__ = ["BatchItemStatus", "BatchItemResult", "RegisterUsersBatchResult", "RegisterUsersBatchUseCase"]
@@ -0,0 +1,52 @@
+"""
+Result objects returned by the bulk user registration use case.
+
+Each submitted item gets exactly one BatchItemResult, in submission order,
+so callers can match outcomes back to their input rows by index.
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List, Optional
+from uuid import UUID
+
+
+class BatchItemStatus(Enum):
+    """
+    Outcome of a single item in a registration batch.
+
+    CREATED items were persisted, REJECTED items failed command or domain
+    validation, DUPLICATE items use an email that is already registered or
+    appears earlier in the batch, and FAILED items were valid but their chunk
+    could not be stored.
+    """
+    CREATED = "CREATED"
+    REJECTED = "REJECTED"
+    DUPLICATE = "DUPLICATE"
+    FAILED = "FAILED"
+
+
+@dataclass
+class BatchItemResult:
+    index: int
+    status: BatchItemStatus
+    uuid: Optional[UUID] = None
+    email: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class RegisterUsersBatchResult:
+    items: List[BatchItemResult] = field(default_factory=list)
+    chunk_size: int = 0
+    elapsed_seconds: float = 0.0
+
+    def count(self, status: BatchItemStatus) -> int:
+        return sum(1 for item in self.items if item.status is status)
+
+    @property
+    def users_per_second(self) -> float:
+        """Persisted users per second of wall-clock time spent in the use case."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.count(BatchItemStatus.CREATED) / self.elapsed_seconds
@@ -0,0 +1,162 @@
+"""
+Application service to register many users in one request.
+
+Each payload is validated as a RegisterUserCommand and turned into a User by
+UserFactory, exactly like the single registration flow. Valid users are then
+persisted in chunks through UserRepository.save_many, one unit of work (and
+one commit) per chunk, so a bad chunk never discards the work of the chunks
+around it.
+
+Before a chunk is inserted, its emails are checked against the registered
+ones with a single query (only the emails the registered email filter flags,
+when one is configured). Users whose email is taken are reported as
+DUPLICATE and the rest of the chunk is stored.
+"""
+
+import logging
+import time
+from typing import Any, List, Mapping, Optional, Sequence, Tuple
+
+from user_management.application.registered_emails import RegisteredEmailFilter
+from user_management.application.unit_of_work import UnitOfWork
+from user_management.application.use_cases.register_user import RegisterUserCommand
+from user_management.domain.entities import User
+from user_management.domain.exceptions import EmailAlreadyRegisteredError
+from user_management.domain.factories import UserFactory
+
+from .result import BatchItemResult, BatchItemStatus, RegisterUsersBatchResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+class RegisterUsersBatchUseCase:
+    """
+    Application service to register a batch of users.
+
+    Produces one result per submitted item and never aborts the whole batch
+    because of a single invalid row.
+    """
+
+    def __init__(self, unit_of_work: UnitOfWork, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 email_filter: Optional[RegisteredEmailFilter] = None):
+        """
+        Initializes the use case.
+
+        Args:
+            unit_of_work: Unit of work entered once per chunk.
+            chunk_size (int): Default number of users persisted per transaction.
+            email_filter: Optional filter of registered emails, updated with every committed chunk.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        self.unit_of_work = unit_of_work
+        self.chunk_size = chunk_size
+        self.email_filter = email_filter
+
+    async def execute(self, payloads: Sequence[Mapping[str, Any]], chunk_size: int = None) -> RegisterUsersBatchResult:
+        """
+        Validates, creates and persists every payload in the batch.
+
+        Args:
+            payloads: Raw registration payloads, each shaped like a RegisterUserCommand.
+            chunk_size (int, optional): Overrides the default chunk size for this call.
+
+        Returns:
+            RegisterUsersBatchResult: Per-item outcomes plus timing information.
+        """
+        chunk_size = chunk_size or self.chunk_size
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+
+        started = time.perf_counter()
+        results: List[BatchItemResult] = []
+        pending: List[Tuple[BatchItemResult, User]] = []
+        seen_emails = set()
+
+        for index, payload in enumerate(payloads):
+            try:
+                command = RegisterUserCommand.model_validate(payload)
+                user = UserFactory.create_from_command(command)
+            except Exception as e:
+                results.append(BatchItemResult(index=index, status=BatchItemStatus.REJECTED, error=str(e)))
+                continue
+
+            email_key = user.email.lower()
+            if email_key in seen_emails:
+                results.append(BatchItemResult(index=index, status=BatchItemStatus.DUPLICATE, email=user.email,
+                                               error=f"Duplicate email in batch: {user.email}"))
+                continue
+            seen_emails.add(email_key)
+
+            item = BatchItemResult(index=index, status=BatchItemStatus.CREATED, uuid=user.uuid, email=user.email)
+            results.append(item)
+            pending.append((item, user))
+
+            if len(pending) >= chunk_size:
+                await self._persist_chunk(pending)
+                pending = []
+
+        if pending:
+            await self._persist_chunk(pending)
+
+        return RegisterUsersBatchResult(
+            items=results,
+            chunk_size=chunk_size,
+            elapsed_seconds=time.perf_counter() - started,
+        )
+
+    async def _persist_chunk(self, chunk: List[Tuple[BatchItemResult, User]]) -> None:
+        # A second attempt covers an email registered by another request (or worker, unknown to this
+        # worker's email filter) between the check and the insert; it checks every email.
+        for attempt in range(2):
+            try:
+                async with self.unit_of_work as uow:
+                    chunk = await self._skip_registered(uow, chunk, use_filter=attempt == 0)
+                    if chunk:
+                        await uow.users.save_many([user for _, user in chunk])
+                    await uow.commit()
+                break
+            except EmailAlreadyRegisteredError as e:
+                if attempt == 0:
+                    logger.warning("Registration chunk of %d users hit an email registered concurrently; "
+                                   "checking again: %s", len(chunk), e)
+                    continue
+                self._mark_failed(chunk, e)
+                return
+            except Exception as e:
+                self._mark_failed(chunk, e)
+                return
+
+        if self.email_filter is not None:
+            for _, user in chunk:
+                self.email_filter.add(user.email)
+
+    async def _skip_registered(self, uow: UnitOfWork, chunk: List[Tuple[BatchItemResult, User]],
+                               use_filter: bool = True) -> List[Tuple[BatchItemResult, User]]:
+        """Marks the users whose email is already registered as DUPLICATE and returns the others."""
+        emails = [user.email for _, user in chunk]
+        if use_filter and self.email_filter is not None:
+            emails = [email for email in emails if self.email_filter.might_be_registered(email)]
+        registered = await uow.users.find_registered_emails(emails) if emails else set()
+        if not registered:
+            return chunk
+
+        remaining = []
+        for item, user in chunk:
+            if user.email.lower() in registered:
+                item.status = BatchItemStatus.DUPLICATE
+                item.uuid = None
+                item.error = f"Email already registered: {user.email}"
+            else:
+                remaining.append((item, user))
+        return remaining
+
+    @staticmethod
+    def _mark_failed(chunk: List[Tuple[BatchItemResult, User]], error: Exception) -> None:
+        logger.error("Failed to persist registration chunk of %d users: %s", len(chunk), error, exc_info=True)
+        for item, _ in chunk:
+            item.status = BatchItemStatus.FAILED
+            item.uuid = None
+            item.error = "Failed to persist batch chunk."
@@ -0,0 +1,11 @@
+from .use_case import SearchUsersUseCase, SearchUsersResult
+from .query import SearchUsersQuery
+from .cursor import encode_cursor, decode_cursor
+
+__all__ = [
+    "SearchUsersUseCase",
+    "SearchUsersResult",
+    "SearchUsersQuery",
+    "encode_cursor",
+    "decode_cursor"
+]
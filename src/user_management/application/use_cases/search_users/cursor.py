@@ -0,0 +1,52 @@
+"""
+Opaque keyset cursors for user search pagination.
+
+A cursor encodes the ``(created_at, uuid)`` of the last user on a page. The
+next page starts strictly after that key, so fetching page N costs the same
+as fetching page one no matter how deep the client has paged.
+"""
+import base64
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+
+
+def encode_cursor(created_at: datetime, uuid: UUID) -> str:
+    """
+    Encodes a keyset position as a URL-safe string.
+
+    Args:
+        created_at (datetime): Creation timestamp of the last returned user.
+        uuid (UUID): UUID of the last returned user.
+
+    Returns:
+        str: The opaque cursor.
+    """
+    raw = f"{created_at.isoformat()}|{uuid}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decodes a cursor produced by encode_cursor.
+
+    Args:
+        cursor (str): The opaque cursor.
+
+    Returns:
+        Tuple[datetime, UUID]: The keyset position to continue after.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at_raw, uuid_raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8").split("|")
+        created_at = datetime.fromisoformat(created_at_raw)
+        uuid = UUID(uuid_raw)
+    except Exception as e:
+        raise ValueError(f"Invalid search cursor: {cursor}") from e
+
+    if created_at.tzinfo is None:
+        raise ValueError(f"Invalid search cursor: {cursor}")
+    return created_at, uuid
@@ -0,0 +1,41 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+from user_management.domain.enums import UserRole, UserStatus
+
+
+class SearchUsersQuery(BaseModel):
+    """
+    Query to search users by name/email prefix, role and status.
+
+    Results are ordered by ``(created_at, uuid)`` and paged with an opaque
+    keyset cursor instead of an offset.
+    """
+
+    q: Optional[str] = Field(None, max_length=100, description="Prefix of first name, last name or email")
+    role: Optional[UserRole] = Field(None, description="Only return users with this role")
+    status: Optional[UserStatus] = Field(None, description="Only return users with this status")
+    limit: int = Field(20, ge=1, le=100, description="Maximum number of users per page")
+    cursor: Optional[str] = Field(None, description="Cursor returned by the previous page")
+
+    @field_validator('q')
+    @classmethod
+    def normalize_search_term(cls, v: Optional[str]) -> Optional[str]:
+        """
+        Strips the search term; blank terms disable text matching.
+        """
+        if v is None:
+            return None
+        v = v.strip()
+        return v or None
+
+    @field_validator('role', 'status', mode='before')
+    @classmethod
+    def normalize_enum_value(cls, v):
+        """
+        Accepts enum values case-insensitively (e.g. ``Doctor`` for ``DOCTOR``).
+        """
+        if isinstance(v, str):
+            return v.strip().upper()
+        return v
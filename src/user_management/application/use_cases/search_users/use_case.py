@@ -0,0 +1,37 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from user_management.application.repositories import UserRepository
+from user_management.application.use_cases.search_users.cursor import decode_cursor, encode_cursor
+from user_management.application.use_cases.search_users.query import SearchUsersQuery
+from user_management.domain.entities import User
+
+
+@dataclass
+class SearchUsersResult:
+    users: List[User] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+class SearchUsersUseCase:
+    def __init__(self, user_repository: UserRepository):
+        self.user_repository = user_repository
+
+    async def execute(self, query: SearchUsersQuery) -> SearchUsersResult:
+        after = decode_cursor(query.cursor) if query.cursor else None
+
+        # Fetch one extra row to learn whether another page exists without a COUNT query.
+        users = await self.user_repository.search(
+            text=query.q,
+            role=query.role,
+            status=query.status,
+            limit=query.limit + 1,
+            after=after,
+        )
+
+        if len(users) <= query.limit:
+            return SearchUsersResult(users=users)
+
+        page = users[:query.limit]
+        last = page[-1]
+        return SearchUsersResult(users=page, next_cursor=encode_cursor(last.created_at, last.uuid))
@@ -8,12 +8,24 @@ from user_management.domain.exceptions import InvalidPatientProfileUserUUIDError
     InvalidPatientProfileMedicalHistorySummaryError, InvalidPatientProfileCreatedAtError, \
     InvalidPatientProfileUpdatedAtError
 from user_management.domain.specifications.patient_profile import ValidEmergencyContactNameSpecification, \
-    ValidEmergencyContactPhoneSpecification, ValidInsuranceInfoSpecification, ValidPreferredLanguageSpecification, \
-    ValidMedicalHistorySummarySpecification
+    ValidEmergencyContactPhoneSpecification, ValidMedicalHistorySummarySpecification
 from user_management.domain.validation.patient_profile import PatientProfileValidator
+from user_management.domain.validation.patient_profile.patient_profile_validator import \
+    INSURANCE_INFO_SPECIFICATION, PREFERRED_LANGUAGE_SPECIFICATION
+from user_management.domain.validation.rehydration_sampling import get_rehydration_sampler
+from user_management.domain.validation.validated_fields import ValidatedFields
+
+_valid_emergency_contact_name = ValidEmergencyContactNameSpecification().compile()
+_valid_emergency_contact_phone = ValidEmergencyContactPhoneSpecification().compile()
+_valid_insurance_info = INSURANCE_INFO_SPECIFICATION.compile()
+_valid_preferred_language = PREFERRED_LANGUAGE_SPECIFICATION.compile()
+_valid_medical_history_summary = ValidMedicalHistorySummarySpecification().compile()
 
 
 class PatientProfile:
+    __slots__ = ("user_uuid", "emergency_contact_name", "emergency_contact_phone", "insurance_info",
+                 "preferred_language", "medical_history_summary", "created_at", "updated_at")
+
     def __init__(self,
                  user_uuid: UUID,
                  emergency_contact_name: str,
@@ -39,6 +51,57 @@ class PatientProfile:
         self.created_at = created_at
         self.updated_at = updated_at
 
+    @classmethod
+    def _rehydrate(cls,
+                   user_uuid: UUID,
+                   emergency_contact_name: str,
+                   emergency_contact_phone: str,
+                   insurance_info: str,
+                   preferred_language: str,
+                   medical_history_summary: str,
+                   created_at: datetime,
+                   updated_at: datetime,
+                   ) -> 'PatientProfile':
+        """
+        Internal factory that rebuilds a PatientProfile from trusted persisted data,
+        running PatientProfileValidator only for loads picked by the rehydration sampler.
+        """
+        if get_rehydration_sampler().should_validate():
+            PatientProfileValidator.validate(user_uuid, emergency_contact_name, emergency_contact_phone,
+                                             insurance_info, preferred_language, medical_history_summary,
+                                             created_at, updated_at)
+
+        profile = cls.__new__(cls)
+        profile.user_uuid = user_uuid
+        profile.emergency_contact_name = emergency_contact_name
+        profile.emergency_contact_phone = emergency_contact_phone
+        profile.insurance_info = insurance_info
+        profile.preferred_language = preferred_language
+        profile.medical_history_summary = medical_history_summary
+        profile.created_at = created_at
+        profile.updated_at = updated_at
+        return profile
+
+    @classmethod
+    def _create_validated(cls, validated: ValidatedFields, **fields) -> 'PatientProfile':
+        """
+        Internal factory for values an application command already checked.
+
+        ``validated`` holds the fields the command checked with the same
+        specifications, ``fields`` the others. Only the rules they do not cover
+        run: the remaining fields and updated_at >= created_at.
+
+        Raises:
+            DomainError: If a field outside the token or a cross-field invariant is invalid
+        """
+        values = {**fields, **validated.to_dict()}
+        PatientProfileValidator.validate_unverified(validated.names, **values)
+
+        profile = cls.__new__(cls)
+        for name, value in values.items():
+            setattr(profile, name, value)
+        return profile
+
 
     def update_medical_info(self,
                             emergency_contact_name: str,
@@ -47,19 +110,19 @@ class PatientProfile:
                             preferred_language: str,
                             medical_history_summary: str):
 
-        if not ValidEmergencyContactNameSpecification().is_satisfied_by(emergency_contact_name):
+        if not _valid_emergency_contact_name(emergency_contact_name):
             raise InvalidPatientProfileEmergencyContactNameError("Invalid emergency contact name")
 
-        if not ValidEmergencyContactPhoneSpecification().is_satisfied_by(emergency_contact_phone):
+        if not _valid_emergency_contact_phone(emergency_contact_phone):
             raise InvalidPatientProfileEmergencyContactPhoneError("Invalid emergency contact phone")
 
-        if not ValidInsuranceInfoSpecification().is_satisfied_by(insurance_info):
+        if not _valid_insurance_info(insurance_info):
             raise InvalidPatientProfileInsuranceInfoError("Invalid insurance info")
 
-        if not ValidPreferredLanguageSpecification().is_satisfied_by(preferred_language):
+        if not _valid_preferred_language(preferred_language):
             raise InvalidPatientProfilePreferredLanguageError("Invalid preferred language")
 
-        if not ValidMedicalHistorySummarySpecification().is_satisfied_by(medical_history_summary):
+        if not _valid_medical_history_summary(medical_history_summary):
             raise InvalidPatientProfileMedicalHistorySummaryError("Invalid medical history summary")
 
 
@@ -5,6 +5,8 @@
         security, and auditability.
 """
 from datetime import date, timedelta, datetime, timezone
+from functools import lru_cache
+from typing import FrozenSet
 import re
 from uuid import UUID
 
@@ -18,7 +20,9 @@ from user_management.domain.exceptions import (InvalidUUIDError,
                                                InvalidUserStatusError,
                                                InvalidCreatedAtError,
                                                InvalidUpdatedAtError, InvalidPasswordError)
+from user_management.domain.validation.rehydration_sampling import get_rehydration_sampler
 from user_management.domain.validation.user import UserValidator
+from user_management.domain.validation.validated_fields import ValidatedFields
 from user_management.domain.value_objects import UserCredentials
 
 from user_management.domain.specifications.user import (
@@ -28,6 +32,19 @@ from user_management.domain.specifications.user import (
     ValidDateOfBirthSpecification
 )
 
+_valid_name = ValidNameSpecification().compile()
+_valid_email = ValidEmailSpecification().compile()
+_valid_phone_e164 = ValidPhoneE164Specification().compile()
+_valid_date_of_birth = ValidDateOfBirthSpecification().compile()
+
+# UserValidator names two of its parameters after the enums rather than the attributes.
+_VALIDATOR_PARAMETERS = {"user_role": "role", "user_status": "status"}
+
+
+@lru_cache(maxsize=None)
+def _validator_parameters(names: FrozenSet[str]) -> FrozenSet[str]:
+    return frozenset(_VALIDATOR_PARAMETERS.get(name, name) for name in names)
+
 
 class User:
     """
@@ -37,6 +54,10 @@ class User:
         security, and auditability.
     """
 
+    # No per-instance __dict__: caches and exports hold users by the hundred thousand.
+    __slots__ = ("uuid", "email", "first_name", "last_name", "phone", "date_of_birth", "user_role",
+                 "user_status", "created_at", "updated_at", "_credentials")
+
     def __init__(self,
                  uuid: UUID,
                  email: str,
@@ -68,6 +89,73 @@ class User:
         self.updated_at = updated_at
         self._credentials = credentials
 
+    @classmethod
+    def _rehydrate(cls,
+                   uuid: UUID,
+                   email: str,
+                   first_name: str,
+                   last_name: str,
+                   phone: str,
+                   date_of_birth: date,
+                   user_role: UserRole,
+                   user_status: UserStatus,
+                   created_at: datetime,
+                   updated_at: datetime,
+                   credentials: UserCredentials
+                   ) -> 'User':
+        """
+        Internal factory that rebuilds a User from trusted persisted data.
+        Used during re-hydration from persistence (e.g., database read).
+
+        The values were validated before they were stored, so UserValidator
+        only runs for the fraction of loads picked by the rehydration sampler.
+
+        Raises:
+            DomainError: If a sampled row no longer satisfies the User invariants
+        """
+        if get_rehydration_sampler().should_validate():
+            UserValidator.validate(uuid, email, first_name, last_name,
+                                   phone, date_of_birth, user_role, user_status, created_at, updated_at)
+
+        user = cls.__new__(cls)
+        user.uuid = uuid
+        user.email = email
+        user.first_name = first_name
+        user.last_name = last_name
+        user.phone = phone
+        user.date_of_birth = date_of_birth
+        user.user_role = user_role
+        user.user_status = user_status
+        user.created_at = created_at
+        user.updated_at = updated_at
+        user._credentials = credentials
+        return user
+
+    @classmethod
+    def _create_validated(cls, validated: ValidatedFields, credentials: UserCredentials, **fields) -> 'User':
+        """
+        Internal factory for values an application command already checked.
+
+        ``validated`` holds the fields the command checked with the same
+        specifications, ``fields`` the others (uuid, status, timestamps...).
+        UserValidator only runs the rules they do not cover, plus any
+        cross-field rule.
+
+        Raises:
+            DomainError: If a field outside the token is invalid
+        """
+        values = {**fields, **validated.to_dict()}
+        UserValidator.validate_unverified(_validator_parameters(validated.names), values["uuid"], values["email"],
+                                          values["first_name"], values["last_name"], values["phone"],
+                                          values["date_of_birth"], values["user_role"], values["user_status"],
+                                          values["created_at"], values["updated_at"])
+
+        user = cls.__new__(cls)
+        for name, value in values.items():
+            setattr(user, name, value)
+        user._credentials = credentials
+        return user
+
 
     def is_password_valid(self, provided: str) -> bool:
         return self._credentials.is_valid(provided)
@@ -141,19 +229,19 @@ class User:
             InvalidDateOfBirthError: If date_of_birth fails specification
         """
         # Validate using specifications
-        if not ValidNameSpecification().is_satisfied_by(first_name):
+        if not _valid_name(first_name):
             raise InvalidNameError("First name does not satisfy naming rules")
 
-        if not ValidNameSpecification().is_satisfied_by(last_name):
+        if not _valid_name(last_name):
             raise InvalidNameError("Last name does not satisfy naming rules")
 
-        if not ValidEmailSpecification().is_satisfied_by(email):
+        if not _valid_email(email):
             raise InvalidEmailError("Email does not satisfy format rules")
 
-        if not ValidPhoneE164Specification().is_satisfied_by(phone):
+        if not _valid_phone_e164(phone):
             raise InvalidPhoneNumberError("Phone number does not follow E.164 format")
 
-        if not ValidDateOfBirthSpecification().is_satisfied_by(date_of_birth):
+        if not _valid_date_of_birth(date_of_birth):
             raise InvalidDateOfBirthError("Date of birth is not valid")
 
         # Apply changes
@@ -18,6 +18,7 @@ from .user import (
     InvalidUserStatusError,
     InvalidCreatedAtError,
     InvalidUpdatedAtError,
+    EmailAlreadyRegisteredError,
 )
 
 from .patient_profile import (
@@ -49,6 +50,7 @@ __all__ = [
     "InvalidUserStatusError",
     "InvalidCreatedAtError",
     "InvalidUpdatedAtError",
+    "EmailAlreadyRegisteredError",
     "InvalidCredentialsError",
     "InvalidPasswordError",
     "InvalidPatientProfileUserUUIDError",
@@ -148,3 +148,13 @@ class InvalidUpdatedAtError(InvalidUserError):
     """
     pass
 
+
+
+class EmailAlreadyRegisteredError(InvalidUserError):
+    """
+    Raised when registering a user whose email (compared case-insensitively)
+    already belongs to another user.
+
+    Email addresses identify users at login, so they must be unique.
+    """
+    pass
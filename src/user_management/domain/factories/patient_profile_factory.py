@@ -7,6 +7,11 @@ class PatientProfileFactory:
     def create_from_command(command) -> PatientProfile:
         now = datetime.now(timezone.utc)
 
+        # Fields the command already checked with the entity's specifications are not checked again.
+        validated = getattr(command, "validated_fields", None)
+        if validated is not None:
+            return PatientProfile._create_validated(validated, created_at=now, updated_at=now)
+
         try:
             patient = PatientProfile(
                 user_uuid=command.user_uuid,
@@ -9,10 +9,11 @@ and generating system-controlled values like UUIDs and timestamps.
 """
 
 from datetime import datetime, timezone
-from uuid import uuid4
+from typing import Optional
 
 from user_management.domain.entities import User
 from user_management.domain.enums import UserRole, UserStatus
+from user_management.domain.identifiers import IdGenerator, get_default_id_generator
 from user_management.domain.value_objects import UserCredentials
 
 class UserFactory:
@@ -25,19 +26,23 @@ class UserFactory:
     """
 
     @staticmethod
-    def create_from_command(command) -> User:
+    def create_from_command(command, id_generator: Optional[IdGenerator] = None) -> User:
         """
         Creates a new User entity based on the data provided in the command.
 
         This method orchestrates the creation process:
-        1. Generates a unique identifier (UUID).
+        1. Generates a unique identifier (UUID) with the given or default IdGenerator.
         2. Sets creation and update timestamps.
         3. Converts string role to UserRole enum.
         4. Creates UserCredentials from the provided password.
-        5. Instantiates the User entity with all necessary data.
+        5. Instantiates the User entity with all necessary data. When the command
+           carries a ValidatedFields token (``validated_fields``), the fields it
+           covers are not checked again; the others still are.
 
         Args:
             command: An instance of RegisterUserCommand containing user registration data.
+            id_generator: Generator for the user's UUID. Defaults to the process-wide
+                generator from user_management.domain.identifiers.
 
         Returns:
             User: A newly created User entity.
@@ -49,10 +54,18 @@ class UserFactory:
         """
 
         # 1. Generate ID and timestamps
-        user_id = uuid4()
+        user_id = (id_generator or get_default_id_generator()).new_id()
         now = datetime.now(timezone.utc)
 
-        # 2. Convert string to UserRole enum
+        # 2. Create credentials (handles password validation internally)
+        credentials = UserCredentials.create(command.password)
+
+        validated = getattr(command, "validated_fields", None)
+        if validated is not None:
+            return User._create_validated(validated, credentials, uuid=user_id, user_status=UserStatus.ACTIVE,
+                                          created_at=now, updated_at=now)
+
+        # 3. Convert string to UserRole enum
         # The command validator should have normalized this, but we ensure it here too.
         try:
             role_enum = UserRole(command.user_role)
@@ -60,13 +73,6 @@ class UserFactory:
             # Re-raise with a clear message
             raise ValueError(f"Invalid user role provided during factory creation: {command.user_role}") from e
 
-        # 3. Create credentials (handles password validation internally)
-        try:
-            credentials = UserCredentials.create(command.password)
-        except Exception as e:
-            # Re-raise the domain-specific exception
-            raise
-
         # 4. Instantiate the User entity
         # The User constructor should ideally only accept validated data.
         try:
@@ -0,0 +1,18 @@
+"""
+Public API for user_management.domain.identifiers.
+"""
+
+from .id_generator import IdGenerator
+from .uuid4_generator import UUID4Generator
+from .uuid7_generator import UUID7Generator
+from .registry import ID_STRATEGIES, id_generator_for, get_default_id_generator, set_default_id_generator
+
+__all__ = [
+    "IdGenerator",
+    "UUID4Generator",
+    "UUID7Generator",
+    "ID_STRATEGIES",
+    "id_generator_for",
+    "get_default_id_generator",
+    "set_default_id_generator"
+]
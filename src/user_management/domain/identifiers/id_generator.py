@@ -0,0 +1,28 @@
+"""
+Abstraction for generating entity identifiers.
+
+Factories ask an IdGenerator for new identities instead of calling uuid4()
+directly, so the identifier scheme can change (e.g. to time-ordered UUIDv7
+for better index locality) without touching the factories or entities.
+"""
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class IdGenerator(ABC):
+    """
+    Produces new, unique entity identifiers.
+
+    Every generated value is a uuid.UUID instance, so it satisfies
+    ValidUUIDSpecification regardless of the implementation.
+    """
+
+    @abstractmethod
+    def new_id(self) -> UUID:
+        """
+        Returns a new identifier.
+
+        Returns:
+            UUID: A value never returned before by this generator.
+        """
+        ...
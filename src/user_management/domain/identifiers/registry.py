@@ -0,0 +1,56 @@
+"""
+Process-wide default identifier generator.
+
+Factories fall back to this generator when none is passed explicitly. The
+application selects the strategy once at startup (see ``USER_ID_STRATEGY``
+in the API dependencies); the domain itself never reads configuration.
+"""
+from typing import Callable, Dict
+
+from .id_generator import IdGenerator
+from .uuid4_generator import UUID4Generator
+from .uuid7_generator import UUID7Generator
+
+ID_STRATEGIES: Dict[str, Callable[[], IdGenerator]] = {
+    "uuid4": UUID4Generator,
+    "uuid7": UUID7Generator,
+}
+
+_default_id_generator: IdGenerator = UUID4Generator()
+
+
+def id_generator_for(strategy: str) -> IdGenerator:
+    """
+    Builds the generator registered under ``strategy``.
+
+    Args:
+        strategy (str): One of ID_STRATEGIES (case-insensitive).
+
+    Returns:
+        IdGenerator: A new generator instance.
+
+    Raises:
+        ValueError: If the strategy is unknown.
+    """
+    try:
+        return ID_STRATEGIES[strategy.strip().lower()]()
+    except KeyError:
+        raise ValueError(f"Unknown id strategy: {strategy}. Expected one of {', '.join(ID_STRATEGIES)}") from None
+
+
+def get_default_id_generator() -> IdGenerator:
+    """
+    Returns the generator factories use when none is given.
+    """
+    return _default_id_generator
+
+
+def set_default_id_generator(id_generator: IdGenerator) -> None:
+    """
+    Replaces the generator factories use when none is given.
+
+    Args:
+        id_generator (IdGenerator): The new default generator.
+    """
+    global _default_id_generator
+    _default_id_generator = id_generator
@@ -0,0 +1,17 @@
+"""
+Random (version 4) UUID generator.
+
+This is the historical identifier scheme of the domain and remains the default.
+"""
+from uuid import UUID, uuid4
+
+from .id_generator import IdGenerator
+
+
+class UUID4Generator(IdGenerator):
+    """
+    Generates random version 4 UUIDs.
+    """
+
+    def new_id(self) -> UUID:
+        return uuid4()
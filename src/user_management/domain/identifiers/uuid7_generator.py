@@ -0,0 +1,81 @@
+"""
+Time-ordered (version 7) UUID generator, as defined by RFC 9562.
+
+A UUIDv7 starts with a 48-bit Unix timestamp in milliseconds, so identifiers
+generated later sort after earlier ones. New rows then land at the right edge
+of primary key indexes instead of on random pages, which avoids page splits
+and keeps the hot part of the index small under heavy registration.
+
+Layout (most significant bit first):
+- 48 bits: Unix timestamp in milliseconds
+- 4 bits: version (0b0111)
+- 12 bits: rand_a
+- 2 bits: variant (0b10)
+- 62 bits: rand_b
+
+rand_a and rand_b together form a 74-bit counter seeded randomly each
+millisecond and advanced by a random step for every further identifier in
+the same millisecond (RFC 9562, section 6.2, method 2). Identifiers from one
+generator are therefore strictly increasing, even when the system clock
+steps backwards.
+"""
+import secrets
+import threading
+import time
+from typing import Callable
+from uuid import UUID
+
+from .id_generator import IdGenerator
+
+_COUNTER_BITS = 74
+_RAND_B_BITS = 62
+_COUNTER_LIMIT = 1 << _COUNTER_BITS
+_RAND_B_MASK = (1 << _RAND_B_BITS) - 1
+_MAX_STEP_BITS = 32
+
+
+def _now_ms() -> int:
+    return time.time_ns() // 1_000_000
+
+
+class UUID7Generator(IdGenerator):
+    """
+    Generates monotonic, time-ordered version 7 UUIDs.
+
+    Args:
+        clock: Returns the current Unix time in milliseconds. Injectable for tests.
+    """
+
+    def __init__(self, clock: Callable[[], int] = _now_ms):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._counter = 0
+
+    def new_id(self) -> UUID:
+        with self._lock:
+            now_ms = self._clock()
+
+            if now_ms > self._last_ms:
+                # Leave the top bit clear so the counter has room to grow within this millisecond.
+                self._last_ms = now_ms
+                self._counter = secrets.randbits(_COUNTER_BITS - 1)
+            else:
+                self._counter += secrets.randbits(_MAX_STEP_BITS) + 1
+                if self._counter >= _COUNTER_LIMIT:
+                    self._last_ms += 1
+                    self._counter = secrets.randbits(_COUNTER_BITS - 1)
+
+            timestamp_ms = self._last_ms
+            counter = self._counter
+
+        rand_a = counter >> _RAND_B_BITS
+        rand_b = counter & _RAND_B_MASK
+        value = (
+            (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+            | 0x7 << 76
+            | rand_a << 64
+            | 0b10 << 62
+            | rand_b
+        )
+        return UUID(int=value)
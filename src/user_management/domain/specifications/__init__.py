@@ -7,21 +7,25 @@ and_, or_, and not_ methods, supporting complex validation workflows in a clean,
 readable way.
 
 Import specification base classes directly using:
-from .specification import Specification
+from .specification import PureSpecification, Specification
 from .and_specification import AndSpecification
 from .or_specification import OrSpecification
 from .not_specification import NotSpecification
 )
 """
 
-from .specification import Specification
+from .specification import PureSpecification, Specification
 from .and_specification import AndSpecification
 from .or_specification import OrSpecification
 from .not_specification import NotSpecification
+from .memoization import MemoizedSpecification, memoized
 
 __all__ = [
     "Specification",
+    "PureSpecification",
     "AndSpecification",
     "OrSpecification",
     "NotSpecification",
+    "MemoizedSpecification",
+    "memoized",
 ]
\ No newline at end of file
@@ -1,5 +1,6 @@
+from .compilation import ADAPTIVE_SAMPLE_SIZE, AdaptiveJunction, all_of, flatten
 from .specification import Specification
-from typing import Generic, TypeVar
+from typing import Callable, Generic, Iterable, List, TypeVar
 
 T = TypeVar('T')
 
@@ -36,4 +37,52 @@ class AndSpecification(Specification[T]):
         Returns:
             bool: True if all specifications are satisfied; False otherwise.
         """
-        return all(spec.is_satisfied_by(candidate) for spec in self.specs)
\ No newline at end of file
+        return all(spec.is_satisfied_by(candidate) for spec in self.specs)
+
+    def compile(self, adaptive: bool = False, sample_size: int = ADAPTIVE_SAMPLE_SIZE) -> Callable[[T], bool]:
+        """
+        Compiles the composite into one predicate over its flattened clauses.
+
+        Nested AndSpecification nodes are inlined, so ``a.and_(b).and_(c)`` is evaluated
+        as a single all-of-three rather than through two levels of generators.
+
+        Args:
+            adaptive (bool): Reorder the clauses by observed cost and short-circuit rate.
+            sample_size (int): Evaluations profiled before the order is fixed.
+
+        Returns:
+            Callable[[T], bool]: Predicate equivalent to ``is_satisfied_by``.
+        """
+        predicates = [spec.compile(adaptive, sample_size) for spec in flatten(self.specs, AndSpecification)]
+        if adaptive and len(predicates) > 1:
+            return AdaptiveJunction(predicates, decides_on=False, sample_size=sample_size)
+        return all_of(predicates)
+
+    def is_satisfied_by_many(self, values: Iterable[T]) -> List[bool]:
+        """
+        Evaluates the composite over a column, clause by clause.
+
+        Each clause runs in batch over the values still satisfied, so later
+        clauses skip what earlier ones already decided, as ``all`` would.
+
+        Args:
+            values (Iterable[T]): The candidates to evaluate.
+
+        Returns:
+            List[bool]: One flag per candidate, in input order.
+        """
+        values = list(values)
+        mask = [True] * len(values)
+        pending = list(range(len(values)))
+        for spec in flatten(self.specs, AndSpecification):
+            if not pending:
+                break
+            results = spec.is_satisfied_by_many([values[index] for index in pending])
+            still_pending = []
+            for index, result in zip(pending, results):
+                if result:
+                    still_pending.append(index)
+                else:
+                    mask[index] = False
+            pending = still_pending
+        return mask
@@ -0,0 +1,172 @@
+"""
+Building blocks for Specification.compile().
+
+A compiled specification is a plain predicate ``candidate -> bool``: nested
+AND/OR/NOT composites are flattened into one level of clauses, double
+negations cancel out, and stateless leaves are replaced by one shared
+instance per class, so evaluating it costs one Python call per leaf instead
+of a generator and an ``is_satisfied_by`` dispatch per node.
+
+With ``adaptive=True`` a junction times its clauses for its first
+``sample_size`` evaluations and then fixes their order so that cheap,
+frequently short-circuiting clauses run first. This relies on clauses
+having no side effects and not depending on one another, not on them being
+pure: leaves that read the clock (see PureSpecification) give the same
+answer whichever clause runs first. Reordering can change which clauses get
+evaluated, though, so a clause that raises may be skipped in one order and
+reached in another.
+"""
+import time
+from typing import Callable, Dict, Iterator, List, NamedTuple, Sequence, Type
+
+Predicate = Callable[[object], bool]
+
+ADAPTIVE_SAMPLE_SIZE = 1000
+
+
+class InlineCheck(NamedTuple):
+    """
+    A leaf specification written as a Python expression, for generated validators.
+
+    ``template`` is a boolean expression formatted with ``str.format``:
+    ``{value}`` is the candidate, ``{now}`` the current UTC datetime and
+    ``{today}`` the current date (each read once per generated call), and
+    every key of ``names`` is an object the expression refers to.
+    """
+    template: str
+    names: Dict[str, object] = {}
+
+_shared_leaves: Dict[type, object] = {}
+
+
+def shared_leaf(spec):
+    """
+    Returns the process-wide instance of a stateless leaf specification.
+
+    Leaves that carry instance state (constructor arguments) are returned as
+    they are, since two instances may then behave differently.
+    """
+    if getattr(spec, "__dict__", None):
+        return spec
+    return _shared_leaves.setdefault(type(spec), spec)
+
+
+def flatten(specs: Sequence, composite: Type) -> Iterator:
+    """Yields the clauses of ``specs``, inlining the children of nested ``composite`` nodes."""
+    for spec in specs:
+        if type(spec) is composite:
+            yield from flatten(spec.specs, composite)
+        else:
+            yield spec
+
+
+def all_of(predicates: Sequence[Predicate]) -> Predicate:
+    """Returns a predicate satisfied when every predicate is, evaluated left to right."""
+    if len(predicates) == 1:
+        return predicates[0]
+    if len(predicates) == 2:
+        first, second = predicates
+        return lambda candidate: first(candidate) and second(candidate)
+    predicates = tuple(predicates)
+
+    def satisfied(candidate) -> bool:
+        for predicate in predicates:
+            if not predicate(candidate):
+                return False
+        return True
+
+    return satisfied
+
+
+def any_of(predicates: Sequence[Predicate]) -> Predicate:
+    """Returns a predicate satisfied when any predicate is, evaluated left to right."""
+    if len(predicates) == 1:
+        return predicates[0]
+    if len(predicates) == 2:
+        first, second = predicates
+        return lambda candidate: first(candidate) or second(candidate)
+    predicates = tuple(predicates)
+
+    def satisfied(candidate) -> bool:
+        for predicate in predicates:
+            if predicate(candidate):
+                return True
+        return False
+
+    return satisfied
+
+
+class AdaptiveJunction:
+    """
+    AND/OR over clauses whose order is learned from the first evaluations.
+
+    For its first ``sample_size`` calls the junction times every clause it
+    evaluates and counts how often each one decides the result (fails, for
+    AND; passes, for OR). It then sorts the clauses by cost per decision,
+    which minimizes the expected cost when clauses are independent, and
+    evaluates them in that order from then on.
+
+    Attributes:
+        predicates (List[Predicate]): The clauses, in their current order.
+    """
+
+    def __init__(self, predicates: Sequence[Predicate], decides_on: bool, sample_size: int = ADAPTIVE_SAMPLE_SIZE):
+        """
+        Args:
+            predicates: The compiled clauses, in declaration order.
+            decides_on: The clause result that short-circuits: False for AND, True for OR.
+            sample_size: Number of evaluations to profile before fixing the order.
+        """
+        self.predicates: List[Predicate] = list(predicates)
+        self._decides_on = decides_on
+        self._remaining = sample_size
+        self._nanoseconds = [0] * len(self.predicates)
+        self._evaluations = [0] * len(self.predicates)
+        self._decisions = [0] * len(self.predicates)
+
+    def __call__(self, candidate) -> bool:
+        if self._remaining:
+            return self._profile(candidate)
+        decides_on = self._decides_on
+        for predicate in self.predicates:
+            if bool(predicate(candidate)) is decides_on:
+                return decides_on
+        return not decides_on
+
+    def statistics(self) -> List[dict]:
+        """Returns the profile gathered for each clause, in declaration order."""
+        return [
+            {"evaluations": evaluations, "decisions": decisions,
+             "mean_ns": nanoseconds / evaluations if evaluations else None}
+            for nanoseconds, evaluations, decisions in zip(self._nanoseconds, self._evaluations, self._decisions)
+        ]
+
+    def _profile(self, candidate) -> bool:
+        result = not self._decides_on
+        for index, predicate in enumerate(self.predicates):
+            started = time.perf_counter_ns()
+            outcome = bool(predicate(candidate))
+            self._nanoseconds[index] += time.perf_counter_ns() - started
+            self._evaluations[index] += 1
+            if outcome is self._decides_on:
+                self._decisions[index] += 1
+                result = self._decides_on
+                break
+
+        self._remaining -= 1
+        if not self._remaining:
+            self._reorder()
+        return result
+
+    def _reorder(self) -> None:
+        def cost_per_decision(index: int) -> float:
+            evaluations = self._evaluations[index]
+            if not evaluations:
+                return float("inf")
+            mean_cost = self._nanoseconds[index] / evaluations
+            decision_rate = self._decisions[index] / evaluations
+            return mean_cost / decision_rate if decision_rate else float("inf")
+
+        # sorted() is stable: clauses that never decided keep their declared order.
+        order = sorted(range(len(self.predicates)), key=cost_per_decision)
+        self.predicates = [self.predicates[index] for index in order]
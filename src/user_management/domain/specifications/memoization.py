@@ -0,0 +1,92 @@
+"""
+Result memoization for pure leaf specifications.
+
+Field values repeat heavily across records (insurance providers, languages),
+and a pure specification always gives the same answer for the same value, so
+its result can be cached. ``memoized(spec)`` wraps a PureSpecification in a
+bounded LRU cache keyed by the candidate; time-dependent specifications are
+refused, since a cached answer about "now" goes stale.
+
+Candidates are keyed by value and type (``1`` and ``True`` are different
+keys). Unhashable candidates bypass the cache.
+"""
+from functools import lru_cache
+from typing import Callable, Iterable, List, Optional
+
+from .compilation import ADAPTIVE_SAMPLE_SIZE, InlineCheck
+from .specification import PureSpecification, T
+
+DEFAULT_MEMO_SIZE = 4096
+
+
+class MemoizedSpecification(PureSpecification[T]):
+    """
+    A pure specification whose results are kept in a bounded LRU cache.
+
+    Attributes:
+        specification (PureSpecification): The wrapped specification.
+        maxsize (int): Most results kept; the least recently used is evicted first.
+    """
+
+    def __init__(self, specification: PureSpecification[T], maxsize: int = DEFAULT_MEMO_SIZE):
+        if not isinstance(specification, PureSpecification):
+            raise TypeError(f"{type(specification).__name__} is not a PureSpecification and cannot be memoized")
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        self.specification = specification
+        self.maxsize = maxsize
+
+        predicate = specification.compile()
+        cached = lru_cache(maxsize=maxsize, typed=True)(predicate)
+
+        def memoized_predicate(candidate) -> bool:
+            try:
+                return cached(candidate)
+            except TypeError:  # unhashable candidate
+                return predicate(candidate)
+
+        self._cached = cached
+        self._predicate = memoized_predicate
+
+    def is_satisfied_by(self, candidate: T) -> bool:
+        return self._predicate(candidate)
+
+    def compile(self, adaptive: bool = False, sample_size: int = ADAPTIVE_SAMPLE_SIZE) -> Callable[[T], bool]:
+        """Returns the caching predicate; every compiled copy shares one cache."""
+        return self._predicate
+
+    def is_satisfied_by_many(self, values: Iterable[T]) -> List[bool]:
+        predicate = self._predicate
+        return [bool(predicate(value)) for value in values]
+
+    def inline(self) -> Optional[InlineCheck]:
+        # Generated validators must call the caching predicate, not paste the wrapped check.
+        return None
+
+    def statistics(self) -> dict:
+        """Returns the cache's hits, misses, current size, maxsize and hit rate (None before any lookup)."""
+        info = self._cached.cache_info()
+        lookups = info.hits + info.misses
+        return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "maxsize": info.maxsize,
+                "hit_rate": info.hits / lookups if lookups else None}
+
+    def cache_clear(self) -> None:
+        """Drops every cached result and resets the statistics."""
+        self._cached.cache_clear()
+
+
+def memoized(specification: PureSpecification[T], maxsize: int = DEFAULT_MEMO_SIZE) -> MemoizedSpecification[T]:
+    """
+    Wraps a pure specification with a bounded LRU cache of its results.
+
+    Args:
+        specification (PureSpecification): The specification to memoize.
+        maxsize (int): Most distinct candidates whose result is kept.
+
+    Returns:
+        MemoizedSpecification: Equivalent specification with ``statistics()``.
+
+    Raises:
+        TypeError: If the specification is not a PureSpecification.
+    """
+    return MemoizedSpecification(specification, maxsize)
@@ -1,5 +1,6 @@
+from .compilation import ADAPTIVE_SAMPLE_SIZE
 from .specification import Specification
-from typing import Generic, TypeVar
+from typing import Callable, Generic, Iterable, List, TypeVar
 
 T = TypeVar('T')
 
@@ -36,4 +37,26 @@ class NotSpecification(Specification[T]):
         Returns:
             bool: True if the original specification fails; False otherwise.
         """
-        return not self.spec.is_satisfied_by(candidate)
\ No newline at end of file
+        return not self.spec.is_satisfied_by(candidate)
+
+    def compile(self, adaptive: bool = False, sample_size: int = ADAPTIVE_SAMPLE_SIZE) -> Callable[[T], bool]:
+        """
+        Compiles the negation into one predicate; a double negation compiles to the inner specification.
+
+        Args:
+            adaptive (bool): Passed on to the wrapped specification.
+            sample_size (int): Passed on to the wrapped specification.
+
+        Returns:
+            Callable[[T], bool]: Predicate equivalent to ``is_satisfied_by``.
+        """
+        if type(self.spec) is NotSpecification:
+            return self.spec.spec.compile(adaptive, sample_size)
+        predicate = self.spec.compile(adaptive, sample_size)
+        return lambda candidate: not predicate(candidate)
+
+    def is_satisfied_by_many(self, values: Iterable[T]) -> List[bool]:
+        """
+        Evaluates the negation over a column by inverting the wrapped specification's batch result.
+        """
+        return [not result for result in self.spec.is_satisfied_by_many(values)]
@@ -1,6 +1,7 @@
 # src/user_management/domain/specifications/or_specification.py
+from .compilation import ADAPTIVE_SAMPLE_SIZE, AdaptiveJunction, any_of, flatten
 from .specification import Specification
-from typing import Generic, TypeVar
+from typing import Callable, Generic, Iterable, List, TypeVar
 
 T = TypeVar('T')
 
@@ -38,4 +39,52 @@ class OrSpecification(Specification[T]):
         Returns:
             bool: True if any specification is satisfied; False otherwise.
         """
-        return any(spec.is_satisfied_by(candidate) for spec in self.specs)
\ No newline at end of file
+        return any(spec.is_satisfied_by(candidate) for spec in self.specs)
+
+    def compile(self, adaptive: bool = False, sample_size: int = ADAPTIVE_SAMPLE_SIZE) -> Callable[[T], bool]:
+        """
+        Compiles the composite into one predicate over its flattened clauses.
+
+        Nested OrSpecification nodes are inlined, so ``a.or_(b).or_(c)`` is evaluated
+        as a single any-of-three rather than through two levels of generators.
+
+        Args:
+            adaptive (bool): Reorder the clauses by observed cost and short-circuit rate.
+            sample_size (int): Evaluations profiled before the order is fixed.
+
+        Returns:
+            Callable[[T], bool]: Predicate equivalent to ``is_satisfied_by``.
+        """
+        predicates = [spec.compile(adaptive, sample_size) for spec in flatten(self.specs, OrSpecification)]
+        if adaptive and len(predicates) > 1:
+            return AdaptiveJunction(predicates, decides_on=True, sample_size=sample_size)
+        return any_of(predicates)
+
+    def is_satisfied_by_many(self, values: Iterable[T]) -> List[bool]:
+        """
+        Evaluates the composite over a column, clause by clause.
+
+        Each clause runs in batch over the values no clause has satisfied yet, so later
+        clauses skip what earlier ones already decided, as ``any`` would.
+
+        Args:
+            values (Iterable[T]): The candidates to evaluate.
+
+        Returns:
+            List[bool]: One flag per candidate, in input order.
+        """
+        values = list(values)
+        mask = [False] * len(values)
+        pending = list(range(len(values)))
+        for spec in flatten(self.specs, OrSpecification):
+            if not pending:
+                break
+            results = spec.is_satisfied_by_many([values[index] for index in pending])
+            still_pending = []
+            for index, result in zip(pending, results):
+                if not result:
+                    still_pending.append(index)
+                else:
+                    mask[index] = True
+            pending = still_pending
+        return mask
@@ -14,7 +14,9 @@ for patient health information (PHI) records.
 
 from datetime import datetime, timezone, timedelta
 
+from typing import Iterable, List, Optional
 from .. import Specification
+from ..compilation import InlineCheck
 
 
 class ValidCreatedAtSpecification(Specification):
@@ -43,4 +45,18 @@ class ValidCreatedAtSpecification(Specification):
             return False
         now = datetime.now(timezone.utc)
         # Allow small clock skew (e.g., 1 minute ahead)
-        return created_at <= now + timedelta(minutes=1)
\ No newline at end of file
+        return created_at <= now + timedelta(minutes=1)
+
+    def is_satisfied_by_many(self, values: Iterable) -> List[bool]:
+        """
+        Checks a column of timestamps against one reading of the clock.
+        """
+        latest = datetime.now(timezone.utc) + timedelta(minutes=1)
+        return [
+            isinstance(created_at, datetime) and created_at.tzinfo == timezone.utc and created_at <= latest
+            for created_at in values
+        ]
+
+    def inline(self) -> Optional[InlineCheck]:
+        return InlineCheck("isinstance({value}, {datetime}) and {value}.tzinfo == {utc} and {value} <= {now} + {skew}",
+                           {"datetime": datetime, "utc": timezone.utc, "skew": timedelta(minutes=1)})
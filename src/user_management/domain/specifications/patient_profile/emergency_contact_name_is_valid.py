@@ -10,10 +10,14 @@ preventing invalid or spoofed identifiers in audit trails and entity references.
 """
 import re
 from uuid import UUID
-from .. import Specification
+from typing import Iterable, List, Optional
+from .. import PureSpecification
+from ..compilation import InlineCheck
 
+_NAME_PATTERN = re.compile(r"^[A-Za-z]+(?: [A-Za-z]+)*$")
 
-class ValidEmergencyContactNameSpecification(Specification):
+
+class ValidEmergencyContactNameSpecification(PureSpecification):
     """
     Specification to validate that a UUID is a properly typed identity object.
 
@@ -40,5 +44,14 @@ class ValidEmergencyContactNameSpecification(Specification):
 
         # Matches one or more words, each starting with a letter, separated by single spaces
         # Example: "John", "Mary Jane", but not "Mary  Jane" (double space) or "O'Connor"
-        pattern = r"^[A-Za-z]+(?: [A-Za-z]+)*$"
-        return re.match(pattern, name) is not None
\ No newline at end of file
+        return _NAME_PATTERN.match(name) is not None
+
+    def is_satisfied_by_many(self, values: Iterable) -> List[bool]:
+        """
+        Checks a column of contact names; the pattern alone rejects empty and blank strings.
+        """
+        match = _NAME_PATTERN.match
+        return [isinstance(name, str) and match(name) is not None for name in values]
+
+    def inline(self) -> Optional[InlineCheck]:
+        return InlineCheck("isinstance({value}, str) and {match}({value}) is not None", {"match": _NAME_PATTERN.match})
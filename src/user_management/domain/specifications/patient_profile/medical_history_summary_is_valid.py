@@ -10,10 +10,14 @@ preventing invalid or spoofed identifiers in audit trails and entity references.
 """
 import re
 from uuid import UUID
-from .. import Specification
+from typing import Iterable, List, Optional
+from .. import PureSpecification
+from ..compilation import InlineCheck
 
+_SUMMARY_PATTERN = re.compile(r"^[A-Za-zÀ-ÿ\s,.;:()-]+$")
 
-class ValidMedicalHistorySummarySpecification(Specification):
+
+class ValidMedicalHistorySummarySpecification(PureSpecification):
     """
     Specification to validate that a UUID is a properly typed identity object.
 
@@ -27,5 +31,14 @@ class ValidMedicalHistorySummarySpecification(Specification):
         if not isinstance(mhs, str):
             return False
 
-        pattern = r"^[A-Za-zÀ-ÿ\s,.;:()-]+$"
-        return re.match(pattern, mhs) is not None
\ No newline at end of file
+        return _SUMMARY_PATTERN.match(mhs) is not None
+
+    def is_satisfied_by_many(self, values: Iterable) -> List[bool]:
+        """
+        Checks a column of medical history summaries.
+        """
+        match = _SUMMARY_PATTERN.match
+        return [isinstance(mhs, str) and match(mhs) is not None for mhs in values]
+
+    def inline(self) -> Optional[InlineCheck]:
+        return InlineCheck("isinstance({value}, str) and {match}({value}) is not None", {"match": _SUMMARY_PATTERN.match})
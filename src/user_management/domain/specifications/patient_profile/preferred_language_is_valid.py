@@ -10,10 +10,14 @@ preventing invalid or spoofed identifiers in audit trails and entity references.
 """
 import re
 from uuid import UUID
-from .. import Specification
+from typing import Iterable, List
+from .. import PureSpecification
 
+_LETTER_PATTERN = re.compile(r"[A-Za-zÀ-ÿ]")
+_ALLOWED_PATTERN = re.compile(r"[A-Za-zÀ-ÿ0-9\s\-'.]+")
 
-class ValidPreferredLanguageSpecification(Specification):
+
+class ValidPreferredLanguageSpecification(PureSpecification):
     """
     Specification to validate that a UUID is a properly typed identity object.
 
@@ -33,10 +37,23 @@ class ValidPreferredLanguageSpecification(Specification):
         if len(stripped) > 100:
             return False
 
-        if not re.search(r"[A-Za-zÀ-ÿ]", stripped):
+        if not _LETTER_PATTERN.search(stripped):
             return False
 
-        if not re.fullmatch(r"[A-Za-zÀ-ÿ0-9\s\-'.]+", stripped):
+        if not _ALLOWED_PATTERN.fullmatch(stripped):
             return False
 
         return True
+
+    def is_satisfied_by_many(self, values: Iterable) -> List[bool]:
+        """
+        Checks a column of values with the same rules, stripping each value once.
+        """
+        search, fullmatch = _LETTER_PATTERN.search, _ALLOWED_PATTERN.fullmatch
+        return [
+            isinstance(value, str)
+            and 3 <= len(stripped := value.strip()) <= 100
+            and search(stripped) is not None
+            and fullmatch(stripped) is not None
+            for value in values
+        ]
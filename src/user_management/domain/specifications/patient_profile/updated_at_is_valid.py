@@ -13,7 +13,9 @@ and compliance with standards like HIPAA/GDPR in healthcare systems.
 """
 
 from datetime import datetime, timezone, timedelta
+from typing import Iterable, List, Optional
 from .. import Specification
+from ..compilation import InlineCheck
 
 
 class ValidUpdatedAtSpecification(Specification):
@@ -42,4 +44,18 @@ class ValidUpdatedAtSpecification(Specification):
             return False
         now = datetime.now(timezone.utc)
         # Allow small clock skew (e.g., up to 1 minute ahead due to system sync)
-        return updated_at <= now + timedelta(minutes=1)
\ No newline at end of file
+        return updated_at <= now + timedelta(minutes=1)
+
+    def is_satisfied_by_many(self, values: Iterable) -> List[bool]:
+        """
+        Checks a column of timestamps against one reading of the clock.
+        """
+        latest = datetime.now(timezone.utc) + timedelta(minutes=1)
+        return [
+            isinstance(updated_at, datetime) and updated_at.tzinfo == timezone.utc and updated_at <= latest
+            for updated_at in values
+        ]
+
+    def inline(self) -> Optional[InlineCheck]:
+        return InlineCheck("isinstance({value}, {datetime}) and {value}.tzinfo == {utc} and {value} <= {now} + {skew}",
+                           {"datetime": datetime, "utc": timezone.utc, "skew": timedelta(minutes=1)})
@@ -10,10 +10,12 @@ preventing invalid or spoofed identifiers in audit trails and entity references.
 """
 
 from uuid import UUID
-from .. import Specification
+from typing import Iterable, List, Optional
+from .. import PureSpecification
+from ..compilation import InlineCheck
 
 
-class ValidUserUUIDSpecification(Specification):
+class ValidUserUUIDSpecification(PureSpecification):
     """
     Specification to validate that a UUID is a properly typed identity object.
 
@@ -32,4 +34,13 @@ class ValidUserUUIDSpecification(Specification):
         Returns:
             bool: True if the value is a valid UUID; False otherwise.
         """
-        return isinstance(uuid, UUID)
\ No newline at end of file
+        return isinstance(uuid, UUID)
+
+    def is_satisfied_by_many(self, values: Iterable) -> List[bool]:
+        """
+        Checks a column of identifiers.
+        """
+        return [isinstance(uuid, UUID) for uuid in values]
+
+    def inline(self) -> Optional[InlineCheck]:
+        return InlineCheck("isinstance({value}, {UUID})", {"UUID": UUID})
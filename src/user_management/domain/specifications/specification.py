@@ -7,7 +7,9 @@ such as AND, OR, and NOT. Supports the creation of complex, reusable, and testab
 business logic in a clean and expressive way.
 """
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, TYPE_CHECKING
+from typing import Callable, Iterable, List, Optional, TypeVar, Generic, TYPE_CHECKING
+
+from .compilation import ADAPTIVE_SAMPLE_SIZE, InlineCheck, shared_leaf
 
 if TYPE_CHECKING:
     from .and_specification import AndSpecification
@@ -85,4 +87,60 @@ class Specification(Generic[T], ABC):
             NotSpecification[T]: A new negated specification.
         """
         from .not_specification import NotSpecification
-        return NotSpecification(self)
\ No newline at end of file
+        return NotSpecification(self)
+
+    def compile(self, adaptive: bool = False, sample_size: int = ADAPTIVE_SAMPLE_SIZE) -> Callable[[T], bool]:
+        """
+        Compiles this specification into a plain predicate.
+
+        A leaf compiles to the ``is_satisfied_by`` of its shared instance, so
+        callers can keep the predicate at module level instead of building the
+        specification on every call. Composites override this to flatten
+        their tree into a single callable.
+
+        Args:
+            adaptive (bool): Let AND/OR junctions reorder their clauses by observed cost
+                and short-circuit rate after ``sample_size`` evaluations.
+            sample_size (int): Evaluations profiled by adaptive junctions.
+
+        Returns:
+            Callable[[T], bool]: Predicate equivalent to ``is_satisfied_by``.
+        """
+        return shared_leaf(self).is_satisfied_by
+
+    def is_satisfied_by_many(self, values: Iterable[T]) -> List[bool]:
+        """
+        Evaluates this specification over a whole column of candidates.
+
+        This generic version applies the compiled predicate to each value.
+        The user and patient_profile leaves override it with batch versions
+        that hoist per-call work (clock reads, attribute lookups) out of the
+        loop and fold multi-step string checks into a single regex.
+
+        Args:
+            values (Iterable[T]): The candidates to evaluate.
+
+        Returns:
+            List[bool]: One flag per candidate, in input order.
+        """
+        predicate = self.compile()
+        return [bool(predicate(value)) for value in values]
+
+    def inline(self) -> Optional[InlineCheck]:
+        """
+        Returns this rule as an expression that generated validators can
+        embed, or None when it has to be called as a predicate instead.
+        """
+        return None
+
+
+class PureSpecification(Specification[T], ABC):
+    """
+    Marker base for leaf specifications whose result depends only on the candidate.
+
+    A pure specification reads no clock, no configuration and no mutable
+    state, so its result for a given value never changes and may be cached
+    (see ``memoized``). Rules relative to the current time, such as
+    ValidCreatedAtSpecification or ValidDateOfBirthSpecification, must derive
+    from Specification directly.
+    """
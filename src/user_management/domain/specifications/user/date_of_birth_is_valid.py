@@ -12,7 +12,9 @@ and consistency across healthcare workflows (e.g., patient_profile registration)
 """
 
 from datetime import date, timedelta
+from typing import Iterable, List, Optional
 from .. import Specification
+from ..compilation import InlineCheck
 
 
 class ValidDateOfBirthSpecification(Specification):
@@ -45,4 +47,16 @@ class ValidDateOfBirthSpecification(Specification):
 
         # Minimum allowed date: ~150 years back (accounts for leap years)
         min_allowed_date = today - timedelta(days=150 * 365.25)
-        return dob >= min_allowed_date
\ No newline at end of file
+        return dob >= min_allowed_date
+
+    def is_satisfied_by_many(self, values: Iterable) -> List[bool]:
+        """
+        Checks a column of dates of birth against one reading of today's date.
+        """
+        today = date.today()
+        min_allowed_date = today - timedelta(days=150 * 365.25)
+        return [isinstance(dob, date) and min_allowed_date <= dob <= today for dob in values]
+
+    def inline(self) -> Optional[InlineCheck]:
+        return InlineCheck("isinstance({value}, {date}) and {today} - {max_age} <= {value} <= {today}",
+                           {"date": date, "max_age": timedelta(days=150 * 365.25)})
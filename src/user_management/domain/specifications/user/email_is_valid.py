@@ -14,10 +14,18 @@ This rule enforces data integrity during user registration, profile updates,
 and authentication workflows in compliance with common RFC-like formatting standards.
 """
 
-from .. import Specification
+import re
+from typing import Iterable, List, Optional
+from .. import PureSpecification
+from ..compilation import InlineCheck
 
+# The rules of is_satisfied_by as one pattern ("..", which spans both parts, is tested apart):
+# exactly one "@", no spaces, local and domain parts non-empty and not starting or ending
+# with ".", and a "." inside the domain.
+_EMAIL_PATTERN = re.compile(r"[^ @.](?:[^ @]*[^ @.])?@[^ @.][^ @]*\.[^ @]*[^ @.]")
 
-class ValidEmailSpecification(Specification):
+
+class ValidEmailSpecification(PureSpecification):
     """
     Specification to validate that an email address conforms to structural rules.
 
@@ -65,4 +73,15 @@ class ValidEmailSpecification(Specification):
         if "." not in domain:
             return False
 
-        return True
\ No newline at end of file
+        return True
+
+    def is_satisfied_by_many(self, values: Iterable) -> List[bool]:
+        """
+        Checks a column of emails with one regex per value instead of the chain of string tests.
+        """
+        fullmatch = _EMAIL_PATTERN.fullmatch
+        return [isinstance(email, str) and ".." not in email and fullmatch(email) is not None for email in values]
+
+    def inline(self) -> Optional[InlineCheck]:
+        return InlineCheck('isinstance({value}, str) and ".." not in {value} and {fullmatch}({value}) is not None',
+                           {"fullmatch": _EMAIL_PATTERN.fullmatch})
@@ -13,10 +13,14 @@ and prevents injection risks in user identity management.
 """
 
 import re
-from .. import Specification
+from typing import Iterable, List, Optional
+from .. import PureSpecification
+from ..compilation import InlineCheck
 
+_NAME_PATTERN = re.compile(r"^[A-Za-z]+(?: [A-Za-z]+)*$")
 
-class ValidNameSpecification(Specification):
+
+class ValidNameSpecification(PureSpecification):
     """
     Specification to validate that a first or last name conforms to allowed format rules.
 
@@ -42,5 +46,14 @@ class ValidNameSpecification(Specification):
 
         # Matches one or more words, each starting with a letter, separated by single spaces
         # Example: "John", "Mary Jane", but not "Mary  Jane" (double space) or "O'Connor"
-        pattern = r"^[A-Za-z]+(?: [A-Za-z]+)*$"
-        return re.match(pattern, name) is not None
\ No newline at end of file
+        return _NAME_PATTERN.match(name) is not None
+
+    def is_satisfied_by_many(self, values: Iterable) -> List[bool]:
+        """
+        Checks a column of names; the pattern alone rejects empty and blank strings.
+        """
+        match = _NAME_PATTERN.match
+        return [isinstance(name, str) and match(name) is not None for name in values]
+
+    def inline(self) -> Optional[InlineCheck]:
+        return InlineCheck("isinstance({value}, str) and {match}({value}) is not None", {"match": _NAME_PATTERN.match})
@@ -13,10 +13,14 @@ voice services, and emergency contact routing in healthcare applications.
 """
 
 import re
-from .. import Specification
+from typing import Iterable, List, Optional
+from .. import PureSpecification
+from ..compilation import InlineCheck
 
+_E164_PATTERN = re.compile(r"^\+[1-9]\d{1,14}$")
 
-class ValidPhoneE164Specification(Specification):
+
+class ValidPhoneE164Specification(PureSpecification):
     """
     Specification to validate that a phone number conforms to the E.164 international standard.
 
@@ -41,5 +45,15 @@ class ValidPhoneE164Specification(Specification):
             return False
 
         # E.164 format: +[1-9][0-9]{1,14}
-        pattern = r"^\+[1-9]\d{1,14}$"
-        return re.match(pattern, phone) is not None
\ No newline at end of file
+        return _E164_PATTERN.match(phone) is not None
+
+    def is_satisfied_by_many(self, values: Iterable) -> List[bool]:
+        """
+        Checks a column of phone numbers, accepting None like ``is_satisfied_by``.
+        """
+        match = _E164_PATTERN.match
+        return [phone is None or (isinstance(phone, str) and match(phone) is not None) for phone in values]
+
+    def inline(self) -> Optional[InlineCheck]:
+        return InlineCheck("{value} is None or (isinstance({value}, str) and {match}({value}) is not None)",
+                           {"match": _E164_PATTERN.match})
@@ -9,11 +9,13 @@ This rule ensures consistent role management, supports role-based access control
 and prevents unauthorized privilege assignment in healthcare workflows.
 """
 
-from .. import Specification
+from typing import Iterable, List, Optional
+from .. import PureSpecification
+from ..compilation import InlineCheck
 from ...enums import UserRole
 
 
-class ValidUserRoleSpecification(Specification):
+class ValidUserRoleSpecification(PureSpecification):
     """
     Specification to validate that a user role is a valid enum member.
 
@@ -31,4 +33,13 @@ class ValidUserRoleSpecification(Specification):
         Returns:
             bool: True if the role is a valid enum member; False otherwise.
         """
-        return isinstance(user_role, UserRole)
\ No newline at end of file
+        return isinstance(user_role, UserRole)
+
+    def is_satisfied_by_many(self, values: Iterable) -> List[bool]:
+        """
+        Checks a column of roles.
+        """
+        return [isinstance(user_role, UserRole) for user_role in values]
+
+    def inline(self) -> Optional[InlineCheck]:
+        return InlineCheck("isinstance({value}, {UserRole})", {"UserRole": UserRole})
@@ -9,11 +9,13 @@ This rule ensures consistent account lifecycle management, supports security wor
 and prevents invalid state transitions in compliance-sensitive healthcare systems.
 """
 
-from .. import Specification
+from typing import Iterable, List, Optional
+from .. import PureSpecification
+from ..compilation import InlineCheck
 from ...enums import UserStatus
 
 
-class ValidUserStatusSpecification(Specification):
+class ValidUserStatusSpecification(PureSpecification):
     """
     Specification to validate that a user status is a valid enum member.
 
@@ -31,4 +33,13 @@ class ValidUserStatusSpecification(Specification):
         Returns:
             bool: True if the status is a valid enum member; False otherwise.
         """
-        return isinstance(user_status, UserStatus)
\ No newline at end of file
+        return isinstance(user_status, UserStatus)
+
+    def is_satisfied_by_many(self, values: Iterable) -> List[bool]:
+        """
+        Checks a column of statuses.
+        """
+        return [isinstance(user_status, UserStatus) for user_status in values]
+
+    def inline(self) -> Optional[InlineCheck]:
+        return InlineCheck("isinstance({value}, {UserStatus})", {"UserStatus": UserStatus})
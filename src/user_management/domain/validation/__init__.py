@@ -0,0 +1,9 @@
+from .rehydration_sampling import RehydrationSampler, get_rehydration_sampler, set_rehydration_sampler
+from .validated_fields import ValidatedFields
+
+__all__ = [
+    "RehydrationSampler",
+    "get_rehydration_sampler",
+    "set_rehydration_sampler",
+    "ValidatedFields"
+]
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import FrozenSet
 from uuid import UUID
 
 from user_management.domain.exceptions import InvalidPatientProfileUserUUIDError, \
@@ -11,7 +12,41 @@ from user_management.domain.specifications.patient_profile import ValidUserUUIDS
     ValidEmergencyContactNameSpecification, ValidEmergencyContactPhoneSpecification, ValidInsuranceInfoSpecification, \
     ValidPreferredLanguageSpecification, ValidMedicalHistorySummarySpecification, ValidCreatedAtSpecification, \
     ValidUpdatedAtSpecification, ValidUpdatedAtRelativeToCreatedAtSpecification
+from user_management.domain.specifications import memoized
+from user_management.domain.validation.validator_generation import FieldRule, generate_partial_validators, \
+    generate_validator
 
+# Insurance providers and languages repeat across thousands of profiles, so their
+# results are cached; the other fields are personal data or mostly unique.
+INSURANCE_INFO_SPECIFICATION = memoized(ValidInsuranceInfoSpecification())
+PREFERRED_LANGUAGE_SPECIFICATION = memoized(ValidPreferredLanguageSpecification())
+
+# Checked in this order; the first failing rule raises.
+PATIENT_PROFILE_VALIDATION_RULES = (
+    FieldRule("user_uuid", ValidUserUUIDSpecification(), InvalidPatientProfileUserUUIDError, "Invalid user uuid"),
+    FieldRule("emergency_contact_name", ValidEmergencyContactNameSpecification(),
+              InvalidPatientProfileEmergencyContactNameError, "Invalid emergency contact name"),
+    FieldRule("emergency_contact_phone", ValidEmergencyContactPhoneSpecification(),
+              InvalidPatientProfileEmergencyContactPhoneError, "Invalid emergency contact phone"),
+    FieldRule("insurance_info", INSURANCE_INFO_SPECIFICATION,
+              InvalidPatientProfileInsuranceInfoError, "Invalid insurance info"),
+    FieldRule("preferred_language", PREFERRED_LANGUAGE_SPECIFICATION,
+              InvalidPatientProfilePreferredLanguageError, "Invalid preferred language"),
+    FieldRule("medical_history_summary", ValidMedicalHistorySummarySpecification(),
+              InvalidPatientProfileMedicalHistorySummaryError, "Invalid medical history summary"),
+    FieldRule("created_at", ValidCreatedAtSpecification(), InvalidPatientProfileCreatedAtError, "Invalid created at date"),
+    FieldRule("updated_at", ValidUpdatedAtSpecification(), InvalidPatientProfileUpdatedAtError, "Invalid updated at date"),
+    FieldRule("updated_at", ValidUpdatedAtRelativeToCreatedAtSpecification, InvalidPatientProfileUpdatedAtError,
+              "updated_at cannot be earlier than created_at", arguments=("created_at",)),
+)
+
+_PATIENT_PROFILE_PARAMETERS = ("user_uuid", "emergency_contact_name", "emergency_contact_phone", "insurance_info",
+                               "preferred_language", "medical_history_summary", "created_at", "updated_at")
+_validate_patient_profile = generate_validator("validate_patient_profile", _PATIENT_PROFILE_PARAMETERS,
+                                               PATIENT_PROFILE_VALIDATION_RULES)
+_validate_patient_profile_skipping = generate_partial_validators("validate_patient_profile",
+                                                                 _PATIENT_PROFILE_PARAMETERS,
+                                                                 PATIENT_PROFILE_VALIDATION_RULES)
 
 class PatientProfileValidator:
 
@@ -27,29 +62,26 @@ class PatientProfileValidator:
             updated_at: datetime,
     ) -> None:
 
-        if not ValidUserUUIDSpecification().is_satisfied_by(user_uuid):
-            raise InvalidPatientProfileUserUUIDError("Invalid user uuid")
-
-        if not ValidEmergencyContactNameSpecification().is_satisfied_by(emergency_contact_name):
-            raise InvalidPatientProfileEmergencyContactNameError("Invalid emergency contact name")
-
-        if not ValidEmergencyContactPhoneSpecification().is_satisfied_by(emergency_contact_phone):
-            raise InvalidPatientProfileEmergencyContactPhoneError("Invalid emergency contact phone")
-
-        if not ValidInsuranceInfoSpecification().is_satisfied_by(insurance_info):
-            raise InvalidPatientProfileInsuranceInfoError("Invalid insurance info")
+        _validate_patient_profile(user_uuid, emergency_contact_name, emergency_contact_phone, insurance_info,
+                                  preferred_language, medical_history_summary, created_at, updated_at)
 
-        if not ValidPreferredLanguageSpecification().is_satisfied_by(preferred_language):
-            raise InvalidPatientProfilePreferredLanguageError("Invalid preferred language")
-
-        if not ValidMedicalHistorySummarySpecification().is_satisfied_by(medical_history_summary):
-            raise InvalidPatientProfileMedicalHistorySummaryError("Invalid medical history summary")
-
-        if not ValidCreatedAtSpecification().is_satisfied_by(created_at):
-            raise InvalidPatientProfileCreatedAtError("Invalid created at date")
-
-        if not ValidUpdatedAtSpecification().is_satisfied_by(updated_at):
-            raise InvalidPatientProfileUpdatedAtError("Invalid updated at date")
+    @staticmethod
+    def validate_unverified(
+            verified: FrozenSet[str],
+            user_uuid: UUID,
+            emergency_contact_name: str,
+            emergency_contact_phone: str,
+            insurance_info: str,
+            preferred_language: str,
+            medical_history_summary: str,
+            created_at: datetime,
+            updated_at: datetime,
+    ) -> None:
+        """
+        Like validate, but skips the single-field rules on the ``verified`` fields.
 
-        if not ValidUpdatedAtRelativeToCreatedAtSpecification(created_at).is_satisfied_by(updated_at):
-            raise InvalidPatientProfileUpdatedAtError("updated_at cannot be earlier than created_at")
+        The updated_at >= created_at rule relates two fields and always runs.
+        """
+        _validate_patient_profile_skipping(verified)(user_uuid, emergency_contact_name, emergency_contact_phone,
+                                                     insurance_info, preferred_language, medical_history_summary,
+                                                     created_at, updated_at)
@@ -0,0 +1,61 @@
+"""
+Sampled validation of entities rehydrated from persistence.
+
+Rows read back from storage were validated before they were written, so
+repositories rebuild entities with ``_rehydrate``, which skips the
+validators. A RehydrationSampler can still send a fraction of those loads
+through full validation, to surface rows corrupted outside the domain
+(manual edits, faulty migrations) with the usual domain errors.
+
+Like the identifier strategy, the process-wide sampler is chosen once at
+startup by the application; the domain itself never reads configuration.
+"""
+import random
+from typing import Callable
+
+
+class RehydrationSampler:
+    """
+    Decides which rehydrated entities are validated.
+
+    Attributes:
+        rate (float): Fraction of loads validated, from 0.0 (none) to 1.0 (all).
+        loads (int): Number of rehydrations seen.
+        validated (int): Number of them that were validated.
+    """
+
+    def __init__(self, rate: float = 0.0, random_source: Callable[[], float] = random.random):
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError(f"Rehydration sample rate must be between 0 and 1, got {rate}")
+        self.rate = rate
+        self._random = random_source
+        self.loads = 0
+        self.validated = 0
+
+    def should_validate(self) -> bool:
+        self.loads += 1
+        if self.rate <= 0.0 or (self.rate < 1.0 and self._random() >= self.rate):
+            return False
+        self.validated += 1
+        return True
+
+
+_rehydration_sampler = RehydrationSampler()
+
+
+def get_rehydration_sampler() -> RehydrationSampler:
+    """
+    Returns the sampler ``_rehydrate`` consults; by default nothing is validated.
+    """
+    return _rehydration_sampler
+
+
+def set_rehydration_sampler(sampler: RehydrationSampler) -> None:
+    """
+    Replaces the sampler ``_rehydrate`` consults.
+
+    Args:
+        sampler (RehydrationSampler): The new process-wide sampler.
+    """
+    global _rehydration_sampler
+    _rehydration_sampler = sampler
@@ -1,4 +1,5 @@
 from datetime import date, datetime
+from typing import FrozenSet
 from uuid import UUID
 
 from ...enums.user_role import UserRole
@@ -17,7 +18,26 @@ from ....domain.specifications.user import (
     ValidPhoneE164Specification,
     ValidDateOfBirthSpecification,
 )
+from ..validator_generation import FieldRule, generate_partial_validators, generate_validator
+
+# Checked in this order; the first failing rule raises.
+USER_VALIDATION_RULES = (
+    FieldRule("uuid", ValidUUIDSpecification(), InvalidUUIDError, "Invalid uuid"),
+    FieldRule("email", ValidEmailSpecification(), InvalidEmailError, "Invalid email format"),
+    FieldRule("first_name", ValidNameSpecification(), InvalidNameError, "Name must contain only letters and spaces"),
+    FieldRule("last_name", ValidNameSpecification(), InvalidNameError, "Name must contain only letters and spaces"),
+    FieldRule("phone", ValidPhoneE164Specification(), InvalidPhoneNumberError, "Phone must be in E.164 format"),
+    FieldRule("date_of_birth", ValidDateOfBirthSpecification(), InvalidDateOfBirthError, "Invalid date of birth"),
+    FieldRule("role", ValidUserRoleSpecification(), InvalidUserRoleError, "Invalid user role"),
+    FieldRule("status", ValidUserStatusSpecification(), InvalidUserStatusError, "Invalid user role"),
+    FieldRule("created_at", ValidCreatedAtSpecification(), InvalidCreatedAtError, "Invalid created at date"),
+    FieldRule("updated_at", ValidUpdatedAtSpecification(), InvalidUpdatedAtError, "Invalid update at date"),
+)
 
+_USER_PARAMETERS = ("uuid", "email", "first_name", "last_name", "phone", "date_of_birth", "role", "status",
+                    "created_at", "updated_at")
+_validate_user = generate_validator("validate_user", _USER_PARAMETERS, USER_VALIDATION_RULES)
+_validate_user_skipping = generate_partial_validators("validate_user", _USER_PARAMETERS, USER_VALIDATION_RULES)
 
 class UserValidator:
     """
@@ -52,8 +72,8 @@ class UserValidator:
         """
         Validates user data against domain rules before entity creation.
 
-        Executes a series of checks using Specifications. Raises specific domain exceptions
-        if any validation fails. All validations are executed sequentially.
+        Checks USER_VALIDATION_RULES in order through a function generated from them,
+        raising the specific domain exception of the first rule that fails.
 
         Args:
             uuid (UUID): Unique identifier; must be a valid UUID instance.
@@ -72,32 +92,31 @@ class UserValidator:
             InvalidPhoneNumberError: If phone is provided but not in E.164 format.
         """
 
-        if not ValidUUIDSpecification().is_satisfied_by(uuid):
-            raise InvalidUUIDError("Invalid uuid")
-
-        if not ValidEmailSpecification().is_satisfied_by(email):
-            raise InvalidEmailError("Invalid email format")
-
-        if not ValidNameSpecification().is_satisfied_by(first_name):
-            raise InvalidNameError("Name must contain only letters and spaces")
-
-        if not ValidNameSpecification().is_satisfied_by(last_name):
-            raise InvalidNameError("Name must contain only letters and spaces")
-
-        if not ValidPhoneE164Specification().is_satisfied_by(phone):
-            raise InvalidPhoneNumberError("Phone must be in E.164 format")
-
-        if not ValidDateOfBirthSpecification().is_satisfied_by(date_of_birth):
-            raise InvalidDateOfBirthError("Invalid date of birth")
+        _validate_user(uuid, email, first_name, last_name, phone, date_of_birth, role, status, created_at, updated_at)
 
-        if not ValidUserRoleSpecification().is_satisfied_by(role):
-            raise InvalidUserRoleError("Invalid user role")
-
-        if not ValidUserStatusSpecification().is_satisfied_by(status):
-            raise InvalidUserStatusError("Invalid user role")
+    @staticmethod
+    def validate_unverified(
+        verified: FrozenSet[str],
+        uuid: UUID,
+        email: str,
+        first_name: str,
+        last_name: str,
+        phone,
+        date_of_birth,
+        role: UserRole,
+        status: UserStatus,
+        created_at: datetime,
+        updated_at: datetime
+    ) -> None:
+        """
+        Like validate, but skips the single-field rules on the ``verified`` parameters.
 
-        if not ValidCreatedAtSpecification().is_satisfied_by(created_at):
-            raise InvalidCreatedAtError("Invalid created at date")
+        For values an application command already checked with the same
+        specifications (see ValidatedFields); the remaining fields and every
+        cross-field rule are still enforced.
 
-        if not ValidUpdatedAtSpecification().is_satisfied_by(updated_at):
-            raise InvalidUpdatedAtError("Invalid update at date")
\ No newline at end of file
+        Args:
+            verified (FrozenSet[str]): Parameters whose values are already known to be valid.
+        """
+        _validate_user_skipping(verified)(uuid, email, first_name, last_name, phone, date_of_birth, role, status,
+                                          created_at, updated_at)
@@ -0,0 +1,46 @@
+"""
+Proof that field values already satisfied the entity's own specifications.
+
+Application commands that check a field with the same specification the
+entity uses can issue a ValidatedFields token holding the checked values.
+Entities built from a token (``_create_validated``) skip those single-field
+rules and run only the rest: fields the token does not cover and every
+cross-field invariant, since a command checks fields one at a time.
+
+The token keeps its own copy of the values, so changing a command after it
+was validated cannot smuggle unchecked data into an entity.
+"""
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterator, Mapping
+
+
+class ValidatedFields(Mapping):
+    """
+    Read-only mapping of entity field names to values that passed their specifications.
+    """
+
+    __slots__ = ("_values", "_names")
+
+    def __init__(self, **values):
+        self._values = MappingProxyType(values)
+        self._names = frozenset(values)
+
+    @property
+    def names(self) -> FrozenSet[str]:
+        return self._names
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns a new plain dict of the values (much cheaper than ``dict(token)``)."""
+        return self._values.copy()
+
+    def __getitem__(self, name: str):
+        return self._values[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"ValidatedFields({', '.join(sorted(self._values))})"
@@ -0,0 +1,122 @@
+"""
+Generates straight-line validator functions from field-to-specification rules.
+
+A validator is declared as an ordered list of FieldRule entries. Instead of
+calling one specification object per rule, generate_validator writes a
+single function that checks every rule in order, raising the rule's domain
+exception with its message at the first failure:
+
+- leaves exposing an InlineCheck are pasted in as expressions over the
+  argument, with their compiled patterns bound as globals of the function;
+- the UTC clock and today's date are read at most once per call and shared
+  by every rule that needs them;
+- other specifications are called through their compiled predicate, and
+  rules with ``arguments`` build their specification from other fields.
+
+The generated source is registered with linecache, so tracebacks and
+debuggers show the code that actually ran.
+"""
+import linecache
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, NamedTuple, Sequence, Tuple, Type
+
+from user_management.domain.exceptions import DomainError
+from user_management.domain.specifications import Specification
+
+
+class FieldRule(NamedTuple):
+    """
+    One rule of a generated validator.
+
+    Attributes:
+        field (str): Parameter the rule checks.
+        specification: The specification, or its class when ``arguments`` is set.
+        error (Type[DomainError]): Exception raised when the rule fails.
+        message (str): Message of the exception.
+        arguments (Tuple[str, ...]): Parameters passed to the specification class
+            on each call, for rules that depend on other fields.
+    """
+    field: str
+    specification: object
+    error: Type[DomainError]
+    message: str
+    arguments: Tuple[str, ...] = ()
+
+
+def generate_validator(name: str, parameters: Sequence[str], rules: Sequence[FieldRule]) -> Callable[..., None]:
+    """
+    Builds a function ``name(*parameters)`` that enforces ``rules`` in order.
+
+    Args:
+        name (str): Name of the generated function.
+        parameters (Sequence[str]): Its parameters, in call order.
+        rules (Sequence[FieldRule]): The rules, in the order they are checked.
+
+    Returns:
+        Callable[..., None]: The validator; it returns None or raises the first failing rule's error.
+    """
+    namespace: Dict[str, object] = {}
+    templates = []
+    for index, rule in enumerate(rules):
+        if rule.field not in parameters or not set(rule.arguments) <= set(parameters):
+            raise ValueError(f"Rule {index} of {name} refers to an unknown parameter")
+        namespace[f"_error_{index}"] = rule.error
+        templates.append(_condition_template(index, rule, namespace))
+
+    body = []
+    if any("{now}" in template for template in templates):
+        namespace["_datetime_now"], namespace["_utc"] = datetime.now, timezone.utc
+        body.append("_now = _datetime_now(_utc)")
+    if any("{today}" in template for template in templates):
+        namespace["_date_today"] = date.today
+        body.append("_today = _date_today()")
+    for index, (rule, template) in enumerate(zip(rules, templates)):
+        body.append(f"if not ({template.format(now='_now', today='_today')}):")
+        body.append(f"    raise _error_{index}({rule.message!r})")
+
+    source = f"def {name}({', '.join(parameters)}):\n" + "".join(f"    {line}\n" for line in body or ["pass"])
+    filename = f"<generated validator {name}>"
+    exec(compile(source, filename, "exec"), namespace)
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+
+    validator = namespace[name]
+    validator.__source__ = source
+    return validator
+
+
+def generate_partial_validators(name: str, parameters: Sequence[str],
+                                rules: Sequence[FieldRule]) -> Callable[[FrozenSet[str]], Callable[..., None]]:
+    """
+    Builds ``skipping(verified)``, which returns the validator of ``rules`` without
+    the single-field rules on the ``verified`` parameters.
+
+    Used for values backed by a ValidatedFields token. Rules with ``arguments``
+    relate several fields and are always kept. Each set of verified fields is
+    generated once and reused.
+    """
+    @lru_cache(maxsize=None)
+    def skipping(verified: FrozenSet[str]) -> Callable[..., None]:
+        remaining = [rule for rule in rules if rule.arguments or rule.field not in verified]
+        return generate_validator(f"{name}_unverified", parameters, remaining)
+
+    return skipping
+
+
+def _condition_template(index: int, rule: FieldRule, namespace: Dict[str, object]) -> str:
+    """Returns the rule's condition, with only the ``{now}`` and ``{today}`` placeholders left."""
+    if rule.arguments:
+        namespace[f"_spec_{index}"] = rule.specification
+        return f"_spec_{index}({', '.join(rule.arguments)}).is_satisfied_by({rule.field})"
+
+    specification: Specification = rule.specification
+    check = specification.inline()
+    if check is None:
+        namespace[f"_predicate_{index}"] = specification.compile()
+        return f"_predicate_{index}({rule.field})"
+
+    names = {}
+    for key, value in check.names.items():
+        names[key] = f"_{key}_{index}"
+        namespace[names[key]] = value
+    return check.template.format(value=rule.field, now="{now}", today="{today}", **names)
@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from ..exceptions import InvalidPasswordError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserCredentials:
     """
     Immutable value object for user credentials.
@@ -0,0 +1,15 @@
+from .ttl_lru_cache import CacheStatistics, TTLLRUCache
+from .user_cache import UserCache
+from .backends import CacheBackend, InMemoryCacheBackend, InMemoryCacheBroker, RedisCacheBackend
+from .invalidation import CacheInvalidationListener
+
+__all__ = [
+    "CacheStatistics",
+    "TTLLRUCache",
+    "UserCache",
+    "CacheBackend",
+    "InMemoryCacheBackend",
+    "InMemoryCacheBroker",
+    "RedisCacheBackend",
+    "CacheInvalidationListener"
+]
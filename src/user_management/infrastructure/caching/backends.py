@@ -0,0 +1,188 @@
+"""
+Shared cache backends.
+
+A CacheBackend is a small key/value store with per-key expiry plus a pub/sub
+channel, the subset of the Redis protocol the shared caches need. Values are
+opaque bytes (see projections.py).
+
+RedisCacheBackend works with any ``redis.asyncio``-compatible client, so it
+talks to Redis, Valkey, KeyDB, or ``fakeredis.aioredis`` in tests.
+InMemoryCacheBackend keeps everything in the process. Several backends
+attached to one InMemoryCacheBroker behave like workers connected to one
+Redis server, which is how the cross-worker behaviour is tested without a
+server.
+"""
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # pragma: no cover - optional dependency
+    redis_asyncio = None
+
+
+class CacheBackend(ABC):
+    """
+    Key/value store with expiry and pub/sub, shared by all workers.
+    """
+
+    @abstractmethod
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        """
+        Returns the value of every key, in order, with None for missing keys.
+        """
+        ...
+
+    @abstractmethod
+    async def set_many(self, items: Mapping[str, bytes], ttl_seconds: float) -> None:
+        """
+        Stores every item, each expiring ``ttl_seconds`` from now.
+        """
+        ...
+
+    @abstractmethod
+    async def delete(self, keys: Sequence[str]) -> None:
+        ...
+
+    @abstractmethod
+    async def publish(self, channel: str, message: bytes) -> None:
+        ...
+
+    @abstractmethod
+    async def subscribe(self, channel: str) -> AsyncIterator[bytes]:
+        """
+        Subscribes to ``channel`` and returns an iterator of the messages published on it.
+
+        The subscription is active when this returns, so no message published
+        afterwards is missed. Closing the iterator (``aclose``) unsubscribes.
+        """
+        ...
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return (await self.get_many([key]))[0]
+
+    async def close(self) -> None:
+        """
+        Releases connections held by the backend.
+        """
+
+
+class InMemoryCacheBroker:
+    """
+    The state shared by InMemoryCacheBackend instances: one "server".
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.entries: Dict[str, Tuple[float, bytes]] = {}
+        self.subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    In-process CacheBackend, for tests and single-worker deployments.
+
+    Backends attached to the same broker share data and pub/sub messages.
+    """
+
+    def __init__(self, broker: Optional[InMemoryCacheBroker] = None):
+        self.broker = broker or InMemoryCacheBroker()
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        now = self.broker.clock()
+        values = []
+        for key in keys:
+            entry = self.broker.entries.get(key)
+            if entry is not None and entry[0] <= now:
+                del self.broker.entries[key]
+                entry = None
+            values.append(entry[1] if entry is not None else None)
+        return values
+
+    async def set_many(self, items: Mapping[str, bytes], ttl_seconds: float) -> None:
+        expires_at = self.broker.clock() + ttl_seconds
+        for key, value in items.items():
+            self.broker.entries[key] = (expires_at, value)
+
+    async def delete(self, keys: Sequence[str]) -> None:
+        for key in keys:
+            self.broker.entries.pop(key, None)
+
+    async def publish(self, channel: str, message: bytes) -> None:
+        for queue in list(self.broker.subscribers.get(channel, ())):
+            queue.put_nowait(message)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[bytes]:
+        queue: asyncio.Queue = asyncio.Queue()
+        subscribers = self.broker.subscribers.setdefault(channel, set())
+        subscribers.add(queue)
+        return self._messages(queue, subscribers)
+
+    @staticmethod
+    async def _messages(queue: asyncio.Queue, subscribers: Set[asyncio.Queue]) -> AsyncIterator[bytes]:
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            subscribers.discard(queue)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    CacheBackend on a Redis-protocol server.
+
+    Args:
+        client: A ``redis.asyncio.Redis`` (or compatible) client.
+        key_prefix (str): Namespace prepended to every key and channel.
+    """
+
+    def __init__(self, client: Any, key_prefix: str = "nextgenhealth:"):
+        self.client = client
+        self.key_prefix = key_prefix
+
+    @classmethod
+    def from_url(cls, url: str, key_prefix: str = "nextgenhealth:") -> 'RedisCacheBackend':
+        if redis_asyncio is None:
+            raise RuntimeError("The redis package is required for the redis cache backend (pip install redis)")
+        return cls(redis_asyncio.Redis.from_url(url), key_prefix)
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        if not keys:
+            return []
+        return await self.client.mget([self.key_prefix + key for key in keys])
+
+    async def set_many(self, items: Mapping[str, bytes], ttl_seconds: float) -> None:
+        if not items:
+            return
+        ttl_milliseconds = max(1, int(ttl_seconds * 1000))
+        async with self.client.pipeline(transaction=False) as pipeline:
+            for key, value in items.items():
+                pipeline.set(self.key_prefix + key, value, px=ttl_milliseconds)
+            await pipeline.execute()
+
+    async def delete(self, keys: Sequence[str]) -> None:
+        if keys:
+            await self.client.delete(*(self.key_prefix + key for key in keys))
+
+    async def publish(self, channel: str, message: bytes) -> None:
+        await self.client.publish(self.key_prefix + channel, message)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[bytes]:
+        pubsub = self.client.pubsub()
+        await pubsub.subscribe(self.key_prefix + channel)
+        return self._messages(pubsub)
+
+    @staticmethod
+    async def _messages(pubsub: Any) -> AsyncIterator[bytes]:
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    yield message["data"]
+        finally:
+            await pubsub.unsubscribe()
+            await pubsub.aclose()
+
+    async def close(self) -> None:
+        await self.client.aclose()
@@ -0,0 +1,87 @@
+"""
+Cross-worker cache invalidation over the shared backend's pub/sub channel.
+
+Every worker keeps a process-local UserCache in front of the shared cache.
+When any worker writes a user, it publishes an invalidation message; the
+CacheInvalidationListener of every worker, including the writer's, evicts
+the local entries, so no worker keeps serving the old version until its TTL.
+
+Messages are ``<kind>:<hex uuid>[,<hex uuid>...]``, e.g. ``user:1f0c...``.
+"""
+import asyncio
+import logging
+from typing import Callable, Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+from user_management.infrastructure.caching.backends import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache-invalidation"
+
+USER = "user"
+PATIENT_PROFILE = "patient-profile"
+
+
+def encode_invalidation(kind: str, uuids: Iterable[UUID]) -> bytes:
+    return f"{kind}:{','.join(uuid.hex for uuid in uuids)}".encode("ascii")
+
+
+def decode_invalidation(message: bytes) -> Tuple[str, Tuple[UUID, ...]]:
+    kind, _, uuids = message.decode("ascii").partition(":")
+    return kind, tuple(UUID(hex=value) for value in uuids.split(",") if value)
+
+
+async def publish_invalidation(backend: CacheBackend, kind: str, uuids: Iterable[UUID]) -> None:
+    uuids = list(uuids)
+    if uuids:
+        await backend.publish(INVALIDATION_CHANNEL, encode_invalidation(kind, uuids))
+
+
+class CacheInvalidationListener:
+    """
+    Background task applying invalidation messages to process-local caches.
+
+    Args:
+        backend: The shared backend whose channel is listened to.
+        handlers: For each kind of entry, the callable evicting one UUID locally.
+    """
+
+    def __init__(self, backend: CacheBackend, handlers: Dict[str, Callable[[UUID], None]]):
+        self.backend = backend
+        self.handlers = handlers
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """
+        Subscribes and starts listening; messages published after this returns are applied.
+        """
+        if self._task is not None:
+            return
+        messages = await self.backend.subscribe(INVALIDATION_CHANNEL)
+        self._task = asyncio.create_task(self._listen(messages), name="cache-invalidation-listener")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _listen(self, messages) -> None:
+        try:
+            async for message in messages:
+                try:
+                    kind, uuids = decode_invalidation(message)
+                except ValueError:
+                    logger.warning("Ignoring malformed cache invalidation message: %r", message)
+                    continue
+                handler = self.handlers.get(kind)
+                if handler is not None:
+                    for uuid in uuids:
+                        handler(uuid)
+        finally:
+            await messages.aclose()
@@ -0,0 +1,156 @@
+"""
+Compact serialized projections of User and PatientProfile for shared caches.
+
+An entity is stored as a JSON array of its fields in a fixed order, with a
+format version first, so no field names are repeated in every entry:
+
+- UUIDs as 32 hex digits, enums as their values, dates as ordinals,
+- datetimes as integer microseconds since the epoch (UTC), which round-trip
+  exactly where floats would not.
+
+Password hashes are never written to the shared cache. Users decoded from it
+carry UNCACHED_CREDENTIALS, which raise instead of checking a password or
+being stored, so anything that needs the credentials (a login, a password
+change, a save) must load the user from the database; the unit of work does.
+
+A User entry is about 170 bytes. Entries whose version does not match are
+treated as misses, so a deploy that changes the layout only costs reloads.
+"""
+import json
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+from uuid import UUID
+
+from user_management.domain.entities import PatientProfile, User
+from user_management.domain.enums import UserRole, UserStatus
+from user_management.domain.value_objects import UserCredentials
+
+PROJECTION_VERSION = 2
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class UncachedCredentials(UserCredentials):
+    """
+    Stands in for the credentials of a user decoded from the shared cache.
+    """
+    __slots__ = ()
+
+    @property
+    def _hashed_password(self) -> str:
+        raise RuntimeError("The shared cache holds no password hashes; "
+                           "load the user from the database to check or store its credentials")
+
+    def __eq__(self, other) -> bool:
+        return self is other
+
+    def __hash__(self) -> int:
+        return id(self)
+
+    def __repr__(self) -> str:
+        return "UncachedCredentials()"
+
+
+UNCACHED_CREDENTIALS = object.__new__(UncachedCredentials)
+
+
+def has_credentials(user: User) -> bool:
+    """
+    Tells whether the user was loaded with its credentials, i.e. not from the shared cache.
+    """
+    return user._credentials is not UNCACHED_CREDENTIALS
+
+
+def encode_user(user: User) -> bytes:
+    return _dump([
+        PROJECTION_VERSION,
+        user.uuid.hex,
+        user.email,
+        user.first_name,
+        user.last_name,
+        user.phone,
+        user.date_of_birth.toordinal(),
+        user.user_role.value,
+        user.user_status.value,
+        _encode_datetime(user.created_at),
+        _encode_datetime(user.updated_at),
+    ])
+
+
+def decode_user(data: bytes) -> Optional[User]:
+    fields = _load(data)
+    if fields is None:
+        return None
+    (_, uuid, email, first_name, last_name, phone, date_of_birth, user_role, user_status,
+     created_at, updated_at) = fields
+    return User._rehydrate(
+        uuid=UUID(hex=uuid),
+        email=email,
+        first_name=first_name,
+        last_name=last_name,
+        phone=phone,
+        date_of_birth=date.fromordinal(date_of_birth),
+        user_role=UserRole(user_role),
+        user_status=UserStatus(user_status),
+        created_at=_decode_datetime(created_at),
+        updated_at=_decode_datetime(updated_at),
+        credentials=UNCACHED_CREDENTIALS,
+    )
+
+
+def encode_user_version(user: User) -> bytes:
+    """
+    The user's ``updated_at`` as an opaque, ordered cache value (integer microseconds).
+    """
+    return str(_encode_datetime(user.updated_at)).encode("ascii")
+
+
+def encode_patient_profile(profile: PatientProfile) -> bytes:
+    return _dump([
+        PROJECTION_VERSION,
+        profile.user_uuid.hex,
+        profile.emergency_contact_name,
+        profile.emergency_contact_phone,
+        profile.insurance_info,
+        profile.preferred_language,
+        profile.medical_history_summary,
+        _encode_datetime(profile.created_at),
+        _encode_datetime(profile.updated_at),
+    ])
+
+
+def decode_patient_profile(data: bytes) -> Optional[PatientProfile]:
+    fields = _load(data)
+    if fields is None:
+        return None
+    (_, user_uuid, emergency_contact_name, emergency_contact_phone, insurance_info, preferred_language,
+     medical_history_summary, created_at, updated_at) = fields
+    return PatientProfile._rehydrate(
+        user_uuid=UUID(hex=user_uuid),
+        emergency_contact_name=emergency_contact_name,
+        emergency_contact_phone=emergency_contact_phone,
+        insurance_info=insurance_info,
+        preferred_language=preferred_language,
+        medical_history_summary=medical_history_summary,
+        created_at=_decode_datetime(created_at),
+        updated_at=_decode_datetime(updated_at),
+    )
+
+
+def _dump(fields: list) -> bytes:
+    return json.dumps(fields, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _load(data: bytes) -> Optional[list]:
+    fields = json.loads(data)
+    if not fields or fields[0] != PROJECTION_VERSION:
+        return None
+    return fields
+
+
+def _encode_datetime(value: datetime) -> int:
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _decode_datetime(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
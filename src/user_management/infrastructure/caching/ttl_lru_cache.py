@@ -0,0 +1,133 @@
+"""
+Bounded in-process cache with least-recently-used eviction and a time to live.
+
+Entries expire ``ttl_seconds`` after they were stored, whatever their use,
+which bounds how stale a value can be when it is changed behind the cache's
+back (another process, a manual UPDATE). ``max_entries`` bounds memory: when
+full, storing a new key evicts the least recently read or written entry.
+
+All operations are O(1). The cache is meant to be used from a single event
+loop thread and does no locking.
+"""
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStatistics:
+    """
+    Counters of a cache since it was created.
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    size: int = 0
+    max_entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TTLLRUCache(Generic[K, V]):
+    """
+    LRU cache whose entries also expire after a fixed time to live.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            max_entries (int): Maximum number of entries kept.
+            ttl_seconds (float): Lifetime of an entry from the moment it is stored.
+            clock: Monotonic time source, in seconds; injectable for tests.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be a positive integer")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self._statistics = CacheStatistics(max_entries=max_entries)
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Returns the live value for ``key`` and marks it recently used, or None.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._statistics.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self._statistics.expirations += 1
+            self._statistics.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._statistics.hits += 1
+        return value
+
+    def peek(self, key: K) -> Optional[V]:
+        """
+        Returns the live value for ``key`` without counting a lookup or touching its recency.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self._clock():
+            return None
+        return entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Stores ``value`` with a fresh time to live, evicting the least recently used entry if full.
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        elif len(self._entries) >= self.max_entries:
+            self._entries.popitem(last=False)
+            self._statistics.evictions += 1
+        self._entries[key] = (self._clock() + self.ttl_seconds, value)
+
+    def delete(self, key: K) -> bool:
+        """
+        Removes ``key``; returns whether it was present.
+        """
+        if self._entries.pop(key, None) is None:
+            return False
+        self._statistics.invalidations += 1
+        return True
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def statistics(self) -> CacheStatistics:
+        """
+        Returns a snapshot of the counters.
+        """
+        return CacheStatistics(
+            hits=self._statistics.hits,
+            misses=self._statistics.misses,
+            evictions=self._statistics.evictions,
+            expirations=self._statistics.expirations,
+            invalidations=self._statistics.invalidations,
+            size=len(self._entries),
+            max_entries=self.max_entries,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] > self._clock()
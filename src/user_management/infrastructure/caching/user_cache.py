@@ -0,0 +1,120 @@
+"""
+Process-wide cache of users for CachingUserRepository.
+
+Users are indexed twice: by UUID (holding the user) and by lower-cased email
+(holding the UUID), each a TTLLRUCache. An email hit is only served if the
+UUID entry is still live and still has that email, so the two indexes can
+never disagree.
+
+The cache holds private copies. ``put`` stores a shallow copy and ``get_*``
+return a new shallow copy, so a caller mutating its User (change_password,
+change_user_status, ...) never changes what other requests read. A copy is
+enough because the mutators rebind attributes and UserCredentials is
+immutable.
+
+Users written by this process are evicted with ``invalidate_written``, which
+also remembers their new ``updated_at`` for the time to live. ``put`` skips a
+user older than that, so a request whose SELECT ran before the commit cannot
+store the old row after the eviction. The versions live in an LRU of the same
+size as the cache; a write pushed out of it is bounded by the time to live.
+
+Users decoded from the shared cache have no credentials (see projections.py)
+and are not stored, so every user served from here can have its password
+checked or be saved, including by the unit of work.
+"""
+import copy
+import time
+from datetime import datetime
+from typing import Callable, Iterable, Optional
+from uuid import UUID
+
+from user_management.domain.entities import User
+from user_management.infrastructure.caching.projections import has_credentials
+from user_management.infrastructure.caching.ttl_lru_cache import CacheStatistics, TTLLRUCache
+
+
+class UserCache:
+    """
+    TTL/LRU cache of users, addressable by UUID or email.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self._by_uuid: TTLLRUCache[UUID, User] = TTLLRUCache(max_entries, ttl_seconds, clock)
+        self._by_email: TTLLRUCache[str, UUID] = TTLLRUCache(max_entries, ttl_seconds, clock)
+        self._written_versions: TTLLRUCache[UUID, datetime] = TTLLRUCache(max_entries, ttl_seconds, clock)
+
+    def get_by_uuid(self, uuid: UUID) -> Optional[User]:
+        user = self._by_uuid.get(uuid)
+        return copy.copy(user) if user is not None else None
+
+    def get_by_email(self, email: str) -> Optional[User]:
+        email = email.lower()
+        uuid = self._by_email.get(email)
+        if uuid is None:
+            return None
+
+        user = self._by_uuid.get(uuid)
+        if user is None or user.email.lower() != email:
+            self._by_email.delete(email)
+            return None
+        return copy.copy(user)
+
+    def contains(self, uuid: UUID) -> bool:
+        """
+        Tells whether a live entry exists, without counting a lookup.
+        """
+        return uuid in self._by_uuid
+
+    def put(self, user: User) -> None:
+        if not has_credentials(user):
+            return
+        written_version = self._written_versions.peek(user.uuid)
+        if written_version is not None and user.updated_at < written_version:
+            return
+        self._by_uuid.set(user.uuid, copy.copy(user))
+        self._by_email.set(user.email.lower(), user.uuid)
+
+    def invalidate(self, user: User) -> None:
+        """
+        Drops a user, under its UUID and both its current and cached emails.
+        """
+        self.invalidate_uuid(user.uuid)
+        self._by_email.delete(user.email.lower())
+
+    def invalidate_uuid(self, uuid: UUID) -> None:
+        """
+        Drops a user known only by UUID, e.g. from an invalidation message.
+        """
+        cached = self._by_uuid.peek(uuid)
+        self._by_uuid.delete(uuid)
+        if cached is not None:
+            self._by_email.delete(cached.email.lower())
+
+    def invalidate_many(self, users: Iterable[User]) -> None:
+        for user in users:
+            self.invalidate(user)
+
+    def invalidate_written(self, users: Iterable[User]) -> None:
+        """
+        Drops users whose writing transaction has ended, and refuses older copies of them from then on.
+        """
+        for user in users:
+            self._written_versions.set(user.uuid, user.updated_at)
+            self.invalidate(user)
+
+    def clear(self) -> None:
+        self._by_uuid.clear()
+        self._by_email.clear()
+        self._written_versions.clear()
+
+    def statistics(self) -> CacheStatistics:
+        """
+        Counters of the cache, with every get_by_uuid/get_by_email call counted once.
+
+        An email lookup that finds its UUID goes on to count as a hit or miss on
+        the UUID index; one that does not is counted as a miss of the email index.
+        """
+        statistics = self._by_uuid.statistics()
+        statistics.misses += self._by_email.statistics().misses
+        return statistics
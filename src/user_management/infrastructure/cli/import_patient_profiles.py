@@ -0,0 +1,91 @@
+"""
+Command line entry point for bulk patient profile imports.
+
+Usage:
+    nextgenhealth-import-patients profiles.csv
+    python -m user_management.infrastructure.cli.import_patient_profiles profiles.ndjson \
+        --workers 8 --batch-size 2000 --rejects rejects.ndjson
+
+Rows are validated in a pool of worker processes and inserted in batches
+into the database configured by DATABASE_URL. Rejected rows are written to
+``<input>.rejects.ndjson`` (or ``--rejects``) with their line number and the
+reason they were left out, in the order they were rejected. Progress and throughput are reported on stderr.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from user_management.application.use_cases.import_patient_profiles import ImportPatientProfilesResult, \
+    ImportPatientProfilesUseCase
+from user_management.infrastructure.importing import IMPORT_FORMATS, RejectWriter, aiter_file_chunks, \
+    detect_import_format, read_records
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Bulk import patient profiles from a CSV or NDJSON file.")
+    parser.add_argument("input", help="CSV (with a header row) or NDJSON file to import")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, help="input format (default: from the file extension)")
+    parser.add_argument("--rejects", help="where to write rejected rows (default: <input>.rejects.ndjson)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="validation processes; 0 validates in the main process")
+    parser.add_argument("--batch-size", type=int, default=1000, help="profiles inserted per transaction")
+    args = parser.parse_args(argv)
+
+    args.format = args.format or detect_import_format(path=args.input)
+    if args.format is None:
+        parser.error("cannot tell the input format from the file name; pass --format")
+    args.rejects = args.rejects or f"{args.input}.rejects.ndjson"
+    return args
+
+
+def _print_progress(progress: ImportPatientProfilesResult) -> None:
+    print(f"\rread {progress.rows_read}  imported {progress.imported}  rejected {progress.rejected}  "
+          f"({progress.rows_per_second:,.0f} rows/s)", end="", file=sys.stderr, flush=True)
+
+
+async def _run(args: argparse.Namespace) -> ImportPatientProfilesResult:
+    # Imported here so --help works without a database configuration.
+    from user_management.infrastructure.database.postgres_config import async_sessionmaker_instance, engine
+    from user_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+    executor = None
+    if args.workers > 0:
+        executor = ProcessPoolExecutor(max_workers=args.workers, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        async with async_sessionmaker_instance() as session:
+            use_case = ImportPatientProfilesUseCase(
+                unit_of_work=SqlAlchemyUnitOfWork(session),
+                executor=executor,
+                batch_size=args.batch_size,
+                max_in_flight=2 * max(args.workers, 1),
+            )
+            with open(args.rejects, "w", encoding="utf-8") as rejects_file:
+                return await use_case.execute(
+                    read_records(aiter_file_chunks(args.input), args.format),
+                    on_reject=RejectWriter(rejects_file),
+                    on_progress=_print_progress,
+                )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        await engine.dispose()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+    result = asyncio.run(_run(args))
+    _print_progress(result)
+    print(file=sys.stderr)
+    print(f"{result.imported} imported, {result.rejected} rejected of {result.rows_read} rows "
+          f"in {result.elapsed_seconds:.1f}s ({result.rows_per_second:,.0f} rows/s)", file=sys.stderr)
+    if result.rejected:
+        print(f"rejected rows written to {args.rejects}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""
+Environment-driven settings for the SQLAlchemy engine and its connection pool.
+
+Every value can be overridden through an environment variable (or the .env
+file loaded by python-dotenv), so pool sizing can be tuned per deployment
+without code changes.
+"""
+import os
+from dataclasses import dataclass, field, replace
+from typing import Optional
+
+STORAGE_MODES = ("legacy", "compact")
+
+
+_TRUE_VALUES = ("1", "true", "yes", "on")
+_FALSE_VALUES = ("0", "false", "no", "off")
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    value = value.strip().lower()
+    if value not in _TRUE_VALUES + _FALSE_VALUES:
+        raise ValueError(f"Invalid {name}: {value!r}. Expected one of {', '.join(_TRUE_VALUES + _FALSE_VALUES)}")
+    return value in _TRUE_VALUES
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"Invalid {name}: {value!r}. Expected an integer") from None
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"Invalid {name}: {value!r}. Expected a number") from None
+
+
+@dataclass(frozen=True)
+class DatabaseSettings:
+    """
+    Connection and pool settings used to build the async engine.
+
+    Attributes:
+        url: SQLAlchemy database URL (``DATABASE_URL``).
+        echo: Log every emitted statement (``DB_ECHO``).
+        pool_size: Connections kept open in the pool (``DB_POOL_SIZE``).
+        max_overflow: Extra connections allowed under burst load (``DB_MAX_OVERFLOW``).
+        pool_timeout: Seconds to wait for a free connection before failing (``DB_POOL_TIMEOUT``).
+        pool_pre_ping: Test connections on checkout (``DB_POOL_PRE_PING``).
+        pool_recycle: Seconds after which a connection is replaced; -1 disables (``DB_POOL_RECYCLE``).
+        statement_cache_size: asyncpg prepared statement cache per connection (``DB_STATEMENT_CACHE_SIZE``).
+        statement_timeout_ms: Server-side statement timeout; 0 disables (``DB_STATEMENT_TIMEOUT_MS``).
+        replica_url: Read replica URL; reads use the primary when unset (``REPLICA_DATABASE_URL``).
+        read_your_writes_seconds: How long a client that just wrote keeps reading
+            from the primary (``DB_READ_YOUR_WRITES_SECONDS``).
+        read_your_writes_secret: Key signing read-your-writes cookies; every worker
+            must share it. When unset, each process uses a random key, so a cookie
+            only pins reads served by the worker that issued it
+            (``DB_READ_YOUR_WRITES_SECRET``).
+        storage_mode: Column encoding for users and credentials, ``legacy`` (text
+            UUIDs, hex digests, named enums) or ``compact`` (native UUIDs, raw
+            digests, small-integer enums) (``DB_STORAGE_MODE``).
+    """
+    url: str = "sqlite+aiosqlite:///./fallback_test.db"
+    echo: bool = False
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: int = 30
+    pool_pre_ping: bool = True
+    pool_recycle: int = 1800
+    statement_cache_size: int = 100
+    statement_timeout_ms: int = 0
+    replica_url: Optional[str] = None
+    read_your_writes_seconds: float = 5.0
+    read_your_writes_secret: Optional[str] = field(default=None, repr=False)
+    storage_mode: str = "legacy"
+
+    def __post_init__(self):
+        if self.storage_mode not in STORAGE_MODES:
+            raise ValueError(f"Invalid storage mode: {self.storage_mode}. Expected one of {', '.join(STORAGE_MODES)}")
+        if self.pool_size < 1:
+            raise ValueError(f"Invalid pool size: {self.pool_size}. Expected at least 1")
+        if self.max_overflow < -1:
+            raise ValueError(f"Invalid max overflow: {self.max_overflow}. Expected -1 (unlimited) or more")
+        if self.pool_timeout <= 0:
+            raise ValueError(f"Invalid pool timeout: {self.pool_timeout}. Expected a positive number of seconds")
+        if self.pool_recycle < -1:
+            raise ValueError(f"Invalid pool recycle: {self.pool_recycle}. Expected -1 (disabled) or more")
+        for name in ("statement_cache_size", "statement_timeout_ms", "read_your_writes_seconds"):
+            if getattr(self, name) < 0:
+                raise ValueError(f"Invalid {name.replace('_', ' ')}: {getattr(self, name)}. Expected 0 or more")
+
+    @classmethod
+    def from_env(cls) -> 'DatabaseSettings':
+        """
+        Builds settings from environment variables, falling back to the class defaults.
+
+        Returns:
+            DatabaseSettings: The resolved settings.
+
+        Raises:
+            ValueError: If a variable cannot be parsed or a value is out of range.
+        """
+        defaults = cls()
+        return cls(
+            url=os.getenv("DATABASE_URL", defaults.url),
+            echo=_env_bool("DB_ECHO", defaults.echo),
+            pool_size=_env_int("DB_POOL_SIZE", defaults.pool_size),
+            max_overflow=_env_int("DB_MAX_OVERFLOW", defaults.max_overflow),
+            pool_timeout=_env_int("DB_POOL_TIMEOUT", defaults.pool_timeout),
+            pool_pre_ping=_env_bool("DB_POOL_PRE_PING", defaults.pool_pre_ping),
+            pool_recycle=_env_int("DB_POOL_RECYCLE", defaults.pool_recycle),
+            statement_cache_size=_env_int("DB_STATEMENT_CACHE_SIZE", defaults.statement_cache_size),
+            statement_timeout_ms=_env_int("DB_STATEMENT_TIMEOUT_MS", defaults.statement_timeout_ms),
+            replica_url=(os.getenv("REPLICA_DATABASE_URL") or "").strip() or defaults.replica_url,
+            read_your_writes_seconds=_env_float("DB_READ_YOUR_WRITES_SECONDS", defaults.read_your_writes_seconds),
+            read_your_writes_secret=os.getenv("DB_READ_YOUR_WRITES_SECRET") or defaults.read_your_writes_secret,
+            storage_mode=os.getenv("DB_STORAGE_MODE", defaults.storage_mode).strip().lower(),
+        )
+
+    def for_replica(self) -> 'DatabaseSettings':
+        """
+        Returns a copy of these settings pointing at the read replica.
+
+        Raises:
+            ValueError: If no replica URL is configured.
+        """
+        if not self.replica_url:
+            raise ValueError("No read replica URL configured")
+        return replace(self, url=self.replica_url, replica_url=None)
@@ -0,0 +1,118 @@
+"""
+Connection pool telemetry.
+
+InstrumentedAsyncAdaptedQueuePool behaves exactly like SQLAlchemy's default
+async queue pool but records how long every checkout waited for a connection.
+Together with the pool's own counters this gives a live view of pool pressure.
+"""
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Upper bounds (in milliseconds) of the checkout wait time histogram buckets.
+WAIT_TIME_BUCKETS_MS: Tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class PoolMetrics:
+    """
+    Thread-safe accumulator for checkout counts, timeouts and wait times.
+    """
+
+    def __init__(self, buckets_ms: Tuple[float, ...] = WAIT_TIME_BUCKETS_MS):
+        self._lock = threading.Lock()
+        self._buckets_ms = buckets_ms
+        self._bucket_counts = [0] * (len(buckets_ms) + 1)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_time_ms_sum = 0.0
+        self.wait_time_ms_max = 0.0
+
+    def observe_wait(self, seconds: float) -> None:
+        waited_ms = seconds * 1000.0
+        with self._lock:
+            self.checkouts += 1
+            self.wait_time_ms_sum += waited_ms
+            self.wait_time_ms_max = max(self.wait_time_ms_max, waited_ms)
+            for position, upper_bound in enumerate(self._buckets_ms):
+                if waited_ms <= upper_bound:
+                    self._bucket_counts[position] += 1
+                    break
+            else:
+                self._bucket_counts[-1] += 1
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            labels = [f"{bound:g}" for bound in self._buckets_ms] + ["+Inf"]
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_time_ms": {
+                    "sum": round(self.wait_time_ms_sum, 3),
+                    "max": round(self.wait_time_ms_max, 3),
+                    "mean": round(self.wait_time_ms_sum / self.checkouts, 3) if self.checkouts else 0.0,
+                    "histogram": dict(zip(labels, self._bucket_counts)),
+                },
+            }
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that times every checkout into a PoolMetrics instance.
+
+    The metrics object survives ``recreate()`` (e.g. after ``engine.dispose()``),
+    so counters are not reset when the pool is rebuilt.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        finally:
+            self.metrics.observe_wait(time.perf_counter() - started)
+
+    def recreate(self) -> 'InstrumentedAsyncAdaptedQueuePool':
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def pool_statistics(pool) -> Dict[str, Any]:
+    """
+    Returns a JSON-serializable snapshot of the pool state.
+
+    Args:
+        pool: The engine's connection pool (``engine.pool`` or ``engine.sync_engine.pool``).
+
+    Returns:
+        dict: Pool class, size, checked in/out and overflow counts, plus
+        checkout metrics when the pool is instrumented.
+    """
+    statistics: Dict[str, Any] = {"pool_class": type(pool).__name__}
+
+    if hasattr(pool, "checkedout"):
+        statistics.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        })
+
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        statistics.update(metrics.snapshot())
+
+    return statistics
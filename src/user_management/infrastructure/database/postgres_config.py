@@ -1,11 +1,82 @@
-import os
+import logging
+import secrets
+from typing import Any, Dict
+
 from dotenv import load_dotenv
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
+from user_management.infrastructure.database.database_settings import DatabaseSettings
+from user_management.infrastructure.database.pool_metrics import InstrumentedAsyncAdaptedQueuePool
+from user_management.infrastructure.database.session_routing import ReadYourWritesTokens, RoutingSessionProvider
+from user_management.infrastructure.models.types import set_storage_mode
+
 load_dotenv()
 
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./fallback_test.db")
+logger = logging.getLogger(__name__)
+
+
+def create_engine_from_settings(settings: DatabaseSettings) -> AsyncEngine:
+    """
+    Builds the async engine with pool sizing and driver options taken from settings.
+
+    Pool options are only applied to databases served through a queue pool;
+    in-memory SQLite keeps SQLAlchemy's default single-connection pool.
+    asyncpg-specific options (statement cache, statement timeout) are only
+    sent when the URL uses the asyncpg driver.
+
+    Args:
+        settings (DatabaseSettings): Connection and pool settings.
+
+    Returns:
+        AsyncEngine: The configured engine.
+    """
+    url = make_url(settings.url)
+    engine_kwargs: Dict[str, Any] = {"echo": settings.echo}
+
+    is_memory_sqlite = url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+    if not is_memory_sqlite:
+        engine_kwargs.update(
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            pool_size=settings.pool_size,
+            max_overflow=settings.max_overflow,
+            pool_timeout=settings.pool_timeout,
+            pool_pre_ping=settings.pool_pre_ping,
+            pool_recycle=settings.pool_recycle,
+        )
+
+    if url.get_driver_name() == "asyncpg":
+        connect_args: Dict[str, Any] = {"statement_cache_size": settings.statement_cache_size}
+        if settings.statement_timeout_ms > 0:
+            connect_args["server_settings"] = {"statement_timeout": str(settings.statement_timeout_ms)}
+        engine_kwargs["connect_args"] = connect_args
+
+    return create_async_engine(url, **engine_kwargs)
+
+
+database_settings = DatabaseSettings.from_env()
+DATABASE_URL = database_settings.url
+set_storage_mode(database_settings.storage_mode)
+
+engine = create_engine_from_settings(database_settings)
+async_sessionmaker_instance = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+replica_engine = create_engine_from_settings(database_settings.for_replica()) if database_settings.replica_url else None
+replica_sessionmaker_instance = (
+    sessionmaker(replica_engine, class_=AsyncSession, expire_on_commit=False) if replica_engine else None
+)
+
+if database_settings.read_your_writes_secret:
+    read_your_writes_secret = database_settings.read_your_writes_secret.encode("utf-8")
+else:
+    read_your_writes_secret = secrets.token_bytes(32)
+    if replica_engine is not None:
+        logger.warning("DB_READ_YOUR_WRITES_SECRET is not set: read-your-writes cookies are only honoured "
+                       "by the worker that issued them")
 
-engine = create_async_engine(DATABASE_URL, echo=True)
-async_sessionmaker_instance = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
\ No newline at end of file
+session_provider = RoutingSessionProvider(
+    primary=async_sessionmaker_instance,
+    replica=replica_sessionmaker_instance,
+    tokens=ReadYourWritesTokens(read_your_writes_secret, database_settings.read_your_writes_seconds),
+)
@@ -1,21 +1,239 @@
-from typing import AsyncGenerator
-from fastapi import Depends
+import asyncio
+import logging
+import os
+from dataclasses import asdict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncContextManager, AsyncGenerator, Callable, Dict, Optional
+from fastapi import Depends, Request
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from user_management.infrastructure.database.postgres_config import async_sessionmaker_instance
-from user_management.infrastructure.repositories import PostgresPatientProfileRepository
+from user_management.infrastructure.caching import CacheBackend, CacheInvalidationListener, InMemoryCacheBackend, \
+    RedisCacheBackend, UserCache
+from user_management.infrastructure.caching.invalidation import USER
+from user_management.infrastructure.database.pool_metrics import pool_statistics
+from user_management.infrastructure.database.postgres_config import async_sessionmaker_instance, database_settings, \
+    engine, replica_engine, session_provider
+from user_management.infrastructure.filters import BloomRegisteredEmailFilter
+from user_management.infrastructure.models import UserModel
+from user_management.infrastructure.repositories.asyncpg_user_repository import AsyncpgUserRepository
+from user_management.infrastructure.repositories.caching_user_repository import CachingUserRepository
+from user_management.infrastructure.repositories.postgres_patient_profile_repository import \
+    PostgresPatientProfileRepository
+from user_management.infrastructure.repositories.shared_caching_patient_profile_repository import \
+    SharedCachingPatientProfileRepository
+from user_management.infrastructure.repositories.shared_caching_user_repository import SharedCachingUserRepository
+from user_management.infrastructure.repositories.identity_map_user_repository import IdentityMapUserRepository, \
+    UserIdentityMap
 from user_management.infrastructure.repositories.postgres_user_repository import PostgresUserRepository
+from user_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
 
+logger = logging.getLogger(__name__)
 
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Provides a database session for dependency injection."""
-    async with async_sessionmaker_instance() as session:
+# A request that commits a write gets a signed read-your-writes token (see session_routing.py) in
+# ``request.state``; the API returns it in this cookie, and reads presenting it use the primary.
+READ_YOUR_WRITES_COOKIE = "read_your_writes"
+READ_YOUR_WRITES_STATE = "read_your_writes_token"
+READ_YOUR_WRITES_SECONDS = database_settings.read_your_writes_seconds
+
+# Implementation behind query endpoints: "orm" (PostgresUserRepository) or
+# "asyncpg" (raw prepared statements; requires the postgresql+asyncpg driver).
+USER_READ_REPOSITORIES = {
+    "orm": PostgresUserRepository,
+    "asyncpg": AsyncpgUserRepository,
+}
+USER_READ_REPOSITORY = os.getenv("USER_READ_REPOSITORY", "orm").strip().lower()
+
+if USER_READ_REPOSITORY not in USER_READ_REPOSITORIES:
+    raise ValueError(f"Invalid USER_READ_REPOSITORY: {USER_READ_REPOSITORY}. "
+                     f"Expected one of {', '.join(USER_READ_REPOSITORIES)}")
+if USER_READ_REPOSITORY == "asyncpg" and engine.dialect.driver != "asyncpg":
+    raise ValueError(f"USER_READ_REPOSITORY=asyncpg requires the asyncpg driver, got {engine.dialect.driver}")
+
+# Process-wide user cache: USER_CACHE_MAX_ENTRIES=0 disables it; entries live
+# at most USER_CACHE_TTL_SECONDS, which bounds staleness after out-of-process writes.
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", "10000"))
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "30"))
+user_cache = UserCache(USER_CACHE_MAX_ENTRIES, USER_CACHE_TTL_SECONDS) if USER_CACHE_MAX_ENTRIES > 0 else None
+
+# Cache shared by all workers: "none", "redis" (CACHE_REDIS_URL) or "memory"
+# (process-local stand-in, for development and tests).
+SHARED_CACHE_BACKENDS = ("none", "redis", "memory")
+SHARED_CACHE_BACKEND = os.getenv("SHARED_CACHE_BACKEND", "none").strip().lower()
+SHARED_CACHE_TTL_SECONDS = float(os.getenv("SHARED_CACHE_TTL_SECONDS", "300"))
+
+if SHARED_CACHE_BACKEND not in SHARED_CACHE_BACKENDS:
+    raise ValueError(f"Invalid SHARED_CACHE_BACKEND: {SHARED_CACHE_BACKEND}. "
+                     f"Expected one of {', '.join(SHARED_CACHE_BACKENDS)}")
+
+
+def create_shared_cache_backend(name: str) -> Optional[CacheBackend]:
+    if name == "redis":
+        return RedisCacheBackend.from_url(os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0"))
+    if name == "memory":
+        return InMemoryCacheBackend()
+    return None
+
+
+shared_cache = create_shared_cache_backend(SHARED_CACHE_BACKEND)
+cache_invalidation_listener = (
+    CacheInvalidationListener(shared_cache, {USER: user_cache.invalidate_uuid})
+    if shared_cache is not None and user_cache is not None else None
+)
+
+
+# Bloom filter of registered emails, loaded at startup: registrations of emails
+# it has never seen skip the duplicate lookup. EMAIL_FILTER_CAPACITY=0 disables it.
+EMAIL_FILTER_CAPACITY = int(os.getenv("EMAIL_FILTER_CAPACITY", "1000000"))
+EMAIL_FILTER_ERROR_RATE = float(os.getenv("EMAIL_FILTER_ERROR_RATE", "0.01"))
+registered_email_filter = (
+    BloomRegisteredEmailFilter(EMAIL_FILTER_CAPACITY, EMAIL_FILTER_ERROR_RATE) if EMAIL_FILTER_CAPACITY > 0 else None
+)
+_email_filter_loading: Optional[asyncio.Task] = None
+
+
+async def load_registered_email_filter() -> None:
+    """Fills the registered email filter from the primary; until it is done every email is probed."""
+    try:
+        async with async_sessionmaker_instance() as session:
+            expected_count = await session.scalar(select(func.count()).select_from(UserModel))
+            loaded = await registered_email_filter.load(PostgresUserRepository(session).iter_emails(),
+                                                        expected_count or 0)
+        logger.info("Registered email filter loaded with %d emails", loaded)
+    except Exception:
+        logger.exception("Failed to load the registered email filter; registrations keep probing the database")
+
+
+def start_registered_email_filter_loading() -> None:
+    """Loads the registered email filter in the background, so startup does not wait for it."""
+    global _email_filter_loading
+    if registered_email_filter is not None and _email_filter_loading is None:
+        _email_filter_loading = asyncio.create_task(load_registered_email_filter())
+
+
+async def stop_registered_email_filter_loading() -> None:
+    global _email_filter_loading
+    if _email_filter_loading is not None:
+        _email_filter_loading.cancel()
+        try:
+            await _email_filter_loading
+        except asyncio.CancelledError:
+            pass
+        _email_filter_loading = None
+
+
+def get_registered_email_filter() -> Optional[BloomRegisteredEmailFilter]:
+    """Provides the process-wide registered email filter, or None when disabled."""
+    return registered_email_filter
+
+
+async def start_cache_invalidation() -> None:
+    """Starts applying other workers' invalidations to this worker's user cache."""
+    if cache_invalidation_listener is not None:
+        await cache_invalidation_listener.start()
+
+
+async def stop_cache_invalidation() -> None:
+    """Stops the invalidation listener and closes the shared cache connections."""
+    if cache_invalidation_listener is not None:
+        await cache_invalidation_listener.stop()
+    if shared_cache is not None:
+        await shared_cache.close()
+
+
+def get_read_your_writes_token(request: Request) -> Optional[str]:
+    """Returns the read-your-writes token the client got back from a recent write, if any."""
+    return request.cookies.get(READ_YOUR_WRITES_COOKIE)
+
+
+async def get_write_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Provides a primary session; each commit on it issues a read-your-writes token for the response."""
+    def pin(token: str) -> None:
+        setattr(request.state, READ_YOUR_WRITES_STATE, token)
+
+    async with session_provider.write_session(pin) as session:
         yield session
 
 
-def get_postgres_user_repository(session: AsyncSession = Depends(get_db_session)):
-    """Factory function to provide PostgresUserRepository."""
-    return PostgresUserRepository(session)
+async def get_read_db_session(
+        token: Optional[str] = Depends(get_read_your_writes_token)) -> AsyncGenerator[AsyncSession, None]:
+    """Provides a replica session, or a primary session for clients that wrote recently."""
+    async with session_provider.read_session(token) as session:
+        yield session
+
+
+def get_user_identity_map() -> UserIdentityMap:
+    """
+    Provides the request's UserIdentityMap.
+
+    FastAPI caches dependencies per request, so every repository and unit of
+    work built for the same request shares one map, and no map outlives it.
+    """
+    return UserIdentityMap()
+
+
+def get_postgres_user_read_repository(session: AsyncSession = Depends(get_read_db_session),
+                                      identity_map: UserIdentityMap = Depends(get_user_identity_map)):
+    """Factory function to provide the configured UserRepository for queries."""
+    repository = USER_READ_REPOSITORIES[USER_READ_REPOSITORY](session)
+    # Replica rows may predate a write that was just evicted: read the caches, never fill them from them.
+    populate = _is_primary(session)
+    if shared_cache is not None:
+        repository = SharedCachingUserRepository(repository, shared_cache, SHARED_CACHE_TTL_SECONDS, populate)
+    if user_cache is not None:
+        repository = CachingUserRepository(repository, user_cache, populate)
+    return IdentityMapUserRepository(repository, identity_map)
+
+
+def get_postgres_patient_profile_read_repository(session: AsyncSession = Depends(get_read_db_session)):
+    """Factory function to provide the PatientProfileRepository for queries."""
+    repository = PostgresPatientProfileRepository(session)
+    if shared_cache is not None:
+        repository = SharedCachingPatientProfileRepository(repository, shared_cache, SHARED_CACHE_TTL_SECONDS,
+                                                           _is_primary(session))
+    return repository
+
+
+def _is_primary(session: AsyncSession) -> bool:
+    return replica_engine is None or session.bind is not replica_engine
+
+def get_postgres_user_read_repository_scope(
+        token: Optional[str] = Depends(get_read_your_writes_token)
+) -> Callable[[], AsyncContextManager[PostgresUserRepository]]:
+    """
+    Provides a factory for read repositories that own their session.
+
+    Used by streamed responses: FastAPI closes yield dependencies before the
+    response body is sent, so the session must be opened inside the stream.
+    """
+    @asynccontextmanager
+    async def scope():
+        async with session_provider.read_session(token) as session:
+            yield USER_READ_REPOSITORIES[USER_READ_REPOSITORY](session)
+
+    return scope
+
+def get_unit_of_work(session: AsyncSession = Depends(get_write_db_session),
+                     identity_map: UserIdentityMap = Depends(get_user_identity_map)):
+    """Provides a SqlAlchemyUnitOfWork on the primary; its commit pins the client to the primary for a short window."""
+    return SqlAlchemyUnitOfWork(session, identity_map, user_cache, shared_cache, SHARED_CACHE_TTL_SECONDS)
+
+def get_database_pool_statistics() -> Dict[str, Any]:
+    """Provides a live snapshot of the primary (and replica, when configured) connection pools."""
+    statistics = pool_statistics(engine.pool)
+    if replica_engine is not None:
+        statistics["replica"] = pool_statistics(replica_engine.pool)
+    return statistics
+
+def get_user_cache_statistics() -> Dict[str, Any]:
+    """Provides hit/miss/eviction counters of the process-wide user cache."""
+    if user_cache is None:
+        return {"enabled": False}
+    statistics = user_cache.statistics()
+    return {"enabled": True, **asdict(statistics), "hit_rate": round(statistics.hit_rate, 4)}
 
-def get_postgres_patient_profile_repository(session: AsyncSession = Depends(get_db_session)):
-    return PostgresPatientProfileRepository(session)
+def get_registered_email_filter_statistics() -> Dict[str, Any]:
+    """Provides the size and estimated false positive rate of the registered email filter."""
+    if registered_email_filter is None:
+        return {"enabled": False}
+    return {"enabled": True, **registered_email_filter.statistics()}
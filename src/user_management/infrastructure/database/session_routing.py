@@ -0,0 +1,102 @@
+"""
+Primary/replica session routing.
+
+Query use cases read from a replica pool while commands write to the primary.
+Because replicas lag behind the primary, a client that has just committed a
+write is pinned to the primary for a short read-your-writes window: the
+commit issues a signed token (see ReadYourWritesTokens), the API hands it
+to the client as a cookie, and reads presenting it go to the primary.
+
+Limitations: the window is a fixed time, not the replica's actual position,
+so a replica lagging longer than the window can still serve a stale read;
+and clients that drop the cookie read from the replica straight away.
+"""
+import hashlib
+import hmac
+import time
+from typing import Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class ReadYourWritesTokens:
+    """
+    Issues and checks the signed tokens that pin a client to the primary after a write.
+
+    A token is ``<expiry in ms since the epoch>.<HMAC-SHA256 of the expiry>``.
+    It names no client and no server state backs it, so every worker sharing
+    the secret honours it, and clients cannot mint or extend one. Expiry uses
+    the wall clock, so workers' clocks must roughly agree.
+
+    Args:
+        secret (bytes): HMAC key; every worker must use the same one.
+        window_seconds (float): How long a token pins its holder; 0 issues none.
+        clock: Returns the current time in seconds since the epoch.
+    """
+
+    def __init__(self, secret: bytes, window_seconds: float, clock: Callable[[], float] = time.time):
+        self.secret = secret
+        self.window_seconds = window_seconds
+        self._clock = clock
+
+    def issue(self) -> Optional[str]:
+        if self.window_seconds <= 0:
+            return None
+        expires_at = str(int((self._clock() + self.window_seconds) * 1000))
+        return f"{expires_at}.{self._sign(expires_at)}"
+
+    def is_pinned(self, token: Optional[str]) -> bool:
+        if not token:
+            return False
+        expires_at, _, signature = token.partition(".")
+        if not expires_at.isdigit() or not hmac.compare_digest(signature, self._sign(expires_at)):
+            return False
+        return int(expires_at) > self._clock() * 1000
+
+    def _sign(self, expires_at: str) -> str:
+        return hmac.new(self.secret, expires_at.encode("ascii"), hashlib.sha256).hexdigest()
+
+
+class RoutingSessionProvider:
+    """
+    Hands out sessions bound to the primary or to the replica.
+
+    Args:
+        primary: Session factory bound to the primary database.
+        replica: Session factory bound to a read replica. When None, reads use the primary.
+        tokens: Issues and checks read-your-writes tokens. When None, no client is pinned.
+    """
+
+    def __init__(self, primary: Callable[[], AsyncSession], replica: Optional[Callable[[], AsyncSession]] = None,
+                 tokens: Optional[ReadYourWritesTokens] = None):
+        self.primary = primary
+        self.replica = replica
+        self.tokens = tokens
+
+    def read_session(self, token: Optional[str] = None) -> AsyncSession:
+        """
+        Returns a session for queries.
+
+        The replica is used unless none is configured or ``token`` is a valid
+        read-your-writes token.
+        """
+        if self.replica is None or (self.tokens is not None and self.tokens.is_pinned(token)):
+            return self.primary()
+        return self.replica()
+
+    def write_session(self, pin: Optional[Callable[[str], None]] = None) -> AsyncSession:
+        """
+        Returns a primary session for commands.
+
+        Every successful commit on it issues a read-your-writes token and passes it to ``pin``.
+        """
+        session = self.primary()
+        if pin is not None and self.tokens is not None:
+            def issue(_session) -> None:
+                token = self.tokens.issue()
+                if token is not None:
+                    pin(token)
+
+            event.listen(session.sync_session, "after_commit", issue)
+        return session
@@ -0,0 +1,7 @@
+from .bloom_filter import BloomFilter
+from .bloom_registered_email_filter import BloomRegisteredEmailFilter
+
+__all__ = [
+    "BloomFilter",
+    "BloomRegisteredEmailFilter"
+]
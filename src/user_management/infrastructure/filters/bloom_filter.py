@@ -0,0 +1,65 @@
+"""
+Bloom filter over strings.
+
+``m`` bits and ``k`` hash functions are derived from the expected number of
+items and the target false positive rate:
+
+    m = -n ln(p) / (ln 2)^2        k = (m / n) ln 2
+
+At 1% that is about 9.6 bits (1.2 bytes) per item, whatever the length of
+the strings. The k bit positions come from one 128-bit BLAKE2b digest split
+into two 64-bit halves (Kirsch–Mitzenmacher double hashing: h1 + i*h2), so
+each operation hashes the value once.
+"""
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter: no false negatives, tunable false positives.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        Args:
+            capacity (int): Number of items the filter is sized for.
+            error_rate (float): False positive rate expected at ``capacity`` items.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bit_count = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.bit_count + 7) // 8)
+
+    def add(self, value: str) -> None:
+        bits = self._bits
+        for position in self._positions(value):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+    @property
+    def size_in_bytes(self) -> int:
+        return len(self._bits)
+
+    def estimated_error_rate(self) -> float:
+        """
+        False positive rate expected with the number of items added so far.
+        """
+        return (1 - math.exp(-self.hash_count * self.count / self.bit_count)) ** self.hash_count
+
+    def _positions(self, value: str):
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        bit_count = self.bit_count
+        return ((first + i * second) % bit_count for i in range(self.hash_count))
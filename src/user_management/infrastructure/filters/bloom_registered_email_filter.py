@@ -0,0 +1,87 @@
+"""
+RegisteredEmailFilter backed by a Bloom filter, loaded from the database.
+
+Emails are normalised (stripped, lower-cased) exactly like the
+case-insensitive unique index on ``lower(email)``. Until ``load`` has
+finished, every email is reported as possibly registered, so registrations
+during startup still take the safe path.
+
+When the table outgrows the configured capacity, the filter is sized for
+twice the number of emails found at load time, which keeps the false positive
+rate near the target as new users are added.
+"""
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from user_management.application.registered_emails import RegisteredEmailFilter
+from user_management.infrastructure.filters.bloom_filter import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+
+class BloomRegisteredEmailFilter(RegisteredEmailFilter):
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.01):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._filter = BloomFilter(capacity, error_rate)
+        self._loaded = False
+        self._added_while_loading: Optional[List[str]] = None
+
+    @staticmethod
+    def normalize(email: str) -> str:
+        return email.strip().lower()
+
+    def might_be_registered(self, email: str) -> bool:
+        if not self._loaded:
+            return True
+        return self.normalize(email) in self._filter
+
+    def add(self, email: str) -> None:
+        email = self.normalize(email)
+        self._filter.add(email)
+        if self._added_while_loading is not None:
+            self._added_while_loading.append(email)
+
+    async def load(self, emails: AsyncIterator[str], expected_count: int = 0) -> int:
+        """
+        Rebuilds the filter from every registered email.
+
+        Emails registered through ``add`` while loading are kept.
+
+        Args:
+            emails: All registered emails, e.g. from UserRepository.iter_emails.
+            expected_count (int): Approximate number of emails, used for sizing.
+
+        Returns:
+            int: Number of emails loaded.
+        """
+        loading = BloomFilter(max(self.capacity, 2 * expected_count), self.error_rate)
+        self._added_while_loading = []
+        loaded = 0
+        try:
+            async for email in emails:
+                loading.add(self.normalize(email))
+                loaded += 1
+            for email in self._added_while_loading:
+                loading.add(email)
+        finally:
+            self._added_while_loading = None
+
+        if loading.count > loading.capacity:
+            logger.warning("Registered email filter holds %d emails for a capacity of %d; "
+                           "false positive rate is now %.3f", loading.count, loading.capacity,
+                           loading.estimated_error_rate())
+        self._filter = loading
+        self._loaded = True
+        return loaded
+
+    def statistics(self) -> Dict[str, Any]:
+        return {
+            "loaded": self._loaded,
+            "emails": self._filter.count,
+            "capacity": self._filter.capacity,
+            "size_bytes": self._filter.size_in_bytes,
+            "hash_count": self._filter.hash_count,
+            "estimated_error_rate": round(self._filter.estimated_error_rate(), 6),
+        }
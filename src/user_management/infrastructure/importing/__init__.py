@@ -0,0 +1,12 @@
+from .readers import IMPORT_FORMATS, aiter_file_chunks, detect_import_format, read_records
+from .reject_writer import RejectWriter
+from .rejects_store import RejectsStore
+
+__all__ = [
+    "IMPORT_FORMATS",
+    "aiter_file_chunks",
+    "detect_import_format",
+    "read_records",
+    "RejectWriter",
+    "RejectsStore"
+]
@@ -0,0 +1,148 @@
+"""
+Incremental CSV and NDJSON readers for the patient profile import.
+
+Both readers consume an async iterator of byte chunks (a file read in
+blocks, or an HTTP request body) and yield ``(line number, record)`` pairs
+as soon as a record is complete, so inputs of any size are parsed in
+constant memory. Records that cannot be parsed are yielded as
+MalformedRecord so the import can reject them and keep going.
+"""
+import codecs
+import csv
+import json
+import os
+from typing import AsyncIterator, List, Optional, Tuple
+
+from user_management.application.use_cases.import_patient_profiles import MalformedRecord
+from user_management.application.use_cases.import_patient_profiles.records import Record
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+_EXTENSIONS = {
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+FILE_CHUNK_SIZE = 1024 * 1024
+
+
+def detect_import_format(path: Optional[str] = None, content_type: Optional[str] = None) -> Optional[str]:
+    """
+    Guesses the import format from a file name or a Content-Type header.
+
+    Returns:
+        Optional[str]: "csv", "ndjson", or None when it cannot be told.
+    """
+    if path:
+        fmt = _EXTENSIONS.get(os.path.splitext(path)[1].lower())
+        if fmt:
+            return fmt
+    if content_type:
+        return _CONTENT_TYPES.get(content_type.split(";")[0].strip().lower())
+    return None
+
+
+async def aiter_file_chunks(path: str, chunk_size: int = FILE_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """
+    Reads a file in fixed-size blocks.
+
+    Reads are blocking but short; the event loop is only held for one block.
+    """
+    with open(path, "rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+async def read_records(chunks: AsyncIterator[bytes], fmt: str) -> AsyncIterator[Tuple[int, Record]]:
+    """
+    Parses a byte stream in the given format.
+
+    Args:
+        chunks: The raw input, in arbitrary block sizes.
+        fmt (str): One of IMPORT_FORMATS.
+
+    Yields:
+        Tuple[int, Record]: The 1-based line a record starts on, and the record.
+    """
+    if fmt == "csv":
+        reader = _read_csv
+    elif fmt == "ndjson":
+        reader = _read_ndjson
+    else:
+        raise ValueError(f"Invalid import format: {fmt}. Expected one of {', '.join(IMPORT_FORMATS)}")
+    async for line, record in reader(_iter_lines(chunks)):
+        yield line, record
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    buffer = ""
+    number = 0
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        lines = buffer.split("\n")
+        buffer = lines.pop()
+        for line in lines:
+            number += 1
+            yield number, line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield number + 1, buffer.rstrip("\r")
+
+
+async def _read_ndjson(lines: AsyncIterator[Tuple[int, str]]) -> AsyncIterator[Tuple[int, Record]]:
+    async for number, line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield number, MalformedRecord(raw=line, reason=f"Invalid JSON: {e}")
+            continue
+        if not isinstance(record, dict):
+            yield number, MalformedRecord(raw=line, reason="Expected a JSON object")
+            continue
+        yield number, record
+
+
+async def _read_csv(lines: AsyncIterator[Tuple[int, str]]) -> AsyncIterator[Tuple[int, Record]]:
+    header = None
+    pending = []
+    start = 0
+    async for number, line in lines:
+        if not pending:
+            if not line.strip():
+                continue
+            start = number
+        pending.append(line)
+        # A quoted field may contain newlines: keep reading until quotes balance.
+        if sum(part.count('"') for part in pending) % 2:
+            continue
+        raw = "\n".join(pending)
+        pending = []
+
+        fields = _parse_csv_record(raw)
+        if header is None:
+            header = [name.strip() for name in fields]
+            continue
+        if len(fields) != len(header):
+            yield start, MalformedRecord(raw=raw, reason=f"Expected {len(header)} fields, got {len(fields)}")
+            continue
+        yield start, dict(zip(header, fields))
+
+    if pending:
+        yield start, MalformedRecord(raw="\n".join(pending), reason="Unterminated quoted field")
+
+
+def _parse_csv_record(raw: str) -> List[str]:
+    return next(csv.reader([raw]), [])
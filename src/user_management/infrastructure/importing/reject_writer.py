@@ -0,0 +1,33 @@
+import json
+from typing import IO, Any, Dict, List
+
+from user_management.application.use_cases.import_patient_profiles import MalformedRecord, RejectedRow
+
+
+class RejectWriter:
+    """
+    Writes rejected import rows to a side file, one JSON object per line.
+
+    Each line holds the source line number, the reason, and either the parsed
+    ``row`` or, for records that could not be parsed, the ``raw`` text. The
+    first ``sample_size`` rejects are also kept in memory for reporting.
+    Lines are written in the order rejects are reported, which is not source
+    order; sort by ``line`` if it matters.
+    """
+
+    def __init__(self, file: IO[str], sample_size: int = 10):
+        self.file = file
+        self.sample_size = sample_size
+        self.count = 0
+        self.samples: List[Dict[str, Any]] = []
+
+    def __call__(self, rejected: RejectedRow) -> None:
+        entry: Dict[str, Any] = {"line": rejected.line, "reason": rejected.reason}
+        if isinstance(rejected.record, MalformedRecord):
+            entry["raw"] = rejected.record.raw
+        else:
+            entry["row"] = dict(rejected.record)
+        self.file.write(json.dumps(entry, default=str, ensure_ascii=False) + "\n")
+        self.count += 1
+        if len(self.samples) < self.sample_size:
+            self.samples.append(entry)
@@ -0,0 +1,84 @@
+import os
+import re
+import stat
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Tuple
+
+from .reject_writer import RejectWriter
+
+_IMPORT_ID = re.compile(r"[0-9a-f]{32}")
+_SUFFIX = ".rejects.ndjson"
+
+
+class RejectsStore:
+    """
+    Keeps the rejected rows of each patient import in a private directory.
+
+    Rejected rows hold patient data, so the directory must be configured
+    explicitly and must not be readable by other users; it is created with
+    mode 0700 and every rejects file with mode 0600. Files are named after a
+    random import id, which is all callers are given back, and files older
+    than ``retention_seconds`` are deleted whenever a new import starts.
+    """
+
+    def __init__(self, directory: str, retention_seconds: float,
+                 clock: Callable[[], float] = time.time):
+        if not directory:
+            raise ValueError("A directory for import rejects must be configured")
+        if retention_seconds <= 0:
+            raise ValueError("Rejects retention must be positive")
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if stat.S_IMODE(os.stat(directory).st_mode) & 0o077:
+            raise ValueError(f"Rejects directory {directory} must not be accessible to group or others")
+        self.directory = directory
+        self.retention_seconds = retention_seconds
+        self._clock = clock
+
+    def _path(self, import_id: str) -> str:
+        return os.path.join(self.directory, f"patient-import-{import_id}{_SUFFIX}")
+
+    @contextmanager
+    def writer(self, sample_size: int = 10) -> Iterator[Tuple[str, RejectWriter]]:
+        """
+        Creates the rejects file of a new import.
+
+        Yields:
+            The import id and a ``RejectWriter`` over the new file.
+        """
+        self.purge_expired()
+        import_id = uuid.uuid4().hex
+        fd = os.open(self._path(import_id), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with open(fd, "w", encoding="utf-8") as file:
+            yield import_id, RejectWriter(file, sample_size=sample_size)
+
+    def find(self, import_id: str) -> Optional[str]:
+        """
+        Returns the path of an import's rejects file, or None if the id is
+        malformed, unknown or past its retention.
+        """
+        if not _IMPORT_ID.fullmatch(import_id):
+            return None
+        path = self._path(import_id)
+        try:
+            modified = os.stat(path).st_mtime
+        except FileNotFoundError:
+            return None
+        return path if self._clock() - modified <= self.retention_seconds else None
+
+    def purge_expired(self) -> int:
+        """Deletes the rejects files past their retention and returns how many were removed."""
+        cutoff = self._clock() - self.retention_seconds
+        removed = 0
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not (entry.name.startswith("patient-import-") and entry.name.endswith(_SUFFIX)):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        removed += 1
+                except FileNotFoundError:
+                    pass
+        return removed
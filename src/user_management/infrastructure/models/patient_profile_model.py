@@ -1,14 +1,15 @@
-from sqlalchemy import String, Text, DateTime, ForeignKey
+from sqlalchemy import String, Text, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column
 from datetime import datetime
 import uuid
 from user_management.infrastructure.models.base import Base
+from user_management.infrastructure.models.types import UTCDateTime, UUIDType
 
 class PatientProfileModel(Base):
     __tablename__ = "patient_profiles"
 
     user_uuid: Mapped[uuid.UUID] = mapped_column(
-        String(36),
+        UUIDType,
         ForeignKey("users.uuid"),
         primary_key=True,
         nullable=False
@@ -19,8 +20,8 @@ class PatientProfileModel(Base):
     insurance_info: Mapped[str] = mapped_column(Text, nullable=False)
     preferred_language: Mapped[str] = mapped_column(String(10), nullable=False)
     medical_history_summary: Mapped[str] = mapped_column(Text, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(UTCDateTime, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(UTCDateTime, nullable=False)
 
     def __repr__(self) -> str:
         return (f"<PatientProfileModel(user_uuid={self.user_uuid}, "
@@ -0,0 +1,214 @@
+"""
+Custom column types shared by the ORM models.
+
+These keep the values handed back to the domain layer identical across
+database backends, so the same repositories work on PostgreSQL and SQLite.
+
+The identifier, digest and enum types also implement the two storage modes
+of ``DatabaseSettings.storage_mode``. ``legacy`` keeps the original layout
+(UUIDs as 36-character strings, hex digests, named enums); ``compact`` stores
+native 16-byte UUIDs, raw 32-byte digests and small-integer enum codes.
+Repositories see the same Python values in both modes.
+
+Columns built without an explicit ``compact`` flag follow the process-wide
+mode, which the database configuration sets with ``set_storage_mode`` when it
+creates the engines. The mode is looked up when a type is first used with an
+engine, not when the models are imported, so it must be set before then.
+"""
+from datetime import datetime, timezone
+from enum import Enum as PyEnum
+from typing import Mapping, Optional, Type, Union
+from uuid import UUID
+
+from sqlalchemy import DateTime, Enum, LargeBinary, SmallInteger, String, Uuid
+from sqlalchemy.types import TypeDecorator
+
+from user_management.infrastructure.database.database_settings import STORAGE_MODES
+
+SHA256_DIGEST_SIZE = 32
+
+_storage_mode = "legacy"
+
+
+def get_storage_mode() -> str:
+    """
+    Returns the storage mode of columns built without an explicit ``compact`` flag.
+    """
+    return _storage_mode
+
+
+def set_storage_mode(mode: str) -> None:
+    """
+    Sets the storage mode of columns built without an explicit ``compact`` flag.
+
+    Args:
+        mode (str): One of STORAGE_MODES.
+
+    Raises:
+        ValueError: If the mode is unknown.
+    """
+    if mode not in STORAGE_MODES:
+        raise ValueError(f"Invalid storage mode: {mode}. Expected one of {', '.join(STORAGE_MODES)}")
+    global _storage_mode
+    _storage_mode = mode
+
+
+class StorageModeType(TypeDecorator):
+    """
+    Base for column types whose layout depends on the storage mode.
+
+    Args:
+        compact: Force compact (True) or legacy (False) storage; None follows ``get_storage_mode()``.
+    """
+
+    cache_ok = True
+
+    def __init__(self, compact: Optional[bool] = None):
+        super().__init__()
+        self.compact = compact
+
+    @property
+    def is_compact(self) -> bool:
+        if self.compact is None:
+            return _storage_mode == "compact"
+        return self.compact
+
+
+class UTCDateTime(TypeDecorator):
+    """
+    Timezone-aware datetime column that always round-trips as UTC.
+
+    PostgreSQL stores ``timestamptz`` natively, but SQLite drops the offset
+    and returns naive datetimes, which the domain rejects. Values are
+    normalized to UTC on the way in and re-tagged as UTC on the way out.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[datetime], dialect) -> Optional[datetime]:
+        if value is not None and value.tzinfo is not None:
+            return value.astimezone(timezone.utc)
+        return value
+
+    def process_result_value(self, value: Optional[datetime], dialect) -> Optional[datetime]:
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+
+class UUIDType(StorageModeType):
+    """
+    UUID column that always binds and loads ``uuid.UUID`` objects.
+
+    Compact storage uses PostgreSQL's native 16-byte ``uuid`` type. Legacy
+    storage, and backends without a native type such as SQLite, fall back to
+    the canonical 36-character string.
+    """
+
+    impl = String(36)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if self.is_compact and dialect.name == "postgresql":
+            return dialect.type_descriptor(Uuid(as_uuid=True))
+        return dialect.type_descriptor(String(36))
+
+    def process_bind_param(self, value: Optional[Union[UUID, str]], dialect):
+        if value is None:
+            return None
+        if not isinstance(value, UUID):
+            value = UUID(str(value))
+        if self.is_compact and dialect.name == "postgresql":
+            return value
+        return str(value)
+
+    def process_result_value(self, value, dialect) -> Optional[UUID]:
+        if value is None or isinstance(value, UUID):
+            return value
+        return UUID(value)
+
+
+class PasswordDigest(StorageModeType):
+    """
+    SHA-256 password digest exchanged with the domain as a 64-character hex string.
+
+    Compact storage keeps the raw 32-byte digest; legacy storage keeps the
+    UTF-8 encoded hex string. Loading accepts either layout, so rows written
+    before a migration remain readable.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        if self.is_compact:
+            return bytes.fromhex(value)
+        return value.encode("utf-8")
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        value = bytes(value)
+        if len(value) == SHA256_DIGEST_SIZE:
+            return value.hex()
+        return value.decode("utf-8")
+
+
+class EnumCode(StorageModeType):
+    """
+    Enum column stored either by member name or as a stable small-integer code.
+
+    Codes are given explicitly per member, so reordering or extending the
+    Python enum never changes what is already stored. Bind parameters may be
+    members or their values; loaded values are always members.
+
+    Unless the column is forced to compact storage, the named enum stays
+    attached to the metadata, so ``create_all`` on PostgreSQL also creates its
+    (unused) type in compact mode; deployed schemas come from ``migrations/``.
+
+    Args:
+        enum_class: The Python enum stored in the column.
+        codes: Stable code for every member, used by compact storage.
+        compact: Store codes instead of the named enum; None follows ``get_storage_mode()``.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[PyEnum], codes: Mapping[PyEnum, int], compact: Optional[bool] = None):
+        missing = [member.name for member in enum_class if member not in codes]
+        if missing:
+            raise ValueError(f"No storage code for {enum_class.__name__} members: {', '.join(missing)}")
+
+        super().__init__(compact)
+        self.enum_class = enum_class
+        self.codes = tuple(sorted((member.name, code) for member, code in codes.items()))
+        self._code_by_member = {member: code for member, code in codes.items()}
+        self._member_by_code = {code: member for member, code in codes.items()}
+        if not compact:
+            self.impl = Enum(enum_class)
+
+    def load_dialect_impl(self, dialect):
+        if self.is_compact:
+            return dialect.type_descriptor(SmallInteger())
+        return dialect.type_descriptor(self.impl)
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        member = self.enum_class(value)
+        if self.is_compact:
+            return self._code_by_member[member]
+        return member
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if self.is_compact:
+            return self._member_by_code[value]
+        return self.enum_class(value) if not isinstance(value, self.enum_class) else value
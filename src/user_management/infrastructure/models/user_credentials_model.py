@@ -10,10 +10,11 @@ keeping persistence concerns separate from business logic.
 """
 
 from uuid import UUID
-from sqlalchemy import String, LargeBinary, ForeignKey
+from sqlalchemy import ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .user_model import Base
+from .types import PasswordDigest, UUIDType
 
 
 class UserCredentialsModel(Base):
@@ -26,8 +27,8 @@ class UserCredentialsModel(Base):
 
     __tablename__ = "user_credentials"
 
-    user_uuid: Mapped[UUID] = mapped_column(String(36), ForeignKey("users.uuid"), primary_key=True)
-    hashed_password: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    user_uuid: Mapped[UUID] = mapped_column(UUIDType, ForeignKey("users.uuid"), primary_key=True)
+    hashed_password: Mapped[str] = mapped_column(PasswordDigest, nullable=False)
 
     def __repr__(self):
         return f"<UserCredentialsModel(user_uuid={self.user_uuid})>"
\ No newline at end of file
@@ -4,30 +4,81 @@ ORM model for the User entity.
 
 Maps the domain User to a PostgreSQL table using SQLAlchemy.
 Keeps persistence concerns separate from domain logic.
+
+The composite indexes back the keyset-paginated user search: each one ends in
+``(created_at, uuid)`` so a filtered page is a single ordered range scan. The
+``lower()`` indexes use ``text_pattern_ops`` on PostgreSQL so case-insensitive
+prefix searches (``LIKE 'abc%'``) can use them under any collation.
+
+Emails are unique case-insensitively: uniqueness is enforced by the unique
+index on ``lower(email)``, which is also the index ``find_by_email`` looks up,
+while the column keeps the address exactly as the user typed it. Databases
+created before these indexes get them from
+``migrations/postgresql/0002_email_and_search_indexes.sql``.
 """
 
-from sqlalchemy import Column, String, Date, DateTime, Enum
+from sqlalchemy import Column, String, Date, DateTime, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 from uuid import UUID
 import uuid
 
 from user_management.domain.enums import UserRole, UserStatus
 from user_management.infrastructure.models.base import Base
+from user_management.infrastructure.models.types import EnumCode, UTCDateTime, UUIDType
+
+# Stable codes used by compact storage. Never renumber an existing member.
+USER_ROLE_CODES = {
+    UserRole.PATIENT: 1,
+    UserRole.NURSE: 2,
+    UserRole.DOCTOR: 3,
+    UserRole.ADMINISTRATOR: 4,
+}
+
+USER_STATUS_CODES = {
+    UserStatus.ACTIVE: 1,
+    UserStatus.INACTIVE: 2,
+    UserStatus.LOCKED: 3,
+}
 
 
 class UserModel(Base):
     __tablename__ = "users"
 
-    uuid: Mapped[UUID] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    uuid: Mapped[UUID] = mapped_column(UUIDType, primary_key=True, default=uuid.uuid4)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
     first_name: Mapped[str] = mapped_column(String(100), nullable=False)
     last_name: Mapped[str] = mapped_column(String(100), nullable=False)
     phone: Mapped[str] = mapped_column(String(20), nullable=True)
     date_of_birth: Mapped[Date] = mapped_column(Date, nullable=False)
-    user_role: Mapped[str] = mapped_column(Enum(UserRole), nullable=False)
-    user_status: Mapped[UserStatus] = mapped_column(Enum(UserStatus), nullable=False)
-    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False)
-    updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False)
+    user_role: Mapped[UserRole] = mapped_column(EnumCode(UserRole, USER_ROLE_CODES), nullable=False)
+    user_status: Mapped[UserStatus] = mapped_column(EnumCode(UserStatus, USER_STATUS_CODES), nullable=False)
+    created_at: Mapped[DateTime] = mapped_column(UTCDateTime, nullable=False)
+    updated_at: Mapped[DateTime] = mapped_column(UTCDateTime, nullable=False)
 
     def __repr__(self):
-        return f"<UserModel(uuid={self.uuid}, email={self.email})>"
\ No newline at end of file
+        return f"<UserModel(uuid={self.uuid}, email={self.email})>"
+
+Index("ix_users_created_at_uuid", UserModel.created_at, UserModel.uuid)
+Index("ix_users_role_created_at_uuid", UserModel.user_role, UserModel.created_at, UserModel.uuid)
+Index("ix_users_status_created_at_uuid", UserModel.user_status, UserModel.created_at, UserModel.uuid)
+Index(
+    "ix_users_first_name_lower",
+    func.lower(UserModel.first_name).label("first_name_lower"),
+    postgresql_ops={"first_name_lower": "text_pattern_ops"},
+)
+Index(
+    "ix_users_last_name_lower",
+    func.lower(UserModel.last_name).label("last_name_lower"),
+    postgresql_ops={"last_name_lower": "text_pattern_ops"},
+)
+# Case-insensitive uniqueness of emails; repositories recognise its violations by name.
+EMAIL_UNIQUE_INDEX = "uq_users_email_lower"
+# The case-sensitive constraint it replaces, found on databases that have not run
+# migrations/postgresql/0002_email_and_search_indexes.sql yet.
+LEGACY_EMAIL_UNIQUE_CONSTRAINT = "users_email_key"
+Index(
+    EMAIL_UNIQUE_INDEX,
+    func.lower(UserModel.email).label("email_lower"),
+    unique=True,
+    postgresql_ops={"email_lower": "text_pattern_ops"},
+)
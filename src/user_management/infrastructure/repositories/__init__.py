@@ -1,9 +1,22 @@
 from .in_memory_user_repository import InMemoryUserRepository
+from .in_memory_patient_profile_repository import InMemoryPatientProfileRepository
 from .postgres_user_repository import PostgresUserRepository
 from .postgres_patient_profile_repository import PostgresPatientProfileRepository
+from .asyncpg_user_repository import AsyncpgUserRepository
+from .identity_map_user_repository import IdentityMapUserRepository, UserIdentityMap
+from .caching_user_repository import CachingUserRepository
+from .shared_caching_user_repository import SharedCachingUserRepository
+from .shared_caching_patient_profile_repository import SharedCachingPatientProfileRepository
 
 __all__ = [
     "InMemoryUserRepository",
+    "InMemoryPatientProfileRepository",
     "PostgresUserRepository",
-    "PostgresPatientProfileRepository"
+    "PostgresPatientProfileRepository",
+    "AsyncpgUserRepository",
+    "IdentityMapUserRepository",
+    "UserIdentityMap",
+    "CachingUserRepository",
+    "SharedCachingUserRepository",
+    "SharedCachingPatientProfileRepository"
 ]
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""
+UserRepository with a raw asyncpg fast path for the hottest read queries.
+
+``find_by_uuid``, ``find_by_email``, ``find_many_by_uuids`` and
+``find_updated_at`` bypass the ORM: they run a fixed SQL statement directly on
+the asyncpg connection behind the session and build ``User`` objects straight
+from the returned records. There is
+no ``UserModel`` instantiation, identity map or unit-of-work bookkeeping.
+
+asyncpg prepares every statement it runs and keeps it in a per-connection
+cache (``DB_STATEMENT_CACHE_SIZE``), so after the first call on a pooled
+connection each lookup is a single Bind/Execute round trip.
+
+Values are encoded and decoded with the same column types the ORM uses, so the
+fast path honours the configured storage mode and returns exactly the same ``User``.
+Everything else (writes, search) is inherited from PostgresUserRepository and
+runs in the same session and transaction.
+"""
+from datetime import datetime
+from typing import Iterable, List, Optional
+from uuid import UUID
+
+from user_management.domain.entities import User
+from user_management.domain.value_objects import UserCredentials
+from user_management.infrastructure.models import UserCredentialsModel, UserModel
+from user_management.infrastructure.repositories.postgres_user_repository import PostgresUserRepository
+
+_users = UserModel.__table__.c
+_credentials = UserCredentialsModel.__table__.c
+
+_SELECT_USERS_WITH_CREDENTIALS = (
+    "SELECT u.uuid, u.email, u.first_name, u.last_name, u.phone, u.date_of_birth, "
+    "u.user_role, u.user_status, u.created_at, u.updated_at, c.hashed_password "
+    "FROM users AS u LEFT JOIN user_credentials AS c ON c.user_uuid = u.uuid "
+)
+
+FIND_BY_UUID_SQL = _SELECT_USERS_WITH_CREDENTIALS + "WHERE u.uuid = $1"
+FIND_BY_EMAIL_SQL = _SELECT_USERS_WITH_CREDENTIALS + "WHERE lower(u.email) = $1"
+FIND_MANY_BY_UUIDS_SQL = _SELECT_USERS_WITH_CREDENTIALS + "WHERE u.uuid = ANY($1)"
+FIND_UPDATED_AT_SQL = "SELECT updated_at FROM users WHERE uuid = $1"
+
+
+class AsyncpgUserRepository(PostgresUserRepository):
+    """
+    PostgresUserRepository whose point lookups run as raw asyncpg prepared statements.
+
+    Requires an engine using the ``postgresql+asyncpg`` driver.
+    """
+
+    async def find_by_email(self, email: str) -> Optional[User]:
+        connection, _ = await self._driver_connection()
+        record = await connection.fetchrow(FIND_BY_EMAIL_SQL, email.lower())
+        return self._record_to_domain(record) if record else None
+
+    async def find_by_uuid(self, uuid: UUID) -> Optional[User]:
+        connection, dialect = await self._driver_connection()
+        record = await connection.fetchrow(FIND_BY_UUID_SQL, _users.uuid.type.process_bind_param(uuid, dialect))
+        return self._record_to_domain(record) if record else None
+
+    async def find_updated_at(self, uuid: UUID) -> Optional[datetime]:
+        connection, dialect = await self._driver_connection()
+        value = await connection.fetchval(FIND_UPDATED_AT_SQL, _users.uuid.type.process_bind_param(uuid, dialect))
+        return _users.updated_at.type.process_result_value(value, None) if value is not None else None
+
+    async def find_many_by_uuids(self, uuids: Iterable[UUID]) -> List[User]:
+        requested = list(dict.fromkeys(uuids))
+        if not requested:
+            return []
+
+        connection, dialect = await self._driver_connection()
+        encode = _users.uuid.type.process_bind_param
+        records = await connection.fetch(FIND_MANY_BY_UUIDS_SQL, [encode(uuid, dialect) for uuid in requested])
+
+        users_by_uuid = {user.uuid: user for user in map(self._record_to_domain, records)}
+        return [users_by_uuid[uuid] for uuid in requested if uuid in users_by_uuid]
+
+    async def _driver_connection(self):
+        """
+        Returns the asyncpg connection behind the session's current transaction, and its dialect.
+        """
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        return raw_connection.driver_connection, connection.dialect
+
+    @staticmethod
+    def _record_to_domain(record) -> User:
+        if record["hashed_password"] is None:
+            raise ValueError(f"Credentials not found for user {record['uuid']}")
+
+        return User._rehydrate(
+            uuid=_users.uuid.type.process_result_value(record["uuid"], None),
+            email=record["email"],
+            first_name=record["first_name"],
+            last_name=record["last_name"],
+            phone=record["phone"],
+            date_of_birth=record["date_of_birth"],
+            user_role=_users.user_role.type.process_result_value(record["user_role"], None),
+            user_status=_users.user_status.type.process_result_value(record["user_status"], None),
+            created_at=_users.created_at.type.process_result_value(record["created_at"], None),
+            updated_at=_users.updated_at.type.process_result_value(record["updated_at"], None),
+            credentials=UserCredentials._from_hashed(
+                _credentials.hashed_password.type.process_result_value(record["hashed_password"], None)
+            ),
+        )
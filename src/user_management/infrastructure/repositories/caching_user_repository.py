@@ -0,0 +1,134 @@
+"""
+Process-wide read-through cache in front of a UserRepository.
+
+Point lookups (``find_by_uuid``, ``find_by_email``, ``find_many_by_uuids``,
+``find_existing_uuids``) are served from a UserCache shared by every request
+of the process; misses go to the wrapped repository and the users found are
+stored. Misses are not cached, so a user registered a moment ago is never
+reported missing.
+
+Writes go through ``save``/``save_many`` (domain mutators such as
+change_password or change_user_status are persisted that way) and evict the
+user before the write is staged. Users written are evicted once more by
+``evict_written`` after the transaction commits (SqlAlchemyUnitOfWork does
+this), which also makes the cache refuse copies older than the write. A
+concurrent request that read the old row while the transaction was open, and
+stores it after that eviction, is therefore ignored instead of leaving the
+old row, or its old password hash, cached past the commit.
+Changes made outside the process are bounded by the cache's time to live.
+
+``populate=False`` makes the repository read from the cache without storing
+what it loads. It is used for replica sessions, whose rows may lag behind a
+write that was just evicted.
+"""
+from datetime import datetime
+from typing import AsyncIterator, Iterable, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from user_management.application.repositories import UserRepository
+from user_management.domain.entities import User
+from user_management.domain.enums import UserRole, UserStatus
+from user_management.infrastructure.caching import UserCache
+
+
+class CachingUserRepository(UserRepository):
+    """
+    UserRepository decorator backed by a process-wide UserCache.
+    """
+
+    def __init__(self, repository: UserRepository, cache: UserCache, populate: bool = True):
+        self.repository = repository
+        self.cache = cache
+        self.populate = populate
+        self._written: List[User] = []
+
+    async def save(self, user: User) -> None:
+        self.cache.invalidate(user)
+        self._written.append(user)
+        await self.repository.save(user)
+
+    async def save_many(self, users: Sequence[User]) -> None:
+        self.cache.invalidate_many(users)
+        self._written.extend(users)
+        await self.repository.save_many(users)
+
+    async def evict_written(self) -> None:
+        """
+        Evicts every user saved through this repository since the last call.
+
+        To be called once the transaction that wrote them has ended.
+        """
+        written, self._written = self._written, []
+        self.cache.invalidate_written(written)
+
+    async def find_by_email(self, email: str) -> Optional[User]:
+        user = self.cache.get_by_email(email)
+        if user is not None:
+            return user
+
+        user = await self.repository.find_by_email(email)
+        if user is not None and self.populate:
+            self.cache.put(user)
+        return user
+
+    async def find_by_uuid(self, uuid: UUID) -> Optional[User]:
+        user = self.cache.get_by_uuid(uuid)
+        if user is not None:
+            return user
+
+        user = await self.repository.find_by_uuid(uuid)
+        if user is not None and self.populate:
+            self.cache.put(user)
+        return user
+
+    async def find_updated_at(self, uuid: UUID) -> Optional[datetime]:
+        user = self.cache.get_by_uuid(uuid)
+        if user is not None:
+            return user.updated_at
+        return await self.repository.find_updated_at(uuid)
+
+    async def find_many_by_uuids(self, uuids: Iterable[UUID]) -> List[User]:
+        requested = list(dict.fromkeys(uuids))
+        found = {}
+        missing = []
+        for uuid in requested:
+            user = self.cache.get_by_uuid(uuid)
+            if user is None:
+                missing.append(uuid)
+            else:
+                found[uuid] = user
+
+        if missing:
+            for user in await self.repository.find_many_by_uuids(missing):
+                found[user.uuid] = user
+                if self.populate:
+                    self.cache.put(user)
+
+        return [found[uuid] for uuid in requested if uuid in found]
+
+    async def find_existing_uuids(self, uuids: Iterable[UUID]) -> Set[UUID]:
+        requested = list(dict.fromkeys(uuids))
+        existing = {uuid for uuid in requested if self.cache.contains(uuid)}
+        missing = [uuid for uuid in requested if uuid not in existing]
+        if missing:
+            existing |= await self.repository.find_existing_uuids(missing)
+        return existing
+
+    async def find_registered_emails(self, emails: Iterable[str]) -> Set[str]:
+        return await self.repository.find_registered_emails(emails)
+
+    async def search(
+        self,
+        text: Optional[str] = None,
+        role: Optional[UserRole] = None,
+        status: Optional[UserStatus] = None,
+        limit: int = 20,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[User]:
+        return await self.repository.search(text=text, role=role, status=status, limit=limit, after=after)
+
+    def iter_all(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        return self.repository.iter_all(batch_size=batch_size)
+
+    def iter_emails(self, batch_size: int = 10000) -> AsyncIterator[str]:
+        return self.repository.iter_emails(batch_size=batch_size)
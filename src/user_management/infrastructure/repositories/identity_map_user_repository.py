@@ -0,0 +1,160 @@
+"""
+Request-scoped identity map for users.
+
+A request often loads the same user more than once, e.g. a lookup by email
+followed by a use case that loads the same user by UUID. Every load through a
+repository runs a query and builds a new ``User`` (re-running UserValidator).
+UserIdentityMap keeps the users loaded during one request, indexed by UUID and
+by lower-cased email, and IdentityMapUserRepository consults it before
+delegating to the wrapped repository, so repeated loads return the very same
+``User`` instance without another round trip.
+
+The map lives as long as the request (one instance per request, shared by
+every repository of that request) and is never shared between requests, so it
+cannot serve data another request changed. Entries are dropped when the user
+is written through the repository.
+"""
+from datetime import datetime
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from user_management.application.repositories import UserRepository
+from user_management.domain.entities import User
+from user_management.domain.enums import UserRole, UserStatus
+
+
+class UserIdentityMap:
+    """
+    Users loaded in the current request, by UUID and by lower-cased email.
+    """
+
+    def __init__(self):
+        self._by_uuid: Dict[UUID, User] = {}
+        self._by_email: Dict[str, User] = {}
+
+    def get_by_uuid(self, uuid: UUID) -> Optional[User]:
+        return self._by_uuid.get(uuid)
+
+    def get_by_email(self, email: str) -> Optional[User]:
+        return self._by_email.get(email.lower())
+
+    def add(self, user: User) -> User:
+        """
+        Registers a loaded user and returns the instance callers should use.
+
+        If the user is already mapped the existing instance wins, so every
+        load in the request sees the same object.
+        """
+        existing = self._by_uuid.get(user.uuid)
+        if existing is not None:
+            return existing
+        self._by_uuid[user.uuid] = user
+        self._by_email[user.email.lower()] = user
+        return user
+
+    def discard(self, user: User) -> None:
+        """
+        Drops a user, under its current email and the email it was mapped with.
+        """
+        mapped = self._by_uuid.pop(user.uuid, None)
+        emails = {user.email.lower()}
+        if mapped is not None:
+            emails.add(mapped.email.lower())
+        for email in emails:
+            entry = self._by_email.get(email)
+            if entry is not None and entry.uuid == user.uuid:
+                del self._by_email[email]
+
+    def clear(self) -> None:
+        self._by_uuid.clear()
+        self._by_email.clear()
+
+    def __len__(self) -> int:
+        return len(self._by_uuid)
+
+    def __contains__(self, uuid: UUID) -> bool:
+        return uuid in self._by_uuid
+
+
+class IdentityMapUserRepository(UserRepository):
+    """
+    UserRepository decorator resolving point lookups through a UserIdentityMap.
+
+    Point lookups (``find_by_uuid``, ``find_by_email``, ``find_many_by_uuids``)
+    are served from the map and only misses reach the wrapped repository.
+    Searches and exports are passed through unchanged: they return many users
+    that are rarely loaded again, and mapping them would hold on to the
+    whole result for the rest of the request.
+    """
+
+    def __init__(self, repository: UserRepository, identity_map: UserIdentityMap):
+        self.repository = repository
+        self.identity_map = identity_map
+
+    async def save(self, user: User) -> None:
+        self.identity_map.discard(user)
+        await self.repository.save(user)
+
+    async def save_many(self, users: Sequence[User]) -> None:
+        for user in users:
+            self.identity_map.discard(user)
+        await self.repository.save_many(users)
+
+    async def find_by_email(self, email: str) -> Optional[User]:
+        user = self.identity_map.get_by_email(email)
+        if user is not None:
+            return user
+
+        user = await self.repository.find_by_email(email)
+        return self.identity_map.add(user) if user is not None else None
+
+    async def find_by_uuid(self, uuid: UUID) -> Optional[User]:
+        user = self.identity_map.get_by_uuid(uuid)
+        if user is not None:
+            return user
+
+        user = await self.repository.find_by_uuid(uuid)
+        return self.identity_map.add(user) if user is not None else None
+
+    async def find_updated_at(self, uuid: UUID) -> Optional[datetime]:
+        user = self.identity_map.get_by_uuid(uuid)
+        if user is not None:
+            return user.updated_at
+        return await self.repository.find_updated_at(uuid)
+
+    async def find_many_by_uuids(self, uuids: Iterable[UUID]) -> List[User]:
+        requested = list(dict.fromkeys(uuids))
+        missing = [uuid for uuid in requested if uuid not in self.identity_map]
+        if missing:
+            for user in await self.repository.find_many_by_uuids(missing):
+                self.identity_map.add(user)
+
+        found = (self.identity_map.get_by_uuid(uuid) for uuid in requested)
+        return [user for user in found if user is not None]
+
+    async def find_existing_uuids(self, uuids: Iterable[UUID]) -> Set[UUID]:
+        requested = list(dict.fromkeys(uuids))
+        existing = {uuid for uuid in requested if uuid in self.identity_map}
+        missing = [uuid for uuid in requested if uuid not in existing]
+        if missing:
+            existing |= await self.repository.find_existing_uuids(missing)
+        return existing
+
+    async def find_registered_emails(self, emails: Iterable[str]) -> Set[str]:
+        return await self.repository.find_registered_emails(emails)
+
+    async def search(
+        self,
+        text: Optional[str] = None,
+        role: Optional[UserRole] = None,
+        status: Optional[UserStatus] = None,
+        limit: int = 20,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[User]:
+        return await self.repository.search(text=text, role=role, status=status, limit=limit, after=after)
+
+    def iter_all(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        return self.repository.iter_all(batch_size=batch_size)
+
+    def iter_emails(self, batch_size: int = 10000) -> AsyncIterator[str]:
+        return self.repository.iter_emails(batch_size=batch_size)
@@ -0,0 +1,37 @@
+"""
+Dictionary-backed PatientProfileRepository for tests and local development.
+"""
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Sequence, Set
+from uuid import UUID
+
+from user_management.application.repositories.patient_profile_repository import PatientProfileRepository
+from user_management.domain.entities.patient_profile import PatientProfile
+
+
+class InMemoryPatientProfileRepository(PatientProfileRepository):
+    def __init__(self):
+        self._profiles: Dict[UUID, PatientProfile] = {}
+
+    async def save(self, patient: PatientProfile) -> None:
+        self._profiles[patient.user_uuid] = patient
+
+    async def save_many(self, patients: Sequence[PatientProfile]) -> None:
+        for patient in patients:
+            await self.save(patient)
+
+    async def find_by_user_uuid(self, user_uuid: UUID) -> Optional[PatientProfile]:
+        return self._profiles.get(user_uuid)
+
+    async def find_updated_at_by_user_uuid(self, user_uuid: UUID) -> Optional[datetime]:
+        profile = self._profiles.get(user_uuid)
+        return profile.updated_at if profile is not None else None
+
+    async def find_existing_user_uuids(self, user_uuids: Iterable[UUID]) -> Set[UUID]:
+        return {user_uuid for user_uuid in user_uuids if user_uuid in self._profiles}
+
+    def _snapshot(self) -> Dict[UUID, PatientProfile]:
+        return dict(self._profiles)
+
+    def _restore(self, snapshot: Dict[UUID, PatientProfile]) -> None:
+        self._profiles = dict(snapshot)
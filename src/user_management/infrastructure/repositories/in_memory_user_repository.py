@@ -1,7 +1,16 @@
-from typing import Dict, Optional
+"""
+Dictionary-backed UserRepository for tests and local development.
+
+Changes are applied immediately; InMemoryUnitOfWork snapshots the state on
+entry and restores it on rollback to give the same all-or-nothing behaviour
+as a database transaction.
+"""
+from datetime import datetime
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 from uuid import UUID
 
 from user_management.domain.entities.user import User
+from user_management.domain.enums import UserRole, UserStatus
 from user_management.application.repositories.user_repository import UserRepository
 
 
@@ -10,11 +19,15 @@ class InMemoryUserRepository(UserRepository):
         self._users: Dict[UUID, User] = {}
         self._emails: Dict[str, UUID] = {}
 
-    def save(self, user: User) -> None:
+    async def save(self, user: User) -> None:
         self._users[user.uuid] = user
         self._emails[user.email.lower()] = user.uuid
 
-    def find_by_email(self, email: str) -> Optional[User]:
+    async def save_many(self, users: Sequence[User]) -> None:
+        for user in users:
+            await self.save(user)
+
+    async def find_by_email(self, email: str) -> Optional[User]:
         if not email:
             return None
 
@@ -23,5 +36,61 @@ class InMemoryUserRepository(UserRepository):
             return self._users.get(uuid)
         return None
 
-    def find_by_uuid(self, uuid: UUID) -> Optional[User]:
-        return self._users.get(uuid)
\ No newline at end of file
+    async def find_by_uuid(self, uuid: UUID) -> Optional[User]:
+        return self._users.get(uuid)
+
+    async def find_updated_at(self, uuid: UUID) -> Optional[datetime]:
+        user = self._users.get(uuid)
+        return user.updated_at if user is not None else None
+
+    async def find_many_by_uuids(self, uuids: Iterable[UUID]) -> List[User]:
+        return [self._users[uuid] for uuid in dict.fromkeys(uuids) if uuid in self._users]
+
+    async def find_existing_uuids(self, uuids: Iterable[UUID]) -> Set[UUID]:
+        return {uuid for uuid in uuids if uuid in self._users}
+
+    async def find_registered_emails(self, emails: Iterable[str]) -> Set[str]:
+        return {email.lower() for email in emails if email.lower() in self._emails}
+
+    async def search(
+        self,
+        text: Optional[str] = None,
+        role: Optional[UserRole] = None,
+        status: Optional[UserStatus] = None,
+        limit: int = 20,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[User]:
+        prefix = text.lower() if text else None
+        after_key = (after[0], str(after[1])) if after else None
+
+        matches = []
+        for user in self._users.values():
+            if role is not None and user.user_role != role:
+                continue
+            if status is not None and user.user_status != status:
+                continue
+            if prefix and not any(
+                value.lower().startswith(prefix) for value in (user.first_name, user.last_name, user.email)
+            ):
+                continue
+            key = (user.created_at, str(user.uuid))
+            if after_key is not None and key <= after_key:
+                continue
+            matches.append((key, user))
+
+        matches.sort(key=lambda match: match[0])
+        return [user for _, user in matches[:limit]]
+
+    async def iter_all(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        for user in sorted(self._users.values(), key=lambda user: (user.created_at, str(user.uuid))):
+            yield user
+
+    async def iter_emails(self, batch_size: int = 10000) -> AsyncIterator[str]:
+        for user in list(self._users.values()):
+            yield user.email
+
+    def _snapshot(self) -> Tuple[Dict[UUID, User], Dict[str, UUID]]:
+        return dict(self._users), dict(self._emails)
+
+    def _restore(self, snapshot: Tuple[Dict[UUID, User], Dict[str, UUID]]) -> None:
+        self._users, self._emails = dict(snapshot[0]), dict(snapshot[1])
@@ -1,6 +1,16 @@
+"""
+PostgreSQL implementation of the PatientProfileRepository interface.
+
+Writes are only staged in the session; the unit of work commits them.
+Batches are written with multi-row inserts.
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Sequence, Set
+from uuid import UUID
+
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from user_management.application.repositories import UserRepository
 from user_management.application.repositories.patient_profile_repository import PatientProfileRepository
 from user_management.domain.entities import PatientProfile
 from user_management.infrastructure.models.patient_profile_model import PatientProfileModel
@@ -12,16 +22,57 @@ class PostgresPatientProfileRepository(PatientProfileRepository):
         self.session = session
 
     async def save(self, patient_profile: PatientProfile) -> None:
-        patient_profile_model = PatientProfileModel(
-            user_uuid=str(patient_profile.user_uuid),
-            emergency_contact_name=patient_profile.emergency_contact_name,
-            emergency_contact_phone=patient_profile.emergency_contact_phone,
-            insurance_info=patient_profile.insurance_info,
-            preferred_language=patient_profile.preferred_language,
-            medical_history_summary=patient_profile.medical_history_summary,
-            created_at=patient_profile.created_at,
-            updated_at=patient_profile.updated_at,
+        self.session.add(PatientProfileModel(**self._profile_row(patient_profile)))
+
+    async def save_many(self, patient_profiles: Sequence[PatientProfile]) -> None:
+        if not patient_profiles:
+            return
+
+        await self.session.execute(insert(PatientProfileModel), [self._profile_row(p) for p in patient_profiles])
+
+    async def find_by_user_uuid(self, user_uuid: UUID) -> Optional[PatientProfile]:
+        result = await self.session.execute(
+            select(PatientProfileModel).where(PatientProfileModel.user_uuid == user_uuid)
         )
+        model = result.scalar_one_or_none()
+        return self._to_domain(model) if model else None
 
-        self.session.add(patient_profile_model)
-        await self.session.commit()
\ No newline at end of file
+    async def find_updated_at_by_user_uuid(self, user_uuid: UUID) -> Optional[datetime]:
+        return await self.session.scalar(
+            select(PatientProfileModel.updated_at).where(PatientProfileModel.user_uuid == user_uuid)
+        )
+
+    async def find_existing_user_uuids(self, user_uuids: Iterable[UUID]) -> Set[UUID]:
+        requested = list(dict.fromkeys(user_uuids))
+        if not requested:
+            return set()
+
+        stmt = select(PatientProfileModel.user_uuid).where(PatientProfileModel.user_uuid.in_(requested))
+        result = await self.session.execute(stmt)
+        return set(result.scalars())
+
+    @staticmethod
+    def _profile_row(patient_profile: PatientProfile) -> Dict[str, Any]:
+        return {
+            "user_uuid": patient_profile.user_uuid,
+            "emergency_contact_name": patient_profile.emergency_contact_name,
+            "emergency_contact_phone": patient_profile.emergency_contact_phone,
+            "insurance_info": patient_profile.insurance_info,
+            "preferred_language": patient_profile.preferred_language,
+            "medical_history_summary": patient_profile.medical_history_summary,
+            "created_at": patient_profile.created_at,
+            "updated_at": patient_profile.updated_at,
+        }
+
+    @staticmethod
+    def _to_domain(model: PatientProfileModel) -> PatientProfile:
+        return PatientProfile._rehydrate(
+            user_uuid=model.user_uuid,
+            emergency_contact_name=model.emergency_contact_name,
+            emergency_contact_phone=model.emergency_contact_phone,
+            insurance_info=model.insurance_info,
+            preferred_language=model.preferred_language,
+            medical_history_summary=model.medical_history_summary,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+        )
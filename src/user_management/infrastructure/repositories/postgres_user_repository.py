@@ -3,17 +3,36 @@ PostgreSQL implementation of the UserRepository interface.
 
 Uses SQLAlchemy async ORM to persist User entities in a relational database.
 Maps domain User to UserModel and vice versa.
+
+Reads hydrate a User from a single statement that joins ``users`` with
+``user_credentials``, so every lookup costs one round trip regardless of
+how many users it returns. Batches are written with multi-row inserts.
+
+Writes are only staged in the session: committing is the job of the unit of
+work the repository belongs to (see SqlAlchemyUnitOfWork). A write violating
+the case-insensitive email index raises EmailAlreadyRegisteredError.
+
+Email lookups compare ``lower(email)`` so they hit the case-insensitive unique
+index. Searches page with a keyset on ``(created_at, uuid)`` rather than OFFSET, so
+every page is an index range scan of ``limit`` rows. Full exports stream
+through a server-side cursor in ``batch_size`` chunks.
 """
-from typing import Optional
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, or_, select, Select, tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from user_management.domain.entities import User
+from user_management.domain.enums import UserRole, UserStatus
+from user_management.domain.exceptions import EmailAlreadyRegisteredError
+from user_management.domain.value_objects import UserCredentials
 from user_management.application.repositories import UserRepository
 from user_management.infrastructure.models import UserModel
 from user_management.infrastructure.models import UserCredentialsModel
+from user_management.infrastructure.models.user_model import EMAIL_UNIQUE_INDEX, LEGACY_EMAIL_UNIQUE_CONSTRAINT
 
 # import logging
 # logger = logging.getLogger(__name__)
@@ -25,73 +44,196 @@ class PostgresUserRepository(UserRepository):
         self.session = session
 
     async def save(self, user: User) -> None:
-        user_model = UserModel(
-            uuid=str(user.uuid),
-            email=user.email,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            phone=user.phone,
-            date_of_birth=user.date_of_birth,
-            user_role=user.user_role.value,
-            user_status=user.user_status.value,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-        )
-
-        credentials_model = UserCredentialsModel(
-            user_uuid=str(user.uuid),
-            hashed_password=user._credentials._hashed_password.encode('utf-8')
-        )
+        user_model = UserModel(**self._user_row(user))
+        credentials_model = UserCredentialsModel(**self._credentials_row(user))
 
+        # The models have no relationship(), so flush the user first to keep
+        # the credentials insert after the row its foreign key points to.
         self.session.add(user_model)
-        await self.session.flush()
+        try:
+            await self.session.flush()
+        except IntegrityError as e:
+            self._raise_if_duplicate_email(e, f"Email already registered: {user.email}")
+            raise
 
         self.session.add(credentials_model)
-        await self.session.commit()
+
+    async def save_many(self, users: Sequence[User]) -> None:
+        if not users:
+            return
+
+        try:
+            await self.session.execute(insert(UserModel), [self._user_row(user) for user in users])
+        except IntegrityError as e:
+            self._raise_if_duplicate_email(e, "One or more emails are already registered")
+            raise
+        await self.session.execute(insert(UserCredentialsModel), [self._credentials_row(user) for user in users])
 
     async def find_by_email(self, email: str) -> Optional[User]:
-        stmt = select(UserModel).where(UserModel.email == email)
+        stmt = self._select_with_credentials().where(func.lower(UserModel.email) == email.lower())
         result = await self.session.execute(stmt)
-        user_model = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if user_model:
-            return await self._to_domain(user_model)
+        if row:
+            return self._to_domain(*row)
         return None
 
     async def find_by_uuid(self, uuid: UUID) -> Optional[User]:
-        stmt = select(UserModel).where(UserModel.uuid == str(uuid))
+        stmt = self._select_with_credentials().where(UserModel.uuid == uuid)
         result = await self.session.execute(stmt)
-        user_model = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if user_model:
-            return await self._to_domain(user_model)
+        if row:
+            return self._to_domain(*row)
         return None
 
-    async def _to_domain(self, user_model: UserModel) -> User:
-        from user_management.domain.value_objects.user_credentials import UserCredentials
-        from user_management.domain.enums import UserRole, UserStatus
-        from uuid import UUID
+    async def find_updated_at(self, uuid: UUID) -> Optional[datetime]:
+        return await self.session.scalar(select(UserModel.updated_at).where(UserModel.uuid == uuid))
+
+    async def find_many_by_uuids(self, uuids: Iterable[UUID]) -> List[User]:
+        requested = list(dict.fromkeys(uuids))
+        if not requested:
+            return []
 
-        stmt = select(UserCredentialsModel).where(UserCredentialsModel.user_uuid == user_model.uuid)
+        stmt = self._select_with_credentials().where(UserModel.uuid.in_(requested))
         result = await self.session.execute(stmt)
-        credentials_model = result.scalar_one_or_none()
+        users_by_uuid = {
+            user_model.uuid: self._to_domain(user_model, credentials_model)
+            for user_model, credentials_model in result.all()
+        }
+
+        return [users_by_uuid[uuid] for uuid in requested if uuid in users_by_uuid]
+
+    async def find_existing_uuids(self, uuids: Iterable[UUID]) -> Set[UUID]:
+        requested = list(dict.fromkeys(uuids))
+        if not requested:
+            return set()
+
+        result = await self.session.execute(select(UserModel.uuid).where(UserModel.uuid.in_(requested)))
+        return set(result.scalars())
+
+    async def find_registered_emails(self, emails: Iterable[str]) -> Set[str]:
+        requested = list(dict.fromkeys(email.lower() for email in emails))
+        if not requested:
+            return set()
+
+        lowered = func.lower(UserModel.email)
+        result = await self.session.execute(select(lowered).where(lowered.in_(requested)))
+        return set(result.scalars())
+
+    async def search(
+        self,
+        text: Optional[str] = None,
+        role: Optional[UserRole] = None,
+        status: Optional[UserStatus] = None,
+        limit: int = 20,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[User]:
+        stmt = self._select_with_credentials()
+
+        if role is not None:
+            stmt = stmt.where(UserModel.user_role == role)
+        if status is not None:
+            stmt = stmt.where(UserModel.user_status == status)
+        if text:
+            pattern = self._escape_like(text.lower()) + "%"
+            stmt = stmt.where(or_(
+                func.lower(UserModel.first_name).like(pattern, escape="\\"),
+                func.lower(UserModel.last_name).like(pattern, escape="\\"),
+                func.lower(UserModel.email).like(pattern, escape="\\"),
+            ))
+        if after is not None:
+            created_at, uuid = after
+            stmt = stmt.where(tuple_(UserModel.created_at, UserModel.uuid) > tuple_(created_at, uuid))
+
+        stmt = stmt.order_by(UserModel.created_at, UserModel.uuid).limit(limit)
+        result = await self.session.execute(stmt)
+        return [self._to_domain(user_model, credentials_model) for user_model, credentials_model in result.all()]
 
+    async def iter_all(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        stmt = (
+            self._select_with_credentials()
+            .order_by(UserModel.created_at, UserModel.uuid)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(stmt)
+        try:
+            async for user_model, credentials_model in result:
+                yield self._to_domain(user_model, credentials_model)
+        finally:
+            await result.close()
+
+    async def iter_emails(self, batch_size: int = 10000) -> AsyncIterator[str]:
+        result = await self.session.stream_scalars(select(UserModel.email).execution_options(yield_per=batch_size))
+        try:
+            async for email in result:
+                yield email
+        finally:
+            await result.close()
+
+    @staticmethod
+    def _raise_if_duplicate_email(error: IntegrityError, message: str) -> None:
+        violated = str(error.orig)
+        if EMAIL_UNIQUE_INDEX in violated or LEGACY_EMAIL_UNIQUE_CONSTRAINT in violated:
+            raise EmailAlreadyRegisteredError(message) from error
+
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        """
+        Escapes LIKE wildcards so user input is always matched literally.
+        """
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    @staticmethod
+    def _user_row(user: User) -> Dict[str, Any]:
+        return {
+            "uuid": user.uuid,
+            "email": user.email,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "phone": user.phone,
+            "date_of_birth": user.date_of_birth,
+            "user_role": user.user_role,
+            "user_status": user.user_status,
+            "created_at": user.created_at,
+            "updated_at": user.updated_at,
+        }
+
+    @staticmethod
+    def _credentials_row(user: User) -> Dict[str, Any]:
+        return {
+            "user_uuid": user.uuid,
+            "hashed_password": user._credentials._hashed_password,
+        }
+
+    @staticmethod
+    def _select_with_credentials() -> Select:
+        """
+        Builds the base statement that loads a user row together with its credentials.
+
+        An outer join keeps users without a credentials row visible, so the
+        integrity error raised by ``_to_domain`` is preserved.
+        """
+        return select(UserModel, UserCredentialsModel).outerjoin(
+            UserCredentialsModel, UserCredentialsModel.user_uuid == UserModel.uuid
+        )
+
+    @staticmethod
+    def _to_domain(user_model: UserModel, credentials_model: Optional[UserCredentialsModel]) -> User:
         if not credentials_model:
             raise ValueError(f"Credentials not found for user {user_model.uuid}")
 
-        hashed_password_str = credentials_model.hashed_password.decode('utf-8')
-
-        credentials = UserCredentials._from_hashed(hashed_password_str)
+        credentials = UserCredentials._from_hashed(credentials_model.hashed_password)
 
-        return User(
-            uuid=UUID(user_model.uuid),
+        return User._rehydrate(
+            uuid=user_model.uuid,
             email=user_model.email,
             first_name=user_model.first_name,
             last_name=user_model.last_name,
             phone=user_model.phone,
             date_of_birth=user_model.date_of_birth,
-            user_role=UserRole(user_model.user_role),
-            user_status=UserStatus(user_model.user_status),
+            user_role=user_model.user_role,
+            user_status=user_model.user_status,
             created_at=user_model.created_at,
             updated_at=user_model.updated_at,
             credentials=credentials
@@ -0,0 +1,99 @@
+"""
+PatientProfileRepository decorator backed by a cache shared by all workers.
+
+Profiles are stored as compact projections under ``patient-profile:<hex
+user uuid>``. Writes delete the key and publish an invalidation message;
+the unit of work repeats the eviction once the transaction ends. Backend
+failures are logged and fall through to the wrapped repository.
+"""
+import logging
+from datetime import datetime
+from typing import Iterable, List, Optional, Sequence, Set
+from uuid import UUID
+
+from user_management.application.repositories import PatientProfileRepository
+from user_management.domain.entities import PatientProfile
+from user_management.infrastructure.caching.backends import CacheBackend
+from user_management.infrastructure.caching.invalidation import PATIENT_PROFILE, publish_invalidation
+from user_management.infrastructure.caching.projections import decode_patient_profile, encode_patient_profile
+from user_management.infrastructure.repositories.shared_caching_user_repository import \
+    DEFAULT_SHARED_CACHE_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+def patient_profile_key(user_uuid: UUID) -> str:
+    return f"patient-profile:{user_uuid.hex}"
+
+
+class SharedCachingPatientProfileRepository(PatientProfileRepository):
+    """
+    Read-through cache of patient profiles in a shared CacheBackend.
+    """
+
+    def __init__(self, repository: PatientProfileRepository, backend: CacheBackend,
+                 ttl_seconds: float = DEFAULT_SHARED_CACHE_TTL_SECONDS, populate: bool = True):
+        self.repository = repository
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.populate = populate
+        self._written: List[UUID] = []
+
+    async def save(self, patient: PatientProfile) -> None:
+        await self._evict([patient.user_uuid])
+        self._written.append(patient.user_uuid)
+        await self.repository.save(patient)
+
+    async def save_many(self, patients: Sequence[PatientProfile]) -> None:
+        user_uuids = [patient.user_uuid for patient in patients]
+        await self._evict(user_uuids)
+        self._written.extend(user_uuids)
+        await self.repository.save_many(patients)
+
+    async def evict_written(self) -> None:
+        written, self._written = self._written, []
+        await self._evict(written)
+
+    async def find_by_user_uuid(self, user_uuid: UUID) -> Optional[PatientProfile]:
+        try:
+            value = await self.backend.get(patient_profile_key(user_uuid))
+        except Exception as e:
+            logger.warning("Shared cache read failed, falling back to the database: %s", e)
+            value = None
+        profile = decode_patient_profile(value) if value is not None else None
+        if profile is not None:
+            return profile
+
+        profile = await self.repository.find_by_user_uuid(user_uuid)
+        if profile is not None and self.populate:
+            try:
+                await self.backend.set_many({patient_profile_key(user_uuid): encode_patient_profile(profile)},
+                                            self.ttl_seconds)
+            except Exception as e:
+                logger.warning("Shared cache write failed: %s", e)
+        return profile
+
+    async def find_updated_at_by_user_uuid(self, user_uuid: UUID) -> Optional[datetime]:
+        # Answer from the same entry find_by_user_uuid would serve, so the two agree.
+        try:
+            value = await self.backend.get(patient_profile_key(user_uuid))
+        except Exception as e:
+            logger.warning("Shared cache read failed, falling back to the database: %s", e)
+            value = None
+        profile = decode_patient_profile(value) if value is not None else None
+        if profile is not None:
+            return profile.updated_at
+        return await self.repository.find_updated_at_by_user_uuid(user_uuid)
+
+    async def find_existing_user_uuids(self, user_uuids: Iterable[UUID]) -> Set[UUID]:
+        # Existence checks guard inserts, so they always go to the database.
+        return await self.repository.find_existing_user_uuids(user_uuids)
+
+    async def _evict(self, user_uuids: Sequence[UUID]) -> None:
+        if not user_uuids:
+            return
+        try:
+            await self.backend.delete([patient_profile_key(user_uuid) for user_uuid in user_uuids])
+            await publish_invalidation(self.backend, PATIENT_PROFILE, user_uuids)
+        except Exception as e:
+            logger.error("Shared cache invalidation failed for %d patient profiles: %s", len(user_uuids), e)
@@ -0,0 +1,225 @@
+"""
+UserRepository decorator backed by a cache shared by all workers.
+
+Users are stored in the CacheBackend as compact projections (see
+caching/projections.py) under ``user:<hex uuid>``, with an email index
+``user-email:<lower-cased email>`` holding the UUID. An email hit is only
+served if the user entry still has that email. Projections hold no password
+hash, so users served from here cannot have their password checked or be
+saved; ``read_through=False`` (used by the unit of work) only evicts and
+always reads from the wrapped repository.
+
+Writes delete the user's keys, record the written ``updated_at`` under
+``user-version:<hex uuid>`` and publish an invalidation message, which makes
+every worker drop the user from its process-local UserCache. Like
+CachingUserRepository, the unit of work repeats the eviction once the
+transaction ends (``evict_written``).
+
+A reader that loaded the old row just before a write must not put it back
+after the eviction, so users older than their recorded version are not
+stored. The version is read just before the entry is written and the two
+are not atomic: a write landing between them can still leave the old entry
+behind, for at most ``ttl_seconds``; keep the TTL short where that matters.
+
+The shared cache is an optimisation only: if the backend fails, the error
+is logged and the call falls through to the wrapped repository.
+"""
+import logging
+from datetime import datetime
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from user_management.application.repositories import UserRepository
+from user_management.domain.entities import User
+from user_management.domain.enums import UserRole, UserStatus
+from user_management.infrastructure.caching.backends import CacheBackend
+from user_management.infrastructure.caching.invalidation import USER, publish_invalidation
+from user_management.infrastructure.caching.projections import decode_user, encode_user, encode_user_version
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHARED_CACHE_TTL_SECONDS = 300.0
+
+
+def user_key(uuid: UUID) -> str:
+    return f"user:{uuid.hex}"
+
+
+def user_email_key(email: str) -> str:
+    return f"user-email:{email.lower()}"
+
+
+def user_version_key(uuid: UUID) -> str:
+    return f"user-version:{uuid.hex}"
+
+
+class SharedCachingUserRepository(UserRepository):
+    """
+    Read-through cache of users in a shared CacheBackend.
+
+    Args:
+        repository: The repository loading users on a miss.
+        backend: The shared cache.
+        ttl_seconds (float): Lifetime of cached entries.
+        populate (bool): Whether users loaded on a miss are stored (False for replica reads).
+        read_through (bool): Whether lookups are served from the cache (False only evicts on writes).
+    """
+
+    def __init__(self, repository: UserRepository, backend: CacheBackend,
+                 ttl_seconds: float = DEFAULT_SHARED_CACHE_TTL_SECONDS, populate: bool = True,
+                 read_through: bool = True):
+        self.repository = repository
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.populate = populate and read_through
+        self.read_through = read_through
+        self._written: List[User] = []
+
+    async def save(self, user: User) -> None:
+        await self._evict([user])
+        self._written.append(user)
+        await self.repository.save(user)
+
+    async def save_many(self, users: Sequence[User]) -> None:
+        await self._evict(users)
+        self._written.extend(users)
+        await self.repository.save_many(users)
+
+    async def evict_written(self) -> None:
+        """
+        Evicts, on every worker, the users saved through this repository since the last call.
+        """
+        written, self._written = self._written, []
+        await self._evict(written)
+
+    async def find_by_email(self, email: str) -> Optional[User]:
+        user = await self._cached_by_email(email)
+        if user is not None:
+            return user
+
+        user = await self.repository.find_by_email(email)
+        if user is not None:
+            await self._store([user])
+        return user
+
+    async def find_by_uuid(self, uuid: UUID) -> Optional[User]:
+        cached = await self._cached_by_uuids([uuid])
+        if uuid in cached:
+            return cached[uuid]
+
+        user = await self.repository.find_by_uuid(uuid)
+        if user is not None:
+            await self._store([user])
+        return user
+
+    async def find_updated_at(self, uuid: UUID) -> Optional[datetime]:
+        # Answer from the same entry find_by_uuid would serve, so the two agree.
+        cached = await self._cached_by_uuids([uuid])
+        if uuid in cached:
+            return cached[uuid].updated_at
+        return await self.repository.find_updated_at(uuid)
+
+    async def find_many_by_uuids(self, uuids: Iterable[UUID]) -> List[User]:
+        requested = list(dict.fromkeys(uuids))
+        if not requested:
+            return []
+
+        found = await self._cached_by_uuids(requested)
+        missing = [uuid for uuid in requested if uuid not in found]
+        if missing:
+            loaded = await self.repository.find_many_by_uuids(missing)
+            found.update((user.uuid, user) for user in loaded)
+            await self._store(loaded)
+
+        return [found[uuid] for uuid in requested if uuid in found]
+
+    async def find_existing_uuids(self, uuids: Iterable[UUID]) -> Set[UUID]:
+        requested = list(dict.fromkeys(uuids))
+        if not requested:
+            return set()
+        if not self.read_through:
+            return await self.repository.find_existing_uuids(requested)
+
+        values = await self._get_many([user_key(uuid) for uuid in requested])
+        existing = {uuid for uuid, value in zip(requested, values) if value is not None}
+        missing = [uuid for uuid in requested if uuid not in existing]
+        if missing:
+            existing |= await self.repository.find_existing_uuids(missing)
+        return existing
+
+    async def find_registered_emails(self, emails: Iterable[str]) -> Set[str]:
+        return await self.repository.find_registered_emails(emails)
+
+    async def search(
+        self,
+        text: Optional[str] = None,
+        role: Optional[UserRole] = None,
+        status: Optional[UserStatus] = None,
+        limit: int = 20,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[User]:
+        return await self.repository.search(text=text, role=role, status=status, limit=limit, after=after)
+
+    def iter_all(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        return self.repository.iter_all(batch_size=batch_size)
+
+    def iter_emails(self, batch_size: int = 10000) -> AsyncIterator[str]:
+        return self.repository.iter_emails(batch_size=batch_size)
+
+    async def _cached_by_uuids(self, uuids: Sequence[UUID]) -> Dict[UUID, User]:
+        if not self.read_through:
+            return {}
+        values = await self._get_many([user_key(uuid) for uuid in uuids])
+        found = {}
+        for uuid, value in zip(uuids, values):
+            user = decode_user(value) if value is not None else None
+            if user is not None:
+                found[uuid] = user
+        return found
+
+    async def _cached_by_email(self, email: str) -> Optional[User]:
+        if not self.read_through:
+            return None
+        (uuid_hex,) = await self._get_many([user_email_key(email)])
+        if uuid_hex is None:
+            return None
+
+        uuid = UUID(hex=uuid_hex.decode("ascii"))
+        user = (await self._cached_by_uuids([uuid])).get(uuid)
+        if user is None or user.email.lower() != email.lower():
+            return None
+        return user
+
+    async def _get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        try:
+            return await self.backend.get_many(keys)
+        except Exception as e:
+            logger.warning("Shared cache read failed, falling back to the database: %s", e)
+            return [None] * len(keys)
+
+    async def _store(self, users: Sequence[User]) -> None:
+        if not users or not self.populate:
+            return
+        versions = await self._get_many([user_version_key(user.uuid) for user in users])
+        items = {}
+        for user, version in zip(users, versions):
+            if version is not None and int(encode_user_version(user)) < int(version):
+                continue
+            items[user_key(user.uuid)] = encode_user(user)
+            items[user_email_key(user.email)] = user.uuid.hex.encode("ascii")
+        try:
+            await self.backend.set_many(items, self.ttl_seconds)
+        except Exception as e:
+            logger.warning("Shared cache write failed: %s", e)
+
+    async def _evict(self, users: Sequence[User]) -> None:
+        if not users:
+            return
+        keys = [key for user in users for key in (user_key(user.uuid), user_email_key(user.email))]
+        versions = {user_version_key(user.uuid): encode_user_version(user) for user in users}
+        try:
+            await self.backend.set_many(versions, self.ttl_seconds)
+            await self.backend.delete(keys)
+            await publish_invalidation(self.backend, USER, [user.uuid for user in users])
+        except Exception as e:
+            logger.error("Shared cache invalidation failed for %d users: %s", len(users), e)
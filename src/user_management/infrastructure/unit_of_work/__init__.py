@@ -0,0 +1,7 @@
+from .sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
+from .in_memory_unit_of_work import InMemoryUnitOfWork
+
+__all__ = [
+    "SqlAlchemyUnitOfWork",
+    "InMemoryUnitOfWork"
+]
@@ -0,0 +1,45 @@
+"""
+In-memory implementation of the UnitOfWork interface for tests.
+
+Entering the unit of work snapshots the repositories; rolling back restores
+the snapshot, so uncommitted changes disappear just as they would in a
+database transaction.
+"""
+from typing import Optional
+
+from user_management.application.unit_of_work import UnitOfWork
+from user_management.infrastructure.repositories.in_memory_patient_profile_repository import \
+    InMemoryPatientProfileRepository
+from user_management.infrastructure.repositories.in_memory_user_repository import InMemoryUserRepository
+
+
+class InMemoryUnitOfWork(UnitOfWork):
+    """
+    Unit of work over in-memory repositories.
+
+    Attributes:
+        commits (int): Number of successful commits, for assertions in tests.
+    """
+
+    def __init__(self,
+                 users: Optional[InMemoryUserRepository] = None,
+                 patient_profiles: Optional[InMemoryPatientProfileRepository] = None):
+        self.users = users or InMemoryUserRepository()
+        self.patient_profiles = patient_profiles or InMemoryPatientProfileRepository()
+        self.commits = 0
+        self._snapshot = None
+
+    async def __aenter__(self) -> 'InMemoryUnitOfWork':
+        self._snapshot = (self.users._snapshot(), self.patient_profiles._snapshot())
+        return self
+
+    async def commit(self) -> None:
+        self._snapshot = (self.users._snapshot(), self.patient_profiles._snapshot())
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        if self._snapshot is None:
+            return
+        users, patient_profiles = self._snapshot
+        self.users._restore(users)
+        self.patient_profiles._restore(patient_profiles)
@@ -0,0 +1,80 @@
+"""
+SQLAlchemy implementation of the UnitOfWork interface.
+
+Wraps one AsyncSession shared by every repository of the unit of work, so a
+business operation touching users and patient profiles is written in a single
+transaction and committed (one fsync on the server) exactly once.
+
+With a UserIdentityMap, user lookups go through the request's identity map
+(see IdentityMapUserRepository). Rolling back an open transaction clears the
+map, as it may hold users only visible inside that transaction.
+
+With a UserCache, user reads go through the process-wide cache (see
+CachingUserRepository); with a shared CacheBackend, patient profiles are
+also cached across workers. Users are never read from the shared cache
+here, since it holds no password hashes (see SharedCachingUserRepository),
+but writes evict them from it. Entries written are evicted again from every
+cache once the transaction ends.
+"""
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from user_management.application.unit_of_work import UnitOfWork
+from user_management.infrastructure.repositories.postgres_patient_profile_repository import \
+    PostgresPatientProfileRepository
+from user_management.infrastructure.caching import CacheBackend, UserCache
+from user_management.infrastructure.repositories.caching_user_repository import CachingUserRepository
+from user_management.infrastructure.repositories.shared_caching_patient_profile_repository import \
+    SharedCachingPatientProfileRepository
+from user_management.infrastructure.repositories.shared_caching_user_repository import \
+    DEFAULT_SHARED_CACHE_TTL_SECONDS, SharedCachingUserRepository
+from user_management.infrastructure.repositories.identity_map_user_repository import IdentityMapUserRepository, \
+    UserIdentityMap
+from user_management.infrastructure.repositories.postgres_user_repository import PostgresUserRepository
+
+
+class SqlAlchemyUnitOfWork(UnitOfWork):
+    """
+    Unit of work bound to an existing session.
+
+    The session's lifetime is owned by the caller (the request-scoped
+    dependency), so the unit of work can be entered several times, e.g. once
+    per chunk of a batch, each with its own commit.
+    """
+
+    def __init__(self, session: AsyncSession, identity_map: Optional[UserIdentityMap] = None,
+                 user_cache: Optional[UserCache] = None, shared_cache: Optional[CacheBackend] = None,
+                 shared_cache_ttl_seconds: float = DEFAULT_SHARED_CACHE_TTL_SECONDS):
+        self.session = session
+        self.identity_map = identity_map
+        self.users = PostgresUserRepository(session)
+        self.patient_profiles = PostgresPatientProfileRepository(session)
+        self._caching_repositories: List = []
+
+        if shared_cache is not None:
+            self.users = SharedCachingUserRepository(self.users, shared_cache, shared_cache_ttl_seconds,
+                                                     read_through=False)
+            self.patient_profiles = SharedCachingPatientProfileRepository(self.patient_profiles, shared_cache,
+                                                                          shared_cache_ttl_seconds)
+            self._caching_repositories += [self.users, self.patient_profiles]
+        if user_cache is not None:
+            self.users = CachingUserRepository(self.users, user_cache)
+            self._caching_repositories.append(self.users)
+        if identity_map is not None:
+            self.users = IdentityMapUserRepository(self.users, identity_map)
+
+    async def commit(self) -> None:
+        await self.session.commit()
+        await self._evict_written()
+
+    async def rollback(self) -> None:
+        if self.identity_map is not None and self.session.in_transaction():
+            self.identity_map.clear()
+        await self.session.rollback()
+        await self._evict_written()
+
+    async def _evict_written(self) -> None:
+        # Shared cache first, so the process-local cache cannot be refilled from a stale shared entry.
+        for repository in self._caching_repositories:
+            await repository.evict_written()
@@ -5,8 +5,14 @@ Allows clean imports across test modules.
 
 from .user_factories import create_valid_user
 from .patient_profile_factories import create_valid_patient_profile
+from .entity_fields import entity_fields
+from .specification_corpus import FIXED_VALUES, fuzzed_strings, specification_corpus
 
 __all__ = [
     "create_valid_user",
-    "create_valid_patient_profile"
+    "create_valid_patient_profile",
+    "entity_fields",
+    "FIXED_VALUES",
+    "fuzzed_strings",
+    "specification_corpus"
 ]
\ No newline at end of file
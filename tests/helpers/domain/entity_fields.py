@@ -0,0 +1,6 @@
+def entity_fields(entity, exclude=()):
+    """
+    Returns the attributes of a slotted domain entity as a dict, for comparing
+    entities field by field (they have no ``__dict__`` for ``vars()``).
+    """
+    return {name: getattr(entity, name) for name in type(entity).__slots__ if name not in exclude}
@@ -0,0 +1,30 @@
+import random
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+from user_management.domain.enums import UserRole, UserStatus
+
+NOW = datetime.now(timezone.utc)
+FIXED_VALUES = [
+    None, 0, 1.5, True, b"bytes", [], "", " ", "\t", "\n", "John", "Mary Jane", "Mary  Jane", "O'Connor",
+    "John\n", " John", "English", "Português", "ab", "a" * 101, "Forever Healthy Insurance", "+15551234567",
+    "+0123", "+1", "5551234567", "+1555123456789012", "john@example.com", "john..doe@example.com",
+    ".john@example.com", "john.@example.com", "john@.example.com", "john@example.com.", "john@example",
+    "jo hn@example.com", "john@@example.com", "john@ex@ample.com", "@example.com", "john@", "a@b.c",
+    "\t@a.b", "a@b.c\n", "Arterial hypertension; (mild), controlled.", uuid4(), "12345678-1234-5678-1234-567812345678",
+    UserRole.PATIENT, "PATIENT", UserStatus.ACTIVE, date(1990, 1, 1), date(1800, 1, 1), date.today(),
+    date.today() + timedelta(days=1), NOW, NOW - timedelta(days=1), NOW + timedelta(hours=1),
+    NOW.replace(tzinfo=None), NOW.astimezone(timezone(timedelta(hours=2))),
+]
+
+
+def fuzzed_strings(count: int, seed: int = 3) -> list:
+    """Random strings built from the characters the leaf specifications care about."""
+    rng = random.Random(seed)
+    pieces = ["a", "Zé", ".", "@", " ", "+1", "5", "-", "'", "\t", "\n", ",", "(", "ab.cd", "x@y.z"]
+    return ["".join(rng.choice(pieces) for _ in range(rng.randrange(0, 8))) for _ in range(count)]
+
+
+def specification_corpus(fuzzed: int = 5_000) -> list:
+    """The fixed edge cases followed by ``fuzzed`` random strings."""
+    return FIXED_VALUES + fuzzed_strings(fuzzed)
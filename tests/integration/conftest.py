@@ -0,0 +1,69 @@
+"""
+Shared fixtures for the integration tests.
+
+The tests run their async scenarios with ``asyncio.run``, one event loop per
+call, so the SQLite engines built here use NullPool: no connection outlives
+the loop that opened it, and each engine can be created and disposed from
+its own ``asyncio.run`` outside the test's scenario.
+"""
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def sessionmaker_factory(tmp_path):
+    """
+    Returns ``make(name="users.db")``, which creates a SQLite database file with
+    every table and returns an ``async_sessionmaker`` bound to it.
+
+    Every engine created this way is disposed when the test ends.
+    """
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from sqlalchemy.pool import NullPool
+
+    from user_management.infrastructure.models import Base
+
+    engines = []
+
+    async def create_tables(engine):
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+    def make(name: str = "users.db"):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}", poolclass=NullPool)
+        engines.append(engine)
+        asyncio.run(create_tables(engine))
+        return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    yield make
+
+    for engine in engines:
+        asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def sessionmaker(sessionmaker_factory):
+    """An ``async_sessionmaker`` bound to a fresh SQLite database with every table."""
+    return sessionmaker_factory()
+
+
+@pytest.fixture
+def selects(sessionmaker):
+    """
+    The SQL of every SELECT run through ``sessionmaker`` since the fixture was set up.
+
+    Clear it after seeding to count only the statements under test.
+    """
+    from sqlalchemy import event
+
+    statements = []
+
+    def record(connection, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(sessionmaker.kw["bind"].sync_engine, "before_cursor_execute", record)
+    return statements
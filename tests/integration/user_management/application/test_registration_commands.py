@@ -0,0 +1,126 @@
+"""
+Integration tests for registration commands issuing ValidatedFields to the factories.
+
+Tests include:
+- Whatever a command accepts, the entity's specification accepts (fuzzed per field)
+- The commands still accept the usual valid values
+- Validated commands carry a ValidatedFields token; model_construct does not issue one
+- The factories build the same entities with and without a token
+"""
+import random
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("pydantic")
+
+from pydantic import ValidationError
+
+from tests.helpers.domain import entity_fields
+from user_management.application.use_cases.register_patient_profile import RegisterPatientProfileCommand
+from user_management.application.use_cases.register_user import RegisterUserCommand
+from user_management.domain.enums import UserRole
+from user_management.domain.exceptions import DomainError, InvalidNameError
+from user_management.domain.factories.patient_profile_factory import PatientProfileFactory
+from user_management.domain.factories.user_factory import UserFactory
+from user_management.domain.specifications.patient_profile import ValidEmergencyContactNameSpecification, \
+    ValidEmergencyContactPhoneSpecification, ValidInsuranceInfoSpecification, ValidMedicalHistorySummarySpecification, \
+    ValidPreferredLanguageSpecification
+from user_management.domain.specifications.user import ValidEmailSpecification, ValidNameSpecification, \
+    ValidPhoneE164Specification
+
+USER_PAYLOAD = dict(email="jane.doe@clinic.com", first_name="Jane", last_name="Doe", phone="+15551234567",
+                    date_of_birth=date(1990, 1, 1), user_role=UserRole.PATIENT, password="Str0ng!Passw0rd")
+PROFILE_PAYLOAD = dict(user_uuid=uuid4(), emergency_contact_name="John Doe", emergency_contact_phone="+15551234567",
+                       insurance_info="Forever Healthy Insurance", preferred_language="English",
+                       medical_history_summary="Arterial hypertension; asthma (mild).")
+
+FIELDS = [
+    (RegisterUserCommand, USER_PAYLOAD, "email", ValidEmailSpecification()),
+    (RegisterUserCommand, USER_PAYLOAD, "first_name", ValidNameSpecification()),
+    (RegisterUserCommand, USER_PAYLOAD, "phone", ValidPhoneE164Specification()),
+    (RegisterPatientProfileCommand, PROFILE_PAYLOAD, "emergency_contact_name", ValidEmergencyContactNameSpecification()),
+    (RegisterPatientProfileCommand, PROFILE_PAYLOAD, "emergency_contact_phone",
+     ValidEmergencyContactPhoneSpecification()),
+    (RegisterPatientProfileCommand, PROFILE_PAYLOAD, "insurance_info", ValidInsuranceInfoSpecification()),
+    (RegisterPatientProfileCommand, PROFILE_PAYLOAD, "preferred_language", ValidPreferredLanguageSpecification()),
+    (RegisterPatientProfileCommand, PROFILE_PAYLOAD, "medical_history_summary",
+     ValidMedicalHistorySummarySpecification()),
+]
+ALPHABET = "aZé ÿ\t\n\x1c .@+-'0919٣,;:()!"
+
+
+def _accepts(command_type, payload) -> bool:
+    try:
+        command_type.model_validate(payload)
+    except (ValidationError, DomainError):
+        return False
+    return True
+
+
+def _samples(valid: str, rng: random.Random):
+    yield from ("", " ", "\n", valid + "\n", " " + valid, valid + " ", "x" * 120, "ab", "a" * 100)
+    for _ in range(3000):
+        if rng.random() < 0.5:
+            chars = list(valid)
+            for _ in range(rng.randint(1, 3)):
+                chars.insert(rng.randint(0, len(chars)), rng.choice(ALPHABET))
+            yield "".join(chars)
+        else:
+            yield "".join(rng.choice(ALPHABET) for _ in range(rng.randint(1, 12)))
+
+
+@pytest.mark.parametrize("command_type, payload, field, specification", FIELDS,
+                         ids=[field for _, _, field, _ in FIELDS])
+def test_commands_never_accept_what_the_specification_rejects(command_type, payload, field, specification):
+    rng = random.Random(field)
+    accepted = 0
+    for value in _samples(payload[field], rng):
+        if _accepts(command_type, payload | {field: value}):
+            accepted += 1
+            assert specification.is_satisfied_by(value), (field, value)
+    assert accepted > 0
+
+
+@pytest.mark.parametrize("field, value", [
+    ("email", "first.last+tag@mail.clinic.co.uk"),
+    ("email", "a@b.c"),
+    ("first_name", "Mary Ann"),
+    ("phone", "+5511987654321"),
+    ("insurance_info", "  Saúde Plus - Gold  "),
+    ("preferred_language", "pt-BR Português"),
+    ("medical_history_summary", "Diabetes: controlled (diet)."),
+])
+def test_commands_accept_valid_values(field, value):
+    payload = USER_PAYLOAD if field in USER_PAYLOAD else PROFILE_PAYLOAD
+    command_type = RegisterUserCommand if payload is USER_PAYLOAD else RegisterPatientProfileCommand
+    assert _accepts(command_type, payload | {field: value})
+
+
+def test_only_validated_commands_carry_a_token():
+    command = RegisterUserCommand(**USER_PAYLOAD)
+    assert command.validated_fields.names == {"email", "first_name", "last_name", "phone", "date_of_birth",
+                                              "user_role"}
+    assert command.validated_fields["user_role"] is UserRole.PATIENT
+    assert RegisterUserCommand.model_construct(**USER_PAYLOAD).validated_fields is None
+
+    profile_command = RegisterPatientProfileCommand(**PROFILE_PAYLOAD)
+    assert "created_at" not in profile_command.validated_fields
+    assert dict(profile_command.validated_fields) == PROFILE_PAYLOAD
+
+
+def test_factories_build_the_same_entities_with_and_without_a_token():
+    command = RegisterUserCommand(**USER_PAYLOAD)
+    unvalidated = RegisterUserCommand.model_construct(**USER_PAYLOAD)
+    exclude = ("uuid", "created_at", "updated_at", "_credentials")
+    assert entity_fields(UserFactory.create_from_command(command), exclude) == \
+        entity_fields(UserFactory.create_from_command(unvalidated), exclude)
+
+    profile_command = RegisterPatientProfileCommand(**PROFILE_PAYLOAD)
+    profile = PatientProfileFactory.create_from_command(profile_command)
+    assert entity_fields(profile, ("created_at", "updated_at")) == PROFILE_PAYLOAD
+    assert profile.updated_at == profile.created_at
+
+    with pytest.raises(InvalidNameError):
+        UserFactory.create_from_command(RegisterUserCommand.model_construct(**USER_PAYLOAD | {"first_name": "J0hn"}))
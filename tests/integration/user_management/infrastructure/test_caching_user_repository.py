@@ -0,0 +1,146 @@
+"""
+Integration tests for the process-wide TTL/LRU user cache.
+
+Tests include:
+- TTLLRUCache evicts the least recently used entry and expires entries after their TTL
+- Lookups by UUID and by email are served from the cache after the first load
+- Callers get private copies, so mutating a returned User does not change the cache
+- A password change saved through the unit of work evicts the cached hash
+- A row read before that commit is not cached once the commit has evicted it
+- Repositories with populate=False read the cache without filling it
+"""
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import delete, update
+
+from tests.helpers.domain import create_valid_user
+from user_management.domain.value_objects import UserCredentials
+from user_management.infrastructure.caching import TTLLRUCache, UserCache
+from user_management.infrastructure.models import Base, UserCredentialsModel
+from user_management.infrastructure.repositories import CachingUserRepository, PostgresUserRepository
+from user_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _seed(sessionmaker, users: int):
+    stored = [create_valid_user(uuid=uuid4(), email=f"user{i}@clinic.com",
+                                credentials=UserCredentials.create("Secret123!"))
+              for i in range(users)]
+    async with sessionmaker() as session:
+        async with SqlAlchemyUnitOfWork(session) as uow:
+            await uow.users.save_many(stored)
+            await uow.commit()
+    return stored
+
+
+def test_ttl_lru_cache_evicts_and_expires():
+    clock = FakeClock()
+    cache = TTLLRUCache(max_entries=2, ttl_seconds=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+    clock.now = 10
+    assert cache.get("a") is None
+    statistics = cache.statistics()
+    assert (statistics.hits, statistics.misses, statistics.evictions, statistics.expirations) == (3, 2, 1, 1)
+    assert statistics.size == 1
+
+
+def test_lookups_are_served_from_the_cache_as_private_copies(sessionmaker, selects):
+    async def scenario():
+        stored = await _seed(sessionmaker, users=3)
+        selects.clear()
+        cache = UserCache(max_entries=100, ttl_seconds=60)
+        async with sessionmaker() as session:
+            repository = CachingUserRepository(PostgresUserRepository(session), cache)
+            first = await repository.find_by_email("USER0@clinic.com")
+            second = await repository.find_by_uuid(stored[0].uuid)
+            many = await repository.find_many_by_uuids([stored[0].uuid, stored[1].uuid])
+            again = await repository.find_many_by_uuids([stored[1].uuid, stored[0].uuid])
+
+        assert len(selects) == 2
+        assert first is not second and first.uuid == second.uuid == stored[0].uuid
+        assert [user.uuid for user in many] == [stored[0].uuid, stored[1].uuid]
+        assert [user.uuid for user in again] == [stored[1].uuid, stored[0].uuid]
+
+        first.change_password("Secret123!", "NewSecret456!")
+        assert cache.get_by_uuid(stored[0].uuid).is_password_valid("Secret123!")
+
+        statistics = cache.statistics()
+        assert (statistics.hits, statistics.misses) == (5, 2)
+
+    asyncio.run(scenario())
+
+
+def test_password_change_saved_through_the_unit_of_work_evicts_the_cached_hash(sessionmaker):
+    async def scenario():
+        stored = await _seed(sessionmaker, users=1)
+        cache = UserCache(max_entries=100, ttl_seconds=60)
+        async with sessionmaker() as session:
+            async with SqlAlchemyUnitOfWork(session, user_cache=cache) as uow:
+                user = await uow.users.find_by_uuid(stored[0].uuid)
+                assert cache.contains(user.uuid)
+
+                # PostgresUserRepository.save inserts, so replace the stored rows to persist the change.
+                user.change_password("Secret123!", "NewSecret456!")
+                await session.execute(delete(UserCredentialsModel))
+                await session.execute(delete(Base.metadata.tables["users"]))
+                await uow.users.save(user)
+                assert not cache.contains(user.uuid)
+
+                # A concurrent reader caching the old row before the commit...
+                cache.put(stored[0])
+                await uow.commit()
+
+            # ...is evicted again once the transaction commits.
+            assert not cache.contains(user.uuid)
+            reloaded = await CachingUserRepository(PostgresUserRepository(session), cache).find_by_email(user.email)
+
+        assert reloaded.is_password_valid("NewSecret456!")
+        assert not cache.get_by_uuid(user.uuid).is_password_valid("Secret123!")
+
+        # A reader whose SELECT ran before the commit, storing the old row only now.
+        cache.invalidate(user)
+        cache.put(stored[0])
+        assert not cache.contains(user.uuid)
+        cache.put(reloaded)
+        assert cache.get_by_uuid(user.uuid).is_password_valid("NewSecret456!")
+
+    asyncio.run(scenario())
+
+
+def test_non_populating_repository_reads_but_does_not_fill_the_cache(sessionmaker, selects):
+    async def scenario():
+        stored = await _seed(sessionmaker, users=2)
+        selects.clear()
+        cache = UserCache(max_entries=100, ttl_seconds=60)
+        cache.put(stored[0])
+        async with sessionmaker() as session:
+            replica = CachingUserRepository(PostgresUserRepository(session), cache, populate=False)
+            await session.execute(update(Base.metadata.tables["users"]).values(first_name="Changed"))
+
+            assert (await replica.find_by_uuid(stored[0].uuid)).first_name == stored[0].first_name
+            assert (await replica.find_by_uuid(stored[1].uuid)).first_name == "Changed"
+            assert not cache.contains(stored[1].uuid)
+
+        assert len(selects) == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,128 @@
+"""
+Integration tests for the storage-mode column types.
+
+The compact variants are instantiated explicitly so both layouts are exercised
+whatever DB_STORAGE_MODE the suite runs with.
+
+Tests include:
+- Digests are stored as 32 raw bytes in compact mode and as hex text in legacy mode
+- Digests written in either layout load back as the same hex string
+- Enums are stored as their stable codes in compact mode
+- UUIDs load back as uuid.UUID objects from their string fallback
+- Enum code mappings must cover every member
+- Columns without an explicit flag follow the storage mode set after they were built
+- Unknown storage modes are rejected
+"""
+from hashlib import sha256
+from uuid import UUID, uuid4
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, insert, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from user_management.domain.enums import UserRole
+from user_management.infrastructure.models import UserModel
+from user_management.infrastructure.models.types import EnumCode, PasswordDigest, UUIDType, get_storage_mode, \
+    set_storage_mode
+from user_management.infrastructure.models.user_model import USER_ROLE_CODES
+
+DIGEST = sha256(b"Secret123!").hexdigest()
+
+
+@pytest.fixture
+def storage_mode():
+    """Restores the process-wide storage mode after the test."""
+    previous = get_storage_mode()
+    yield set_storage_mode
+    set_storage_mode(previous)
+
+
+def _table(compact) -> Table:
+    return Table(
+        "storage",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("uuid", UUIDType(compact=compact)),
+        Column("digest", PasswordDigest(compact=compact)),
+        Column("role", EnumCode(UserRole, USER_ROLE_CODES, compact=compact)),
+    )
+
+
+def _roundtrip(compact):
+    engine = create_engine("sqlite://")
+    table = _table(compact)
+    table.metadata.create_all(engine)
+    uuid = uuid4()
+    try:
+        with engine.begin() as connection:
+            connection.execute(insert(table), {"id": 1, "uuid": uuid, "digest": DIGEST, "role": UserRole.DOCTOR})
+            loaded = connection.execute(select(table.c.uuid, table.c.digest, table.c.role)).one()
+            raw = connection.execute(text("SELECT uuid, digest, role FROM storage")).one()
+    finally:
+        engine.dispose()
+    return uuid, loaded, raw
+
+
+def test_compact_mode_stores_raw_digest_and_enum_code():
+    uuid, loaded, raw = _roundtrip(compact=True)
+
+    assert raw.digest == bytes.fromhex(DIGEST)
+    assert len(raw.digest) == 32
+    assert raw.role == USER_ROLE_CODES[UserRole.DOCTOR]
+    assert loaded.uuid == uuid
+    assert isinstance(loaded.uuid, UUID)
+    assert loaded.digest == DIGEST
+    assert loaded.role is UserRole.DOCTOR
+
+
+def test_legacy_mode_keeps_original_layout():
+    uuid, loaded, raw = _roundtrip(compact=False)
+
+    assert raw.uuid == str(uuid)
+    assert raw.digest == DIGEST.encode("utf-8")
+    assert raw.role == "DOCTOR"
+    assert loaded.uuid == uuid
+    assert loaded.digest == DIGEST
+    assert loaded.role is UserRole.DOCTOR
+
+
+def test_digest_loads_from_either_layout():
+    digest_type = PasswordDigest(compact=True)
+
+    assert digest_type.process_result_value(bytes.fromhex(DIGEST), None) == DIGEST
+    assert digest_type.process_result_value(DIGEST.encode("utf-8"), None) == DIGEST
+
+
+def test_enum_codes_must_cover_every_member():
+    incomplete = {UserRole.PATIENT: 1}
+
+    with pytest.raises(ValueError):
+        EnumCode(UserRole, incomplete, compact=True)
+
+
+@pytest.mark.parametrize("mode", ["legacy", "compact"])
+def test_columns_follow_the_mode_set_after_import(storage_mode, mode):
+    storage_mode(mode)
+    uuid, loaded, raw = _roundtrip(compact=None)
+
+    assert loaded.uuid == uuid and loaded.digest == DIGEST and loaded.role is UserRole.DOCTOR
+    if mode == "compact":
+        assert raw.digest == bytes.fromhex(DIGEST) and raw.role == USER_ROLE_CODES[UserRole.DOCTOR]
+    else:
+        assert raw.digest == DIGEST.encode("utf-8") and raw.role == "DOCTOR"
+
+    ddl = str(CreateTable(UserModel.__table__).compile(dialect=postgresql.dialect()))
+    if mode == "compact":
+        assert "uuid UUID NOT NULL" in ddl and "user_role SMALLINT" in ddl
+    else:
+        assert "uuid VARCHAR(36) NOT NULL" in ddl and "user_role userrole" in ddl
+
+
+def test_unknown_storage_mode_is_rejected(storage_mode):
+    with pytest.raises(ValueError, match="Invalid storage mode"):
+        storage_mode("tiny")
+    assert get_storage_mode() in ("legacy", "compact")
@@ -0,0 +1,161 @@
+"""
+Integration tests for ETags and conditional GETs on user and patient reads.
+
+Tests include:
+- find_updated_at selects only updated_at, and matches the loaded user
+- The identity map and the process-wide cache answer find_updated_at without a query
+- Patient profiles expose the same lookup through find_updated_at_by_user_uuid
+- Weak ETags ignore the datetime's awareness and change whenever updated_at does
+- If-None-Match with the current ETag returns 304 without loading the user or profile
+"""
+import asyncio
+from datetime import timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+pytest.importorskip("httpx")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.dependencies import get_find_patient_profile_by_user_uuid_use_case, get_find_user_by_uuid_use_case
+from api.http_caching import USER_CACHE_CONTROL, etag_matches, weak_etag
+from api.routes.patient_profile_routes import patient_router
+from api.routes.user_routes import router as user_router
+from tests.helpers.domain import create_valid_patient_profile, create_valid_user
+from user_management.application.use_cases.find_patient_profile_by_user_uuid import \
+    FindPatientProfileByUserUUIDUseCase
+from user_management.application.use_cases.find_user_by_uuid import FindUserByUUIDUseCase
+from user_management.infrastructure.caching import UserCache
+from user_management.infrastructure.repositories import CachingUserRepository, IdentityMapUserRepository, \
+    InMemoryUserRepository, PostgresUserRepository, UserIdentityMap
+from user_management.infrastructure.repositories.in_memory_patient_profile_repository import \
+    InMemoryPatientProfileRepository
+from user_management.infrastructure.repositories.postgres_patient_profile_repository import \
+    PostgresPatientProfileRepository
+from user_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+
+async def _seed(sessionmaker):
+    user = create_valid_user(uuid=uuid4(), email="jane@clinic.com")
+    async with sessionmaker() as session:
+        async with SqlAlchemyUnitOfWork(session) as uow:
+            await uow.users.save(user)
+            await uow.patient_profiles.save(create_valid_patient_profile(user_uuid=user.uuid))
+            await uow.commit()
+    return user
+
+
+def test_find_updated_at_selects_only_the_timestamp(sessionmaker, selects):
+    async def scenario():
+        user = await _seed(sessionmaker)
+        selects.clear()
+        async with sessionmaker() as session:
+            repository = PostgresUserRepository(session)
+            updated_at = await repository.find_updated_at(user.uuid)
+            loaded = await repository.find_by_uuid(user.uuid)
+            assert await repository.find_updated_at(uuid4()) is None
+
+        assert weak_etag(user.uuid, updated_at) == weak_etag(loaded.uuid, loaded.updated_at)
+        assert "user_credentials" not in selects[0]
+
+    asyncio.run(scenario())
+
+
+def test_identity_map_and_cache_answer_without_a_query(sessionmaker, selects):
+    async def scenario():
+        user = await _seed(sessionmaker)
+        selects.clear()
+        cache = UserCache(max_entries=10, ttl_seconds=60)
+        async with sessionmaker() as session:
+            cached = CachingUserRepository(PostgresUserRepository(session), cache)
+            mapped = IdentityMapUserRepository(cached, UserIdentityMap())
+            loaded = await mapped.find_by_uuid(user.uuid)
+            selects.clear()
+
+            assert await mapped.find_updated_at(user.uuid) == loaded.updated_at
+            assert await cached.find_updated_at(user.uuid) == loaded.updated_at
+
+        assert selects == []
+
+    asyncio.run(scenario())
+
+
+def test_patient_profile_updated_at_lookup(sessionmaker):
+    async def scenario():
+        user = await _seed(sessionmaker)
+        async with sessionmaker() as session:
+            repository = PostgresPatientProfileRepository(session)
+            profile = await repository.find_by_user_uuid(user.uuid)
+            assert await repository.find_updated_at_by_user_uuid(user.uuid) == profile.updated_at
+            assert await repository.find_updated_at_by_user_uuid(uuid4()) is None
+
+    asyncio.run(scenario())
+
+
+def test_weak_etags():
+    user = create_valid_user(uuid=uuid4())
+    etag = weak_etag(user.uuid, user.updated_at)
+
+    assert etag.startswith('W/"')
+    assert etag == weak_etag(user.uuid, user.updated_at.astimezone(timezone.utc).replace(tzinfo=None))
+    assert etag != weak_etag(user.uuid, user.updated_at + timedelta(microseconds=1))
+    assert etag_matches(f'"other", {etag[2:]}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('W/"other"', etag)
+
+
+class CountingUserRepository(InMemoryUserRepository):
+    def __init__(self):
+        super().__init__()
+        self.loads = 0
+
+    async def find_by_uuid(self, uuid):
+        self.loads += 1
+        return await super().find_by_uuid(uuid)
+
+
+class CountingPatientProfileRepository(InMemoryPatientProfileRepository):
+    def __init__(self):
+        super().__init__()
+        self.loads = 0
+
+    async def find_by_user_uuid(self, user_uuid):
+        self.loads += 1
+        return await super().find_by_user_uuid(user_uuid)
+
+
+def test_matching_if_none_match_returns_304_without_loading():
+    users, profiles = CountingUserRepository(), CountingPatientProfileRepository()
+    user = create_valid_user(uuid=uuid4())
+    asyncio.run(users.save(user))
+    asyncio.run(profiles.save(create_valid_patient_profile(user_uuid=user.uuid)))
+
+    app = FastAPI()
+    app.include_router(user_router)
+    app.include_router(patient_router)
+    app.dependency_overrides[get_find_user_by_uuid_use_case] = lambda: FindUserByUUIDUseCase(users)
+    app.dependency_overrides[get_find_patient_profile_by_user_uuid_use_case] = \
+        lambda: FindPatientProfileByUserUUIDUseCase(profiles)
+    client = TestClient(app)
+
+    for path, repository in ((f"/users/uuid/{user.uuid}", users), (f"/patient/{user.uuid}", profiles)):
+        first = client.get(path)
+        assert first.status_code == 200
+        assert first.headers["Cache-Control"] == USER_CACHE_CONTROL
+        etag = first.headers["ETag"]
+
+        repository.loads = 0
+        revalidated = client.get(path, headers={"If-None-Match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert revalidated.headers["ETag"] == etag
+        assert repository.loads == 0
+
+        changed = client.get(path, headers={"If-None-Match": 'W/"stale"'})
+        assert changed.status_code == 200
+        assert repository.loads == 1
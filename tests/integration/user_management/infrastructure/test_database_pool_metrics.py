@@ -0,0 +1,92 @@
+"""
+Integration tests for the instrumented connection pool and GET /health/database/pool.
+
+Tests include:
+- Engines built from settings use the instrumented queue pool, except in-memory SQLite
+- Checkouts and pool timeouts are recorded by the pool and survive dispose()
+- The endpoint reports the primary pool, and the replica pool when one is configured
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+pytest.importorskip("httpx")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import exc, text
+
+from api.routes.health_routes import health_router
+from user_management.infrastructure.database import postgres_dependencies
+from user_management.infrastructure.database.database_settings import DatabaseSettings
+from user_management.infrastructure.database.pool_metrics import InstrumentedAsyncAdaptedQueuePool
+from user_management.infrastructure.database.postgres_config import create_engine_from_settings
+
+
+def _engine(path):
+    return create_engine_from_settings(DatabaseSettings(url=f"sqlite+aiosqlite:///{path}", pool_size=1,
+                                                        max_overflow=0, pool_timeout=1))
+
+
+def test_engines_use_the_instrumented_pool(tmp_path):
+    engine = _engine(tmp_path / "pool.db")
+    memory = create_engine_from_settings(DatabaseSettings(url="sqlite+aiosqlite://"))
+    try:
+        assert isinstance(engine.pool, InstrumentedAsyncAdaptedQueuePool)
+        assert not isinstance(memory.pool, InstrumentedAsyncAdaptedQueuePool)
+        assert engine.echo is False
+    finally:
+        asyncio.run(engine.dispose())
+        asyncio.run(memory.dispose())
+
+
+def test_checkouts_and_timeouts_are_recorded(tmp_path):
+    engine = _engine(tmp_path / "pool.db")
+
+    async def scenario():
+        try:
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+                with pytest.raises(exc.TimeoutError):
+                    async with engine.connect():
+                        pass
+            await engine.dispose()
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+        finally:
+            await engine.dispose()
+
+    asyncio.run(scenario())
+    snapshot = engine.pool.metrics.snapshot()
+    assert snapshot["checkouts"] == 3 and snapshot["timeouts"] == 1
+    assert snapshot["wait_time_ms"]["max"] >= 1000
+
+
+def test_endpoint_reports_primary_and_replica_pools(tmp_path, monkeypatch):
+    primary, replica = _engine(tmp_path / "primary.db"), _engine(tmp_path / "replica.db")
+    monkeypatch.setattr(postgres_dependencies, "engine", primary)
+    monkeypatch.setattr(postgres_dependencies, "replica_engine", None)
+
+    async def check_out_once(engine):
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    app = FastAPI()
+    app.include_router(health_router)
+    client = TestClient(app)
+    try:
+        asyncio.run(check_out_once(primary))
+        body = client.get("/health/database/pool").json()
+        assert body["pool_class"] == "InstrumentedAsyncAdaptedQueuePool"
+        assert body["size"] == 1 and body["checked_out"] == 0 and body["checkouts"] == 1
+        assert set(body["wait_time_ms"]["histogram"]) >= {"1", "5000", "+Inf"}
+        assert "replica" not in body
+
+        monkeypatch.setattr(postgres_dependencies, "replica_engine", replica)
+        body = client.get("/health/database/pool").json()
+        assert body["replica"]["checkouts"] == 0 and body["replica"]["size"] == 1
+    finally:
+        asyncio.run(primary.dispose())
+        asyncio.run(replica.dispose())
@@ -0,0 +1,80 @@
+"""
+Integration tests for the orjson response pipeline of the user and patient routes.
+
+Tests include:
+- FastJSONResponse bodies are byte-for-byte pydantic's JSON for the same DTO
+- Naive and non-UTC datetimes keep their original representation
+- Routes return the DTO body with cache headers, and 201 on registration
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("orjson")
+pytest.importorskip("httpx")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.dependencies import get_find_patient_profile_by_user_uuid_use_case, get_register_user_use_case, \
+    get_search_users_use_case
+from api.responses import FastJSONResponse, PatientProfileResponse, UserSearchResponse, UserSummaryResponse
+from api.routes.patient_profile_routes import patient_router
+from api.routes.user_routes import router as user_router
+from tests.helpers.domain import create_valid_patient_profile, create_valid_user
+from user_management.application.use_cases.find_patient_profile_by_user_uuid import \
+    FindPatientProfileByUserUUIDUseCase
+from user_management.application.use_cases.register_user import RegisterUserUseCase
+from user_management.application.use_cases.search_users import SearchUsersUseCase
+from user_management.infrastructure.repositories import InMemoryUserRepository
+from user_management.infrastructure.repositories.in_memory_patient_profile_repository import \
+    InMemoryPatientProfileRepository
+from user_management.infrastructure.unit_of_work import InMemoryUnitOfWork
+
+
+def test_body_matches_pydantic_json():
+    user = create_valid_user(uuid=uuid4())
+    dto = UserSummaryResponse.from_user_entity(user)
+    assert FastJSONResponse(dto).body == dto.model_dump_json().encode()
+
+    for created_at in (datetime(2024, 5, 1, 12, 30), datetime(2024, 5, 1, 12, 30, 0, 5,
+                                                               tzinfo=timezone(timedelta(hours=-3)))):
+        profile = create_valid_patient_profile(user_uuid=user.uuid)
+        profile.created_at = created_at
+        dto = PatientProfileResponse.from_patient_profile_entity(profile)
+        assert FastJSONResponse(dto).body == dto.model_dump_json().encode()
+
+
+def test_routes_serialize_with_fast_json():
+    users, profiles = InMemoryUserRepository(), InMemoryPatientProfileRepository()
+    user = create_valid_user(uuid=uuid4())
+    asyncio.run(users.save(user))
+    asyncio.run(profiles.save(create_valid_patient_profile(user_uuid=user.uuid)))
+
+    app = FastAPI()
+    app.include_router(user_router)
+    app.include_router(patient_router)
+    app.dependency_overrides[get_search_users_use_case] = lambda: SearchUsersUseCase(users)
+    app.dependency_overrides[get_register_user_use_case] = lambda: RegisterUserUseCase(InMemoryUnitOfWork(users))
+    app.dependency_overrides[get_find_patient_profile_by_user_uuid_use_case] = \
+        lambda: FindPatientProfileByUserUUIDUseCase(profiles)
+    client = TestClient(app)
+
+    search = client.get("/users/search")
+    assert search.status_code == 200
+    assert search.headers["Cache-Control"] == "private, no-store"
+    expected = UserSearchResponse(items=[UserSummaryResponse.from_user_entity(user)])
+    assert search.content == expected.model_dump_json().encode()
+
+    profile = client.get(f"/patient/{user.uuid}")
+    assert profile.status_code == 200
+    assert profile.headers["ETag"].startswith('W/"')
+
+    registered = client.post("/users/", json={
+        "email": "new@clinic.com", "first_name": "Jane", "last_name": "Doe", "phone": "+15551234567",
+        "date_of_birth": "1990-01-01", "user_role": "PATIENT", "password": "Str0ng!Passw0rd",
+    })
+    assert registered.status_code == 201
+    assert registered.json()["email"] == "new@clinic.com"
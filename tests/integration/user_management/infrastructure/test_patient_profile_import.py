@@ -0,0 +1,238 @@
+"""
+Integration tests for the patient profile bulk import pipeline.
+
+Tests include:
+- CSV rows, including quoted fields spanning lines, are imported in batched inserts
+- Invalid rows, unknown users and duplicate profiles are rejected with reasons and line numbers
+- Malformed NDJSON lines are rejected without stopping the import
+- Validation in a process pool gives the same outcome as inline validation
+- Rejects are kept in a private directory with owner-only files, found by import id and purged after retention
+- Through the API, an import returns an opaque import id its rejects can be fetched by, and is refused
+  while no rejects directory is configured
+"""
+import asyncio
+import csv
+import io
+import json
+import os
+import stat
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import event, func, select
+
+from tests.helpers.domain import create_valid_user
+from user_management.application.use_cases.import_patient_profiles import ImportPatientProfilesUseCase
+from user_management.infrastructure.importing import RejectWriter, RejectsStore, read_records
+from user_management.infrastructure.models.patient_profile_model import PatientProfileModel
+from user_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+COLUMNS = ["user_uuid", "emergency_contact_name", "emergency_contact_phone", "insurance_info",
+           "preferred_language", "medical_history_summary"]
+
+
+def _row(user_uuid, **overrides) -> dict:
+    row = {
+        "user_uuid": str(user_uuid),
+        "emergency_contact_name": "Jane Doe",
+        "emergency_contact_phone": "+15551234567",
+        "insurance_info": "Acme Health",
+        "preferred_language": "pt-BR",
+        "medical_history_summary": "No known allergies.",
+    }
+    row.update(overrides)
+    return row
+
+
+def _csv(rows) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=COLUMNS, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+async def _chunks(data: bytes, size: int = 7):
+    # Small, odd-sized blocks so records and multi-byte characters straddle chunk boundaries.
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def _seed(sessionmaker, users: int):
+    user_uuids = [uuid4() for _ in range(users)]
+    async with sessionmaker() as session:
+        async with SqlAlchemyUnitOfWork(session) as uow:
+            await uow.users.save_many([create_valid_user(uuid=user_uuid, email=f"patient{i}@clinic.com")
+                                       for i, user_uuid in enumerate(user_uuids)])
+            await uow.commit()
+    return user_uuids
+
+
+async def _import(sessionmaker, data: bytes, fmt: str, executor=None, batch_size: int = 2):
+    rejects = RejectWriter(io.StringIO())
+    async with sessionmaker() as session:
+        use_case = ImportPatientProfilesUseCase(SqlAlchemyUnitOfWork(session), executor=executor,
+                                                batch_size=batch_size, validation_chunk_size=3)
+        result = await use_case.execute(read_records(_chunks(data), fmt), on_reject=rejects)
+    return result, rejects
+
+
+async def _profile_count(sessionmaker) -> int:
+    async with sessionmaker() as session:
+        return await session.scalar(select(func.count()).select_from(PatientProfileModel))
+
+
+def test_csv_import_batches_valid_rows_and_rejects_the_rest(sessionmaker):
+    async def scenario():
+        user_uuids = await _seed(sessionmaker, users=5)
+        commits = []
+        event.listen(sessionmaker.kw["bind"].sync_engine, "commit", lambda connection: commits.append(connection))
+
+        data = _csv([
+            _row(user_uuids[0], medical_history_summary="Asthma,\nmild since childhood."),
+            _row(user_uuids[1], medical_history_summary="Asma leve; alergia à penicilina."),
+            _row(user_uuids[2], emergency_contact_phone="not a phone"),
+            _row(uuid4()),
+            _row(user_uuids[1]),
+            _row(user_uuids[3]),
+            _row(user_uuids[4]),
+        ])
+        result, rejects = await _import(sessionmaker, data, "csv")
+
+        assert (result.rows_read, result.imported, result.rejected) == (7, 4, 3)
+        assert len(commits) == 2
+        assert await _profile_count(sessionmaker) == 4
+        async with sessionmaker() as session:
+            profile = await session.get(PatientProfileModel, user_uuids[0])
+            assert profile.medical_history_summary == "Asthma,\nmild since childhood."
+
+        rejected = {entry["line"]: entry["reason"] for entry in rejects.samples}
+        assert set(rejected) == {5, 6, 7}
+        assert "phone" in rejected[5].lower()
+        assert rejected[6].startswith("User not found")
+        assert rejected[7].startswith("Patient profile already exists")
+
+    asyncio.run(scenario())
+
+
+def test_ndjson_import_rejects_malformed_lines(sessionmaker):
+    async def scenario():
+        user_uuids = await _seed(sessionmaker, users=2)
+        lines = [json.dumps(_row(user_uuids[0])), "{not json", "", "[1, 2]", json.dumps(_row(user_uuids[1]))]
+        result, rejects = await _import(sessionmaker, ("\n".join(lines) + "\n").encode("utf-8"), "ndjson")
+
+        assert (result.rows_read, result.imported, result.rejected) == (4, 2, 2)
+        samples = sorted(rejects.samples, key=lambda entry: entry["line"])
+        assert [(entry["line"], "raw" in entry) for entry in samples] == [(2, True), (4, True)]
+        assert samples[0]["reason"].startswith("Invalid JSON")
+        assert await _profile_count(sessionmaker) == 2
+
+    asyncio.run(scenario())
+
+
+def test_process_pool_validation_matches_inline(sessionmaker):
+    async def scenario():
+        user_uuids = await _seed(sessionmaker, users=20)
+        rows = [_row(user_uuid, preferred_language="" if i % 4 == 0 else "en-US")
+                for i, user_uuid in enumerate(user_uuids)]
+
+        with ProcessPoolExecutor(max_workers=2, mp_context=get_context("spawn")) as executor:
+            result, rejects = await _import(sessionmaker, _csv(rows), "csv", executor=executor, batch_size=4)
+
+        assert (result.rows_read, result.imported, result.rejected) == (20, 15, 5)
+        assert sorted(entry["line"] for entry in rejects.samples) == [2, 6, 10, 14, 18]
+        assert await _profile_count(sessionmaker) == 15
+
+    asyncio.run(scenario())
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _mode(path) -> int:
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_rejects_store_keeps_private_files_until_they_expire(tmp_path):
+    clock = FakeClock()
+    store = RejectsStore(str(tmp_path / "rejects"), retention_seconds=60, clock=clock)
+    assert _mode(tmp_path / "rejects") == 0o700
+
+    with store.writer() as (import_id, rejects):
+        rejects.file.write('{"line": 2}\n')
+    path = store.find(import_id)
+
+    assert len(import_id) == 32 and str(tmp_path) not in import_id
+    assert _mode(path) == 0o600
+    with open(path, encoding="utf-8") as file:
+        assert file.read() == '{"line": 2}\n'
+    for unknown in ("0" * 32, "../" + import_id, import_id.upper(), ""):
+        assert store.find(unknown) is None
+
+    os.utime(path, (clock.now - 61, clock.now - 61))
+    assert store.find(import_id) is None
+    with store.writer() as (fresh_id, _):
+        pass
+    assert not os.path.exists(path)
+    assert store.find(fresh_id) is not None
+    assert store.purge_expired() == 0
+
+
+def test_rejects_store_refuses_a_shared_or_missing_directory(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o755)
+
+    with pytest.raises(ValueError, match="group or others"):
+        RejectsStore(str(shared), retention_seconds=60)
+    with pytest.raises(ValueError, match="must be configured"):
+        RejectsStore("", retention_seconds=60)
+
+
+def test_api_import_returns_an_import_id_for_its_rejects(sessionmaker, tmp_path, monkeypatch):
+    pytest.importorskip("orjson")
+    pytest.importorskip("httpx")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from api import dependencies
+    from api.routes.patient_profile_routes import patient_router
+
+    async def use_case():
+        async with sessionmaker() as session:
+            yield ImportPatientProfilesUseCase(SqlAlchemyUnitOfWork(session), batch_size=2)
+
+    app = FastAPI()
+    app.include_router(patient_router)
+    app.dependency_overrides[dependencies.get_import_patient_profiles_use_case] = use_case
+    client = TestClient(app)
+    user_uuids = asyncio.run(_seed(sessionmaker, users=1))
+    data = _csv([_row(user_uuids[0]), _row(uuid4())])
+
+    monkeypatch.setattr(dependencies, "PATIENT_IMPORT_REJECTS_DIR", None)
+    monkeypatch.setattr(dependencies, "_patient_import_rejects_store", None)
+    refused = client.post("/patient/import?format=csv", content=data)
+    assert refused.status_code == 503
+
+    monkeypatch.setattr(dependencies, "PATIENT_IMPORT_REJECTS_DIR", str(tmp_path / "rejects"))
+    response = client.post("/patient/import?format=csv", content=data)
+    body = response.json()
+    assert response.status_code == 200
+    assert (body["imported"], body["rejected"]) == (1, 1)
+    assert "rejects_file" not in body and str(tmp_path) not in response.text
+
+    rejects = client.get(f"/patient/import/{body['import_id']}/rejects")
+    assert rejects.status_code == 200
+    assert [json.loads(line)["line"] for line in rejects.text.splitlines()] == [3]
+    assert client.get(f"/patient/import/{uuid4().hex}/rejects").status_code == 404
@@ -0,0 +1,167 @@
+"""
+Integration tests for primary/replica session routing.
+
+Two SQLite files stand in for the primary and the replica. Nothing replicates
+between them, which makes it easy to see which database served each read:
+a user written through the primary is only visible to reads routed there.
+
+Tests include:
+- Queries are served by the replica
+- Commands are written to the primary
+- A commit issues a read-your-writes token; reads presenting it use the primary until it expires
+- Tokens are honoured by any worker sharing the secret; forged, altered or foreign tokens are not
+- A rolled-back write issues no token
+- Without a replica, every read uses the primary
+- Through the API, a write sets the read-your-writes cookie and the client's next read sees its write
+"""
+import asyncio
+import time
+from uuid import UUID, uuid4
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from tests.helpers.domain import create_valid_user
+from user_management.infrastructure.database.session_routing import ReadYourWritesTokens, RoutingSessionProvider
+from user_management.infrastructure.repositories.postgres_user_repository import PostgresUserRepository
+from user_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+SECRET = b"shared-by-every-worker"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _build_provider(sessionmaker_factory, clock=None, with_replica=True, window_seconds=5.0):
+    primary = sessionmaker_factory("primary.db")
+    replica = sessionmaker_factory("replica.db") if with_replica else None
+    tokens = ReadYourWritesTokens(SECRET, window_seconds=window_seconds, clock=clock or FakeClock())
+    return RoutingSessionProvider(primary=primary, replica=replica, tokens=tokens)
+
+
+async def _register(provider):
+    """Registers a user through a write session and returns it with the token its commit issued."""
+    issued = []
+    user = create_valid_user(uuid=uuid4(), email=f"{uuid4().hex[:12]}@example.com")
+    async with provider.write_session(issued.append) as session:
+        async with SqlAlchemyUnitOfWork(session) as uow:
+            await uow.users.save(user)
+            await uow.commit()
+    return user, (issued[-1] if issued else None)
+
+
+async def _read(provider, uuid, token=None):
+    async with provider.read_session(token) as session:
+        return await PostgresUserRepository(session).find_by_uuid(uuid)
+
+
+def test_reads_are_routed_to_the_replica_and_writes_to_the_primary(sessionmaker_factory):
+    provider = _build_provider(sessionmaker_factory)
+
+    async def scenario():
+        user, _ = await _register(provider)
+
+        assert await _read(provider, user.uuid) is None
+
+        async with provider.primary() as session:
+            assert await PostgresUserRepository(session).find_by_uuid(user.uuid) is not None
+
+    asyncio.run(scenario())
+
+
+def test_token_reads_from_the_primary_until_it_expires(sessionmaker_factory):
+    clock = FakeClock()
+    provider = _build_provider(sessionmaker_factory, clock=clock, window_seconds=5.0)
+
+    async def scenario():
+        user, token = await _register(provider)
+
+        found = await _read(provider, user.uuid, token)
+        assert found is not None and found.email == user.email
+        assert await _read(provider, user.uuid) is None
+
+        clock.now += 5.1
+        assert await _read(provider, user.uuid, token) is None
+
+    asyncio.run(scenario())
+
+
+def test_tokens_are_honoured_by_every_worker_sharing_the_secret():
+    clock = FakeClock()
+    token = ReadYourWritesTokens(SECRET, 5.0, clock).issue()
+    expires_at, _, signature = token.partition(".")
+
+    assert ReadYourWritesTokens(SECRET, 5.0, clock).is_pinned(token)
+    assert not ReadYourWritesTokens(b"another-deployment", 5.0, clock).is_pinned(token)
+    assert not ReadYourWritesTokens(SECRET, 5.0, clock).is_pinned(f"{int(expires_at) + 60_000}.{signature}")
+    for forged in ("", "123", "client-a", f"{expires_at}.", f".{signature}", f"-1.{signature}"):
+        assert not ReadYourWritesTokens(SECRET, 5.0, clock).is_pinned(forged)
+    assert ReadYourWritesTokens(SECRET, 0, clock).issue() is None
+
+
+def test_failed_write_issues_no_token(sessionmaker_factory):
+    provider = _build_provider(sessionmaker_factory)
+
+    async def scenario():
+        issued = []
+        async with provider.write_session(issued.append) as session:
+            await session.rollback()
+
+        assert issued == []
+
+    asyncio.run(scenario())
+
+
+def test_reads_use_the_primary_when_no_replica_is_configured(sessionmaker_factory):
+    provider = _build_provider(sessionmaker_factory, with_replica=False)
+
+    async def scenario():
+        user, _ = await _register(provider)
+
+        assert await _read(provider, user.uuid) is not None
+
+    asyncio.run(scenario())
+
+
+def test_api_write_sets_the_cookie_and_pins_the_next_read(sessionmaker_factory, monkeypatch):
+    pytest.importorskip("httpx")
+    from fastapi import Depends, FastAPI
+    from fastapi.testclient import TestClient
+
+    from api.read_your_writes import ReadYourWritesCookieMiddleware
+    from user_management.infrastructure.database import postgres_dependencies
+
+    provider = _build_provider(sessionmaker_factory, clock=time.time)
+    monkeypatch.setattr(postgres_dependencies, "session_provider", provider)
+
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesCookieMiddleware, max_age_seconds=5.0)
+
+    @app.post("/users")
+    async def register(session=Depends(postgres_dependencies.get_write_db_session)):
+        user = create_valid_user(uuid=uuid4(), email=f"{uuid4().hex[:12]}@example.com")
+        await PostgresUserRepository(session).save(user)
+        await session.commit()
+        return {"uuid": str(user.uuid)}
+
+    @app.get("/users/{uuid}")
+    async def find(uuid: UUID, session=Depends(postgres_dependencies.get_read_db_session)):
+        return {"found": await PostgresUserRepository(session).find_by_uuid(uuid) is not None}
+
+    writer, other = TestClient(app), TestClient(app)
+    response = writer.post("/users")
+    uuid = response.json()["uuid"]
+
+    set_cookie = response.headers["set-cookie"]
+    assert set_cookie.startswith(f"{postgres_dependencies.READ_YOUR_WRITES_COOKIE}=")
+    assert "Max-Age=5" in set_cookie and "HttpOnly" in set_cookie
+    assert writer.get(f"/users/{uuid}").json() == {"found": True}
+    assert other.get(f"/users/{uuid}").json() == {"found": False}
+    assert "set-cookie" not in other.get(f"/users/{uuid}").headers
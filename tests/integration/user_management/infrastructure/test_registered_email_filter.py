@@ -0,0 +1,132 @@
+"""
+Integration tests for the registered email filter and duplicate email handling.
+
+Tests include:
+- The Bloom filter never misses an added email and keeps near its false positive target
+- Loading the filter from the repository, including emails added while it loads
+- Registering a new email skips the duplicate lookup once the filter is loaded
+- A flagged email that exists is rejected with one lookup and no insert
+- Duplicates the filter has not seen are translated from the unique index violation
+"""
+import asyncio
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import event
+
+from tests.helpers.domain import create_valid_user
+from user_management.application.use_cases.register_user import RegisterUserCommand, RegisterUserUseCase
+from user_management.domain.enums import UserRole
+from user_management.domain.exceptions import EmailAlreadyRegisteredError
+from user_management.infrastructure.filters import BloomFilter, BloomRegisteredEmailFilter
+from user_management.infrastructure.repositories import PostgresUserRepository
+from user_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+
+def _command(email: str) -> RegisterUserCommand:
+    return RegisterUserCommand(email=email, first_name="Jane", last_name="Doe", phone="+15551234567",
+                               date_of_birth=date(1990, 1, 1), user_role=UserRole.PATIENT,
+                               password="Str0ng!Passw0rd")
+
+
+async def _seed(sessionmaker, users: int):
+    async with sessionmaker() as session:
+        async with SqlAlchemyUnitOfWork(session) as uow:
+            await uow.users.save_many([create_valid_user(uuid=uuid4(), email=f"user{i}@clinic.com")
+                                       for i in range(users)])
+            await uow.commit()
+
+    statements = []
+    event.listen(sessionmaker.kw["bind"].sync_engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement.lstrip().upper()))
+    return statements
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives():
+    bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+    added = [f"user{i}@clinic.com" for i in range(10_000)]
+    for email in added:
+        bloom.add(email)
+
+    assert all(email in bloom for email in added)
+    false_positives = sum(f"other{i}@clinic.com" in bloom for i in range(10_000))
+    assert false_positives < 10_000 * 0.02
+
+
+def test_filter_loads_from_the_repository_and_keeps_concurrent_adds(sessionmaker):
+    async def scenario():
+        await _seed(sessionmaker, users=50)
+        email_filter = BloomRegisteredEmailFilter(capacity=1_000)
+        assert email_filter.might_be_registered("nobody@clinic.com")
+
+        async def emails():
+            async with sessionmaker() as session:
+                async for email in PostgresUserRepository(session).iter_emails(batch_size=10):
+                    email_filter.add("late@clinic.com")
+                    yield email
+
+        assert await email_filter.load(emails(), expected_count=50) == 50
+        assert all(email_filter.might_be_registered(f"USER{i}@clinic.com") for i in range(50))
+        assert email_filter.might_be_registered("late@clinic.com")
+        assert email_filter.statistics()["loaded"] is True
+
+    asyncio.run(scenario())
+
+
+def test_new_email_skips_the_duplicate_lookup(sessionmaker):
+    async def scenario():
+        statements = await _seed(sessionmaker, users=5)
+        email_filter = BloomRegisteredEmailFilter(capacity=1_000)
+        async with sessionmaker() as session:
+            await email_filter.load(PostgresUserRepository(session).iter_emails())
+        statements.clear()
+
+        async with sessionmaker() as session:
+            user = await RegisterUserUseCase(SqlAlchemyUnitOfWork(session), email_filter).execute(
+                _command("new@clinic.com"))
+
+        assert not any(statement.startswith("SELECT") for statement in statements)
+        assert email_filter.might_be_registered(user.email)
+
+    asyncio.run(scenario())
+
+
+def test_flagged_existing_email_is_rejected_before_inserting(sessionmaker):
+    async def scenario():
+        statements = await _seed(sessionmaker, users=5)
+        email_filter = BloomRegisteredEmailFilter(capacity=1_000)
+        async with sessionmaker() as session:
+            await email_filter.load(PostgresUserRepository(session).iter_emails())
+        statements.clear()
+
+        async with sessionmaker() as session:
+            with pytest.raises(EmailAlreadyRegisteredError):
+                await RegisterUserUseCase(SqlAlchemyUnitOfWork(session), email_filter).execute(
+                    _command("User3@Clinic.com"))
+
+        assert sum(statement.startswith("SELECT") for statement in statements) == 1
+        assert not any(statement.startswith("INSERT") for statement in statements)
+
+    asyncio.run(scenario())
+
+
+def test_unseen_duplicate_is_translated_from_the_unique_index(sessionmaker):
+    async def scenario():
+        await _seed(sessionmaker, users=5)
+
+        async with sessionmaker() as session:
+            with pytest.raises(EmailAlreadyRegisteredError):
+                await RegisterUserUseCase(SqlAlchemyUnitOfWork(session)).execute(_command("USER1@clinic.com"))
+
+        async with sessionmaker() as session:
+            with pytest.raises(EmailAlreadyRegisteredError):
+                async with SqlAlchemyUnitOfWork(session) as uow:
+                    await uow.users.save_many([create_valid_user(uuid=uuid4(), email="user2@CLINIC.com")])
+                    await uow.commit()
+
+    asyncio.run(scenario())
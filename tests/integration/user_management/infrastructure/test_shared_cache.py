@@ -0,0 +1,242 @@
+"""
+Integration tests for the shared, cross-worker user and patient profile cache.
+
+Tests include:
+- Users and patient profiles round-trip exactly through their compact projections, users without their password hash
+- Users served from the shared cache refuse password checks and saves, are not copied into local caches,
+  and the unit of work never reads users from the shared cache
+- A user loaded before a write is not stored back over the eviction
+- A user loaded by one worker is served to another from the shared cache without a query
+- A write on one worker evicts the shared entry and, over pub/sub, every worker's local cache
+- Patient profile lookups are cached and evicted on save
+- A failing backend falls through to the database
+- The Redis backend works against a Redis-protocol stand-in (fakeredis, when installed)
+"""
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import delete
+
+from tests.helpers.domain import create_valid_patient_profile, create_valid_user, entity_fields
+from user_management.infrastructure.caching import CacheBackend, CacheInvalidationListener, InMemoryCacheBackend, \
+    InMemoryCacheBroker, RedisCacheBackend, UserCache
+from user_management.infrastructure.caching.invalidation import USER
+from user_management.infrastructure.caching.projections import decode_patient_profile, decode_user, \
+    encode_patient_profile, encode_user, has_credentials
+from user_management.domain.enums import UserStatus
+from user_management.infrastructure.models import UserCredentialsModel, UserModel
+from user_management.infrastructure.repositories import CachingUserRepository, PostgresUserRepository, \
+    SharedCachingUserRepository
+from user_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+
+class Worker:
+    """One API worker: its own local cache, listening to the shared backend."""
+
+    def __init__(self, broker: InMemoryCacheBroker):
+        self.backend = InMemoryCacheBackend(broker)
+        self.local = UserCache(max_entries=100, ttl_seconds=60)
+        self.listener = CacheInvalidationListener(self.backend, {USER: self.local.invalidate_uuid})
+
+    def users(self, session) -> CachingUserRepository:
+        return CachingUserRepository(SharedCachingUserRepository(PostgresUserRepository(session), self.backend),
+                                     self.local)
+
+    def unit_of_work(self, session) -> SqlAlchemyUnitOfWork:
+        return SqlAlchemyUnitOfWork(session, user_cache=self.local, shared_cache=self.backend)
+
+
+class FailingBackend(CacheBackend):
+    async def get_many(self, keys):
+        raise ConnectionError("cache down")
+
+    async def set_many(self, items, ttl_seconds):
+        raise ConnectionError("cache down")
+
+    async def delete(self, keys):
+        raise ConnectionError("cache down")
+
+    async def publish(self, channel, message):
+        raise ConnectionError("cache down")
+
+    async def subscribe(self, channel):
+        raise ConnectionError("cache down")
+
+
+async def _seed(sessionmaker):
+    user = create_valid_user(uuid=uuid4(), email="shared@clinic.com")
+    async with sessionmaker() as session:
+        async with SqlAlchemyUnitOfWork(session) as uow:
+            await uow.users.save(user)
+            await uow.commit()
+    return user
+
+
+async def _drain():
+    # Lets the listener tasks consume the published invalidations.
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+def test_projections_round_trip_exactly():
+    user = create_valid_user()
+    encoded = encode_user(user)
+    decoded = decode_user(encoded)
+    assert entity_fields(decoded, exclude=("_credentials",)) == entity_fields(user, exclude=("_credentials",))
+    assert user._credentials._hashed_password.encode() not in encoded
+    assert has_credentials(user) and not has_credentials(decoded)
+
+    profile = create_valid_patient_profile()
+    assert entity_fields(decode_patient_profile(encode_patient_profile(profile))) == entity_fields(profile)
+    assert len(encoded) < 200
+
+
+def test_write_on_one_worker_evicts_every_worker(sessionmaker, selects):
+    async def scenario():
+        user = await _seed(sessionmaker)
+        selects.clear()
+        broker = InMemoryCacheBroker()
+        first, second = Worker(broker), Worker(broker)
+        await first.listener.start()
+        await second.listener.start()
+
+        async with sessionmaker() as session:
+            assert (await first.users(session).find_by_uuid(user.uuid)).email == user.email
+            assert (await second.users(session).find_by_email("SHARED@clinic.com")).uuid == user.uuid
+        assert len(selects) == 1
+        # The shared entry has no password hash, so the second worker does not copy it locally.
+        assert first.local.contains(user.uuid) and not second.local.contains(user.uuid)
+
+        async with sessionmaker() as session:
+            async with second.unit_of_work(session) as uow:
+                locked = await uow.users.find_by_uuid(user.uuid)
+                locked.change_user_status(UserStatus.LOCKED)
+                # PostgresUserRepository.save inserts, so replace the stored rows to persist the change.
+                await session.execute(delete(UserCredentialsModel))
+                await session.execute(delete(UserModel))
+                await uow.users.save(locked)
+                await uow.commit()
+        await _drain()
+
+        assert not first.local.contains(user.uuid) and not second.local.contains(user.uuid)
+        assert await first.backend.get(f"user:{user.uuid.hex}") is None
+        async with sessionmaker() as session:
+            assert (await first.users(session).find_by_uuid(user.uuid)).user_status == UserStatus.LOCKED
+
+        await first.listener.stop()
+        await second.listener.stop()
+
+    asyncio.run(scenario())
+
+
+def test_users_from_the_shared_cache_have_no_credentials(sessionmaker, selects):
+    async def scenario():
+        user = await _seed(sessionmaker)
+        backend = InMemoryCacheBackend()
+        local = UserCache(max_entries=100, ttl_seconds=60)
+        async with sessionmaker() as session:
+            await SharedCachingUserRepository(PostgresUserRepository(session), backend).find_by_uuid(user.uuid)
+            selects.clear()
+            cached = await CachingUserRepository(SharedCachingUserRepository(PostgresUserRepository(session),
+                                                                             backend), local).find_by_uuid(user.uuid)
+            assert not selects and not local.contains(user.uuid)
+            with pytest.raises(RuntimeError, match="no password hashes"):
+                cached.is_password_valid("DefaultPass123!")
+            with pytest.raises(RuntimeError, match="no password hashes"):
+                await PostgresUserRepository(session).save(cached)
+
+            async with SqlAlchemyUnitOfWork(session, user_cache=local, shared_cache=backend) as uow:
+                loaded = await uow.users.find_by_uuid(user.uuid)
+            assert len(selects) == 1
+            assert loaded.is_password_valid("DefaultPass123!") and local.contains(user.uuid)
+
+    asyncio.run(scenario())
+
+
+def test_user_loaded_before_a_write_is_not_stored_back(sessionmaker):
+    async def scenario():
+        user = await _seed(sessionmaker)
+        backend = InMemoryCacheBackend()
+        async with sessionmaker() as session:
+            repository = SharedCachingUserRepository(PostgresUserRepository(session), backend)
+            stale = await PostgresUserRepository(session).find_by_uuid(user.uuid)
+
+            written = await PostgresUserRepository(session).find_by_uuid(user.uuid)
+            written.change_user_status(UserStatus.LOCKED)
+            await repository._evict([written])
+
+            await repository._store([stale])
+            assert await backend.get(f"user:{user.uuid.hex}") is None
+            assert await backend.get(f"user-email:{user.email}") is None
+
+            await repository._store([written])
+            assert decode_user(await backend.get(f"user:{user.uuid.hex}")).user_status == UserStatus.LOCKED
+
+    asyncio.run(scenario())
+
+
+def test_patient_profiles_are_cached_and_evicted_on_save(sessionmaker, selects):
+    async def scenario():
+        user = await _seed(sessionmaker)
+        selects.clear()
+        backend = InMemoryCacheBackend()
+        async with sessionmaker() as session:
+            uow = SqlAlchemyUnitOfWork(session, shared_cache=backend)
+            assert await uow.patient_profiles.find_by_user_uuid(user.uuid) is None
+            async with uow:
+                await uow.patient_profiles.save(create_valid_patient_profile(user_uuid=user.uuid))
+                await uow.commit()
+
+            queries = len(selects)
+            first = await uow.patient_profiles.find_by_user_uuid(user.uuid)
+            second = await uow.patient_profiles.find_by_user_uuid(user.uuid)
+        assert len(selects) == queries + 1
+        assert entity_fields(first) == entity_fields(second)
+
+    asyncio.run(scenario())
+
+
+def test_failing_backend_falls_through_to_the_database(sessionmaker):
+    async def scenario():
+        user = await _seed(sessionmaker)
+        async with sessionmaker() as session:
+            repository = SharedCachingUserRepository(PostgresUserRepository(session), FailingBackend())
+            assert (await repository.find_by_uuid(user.uuid)).uuid == user.uuid
+            assert (await repository.find_by_email(user.email)).uuid == user.uuid
+            assert await repository.find_existing_uuids([user.uuid, uuid4()]) == {user.uuid}
+
+    asyncio.run(scenario())
+
+
+def test_redis_backend_against_fakeredis():
+    fakeredis = pytest.importorskip("fakeredis")
+
+    async def scenario():
+        backend = RedisCacheBackend(fakeredis.FakeAsyncRedis())
+        local = UserCache(max_entries=10, ttl_seconds=60)
+        listener = CacheInvalidationListener(backend, {USER: local.invalidate_uuid})
+        await listener.start()
+
+        user = create_valid_user(uuid=uuid4())
+        repository = SharedCachingUserRepository(None, backend)
+        await repository._store([user])
+        local.put(user)
+        assert decode_user(await backend.get(f"user:{user.uuid.hex}")).uuid == user.uuid
+
+        await repository._evict([user])
+        for _ in range(50):
+            if not local.contains(user.uuid):
+                break
+            await asyncio.sleep(0.01)
+        assert not local.contains(user.uuid)
+        assert await backend.get(f"user:{user.uuid.hex}") is None
+
+        await listener.stop()
+        await backend.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,110 @@
+"""
+Integration tests for the unit of work implementations.
+
+Tests include:
+- A user and their patient profile are committed together, with a single commit
+- An error inside the unit of work discards everything staged in it
+- Leaving the unit of work without committing discards staged changes
+- Use cases run inside the in-memory unit of work and commit once per operation
+"""
+import asyncio
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import event
+
+from tests.helpers.domain import create_valid_patient_profile, create_valid_user
+from user_management.application.use_cases.register_user import RegisterUserCommand, RegisterUserUseCase
+from user_management.application.use_cases.register_users_batch import RegisterUsersBatchUseCase
+from user_management.infrastructure.models.patient_profile_model import PatientProfileModel
+from user_management.infrastructure.repositories.postgres_user_repository import PostgresUserRepository
+from user_management.infrastructure.unit_of_work import InMemoryUnitOfWork, SqlAlchemyUnitOfWork
+
+
+def _registration(email: str) -> dict:
+    return {
+        "email": email,
+        "first_name": "John",
+        "last_name": "Doe",
+        "phone": "+15551234567",
+        "date_of_birth": date(1990, 1, 1),
+        "user_role": "PATIENT",
+        "password": "Secret123!",
+    }
+
+
+def test_user_and_patient_profile_are_committed_together_once(sessionmaker):
+    commits = []
+    event.listen(sessionmaker.kw["bind"].sync_engine, "commit", lambda connection: commits.append(connection))
+
+    async def scenario():
+        user = create_valid_user(uuid=uuid4())
+        async with sessionmaker() as session:
+            async with SqlAlchemyUnitOfWork(session) as uow:
+                await uow.users.save(user)
+                await uow.patient_profiles.save(create_valid_patient_profile(user_uuid=user.uuid))
+                await uow.commit()
+
+        assert len(commits) == 1
+        async with sessionmaker() as session:
+            assert await PostgresUserRepository(session).find_by_uuid(user.uuid) is not None
+            assert await session.get(PatientProfileModel, user.uuid) is not None
+
+    asyncio.run(scenario())
+
+
+def test_error_inside_unit_of_work_discards_everything(sessionmaker):
+    async def scenario():
+        user = create_valid_user(uuid=uuid4())
+        async with sessionmaker() as session:
+            with pytest.raises(RuntimeError):
+                async with SqlAlchemyUnitOfWork(session) as uow:
+                    await uow.users.save(user)
+                    raise RuntimeError("profile creation failed")
+
+            async with SqlAlchemyUnitOfWork(session) as uow:
+                await uow.users.save(create_valid_user(uuid=uuid4(), email="never.committed@example.com"))
+
+        async with sessionmaker() as session:
+            repository = PostgresUserRepository(session)
+            assert await repository.find_by_uuid(user.uuid) is None
+            assert await repository.find_by_email("never.committed@example.com") is None
+
+    asyncio.run(scenario())
+
+
+def test_in_memory_unit_of_work_rolls_back_uncommitted_changes():
+    async def scenario():
+        uow = InMemoryUnitOfWork()
+        user = create_valid_user(uuid=uuid4())
+
+        with pytest.raises(RuntimeError):
+            async with uow:
+                await uow.users.save(user)
+                raise RuntimeError("boom")
+
+        assert await uow.users.find_by_uuid(user.uuid) is None
+        assert uow.commits == 0
+
+    asyncio.run(scenario())
+
+
+def test_use_cases_commit_once_per_operation_in_memory():
+    async def scenario():
+        uow = InMemoryUnitOfWork()
+
+        user = await RegisterUserUseCase(uow).execute(RegisterUserCommand(**_registration("single@example.com")))
+        assert uow.commits == 1
+        assert await uow.users.find_by_uuid(user.uuid) is not None
+
+        payloads = [_registration(f"batch{i}@example.com") for i in range(5)]
+        result = await RegisterUsersBatchUseCase(uow, chunk_size=2).execute(payloads)
+        assert uow.commits == 1 + 3
+        assert len(await uow.users.find_many_by_uuids(item.uuid for item in result.items)) == 5
+
+    asyncio.run(scenario())
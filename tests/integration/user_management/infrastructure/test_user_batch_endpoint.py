@@ -0,0 +1,86 @@
+"""
+Integration tests for the bulk registration endpoint.
+
+Tests include:
+- POST /users/batch reports every item in submission order with its status
+- Invalid rows are REJECTED and repeated or registered emails are DUPLICATE, while the other rows are stored
+- Valid users are committed in chunks of the requested size
+- The response totals add up to the number of submitted items
+"""
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("orjson")
+pytest.importorskip("httpx")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.dependencies import get_register_users_batch_use_case
+from api.routes.user_routes import router as user_router
+from tests.helpers.domain import create_valid_user
+from user_management.application.use_cases.register_users_batch import RegisterUsersBatchUseCase
+from user_management.infrastructure.repositories import InMemoryUserRepository
+from user_management.infrastructure.unit_of_work import InMemoryUnitOfWork
+
+
+def _registration(email: str, **overrides) -> dict:
+    return {"email": email, "first_name": "John", "last_name": "Doe", "phone": "+15551234567",
+            "date_of_birth": "1990-01-01", "user_role": "PATIENT", "password": "Secret123!", **overrides}
+
+
+@pytest.fixture
+def unit_of_work():
+    users = InMemoryUserRepository()
+    asyncio.run(users.save(create_valid_user(uuid=uuid4(), email="taken@clinic.com")))
+    return InMemoryUnitOfWork(users)
+
+
+@pytest.fixture
+def client(unit_of_work):
+    app = FastAPI()
+    app.include_router(user_router)
+    app.dependency_overrides[get_register_users_batch_use_case] = \
+        lambda: RegisterUsersBatchUseCase(unit_of_work, chunk_size=500)
+    return TestClient(app)
+
+
+def test_batch_reports_each_item(client, unit_of_work):
+    payloads = [
+        _registration("ana@clinic.com"),
+        _registration("not-an-email"),
+        _registration("ANA@clinic.com"),
+        _registration("Taken@Clinic.com"),
+        _registration("bob@clinic.com", first_name="B0b"),
+        _registration("carl@clinic.com"),
+    ]
+
+    response = client.post("/users/batch", json=payloads)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["index"] for item in body["items"]] == list(range(6))
+    assert [item["status"] for item in body["items"]] == [
+        "CREATED", "REJECTED", "DUPLICATE", "DUPLICATE", "REJECTED", "CREATED"]
+    assert body["items"][2]["error"] == "Duplicate email in batch: ANA@clinic.com"
+    assert body["items"][3]["error"] == "Email already registered: Taken@Clinic.com"
+    assert body["items"][1]["uuid"] is None and body["items"][1]["error"]
+    assert (body["total"], body["created"], body["rejected"], body["duplicates"], body["failed"]) == (6, 2, 2, 2, 0)
+
+    created = [item["uuid"] for item in body["items"] if item["status"] == "CREATED"]
+    stored = asyncio.run(unit_of_work.users.find_by_email("carl@clinic.com"))
+    assert str(stored.uuid) == created[1]
+
+
+def test_batch_commits_in_chunks(client, unit_of_work):
+    payloads = [_registration(f"user{i}@clinic.com") for i in range(7)] + [_registration("", first_name="")]
+
+    response = client.post("/users/batch", params={"chunk_size": 3}, json=payloads)
+
+    body = response.json()
+    assert body["chunk_size"] == 3
+    assert (body["total"], body["created"], body["rejected"]) == (8, 7, 1)
+    assert unit_of_work.commits == 3
+    assert client.post("/users/batch", params={"chunk_size": 0}, json=payloads).status_code == 422
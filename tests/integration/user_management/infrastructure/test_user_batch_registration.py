@@ -0,0 +1,160 @@
+"""
+Integration tests for bulk user registration against the database.
+
+Tests include:
+- save_many inserts users with their credentials, and nothing for an empty list
+- save_many reports a registered email as EmailAlreadyRegisteredError and inserts none of the users
+- Emails already registered (in any case) are reported as DUPLICATE and the rest of their chunk is stored
+- Each chunk checks its emails with one query, or only the ones the registered email filter flags
+- An email registered after the check is found on the retry instead of failing the whole chunk
+"""
+import asyncio
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import func, select
+
+from tests.helpers.domain import create_valid_user
+from user_management.domain.exceptions import EmailAlreadyRegisteredError
+from user_management.domain.value_objects import UserCredentials
+from user_management.application.use_cases.register_users_batch import BatchItemStatus, RegisterUsersBatchUseCase
+from user_management.infrastructure.filters import BloomRegisteredEmailFilter
+from user_management.infrastructure.models import UserModel
+from user_management.infrastructure.repositories import PostgresUserRepository
+from user_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+
+def _registration(email: str, **overrides) -> dict:
+    return {"email": email, "first_name": "John", "last_name": "Doe", "phone": "+15551234567",
+            "date_of_birth": date(1990, 1, 1), "user_role": "PATIENT", "password": "Secret123!", **overrides}
+
+
+async def _seed(sessionmaker, *emails):
+    async with sessionmaker() as session:
+        async with SqlAlchemyUnitOfWork(session) as uow:
+            await uow.users.save_many([create_valid_user(uuid=uuid4(), email=email) for email in emails])
+            await uow.commit()
+
+
+async def _user_count(sessionmaker) -> int:
+    async with sessionmaker() as session:
+        return await session.scalar(select(func.count()).select_from(UserModel))
+
+
+def _email_checks(selects) -> int:
+    return sum("lower(users.email) IN" in statement for statement in selects)
+
+
+def test_save_many_inserts_users_with_their_credentials(sessionmaker):
+    users = [create_valid_user(uuid=uuid4(), email=f"user{i}@clinic.com",
+                               credentials=UserCredentials.create(f"Secret{i}!"))
+             for i in range(3)]
+
+    async def scenario():
+        await _seed(sessionmaker)
+        assert await _user_count(sessionmaker) == 0
+        async with sessionmaker() as session:
+            async with SqlAlchemyUnitOfWork(session) as uow:
+                await uow.users.save_many(users)
+                await uow.commit()
+
+        async with sessionmaker() as session:
+            stored = await PostgresUserRepository(session).find_many_by_uuids([user.uuid for user in users])
+        assert [user.email for user in stored] == ["user0@clinic.com", "user1@clinic.com", "user2@clinic.com"]
+        assert stored[2].is_password_valid("Secret2!")
+
+    asyncio.run(scenario())
+
+
+def test_save_many_reports_a_registered_email(sessionmaker):
+    async def scenario():
+        await _seed(sessionmaker, "taken@clinic.com")
+        async with sessionmaker() as session:
+            async with SqlAlchemyUnitOfWork(session) as uow:
+                with pytest.raises(EmailAlreadyRegisteredError):
+                    await uow.users.save_many([create_valid_user(uuid=uuid4(), email="fresh@clinic.com"),
+                                               create_valid_user(uuid=uuid4(), email="Taken@clinic.com")])
+        assert await _user_count(sessionmaker) == 1
+
+    asyncio.run(scenario())
+
+
+def test_registered_emails_are_duplicates_and_the_rest_of_the_chunk_is_stored(sessionmaker, selects):
+    payloads = [
+        _registration("new0@clinic.com"),
+        _registration("TAKEN@clinic.com"),
+        _registration("new1@clinic.com"),
+        _registration("new2@clinic.com"),
+        _registration("new3@clinic.com"),
+    ]
+
+    async def scenario():
+        await _seed(sessionmaker, "taken@clinic.com")
+        selects.clear()
+        async with sessionmaker() as session:
+            result = await RegisterUsersBatchUseCase(SqlAlchemyUnitOfWork(session), chunk_size=2).execute(payloads)
+
+        assert [item.status for item in result.items] == [
+            BatchItemStatus.CREATED, BatchItemStatus.DUPLICATE, BatchItemStatus.CREATED,
+            BatchItemStatus.CREATED, BatchItemStatus.CREATED]
+        duplicate = result.items[1]
+        assert duplicate.uuid is None and duplicate.error == "Email already registered: TAKEN@clinic.com"
+        assert _email_checks(selects) == 3
+        assert await _user_count(sessionmaker) == 5
+
+    asyncio.run(scenario())
+
+
+def test_only_emails_flagged_by_the_filter_are_checked(sessionmaker, selects):
+    payloads = [_registration(f"new{i}@clinic.com") for i in range(4)] + [_registration("Taken@Clinic.com")]
+
+    async def scenario():
+        await _seed(sessionmaker, "taken@clinic.com")
+        email_filter = BloomRegisteredEmailFilter(capacity=1_000)
+        async with sessionmaker() as session:
+            await email_filter.load(PostgresUserRepository(session).iter_emails())
+        selects.clear()
+
+        async with sessionmaker() as session:
+            use_case = RegisterUsersBatchUseCase(SqlAlchemyUnitOfWork(session), chunk_size=2, email_filter=email_filter)
+            result = await use_case.execute(payloads)
+
+        assert result.count(BatchItemStatus.CREATED) == 4
+        assert result.items[4].status is BatchItemStatus.DUPLICATE
+        assert _email_checks(selects) == 1
+        assert email_filter.might_be_registered("new3@clinic.com")
+
+    asyncio.run(scenario())
+
+
+class StaleEmailFilter:
+    """A filter loaded before another worker registered ``late@clinic.com``."""
+
+    def might_be_registered(self, email: str) -> bool:
+        return False
+
+    def add(self, email: str) -> None:
+        pass
+
+
+def test_email_registered_after_the_check_is_caught_on_retry(sessionmaker, selects):
+    payloads = [_registration("first@clinic.com"), _registration("late@clinic.com"), _registration("last@clinic.com")]
+
+    async def scenario():
+        await _seed(sessionmaker, "late@clinic.com")
+        selects.clear()
+        async with sessionmaker() as session:
+            use_case = RegisterUsersBatchUseCase(SqlAlchemyUnitOfWork(session), email_filter=StaleEmailFilter())
+            result = await use_case.execute(payloads)
+
+        assert [item.status for item in result.items] == [
+            BatchItemStatus.CREATED, BatchItemStatus.DUPLICATE, BatchItemStatus.CREATED]
+        assert _email_checks(selects) == 1
+        assert await _user_count(sessionmaker) == 3
+
+    asyncio.run(scenario())
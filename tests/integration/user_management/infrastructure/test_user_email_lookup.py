@@ -0,0 +1,82 @@
+"""
+Integration tests for case-insensitive email lookup and uniqueness.
+
+Tests include:
+- find_by_email matches regardless of the casing used at registration or lookup
+- The stored email keeps its original casing
+- Two users whose emails differ only in case cannot both be stored
+- A violation of the case-sensitive constraint of not yet migrated databases is reported the same way
+- Every index on the users table is created by a PostgreSQL migration
+"""
+import asyncio
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.exc import IntegrityError
+
+from tests.helpers.domain import create_valid_user
+from user_management.domain.exceptions import EmailAlreadyRegisteredError
+from user_management.infrastructure.models import UserModel
+from user_management.infrastructure.repositories.postgres_user_repository import PostgresUserRepository
+from user_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+
+def test_find_by_email_ignores_case(sessionmaker):
+    async def scenario():
+        user = create_valid_user(uuid=uuid4(), email="Maria.Silva@Clinic.com")
+
+        async with sessionmaker() as session:
+            async with SqlAlchemyUnitOfWork(session) as uow:
+                await uow.users.save(user)
+                await uow.commit()
+
+        async with sessionmaker() as session:
+            repository = PostgresUserRepository(session)
+            for email in ("maria.silva@clinic.com", "MARIA.SILVA@CLINIC.COM", "Maria.Silva@Clinic.com"):
+                found = await repository.find_by_email(email)
+                assert found is not None
+                assert found.uuid == user.uuid
+                assert found.email == "Maria.Silva@Clinic.com"
+
+    asyncio.run(scenario())
+
+
+def test_emails_differing_only_in_case_are_rejected(sessionmaker):
+    async def scenario():
+
+        async with sessionmaker() as session:
+            async with SqlAlchemyUnitOfWork(session) as uow:
+                await uow.users.save(create_valid_user(uuid=uuid4(), email="john@clinic.com"))
+                await uow.commit()
+
+        async with sessionmaker() as session:
+            with pytest.raises(EmailAlreadyRegisteredError):
+                async with SqlAlchemyUnitOfWork(session) as uow:
+                    await uow.users.save(create_valid_user(uuid=uuid4(), email="JOHN@clinic.com"))
+                    await uow.commit()
+
+    asyncio.run(scenario())
+
+
+def test_legacy_email_constraint_is_reported_as_a_duplicate():
+    for violated in ("uq_users_email_lower", "users_email_key"):
+        error = IntegrityError("INSERT INTO users ...", {}, Exception(
+            f'duplicate key value violates unique constraint "{violated}"'))
+        with pytest.raises(EmailAlreadyRegisteredError):
+            PostgresUserRepository._raise_if_duplicate_email(error, "Email already registered")
+
+    other = IntegrityError("INSERT INTO users ...", {}, Exception('violates unique constraint "users_pkey"'))
+    PostgresUserRepository._raise_if_duplicate_email(other, "Email already registered")
+
+
+def test_every_users_index_has_a_migration():
+    migrations = Path(__file__).parents[4] / "migrations" / "postgresql"
+    sql = "\n".join(path.read_text(encoding="utf-8") for path in sorted(migrations.glob("*.sql")))
+
+    for index in UserModel.__table__.indexes:
+        assert f" {index.name} ON users " in sql, index.name
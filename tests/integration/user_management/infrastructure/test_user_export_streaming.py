@@ -0,0 +1,98 @@
+"""
+Integration tests for the streamed NDJSON user export.
+
+Seeds EXPORT_TEST_ROWS synthetic users (5,000 by default, so the suite stays
+fast; set EXPORT_TEST_ROWS=100000 for the full run, or EXPORT_TEST_ROWS=1000000
+for the acceptance run, which takes several minutes) into a SQLite file and
+streams them through UserRepository.iter_all and the NDJSON encoder
+while tracing allocations. Memory must stop growing once the first batches
+are in flight: nothing may accumulate per exported row.
+
+Tests include:
+- Every row is exported exactly once, as one JSON line, in (created_at, uuid) order
+- Traced memory stays flat while streaming and the peak stays far below the dataset size
+"""
+import asyncio
+import json
+import os
+import tracemalloc
+from datetime import date, datetime, timedelta, timezone
+from uuid import UUID
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from api.responses import iter_user_summaries_ndjson
+from user_management.domain.enums import UserRole, UserStatus
+from user_management.infrastructure.models import Base, UserCredentialsModel, UserModel
+from user_management.infrastructure.repositories.postgres_user_repository import PostgresUserRepository
+
+EXPORT_TEST_ROWS = int(os.getenv("EXPORT_TEST_ROWS", "5000"))
+# Small enough that the default run still streams a few dozen batches.
+BATCH_SIZE = 1000 if EXPORT_TEST_ROWS >= 100_000 else 100
+SEED_CHUNK_SIZE = 50_000
+MEMORY_GROWTH_LIMIT = 2 * 1024 * 1024
+PEAK_MEMORY_LIMIT = 64 * 1024 * 1024
+
+
+def _seed(path, rows: int) -> None:
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    hashed_password = "0" * 64
+    with engine.begin() as connection:
+        for offset in range(0, rows, SEED_CHUNK_SIZE):
+            ids = range(offset, min(offset + SEED_CHUNK_SIZE, rows))
+            users = [{
+                "uuid": UUID(int=i), "email": f"patient.{i}@clinic.com", "first_name": "Export",
+                "last_name": "User", "phone": "+15551234567", "date_of_birth": date(1990, 1, 1),
+                "user_role": UserRole.PATIENT, "user_status": UserStatus.ACTIVE,
+                "created_at": start + timedelta(seconds=i), "updated_at": start + timedelta(seconds=i),
+            } for i in ids]
+            connection.execute(insert(UserModel), users)
+            connection.execute(insert(UserCredentialsModel),
+                               [{"user_uuid": UUID(int=i), "hashed_password": hashed_password} for i in ids])
+    engine.dispose()
+
+
+def test_export_streams_every_row_with_flat_memory(tmp_path):
+    path = tmp_path / "export.db"
+    _seed(path, EXPORT_TEST_ROWS)
+
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        sessionmaker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        exported = 0
+        last_uuid = -1
+        samples = []
+        tracemalloc.start()
+        try:
+            async with sessionmaker() as session:
+                users = PostgresUserRepository(session).iter_all(BATCH_SIZE)
+                async for chunk in iter_user_summaries_ndjson(users, lines_per_chunk=BATCH_SIZE):
+                    lines = chunk.decode("utf-8").splitlines()
+                    for line in (lines[0], lines[-1]):
+                        assert json.loads(line)["email"].endswith("@clinic.com")
+                    first, last = UUID(json.loads(lines[0])["uuid"]).int, UUID(json.loads(lines[-1])["uuid"]).int
+                    assert first == last_uuid + 1
+                    last_uuid = last
+                    exported += len(lines)
+                    samples.append(tracemalloc.get_traced_memory()[0])
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            await engine.dispose()
+
+        assert exported == EXPORT_TEST_ROWS
+
+        warmed_up = max(samples[:max(1, len(samples) // 10)])
+        assert max(samples) - warmed_up < MEMORY_GROWTH_LIMIT
+        assert peak < PEAK_MEMORY_LIMIT
+
+    asyncio.run(scenario())
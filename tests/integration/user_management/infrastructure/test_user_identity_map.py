@@ -0,0 +1,106 @@
+"""
+Integration tests for the request-scoped user identity map.
+
+Tests include:
+- Repeated lookups by UUID and by email return the same User with a single query
+- find_many_by_uuids and find_existing_uuids only query the users not yet mapped
+- Saving a user drops its entries, including the email it was mapped under
+- The unit of work shares the map and clears it when an open transaction is rolled back
+"""
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from tests.helpers.domain import create_valid_user
+from user_management.infrastructure.repositories import IdentityMapUserRepository, InMemoryUserRepository, \
+    PostgresUserRepository, UserIdentityMap
+from user_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+
+async def _seed(sessionmaker, users: int):
+    stored = [create_valid_user(uuid=uuid4(), email=f"user{i}@clinic.com") for i in range(users)]
+    async with sessionmaker() as session:
+        async with SqlAlchemyUnitOfWork(session) as uow:
+            await uow.users.save_many(stored)
+            await uow.commit()
+    return stored
+
+
+def test_repeated_lookups_return_the_same_user_with_one_query(sessionmaker, selects):
+    async def scenario():
+        stored = await _seed(sessionmaker, users=1)
+        selects.clear()
+        async with sessionmaker() as session:
+            repository = IdentityMapUserRepository(PostgresUserRepository(session), UserIdentityMap())
+
+            by_email = await repository.find_by_email("USER0@clinic.com")
+            by_uuid = await repository.find_by_uuid(stored[0].uuid)
+            again = await repository.find_by_email("user0@clinic.com")
+
+        assert by_email is by_uuid is again
+        assert len(selects) == 1
+
+    asyncio.run(scenario())
+
+
+def test_bulk_lookups_only_query_unmapped_users(sessionmaker, selects):
+    async def scenario():
+        stored = await _seed(sessionmaker, users=4)
+        selects.clear()
+        async with sessionmaker() as session:
+            repository = IdentityMapUserRepository(PostgresUserRepository(session), UserIdentityMap())
+            first = await repository.find_by_uuid(stored[0].uuid)
+            missing = uuid4()
+
+            users = await repository.find_many_by_uuids([stored[2].uuid, stored[0].uuid, missing, stored[1].uuid])
+            assert [user.uuid for user in users] == [stored[2].uuid, stored[0].uuid, stored[1].uuid]
+            assert users[1] is first
+            assert len(selects) == 2
+
+            existing = await repository.find_existing_uuids([user.uuid for user in stored[:3]])
+            assert existing == {user.uuid for user in stored[:3]}
+            assert len(selects) == 2
+
+    asyncio.run(scenario())
+
+
+def test_save_drops_mapped_entries():
+    async def scenario():
+        inner = InMemoryUserRepository()
+        original = create_valid_user(uuid=uuid4(), email="old@clinic.com")
+        await inner.save(original)
+        repository = IdentityMapUserRepository(inner, UserIdentityMap())
+        assert await repository.find_by_email("old@clinic.com") is original
+
+        renamed = create_valid_user(uuid=original.uuid, email="new@clinic.com")
+        await repository.save(renamed)
+
+        assert await repository.find_by_uuid(original.uuid) is renamed
+        assert await repository.find_by_email("new@clinic.com") is renamed
+        assert repository.identity_map.get_by_email("old@clinic.com") is None
+
+    asyncio.run(scenario())
+
+
+def test_unit_of_work_shares_the_map_and_clears_it_on_rollback(sessionmaker):
+    async def scenario():
+        stored = await _seed(sessionmaker, users=1)
+        identity_map = UserIdentityMap()
+        async with sessionmaker() as read_session, sessionmaker() as write_session:
+            read_repository = IdentityMapUserRepository(PostgresUserRepository(read_session), identity_map)
+            loaded = await read_repository.find_by_uuid(stored[0].uuid)
+
+            unsaved = create_valid_user(uuid=uuid4(), email="pending@clinic.com")
+            async with SqlAlchemyUnitOfWork(write_session, identity_map) as uow:
+                assert await uow.users.find_by_uuid(stored[0].uuid) is loaded
+                await uow.users.save(unsaved)
+                assert await uow.users.find_by_uuid(unsaved.uuid) is not None
+
+            assert len(identity_map) == 0
+            assert await read_repository.find_by_uuid(unsaved.uuid) is None
+
+    asyncio.run(scenario())
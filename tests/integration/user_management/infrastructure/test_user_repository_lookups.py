@@ -0,0 +1,112 @@
+"""
+Integration tests for loading users together with their credentials.
+
+Tests include:
+- find_by_uuid and find_by_email hydrate the user and its credentials with a single SELECT
+- find_many_by_uuids loads any number of users with one SELECT, in request order
+- Unknown and repeated UUIDs are skipped and collapsed; an empty request issues no query
+- A user without a credentials row is reported instead of being returned half-built
+- The in-memory repository gives the same results
+"""
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import delete
+
+from tests.helpers.domain import create_valid_user
+from user_management.domain.value_objects import UserCredentials
+from user_management.infrastructure.models import UserCredentialsModel
+from user_management.infrastructure.repositories import InMemoryUserRepository, PostgresUserRepository
+from user_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+
+def _users(count: int):
+    return [create_valid_user(uuid=uuid4(), email=f"user{i}@clinic.com",
+                              credentials=UserCredentials.create(f"Secret{i}!"))
+            for i in range(count)]
+
+
+async def _seed(sessionmaker, users):
+    async with sessionmaker() as session:
+        async with SqlAlchemyUnitOfWork(session) as uow:
+            await uow.users.save_many(users)
+            await uow.commit()
+
+
+def test_point_lookups_load_credentials_in_the_same_select(sessionmaker, selects):
+    stored = _users(2)
+
+    async def scenario():
+        await _seed(sessionmaker, stored)
+        selects.clear()
+        async with sessionmaker() as session:
+            repository = PostgresUserRepository(session)
+            by_uuid = await repository.find_by_uuid(stored[0].uuid)
+            assert len(selects) == 1
+            by_email = await repository.find_by_email("USER1@clinic.com")
+            assert len(selects) == 2
+            assert await repository.find_by_uuid(uuid4()) is None
+
+        assert by_uuid.uuid == stored[0].uuid and by_uuid.is_password_valid("Secret0!")
+        assert by_email.uuid == stored[1].uuid and by_email.is_password_valid("Secret1!")
+        assert all("user_credentials" in statement for statement in selects)
+
+    asyncio.run(scenario())
+
+
+def test_find_many_by_uuids_uses_one_select_and_keeps_request_order(sessionmaker, selects):
+    stored = _users(5)
+    missing = uuid4()
+    requested = [stored[3].uuid, missing, stored[0].uuid, stored[3].uuid, stored[4].uuid]
+
+    async def scenario():
+        await _seed(sessionmaker, stored)
+        selects.clear()
+        async with sessionmaker() as session:
+            repository = PostgresUserRepository(session)
+            users = await repository.find_many_by_uuids(iter(requested))
+            assert len(selects) == 1
+
+            assert await repository.find_many_by_uuids([]) == []
+            assert await repository.find_many_by_uuids([missing]) == []
+            assert len(selects) == 2
+
+        assert [user.uuid for user in users] == [stored[3].uuid, stored[0].uuid, stored[4].uuid]
+        assert users[0].is_password_valid("Secret3!") and users[1].is_password_valid("Secret0!")
+
+    asyncio.run(scenario())
+
+
+def test_user_without_credentials_is_reported(sessionmaker):
+    stored = _users(1)
+
+    async def scenario():
+        await _seed(sessionmaker, stored)
+        async with sessionmaker() as session:
+            await session.execute(delete(UserCredentialsModel))
+            repository = PostgresUserRepository(session)
+            with pytest.raises(ValueError, match="Credentials not found"):
+                await repository.find_by_uuid(stored[0].uuid)
+            with pytest.raises(ValueError, match="Credentials not found"):
+                await repository.find_many_by_uuids([stored[0].uuid])
+
+    asyncio.run(scenario())
+
+
+def test_in_memory_repository_matches():
+    stored = _users(3)
+    missing = uuid4()
+
+    async def scenario():
+        repository = InMemoryUserRepository()
+        await repository.save_many(stored)
+        users = await repository.find_many_by_uuids([stored[2].uuid, missing, stored[0].uuid, stored[2].uuid])
+        assert [user.uuid for user in users] == [stored[2].uuid, stored[0].uuid]
+        assert await repository.find_many_by_uuids([]) == []
+
+    asyncio.run(scenario())
@@ -0,0 +1,120 @@
+"""
+Integration tests for keyset-paginated user search.
+
+Runs the search use case against the SQLAlchemy repository on a SQLite file.
+
+Tests include:
+- Walking every page with next_cursor returns each match exactly once, in (created_at, uuid) order
+- Role, status and prefix filters are combined
+- LIKE wildcards in the search term are matched literally
+- Malformed cursors are rejected
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from tests.helpers.domain import create_valid_user
+from user_management.application.use_cases.search_users import SearchUsersQuery, SearchUsersUseCase
+from user_management.domain.enums import UserRole, UserStatus
+from user_management.infrastructure.repositories.postgres_user_repository import PostgresUserRepository
+from user_management.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+
+async def _seed(sessionmaker, users):
+    async with sessionmaker() as session:
+        async with SqlAlchemyUnitOfWork(session) as uow:
+            await uow.users.save_many(users)
+            await uow.commit()
+
+
+def _users(count, **kwargs):
+    # Pairs of users share a timestamp so the uuid tie-breaker is exercised.
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    users = []
+    for i in range(count):
+        created_at = base + timedelta(minutes=i // 2)
+        users.append(create_valid_user(
+            uuid=uuid4(),
+            email=f"user{i}@example.com",
+            created_at=created_at,
+            updated_at=created_at,
+            **kwargs
+        ))
+    return users
+
+
+async def _search_all(sessionmaker, **query):
+    pages = []
+    cursor = None
+    async with sessionmaker() as session:
+        use_case = SearchUsersUseCase(PostgresUserRepository(session))
+        while True:
+            result = await use_case.execute(SearchUsersQuery(cursor=cursor, **query))
+            pages.append(result.users)
+            cursor = result.next_cursor
+            if cursor is None:
+                return pages
+
+
+def test_cursor_walks_every_page_once_in_keyset_order(sessionmaker):
+    async def scenario():
+        users = _users(11)
+        await _seed(sessionmaker, users)
+
+        pages = await _search_all(sessionmaker, limit=4)
+
+        assert [len(page) for page in pages] == [4, 4, 3]
+        found = [user.uuid for page in pages for user in page]
+        expected = [user.uuid for user in sorted(users, key=lambda u: (u.created_at, str(u.uuid)))]
+        assert found == expected
+
+    asyncio.run(scenario())
+
+
+def test_filters_are_combined(sessionmaker):
+    async def scenario():
+        users = _users(4) + [
+            create_valid_user(uuid=uuid4(), email="ana.doctor@example.com", first_name="Ana",
+                              user_role=UserRole.DOCTOR),
+            create_valid_user(uuid=uuid4(), email="andre@example.com", first_name="Andre",
+                              user_role=UserRole.DOCTOR, user_status=UserStatus.INACTIVE),
+            create_valid_user(uuid=uuid4(), email="zed@example.com", first_name="Zed",
+                              user_role=UserRole.DOCTOR),
+        ]
+        await _seed(sessionmaker, users)
+
+        pages = await _search_all(sessionmaker, q="AN", role="doctor", status="ACTIVE")
+
+        assert [user.email for page in pages for user in page] == ["ana.doctor@example.com"]
+
+    asyncio.run(scenario())
+
+
+def test_like_wildcards_are_matched_literally(sessionmaker):
+    async def scenario():
+        await _seed(sessionmaker, _users(3))
+
+        pages = await _search_all(sessionmaker, q="user_")
+        assert pages == [[]]
+
+        pages = await _search_all(sessionmaker, q="%")
+        assert pages == [[]]
+
+    asyncio.run(scenario())
+
+
+def test_malformed_cursor_is_rejected(sessionmaker):
+    async def scenario():
+        await _seed(sessionmaker, _users(1))
+
+        async with sessionmaker() as session:
+            use_case = SearchUsersUseCase(PostgresUserRepository(session))
+            with pytest.raises(ValueError):
+                await use_case.execute(SearchUsersQuery(cursor="not-a-cursor"))
+
+    asyncio.run(scenario())
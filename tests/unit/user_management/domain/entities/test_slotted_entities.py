@@ -0,0 +1,47 @@
+"""
+Test suite for the slotted layout of User, PatientProfile and UserCredentials.
+
+Tests include:
+- Instances carry no __dict__ and reject attributes outside their slots
+- Mutation methods keep working on slotted users and profiles
+- Entities and credentials survive pickling (patient imports cross process boundaries)
+"""
+import pickle
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from tests.helpers.domain import create_valid_patient_profile, create_valid_user, entity_fields
+from user_management.domain.enums import UserStatus
+from user_management.domain.value_objects import UserCredentials
+
+
+def test_entities_have_no_instance_dict():
+    user = create_valid_user()
+    for instance in (user, create_valid_patient_profile(), user._credentials):
+        assert not hasattr(instance, "__dict__")
+
+    with pytest.raises(AttributeError):
+        user.nickname = "Fern"
+
+
+def test_mutation_methods_work_on_slotted_entities():
+    user = create_valid_user()
+    user.update_basic_profile("Ana", "Souza", "ana@example.com", "+15551234567", date(1990, 5, 1))
+    user.change_user_status(UserStatus.INACTIVE)
+    assert (user.first_name, user.email, user.user_status) == ("Ana", "ana@example.com", UserStatus.INACTIVE)
+
+    profile = create_valid_patient_profile()
+    profile.update_medical_info("Will Magalhaes", "+5521861499435", "Other Insurance", "Spanish", "None")
+    assert profile.preferred_language == "Spanish"
+
+
+def test_slotted_entities_pickle():
+    user = create_valid_user(uuid=uuid4())
+    profile = create_valid_patient_profile(user_uuid=user.uuid)
+    credentials = UserCredentials._from_hashed("0" * 64)
+
+    assert entity_fields(pickle.loads(pickle.dumps(user))) == entity_fields(user)
+    assert entity_fields(pickle.loads(pickle.dumps(profile))) == entity_fields(profile)
+    assert pickle.loads(pickle.dumps(credentials)) == credentials
@@ -0,0 +1,117 @@
+"""
+Test suite for the domain identifier generators.
+
+Tests include:
+- UUID4Generator and UUID7Generator produce values accepted by ValidUUIDSpecification
+- UUIDv7 values carry the right version, variant and millisecond timestamp
+- UUIDv7 values are strictly increasing within one millisecond and when the clock steps backwards
+- Strategies are resolved by name and unknown strategies are rejected
+- UserFactory takes its UUID from the given or default generator
+"""
+from datetime import date
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+
+from user_management.domain.factories import UserFactory
+from user_management.domain.identifiers import UUID4Generator, UUID7Generator, get_default_id_generator, \
+    id_generator_for, set_default_id_generator
+from user_management.domain.specifications.user import ValidUUIDSpecification
+
+START_MS = 1_700_000_000_000
+
+
+class FakeClock:
+    def __init__(self, now_ms: int = START_MS):
+        self.now_ms = now_ms
+
+    def __call__(self) -> int:
+        return self.now_ms
+
+
+def _command():
+    return SimpleNamespace(
+        email="john.doe@example.com",
+        first_name="John",
+        last_name="Doe",
+        phone="+15551234567",
+        date_of_birth=date(1990, 1, 1),
+        user_role="PATIENT",
+        password="Secret123!",
+    )
+
+
+def test_generated_ids_satisfy_uuid_specification():
+    for generator in (UUID4Generator(), UUID7Generator()):
+        for _ in range(100):
+            assert ValidUUIDSpecification().is_satisfied_by(generator.new_id())
+
+
+def test_uuid7_layout():
+    uuid = UUID7Generator(clock=FakeClock()).new_id()
+
+    assert uuid.version == 7
+    assert uuid.variant == "specified in RFC 4122"
+    assert uuid.int >> 80 == START_MS
+
+
+def test_uuid7_is_strictly_increasing_within_the_same_millisecond():
+    generator = UUID7Generator(clock=FakeClock())
+
+    ids = [generator.new_id() for _ in range(10_000)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    assert str(ids[0]) < str(ids[-1])
+
+
+def test_uuid7_stays_monotonic_when_the_clock_steps_backwards():
+    clock = FakeClock()
+    generator = UUID7Generator(clock=clock)
+
+    before = generator.new_id()
+    clock.now_ms -= 5_000
+    after = generator.new_id()
+
+    assert after > before
+    assert after.int >> 80 == START_MS
+
+
+def test_uuid7_orders_by_time():
+    clock = FakeClock()
+    generator = UUID7Generator(clock=clock)
+
+    earlier = generator.new_id()
+    clock.now_ms += 1
+    later = generator.new_id()
+
+    assert later > earlier
+    assert later.int >> 80 == START_MS + 1
+
+
+def test_strategies_are_resolved_by_name():
+    assert isinstance(id_generator_for("uuid4"), UUID4Generator)
+    assert isinstance(id_generator_for(" UUID7 "), UUID7Generator)
+
+    with pytest.raises(ValueError):
+        id_generator_for("uuid1")
+
+
+def test_user_factory_uses_the_given_generator():
+    user = UserFactory.create_from_command(_command(), id_generator=UUID7Generator(clock=FakeClock()))
+
+    assert user.uuid.version == 7
+    assert user.uuid.int >> 80 == START_MS
+
+
+def test_user_factory_uses_the_default_generator():
+    previous = get_default_id_generator()
+    try:
+        set_default_id_generator(UUID7Generator())
+        assert UserFactory.create_from_command(_command()).uuid.version == 7
+
+        set_default_id_generator(UUID4Generator())
+        assert UserFactory.create_from_command(_command()).uuid.version == 4
+    finally:
+        set_default_id_generator(previous)
@@ -0,0 +1,70 @@
+"""
+Test suite for Specification.is_satisfied_by_many().
+
+Tests include:
+- Every user and patient_profile leaf agrees with is_satisfied_by on fixed and fuzzed columns
+- Custom specifications fall back to evaluating is_satisfied_by per value
+- AND/OR/NOT composites combine batch results and only pass undecided values on
+"""
+from datetime import datetime
+
+import pytest
+
+from tests.helpers.domain import FIXED_VALUES, fuzzed_strings
+from user_management.domain.specifications import Specification
+from user_management.domain.specifications import patient_profile, user
+from user_management.domain.specifications.user import ValidEmailSpecification, ValidNameSpecification, \
+    ValidPhoneE164Specification
+
+LEAVES = [getattr(user, name)() for name in user.__all__] + \
+         [getattr(patient_profile, name)() for name in patient_profile.__all__ if name != "ValidUpdatedAtRelativeToCreatedAtSpecification"]
+
+
+def _expected(spec, values) -> list:
+    return [spec.is_satisfied_by(value) for value in values]
+
+
+@pytest.mark.parametrize("spec", LEAVES, ids=lambda spec: type(spec).__module__.split(".")[-2] + "." + type(spec).__name__)
+def test_batch_leaves_agree_with_is_satisfied_by(spec):
+    values = [value for value in FIXED_VALUES if not isinstance(value, datetime)
+              or "date_of_birth" not in type(spec).__module__] + fuzzed_strings(5_000)
+
+    assert spec.is_satisfied_by_many(values) == _expected(spec, values)
+    assert spec.is_satisfied_by_many(iter(values[:10])) == _expected(spec, values[:10])
+    assert spec.is_satisfied_by_many([]) == []
+
+
+class CountingSpecification(Specification):
+    def __init__(self, predicate):
+        self.predicate = predicate
+        self.evaluated = []
+
+    def is_satisfied_by(self, candidate) -> bool:
+        self.evaluated.append(candidate)
+        return self.predicate(candidate)
+
+
+def test_custom_specifications_fall_back_to_is_satisfied_by():
+    even = CountingSpecification(lambda number: number % 2 == 0)
+    assert even.is_satisfied_by_many(range(5)) == [True, False, True, False, True]
+    assert even.evaluated == [0, 1, 2, 3, 4]
+
+
+def test_composites_evaluate_only_undecided_values():
+    positive = CountingSpecification(lambda number: number > 0)
+    even = CountingSpecification(lambda number: number % 2 == 0)
+    values = [-2, -1, 0, 1, 2, 3, 4]
+
+    assert positive.and_(even).is_satisfied_by_many(values) == [False, False, False, False, True, False, True]
+    assert even.evaluated == [1, 2, 3, 4]
+
+    positive.evaluated.clear()
+    even.evaluated.clear()
+    assert positive.or_(even).not_().is_satisfied_by_many(values) == [False, True, False, False, False, False, False]
+    assert even.evaluated == [-2, -1, 0]
+
+
+def test_composites_of_leaves_agree_with_is_satisfied_by():
+    tree = ValidNameSpecification().or_(ValidEmailSpecification()).and_(ValidPhoneE164Specification().not_())
+    values = FIXED_VALUES + fuzzed_strings(2_000)
+    assert tree.is_satisfied_by_many(values) == [tree.is_satisfied_by(value) for value in values]
@@ -0,0 +1,87 @@
+"""
+Test suite for Specification.compile().
+
+Tests include:
+- Compiled AND/OR/NOT trees agree with is_satisfied_by on valid and invalid candidates
+- Nested junctions are flattened and double negations cancel out
+- Stateless leaves compile to one shared instance; leaves with state are kept apart
+- Adaptive junctions move cheap, frequently deciding clauses first without changing results
+"""
+import time
+
+from user_management.domain.specifications import AndSpecification, NotSpecification, OrSpecification, \
+    Specification
+from user_management.domain.specifications.compilation import AdaptiveJunction
+from user_management.domain.specifications.user import ValidEmailSpecification, ValidNameSpecification, \
+    ValidPhoneE164Specification
+
+CANDIDATES = ["John", "Mary Jane", "john@example.com", "+15551234567", "", "  ", None, 42, "O'Connor", "a@b"]
+
+
+class CountingSpecification(Specification):
+    def __init__(self, result: bool):
+        self.result = result
+        self.calls = 0
+
+    def is_satisfied_by(self, candidate) -> bool:
+        self.calls += 1
+        return self.result
+
+
+class SlowSpecification(Specification):
+    def is_satisfied_by(self, candidate) -> bool:
+        time.sleep(0.0002)
+        return True
+
+
+def test_compiled_trees_agree_with_is_satisfied_by():
+    name, email, phone = ValidNameSpecification(), ValidEmailSpecification(), ValidPhoneE164Specification()
+    trees = [
+        name.and_(email.not_()).and_(phone.or_(email.not_())),
+        name.or_(email).or_(phone),
+        AndSpecification(name, OrSpecification(email, phone), NotSpecification(NotSpecification(name))),
+        NotSpecification(name.or_(email)),
+    ]
+    for tree in trees:
+        for adaptive in (False, True):
+            predicate = tree.compile(adaptive=adaptive, sample_size=3)
+            for _ in range(2):
+                for candidate in CANDIDATES:
+                    assert predicate(candidate) == tree.is_satisfied_by(candidate), (tree, candidate)
+
+
+def test_nested_junctions_are_flattened():
+    clauses = [CountingSpecification(True) for _ in range(4)]
+    tree = clauses[0].and_(clauses[1]).and_(clauses[2].and_(clauses[3]))
+
+    junction = tree.compile(adaptive=True)
+    assert isinstance(junction, AdaptiveJunction)
+    assert len(junction.predicates) == 4
+    assert junction("anything") is True
+    assert [clause.calls for clause in clauses] == [1, 1, 1, 1]
+
+
+def test_double_negation_compiles_to_the_inner_predicate():
+    name = ValidNameSpecification()
+    assert name.not_().not_().compile() == name.compile()
+
+
+def test_stateless_leaves_are_shared_and_stateful_leaves_are_not():
+    assert ValidNameSpecification().compile().__self__ is ValidNameSpecification().compile().__self__
+
+    passing, failing = CountingSpecification(True), CountingSpecification(False)
+    assert passing.compile().__self__ is passing
+    assert failing.compile().__self__ is failing
+
+
+def test_adaptive_junction_runs_cheap_deciding_clauses_first():
+    slow, failing = SlowSpecification(), CountingSpecification(False)
+    junction = slow.and_(failing).compile(adaptive=True, sample_size=20)
+
+    for _ in range(20):
+        assert junction("x") is False
+    assert junction.predicates[0].__self__ is failing
+    assert [clause["decisions"] for clause in junction.statistics()] == [0, 20]
+
+    failing.result = True
+    assert junction("x") is True
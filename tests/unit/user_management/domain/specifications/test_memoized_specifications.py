@@ -0,0 +1,99 @@
+"""
+Test suite for PureSpecification and memoized().
+
+Tests include:
+- Time-independent leaves are PureSpecifications; clock-relative ones are not and cannot be memoized
+- A memoized specification agrees with the wrapped one, including for unhashable candidates
+- The cache is a bounded LRU keyed by value and type, with hit-rate statistics
+- Compiled copies share one cache, and the patient profile validator goes through it
+"""
+import random
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from user_management.domain.entities import PatientProfile
+from user_management.domain.specifications import MemoizedSpecification, PureSpecification, memoized
+from user_management.domain.specifications import patient_profile, user
+from user_management.domain.specifications.patient_profile import ValidInsuranceInfoSpecification
+from user_management.domain.validation.patient_profile.patient_profile_validator import \
+    INSURANCE_INFO_SPECIFICATION, PREFERRED_LANGUAGE_SPECIFICATION
+
+TIME_DEPENDENT = {"ValidCreatedAtSpecification", "ValidUpdatedAtSpecification", "ValidDateOfBirthSpecification",
+                  "ValidUpdatedAtRelativeToCreatedAtSpecification"}
+LEAVES = [(module, name) for module in (user, patient_profile) for name in module.__all__]
+
+
+@pytest.mark.parametrize("module, name", LEAVES, ids=[f"{module.__name__.split('.')[-1]}.{name}"
+                                                      for module, name in LEAVES])
+def test_only_time_independent_leaves_are_pure(module, name):
+    leaf = getattr(module, name)
+    assert issubclass(leaf, PureSpecification) is (name not in TIME_DEPENDENT)
+    if name in TIME_DEPENDENT and name != "ValidUpdatedAtRelativeToCreatedAtSpecification":
+        with pytest.raises(TypeError, match="not a PureSpecification"):
+            memoized(leaf())
+
+
+def test_memoized_specification_agrees_with_the_wrapped_one():
+    rng = random.Random(7)
+    pieces = ["Acme", " ", "Health", "-", "'", ".", "é", "1", "\t", "!", "ab"]
+    values = ["".join(rng.choice(pieces) for _ in range(rng.randrange(0, 5))) for _ in range(2_000)]
+    values += [None, 42, 4.2, True, [], {"a": 1}, uuid4(), "a" * 101]
+    spec = ValidInsuranceInfoSpecification()
+    cached = memoized(spec, maxsize=64)
+
+    assert [cached.is_satisfied_by(value) for value in values] == [spec.is_satisfied_by(value) for value in values]
+    assert cached.is_satisfied_by_many(values) == spec.is_satisfied_by_many(values)
+    assert cached.and_(spec).is_satisfied_by("Acme Health")
+    assert cached.statistics()["size"] == 64
+
+
+class IsBooleanSpecification(PureSpecification):
+    def __init__(self):
+        self.calls = 0
+
+    def is_satisfied_by(self, candidate) -> bool:
+        self.calls += 1
+        return isinstance(candidate, bool)
+
+
+def test_bounded_lru_with_statistics():
+    spec = IsBooleanSpecification()
+    cached = memoized(spec, maxsize=2)
+    assert cached.statistics() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 2, "hit_rate": None}
+
+    assert cached.is_satisfied_by(True) and not cached.is_satisfied_by(1)  # 1 == True, but keyed by type
+    assert cached.is_satisfied_by(True)
+    assert not cached.is_satisfied_by("x")  # evicts 1, the least recently used
+    assert not cached.is_satisfied_by(1)
+    assert not cached.is_satisfied_by([1])  # unhashable: evaluated, not cached
+
+    assert spec.calls == 5
+    assert cached.statistics() == {"hits": 1, "misses": 4, "size": 2, "maxsize": 2, "hit_rate": 0.2}
+    cached.cache_clear()
+    assert cached.statistics()["size"] == 0
+
+
+def test_rejects_invalid_sizes():
+    with pytest.raises(ValueError):
+        MemoizedSpecification(ValidInsuranceInfoSpecification(), maxsize=0)
+
+
+def test_compiled_copies_and_the_patient_profile_validator_share_the_cache():
+    spec = IsBooleanSpecification()
+    cached = memoized(spec)
+    first, second = cached.compile(), cached.compile(adaptive=True)
+    assert first(False) and second(False) and cached.is_satisfied_by(False)
+    assert spec.calls == 1
+
+    INSURANCE_INFO_SPECIFICATION.cache_clear()
+    PREFERRED_LANGUAGE_SPECIFICATION.cache_clear()
+    now = datetime.now(timezone.utc) - timedelta(minutes=1)
+    for _ in range(3):
+        PatientProfile(user_uuid=uuid4(), emergency_contact_name="Jane Doe", emergency_contact_phone="+15551234567",
+                       insurance_info="Forever Healthy Insurance", preferred_language="English",
+                       medical_history_summary="Arterial hypertension", created_at=now, updated_at=now)
+
+    for memo in (INSURANCE_INFO_SPECIFICATION, PREFERRED_LANGUAGE_SPECIFICATION):
+        assert memo.statistics()["hits"] == 2 and memo.statistics()["misses"] == 1
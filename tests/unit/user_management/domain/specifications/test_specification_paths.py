@@ -0,0 +1,82 @@
+"""
+Test suite keeping the evaluation paths of each leaf specification in step.
+
+Every leaf states its rule up to three times: ``is_satisfied_by``, the
+column-wise ``is_satisfied_by_many`` and the ``inline()`` template pasted
+into generated validators. Each leaf is run through all of them over the
+same corpus; a value that raises must raise the same error on every path.
+
+Tests include:
+- Scalar, compiled, batch (per value and per column) and generated-validator results agree for every leaf
+- Leaves that override inline() are pasted into the generated validator instead of being called
+"""
+from datetime import timedelta
+
+import pytest
+
+from tests.helpers.domain import specification_corpus
+from tests.helpers.domain.specification_corpus import NOW
+from user_management.domain.exceptions import InvalidUserError
+from user_management.domain.specifications import patient_profile, user
+from user_management.domain.specifications.patient_profile import ValidUpdatedAtRelativeToCreatedAtSpecification
+from user_management.domain.validation.validator_generation import FieldRule, generate_validator
+
+LEAVES = [getattr(user, name)() for name in user.__all__] + \
+         [getattr(patient_profile, name)() for name in patient_profile.__all__
+          if name != "ValidUpdatedAtRelativeToCreatedAtSpecification"] + \
+         [ValidUpdatedAtRelativeToCreatedAtSpecification(NOW - timedelta(days=1))]
+CORPUS = specification_corpus(2_000)
+
+
+def _outcome(check, value):
+    """The check's result, or the type of the exception it raised."""
+    try:
+        return bool(check(value))
+    except Exception as error:
+        return type(error)
+
+
+def _generated(spec):
+    validate = generate_validator("validate_leaf", ("value",), [
+        FieldRule("value", spec, InvalidUserError, "invalid value")])
+
+    def satisfied(value) -> bool:
+        try:
+            validate(value)
+        except InvalidUserError:
+            return False
+        return True
+
+    return validate, satisfied
+
+
+def _leaf_id(spec) -> str:
+    return type(spec).__module__.split(".")[-2] + "." + type(spec).__name__
+
+
+@pytest.mark.parametrize("spec", LEAVES, ids=_leaf_id)
+def test_every_path_of_a_leaf_agrees(spec):
+    _, generated = _generated(spec)
+    compiled = spec.compile()
+    paths = {
+        "compile": compiled,
+        "is_satisfied_by_many": lambda value: spec.is_satisfied_by_many([value])[0],
+        "generated": generated,
+    }
+
+    expected = [_outcome(spec.is_satisfied_by, value) for value in CORPUS]
+    assert True in expected and False in expected
+    for name, path in paths.items():
+        mismatches = [(value, outcome, expectation) for value, expectation in zip(CORPUS, expected)
+                      if (outcome := _outcome(path, value)) != expectation]
+        assert not mismatches, (name, mismatches[:5])
+
+    column = [value for value, expectation in zip(CORPUS, expected) if isinstance(expectation, bool)]
+    assert spec.is_satisfied_by_many(column) == [expectation for expectation in expected
+                                                 if isinstance(expectation, bool)]
+
+
+@pytest.mark.parametrize("spec", LEAVES, ids=_leaf_id)
+def test_inline_leaves_are_pasted_into_generated_validators(spec):
+    validate, _ = _generated(spec)
+    assert ("_predicate_0(value)" not in validate.__source__) is (spec.inline() is not None)
@@ -0,0 +1,77 @@
+"""
+Test suite for trusted rehydration of User and PatientProfile.
+
+Tests include:
+- _rehydrate builds entities equal, field by field, to the validating constructors
+- With the default sampler no validation runs, so stored rows are trusted as they are
+- Sampled loads are validated and corrupt rows raise the usual domain errors
+- The sampler validates about the configured fraction of loads and rejects invalid rates
+"""
+import random
+from uuid import uuid4
+
+import pytest
+
+from tests.helpers.domain import create_valid_patient_profile, create_valid_user, entity_fields
+from user_management.domain.entities import PatientProfile, User
+from user_management.domain.exceptions import InvalidEmailError, InvalidPatientProfilePreferredLanguageError
+from user_management.domain.validation import RehydrationSampler, get_rehydration_sampler, set_rehydration_sampler
+
+
+@pytest.fixture
+def sampler():
+    previous = get_rehydration_sampler()
+    yield lambda rate: set_rehydration_sampler(RehydrationSampler(rate, random.Random(7).random))
+    set_rehydration_sampler(previous)
+
+
+def _user_fields(user: User) -> dict:
+    fields = entity_fields(user, exclude=("_credentials",))
+    return fields | {"credentials": user._credentials}
+
+
+def _profile_fields(profile: PatientProfile) -> dict:
+    return entity_fields(profile)
+
+
+def test_rehydrated_entities_match_the_constructors(sampler):
+    sampler(0.0)
+    user = create_valid_user(uuid=uuid4())
+    profile = create_valid_patient_profile(user_uuid=user.uuid)
+
+    rehydrated_user = User._rehydrate(**_user_fields(user))
+    rehydrated_profile = PatientProfile._rehydrate(**_profile_fields(profile))
+
+    assert entity_fields(rehydrated_user) == entity_fields(user)
+    assert entity_fields(rehydrated_profile) == entity_fields(profile)
+    assert rehydrated_user.is_password_valid("Secret123!") == user.is_password_valid("Secret123!")
+
+
+def test_unsampled_loads_skip_validation(sampler):
+    sampler(0.0)
+    fields = _user_fields(create_valid_user()) | {"email": "not-an-email"}
+
+    assert User._rehydrate(**fields).email == "not-an-email"
+    assert get_rehydration_sampler().validated == 0
+
+
+def test_sampled_loads_reject_corrupt_rows(sampler):
+    sampler(1.0)
+
+    with pytest.raises(InvalidEmailError):
+        User._rehydrate(**(_user_fields(create_valid_user()) | {"email": "not-an-email"}))
+    with pytest.raises(InvalidPatientProfilePreferredLanguageError):
+        PatientProfile._rehydrate(**(_profile_fields(create_valid_patient_profile()) | {"preferred_language": "12"}))
+
+
+def test_sampler_validates_the_configured_fraction():
+    rehydration_sampler = RehydrationSampler(0.1, random.Random(7).random)
+    for _ in range(10_000):
+        rehydration_sampler.should_validate()
+
+    assert rehydration_sampler.loads == 10_000
+    assert 800 < rehydration_sampler.validated < 1_200
+    assert RehydrationSampler(1.0).should_validate()
+    for rate in (-0.1, 1.5):
+        with pytest.raises(ValueError):
+            RehydrationSampler(rate)
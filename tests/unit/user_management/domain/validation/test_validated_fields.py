@@ -0,0 +1,73 @@
+"""
+Test suite for ValidatedFields and building entities from it.
+
+Tests include:
+- The token is a read-only snapshot of the values it was issued with
+- Entities built from a token skip its fields but check the others
+- Cross-field rules run even when both fields are in the token
+- Overlapping keyword fields cannot replace a verified value with an unchecked one
+"""
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from user_management.domain.entities import PatientProfile, User
+from user_management.domain.enums import UserRole, UserStatus
+from user_management.domain.exceptions import InvalidCreatedAtError, InvalidPatientProfileUpdatedAtError
+from user_management.domain.validation import ValidatedFields
+from user_management.domain.value_objects import UserCredentials
+
+NOW = datetime.now(timezone.utc) - timedelta(minutes=5)
+USER_FIELDS = dict(email="jane.doe@clinic.com", first_name="Jane", last_name="Doe", phone="+15551234567",
+                   date_of_birth=date(1990, 1, 1), user_role=UserRole.PATIENT)
+PROFILE_FIELDS = dict(user_uuid=uuid4(), emergency_contact_name="John Doe", emergency_contact_phone="+15551234567",
+                      insurance_info="Forever Healthy Insurance", preferred_language="English",
+                      medical_history_summary="Arterial hypertension")
+
+
+def test_token_is_a_read_only_snapshot():
+    values = dict(USER_FIELDS)
+    token = ValidatedFields(**values)
+    values["email"] = "changed@clinic.com"
+
+    assert token["email"] == "jane.doe@clinic.com"
+    assert token.names == frozenset(USER_FIELDS)
+    assert dict(token) == USER_FIELDS and len(token) == len(USER_FIELDS)
+    with pytest.raises(TypeError):
+        token["email"] = "changed@clinic.com"
+
+    copy = token.to_dict()
+    copy["email"] = "changed@clinic.com"
+    assert token["email"] == "jane.doe@clinic.com"
+
+
+def test_token_fields_are_skipped_but_the_others_are_checked():
+    credentials = UserCredentials.create("Str0ng!Passw0rd")
+    trusted = ValidatedFields(**USER_FIELDS | {"first_name": "not checked 1"})
+
+    user = User._create_validated(trusted, credentials, uuid=uuid4(), user_status=UserStatus.ACTIVE,
+                                  created_at=NOW, updated_at=NOW)
+    assert user.first_name == "not checked 1"
+    assert user.user_role is UserRole.PATIENT
+    assert user.is_password_valid("Str0ng!Passw0rd")
+
+    with pytest.raises(InvalidCreatedAtError):
+        User._create_validated(trusted, credentials, uuid=uuid4(), user_status=UserStatus.ACTIVE,
+                               created_at=NOW.replace(tzinfo=None), updated_at=NOW)
+
+
+def test_cross_field_rules_run_even_for_verified_fields():
+    profile = PatientProfile._create_validated(ValidatedFields(**PROFILE_FIELDS), created_at=NOW, updated_at=NOW)
+    assert profile.insurance_info == "Forever Healthy Insurance"
+
+    fields = dict(PROFILE_FIELDS, created_at=NOW, updated_at=NOW - timedelta(seconds=1))
+    with pytest.raises(InvalidPatientProfileUpdatedAtError, match="earlier than created_at"):
+        PatientProfile._create_validated(ValidatedFields(**fields))
+
+
+def test_keyword_fields_do_not_override_the_token():
+    token = ValidatedFields(**PROFILE_FIELDS)
+    profile = PatientProfile._create_validated(token, created_at=NOW, updated_at=NOW,
+                                               insurance_info="!!! unchecked !!!")
+    assert profile.insurance_info == "Forever Healthy Insurance"
@@ -0,0 +1,120 @@
+"""
+Test suite for generated straight-line validators.
+
+Tests include:
+- UserValidator and PatientProfileValidator raise the same error as checking each rule's specification in order
+- Inline checks share one clock read; other specifications are called as compiled predicates
+- Rules depending on other fields build their specification on each call
+- Rules naming unknown parameters are rejected when the validator is generated
+"""
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from user_management.domain.enums import UserRole, UserStatus
+from user_management.domain.exceptions import InvalidPatientProfileUpdatedAtError, InvalidUserError
+from user_management.domain.specifications import Specification
+from user_management.domain.specifications.compilation import InlineCheck
+from user_management.domain.validation.patient_profile import PatientProfileValidator
+from user_management.domain.validation.patient_profile.patient_profile_validator import \
+    PATIENT_PROFILE_VALIDATION_RULES
+from user_management.domain.validation.user import UserValidator
+from user_management.domain.validation.user.user_validator import USER_VALIDATION_RULES
+from user_management.domain.validation.validator_generation import FieldRule, generate_validator
+
+NOW = datetime.now(timezone.utc) - timedelta(minutes=5)
+VALID_USER = dict(uuid=uuid4(), email="jane@clinic.com", first_name="Jane", last_name="Doe", phone="+15551234567",
+                  date_of_birth=date(1990, 1, 1), role=UserRole.PATIENT, status=UserStatus.ACTIVE,
+                  created_at=NOW, updated_at=NOW)
+VALID_PROFILE = dict(user_uuid=uuid4(), emergency_contact_name="John Doe", emergency_contact_phone="+15551234567",
+                     insurance_info="Forever Healthy Insurance", preferred_language="English",
+                     medical_history_summary="Arterial hypertension", created_at=NOW, updated_at=NOW)
+INVALID_VALUES = [None, "", "  ", 42, "not valid!", "a..b@c.d", date(1800, 1, 1), date.today() + timedelta(days=1),
+                  NOW.replace(tzinfo=None), NOW + timedelta(hours=1), NOW - timedelta(days=1), "PATIENT"]
+
+
+def _reference(rules, arguments):
+    """Checks each rule's specification in order, as the validators did before generation."""
+    for rule in rules:
+        specification = rule.specification(*(arguments[name] for name in rule.arguments)) \
+            if rule.arguments else rule.specification
+        if not specification.is_satisfied_by(arguments[rule.field]):
+            return rule.error, rule.message
+    return None
+
+
+def _outcome(validate, arguments):
+    try:
+        validate(**arguments)
+    except Exception as error:
+        return type(error), str(error)
+    return None
+
+
+@pytest.mark.parametrize("validate, rules, valid", [
+    (UserValidator.validate, USER_VALIDATION_RULES, VALID_USER),
+    (PatientProfileValidator.validate, PATIENT_PROFILE_VALIDATION_RULES, VALID_PROFILE),
+])
+def test_generated_validators_match_the_rules_checked_one_by_one(validate, rules, valid):
+    assert _outcome(validate, valid) is None
+    for field in valid:
+        for value in INVALID_VALUES:
+            arguments = valid | {field: value}
+            try:
+                expected = _reference(rules, arguments)
+            except TypeError:
+                # e.g. a datetime compared with a date: the generated check must fail the same way
+                assert _outcome(validate, arguments)[0] is TypeError, (field, value)
+                continue
+            assert _outcome(validate, arguments) == expected, (field, value)
+
+
+class FreshSpecification(Specification):
+    def inline(self):
+        return InlineCheck("{value} <= {now}")
+
+    def is_satisfied_by(self, candidate) -> bool:
+        return candidate <= datetime.now(timezone.utc)
+
+
+class PositiveSpecification(Specification):
+    def is_satisfied_by(self, candidate) -> bool:
+        return candidate > 0
+
+
+class AtLeastSpecification(Specification):
+    def __init__(self, minimum):
+        self.minimum = minimum
+
+    def is_satisfied_by(self, candidate) -> bool:
+        return candidate >= self.minimum
+
+
+def test_generated_source_shares_the_clock_and_falls_back_to_predicates():
+    validate = generate_validator("validate_sample", ("first", "second", "count", "total"), [
+        FieldRule("first", FreshSpecification(), InvalidUserError, "first is in the future"),
+        FieldRule("second", FreshSpecification(), InvalidUserError, "second is in the future"),
+        FieldRule("count", PositiveSpecification(), InvalidUserError, "count must be positive"),
+        FieldRule("total", AtLeastSpecification, InvalidPatientProfileUpdatedAtError, "total below count",
+                  arguments=("count",)),
+    ])
+
+    assert validate.__source__.count("_datetime_now(") == 1
+    assert "_today" not in validate.__source__
+    assert validate(NOW, NOW, 2, 3) is None
+    with pytest.raises(InvalidUserError, match="second is in the future"):
+        validate(NOW, NOW + timedelta(hours=1), 2, 3)
+    with pytest.raises(InvalidUserError, match="count must be positive"):
+        validate(NOW, NOW, 0, 3)
+    with pytest.raises(InvalidPatientProfileUpdatedAtError, match="total below count"):
+        validate(NOW, NOW, 5, 3)
+
+
+def test_rules_with_unknown_parameters_are_rejected():
+    with pytest.raises(ValueError):
+        generate_validator("validate_sample", ("count",), [
+            FieldRule("total", PositiveSpecification(), InvalidUserError, "total must be positive")])
+    with pytest.raises(ValueError):
+        generate_validator("validate_sample", ("total",), [
+            FieldRule("total", AtLeastSpecification, InvalidUserError, "too low", arguments=("count",))])
@@ -0,0 +1,80 @@
+"""
+Test suite for DatabaseSettings.
+
+Tests include:
+- Defaults apply when no variable is set (statement echo off, pre-ping on)
+- Every variable is parsed into its field; blank values fall back to the default
+- Unparseable variables and out-of-range values are rejected, naming the setting
+- for_replica() points a copy at the replica and requires one to be configured
+"""
+import pytest
+
+from user_management.infrastructure.database.database_settings import DatabaseSettings
+
+VARIABLES = ("DATABASE_URL", "DB_ECHO", "DB_POOL_SIZE", "DB_MAX_OVERFLOW", "DB_POOL_TIMEOUT", "DB_POOL_PRE_PING",
+             "DB_POOL_RECYCLE", "DB_STATEMENT_CACHE_SIZE", "DB_STATEMENT_TIMEOUT_MS", "REPLICA_DATABASE_URL",
+             "DB_READ_YOUR_WRITES_SECONDS", "DB_STORAGE_MODE")
+
+
+@pytest.fixture(autouse=True)
+def clean_environment(monkeypatch):
+    for name in VARIABLES:
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_defaults_apply_without_variables():
+    settings = DatabaseSettings.from_env()
+    assert settings == DatabaseSettings()
+    assert settings.echo is False and settings.pool_pre_ping is True
+    assert settings.replica_url is None and settings.storage_mode == "legacy"
+
+
+def test_every_variable_is_parsed(monkeypatch):
+    for name, value in {
+        "DATABASE_URL": "postgresql+asyncpg://app@db/app", "DB_ECHO": "yes", "DB_POOL_SIZE": "20",
+        "DB_MAX_OVERFLOW": "-1", "DB_POOL_TIMEOUT": "3", "DB_POOL_PRE_PING": " Off ", "DB_POOL_RECYCLE": "-1",
+        "DB_STATEMENT_CACHE_SIZE": "0", "DB_STATEMENT_TIMEOUT_MS": "1500",
+        "REPLICA_DATABASE_URL": "postgresql+asyncpg://app@replica/app", "DB_READ_YOUR_WRITES_SECONDS": "0.5",
+        "DB_STORAGE_MODE": " Compact ",
+    }.items():
+        monkeypatch.setenv(name, value)
+
+    assert DatabaseSettings.from_env() == DatabaseSettings(
+        url="postgresql+asyncpg://app@db/app", echo=True, pool_size=20, max_overflow=-1, pool_timeout=3,
+        pool_pre_ping=False, pool_recycle=-1, statement_cache_size=0, statement_timeout_ms=1500,
+        replica_url="postgresql+asyncpg://app@replica/app", read_your_writes_seconds=0.5, storage_mode="compact")
+
+
+def test_blank_variables_fall_back_to_defaults(monkeypatch):
+    for name in ("DB_ECHO", "DB_POOL_SIZE", "DB_POOL_PRE_PING", "REPLICA_DATABASE_URL", "DB_READ_YOUR_WRITES_SECONDS"):
+        monkeypatch.setenv(name, "  ")
+    assert DatabaseSettings.from_env() == DatabaseSettings()
+
+
+@pytest.mark.parametrize("name, value, message", [
+    ("DB_POOL_SIZE", "ten", "Invalid DB_POOL_SIZE: 'ten'"),
+    ("DB_POOL_TIMEOUT", "2.5", "Invalid DB_POOL_TIMEOUT: '2.5'"),
+    ("DB_READ_YOUR_WRITES_SECONDS", "soon", "Invalid DB_READ_YOUR_WRITES_SECONDS"),
+    ("DB_ECHO", "maybe", "Invalid DB_ECHO: 'maybe'"),
+    ("DB_POOL_SIZE", "0", "Invalid pool size"),
+    ("DB_MAX_OVERFLOW", "-2", "Invalid max overflow"),
+    ("DB_POOL_TIMEOUT", "0", "Invalid pool timeout"),
+    ("DB_POOL_RECYCLE", "-5", "Invalid pool recycle"),
+    ("DB_STATEMENT_TIMEOUT_MS", "-1", "Invalid statement timeout ms"),
+    ("DB_STORAGE_MODE", "packed", "Invalid storage mode"),
+])
+def test_invalid_variables_are_rejected(monkeypatch, name, value, message):
+    monkeypatch.setenv(name, value)
+    with pytest.raises(ValueError, match=message):
+        DatabaseSettings.from_env()
+
+
+def test_for_replica_requires_a_replica_url():
+    settings = DatabaseSettings(url="postgresql+asyncpg://app@db/app", pool_size=8,
+                                replica_url="postgresql+asyncpg://app@replica/app")
+    replica = settings.for_replica()
+    assert replica.url == "postgresql+asyncpg://app@replica/app"
+    assert replica.replica_url is None and replica.pool_size == 8
+
+    with pytest.raises(ValueError, match="No read replica URL"):
+        replica.for_replica()
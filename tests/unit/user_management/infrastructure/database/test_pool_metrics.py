@@ -0,0 +1,72 @@
+"""
+Test suite for PoolMetrics and pool_statistics().
+
+Tests include:
+- Checkout waits are counted, summed and bucketed by their upper bound, with an +Inf overflow bucket
+- Timeouts are counted apart from checkouts
+- Pools without queue counters or metrics report only what they have
+"""
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from user_management.infrastructure.database.pool_metrics import PoolMetrics, pool_statistics
+
+
+def test_waits_are_counted_and_bucketed():
+    metrics = PoolMetrics(buckets_ms=(1, 10))
+    assert metrics.snapshot() == {"checkouts": 0, "timeouts": 0, "wait_time_ms": {
+        "sum": 0.0, "max": 0.0, "mean": 0.0, "histogram": {"1": 0, "10": 0, "+Inf": 0}}}
+
+    for seconds in (0.0005, 0.001, 0.004, 0.010, 0.25):
+        metrics.observe_wait(seconds)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["checkouts"] == 5
+    assert snapshot["wait_time_ms"] == {"sum": 265.5, "max": 250.0, "mean": 53.1,
+                                        "histogram": {"1": 2, "10": 2, "+Inf": 1}}
+
+
+def test_timeouts_are_counted_apart():
+    metrics = PoolMetrics()
+    metrics.record_timeout()
+    metrics.observe_wait(30.0)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["timeouts"] == 1 and snapshot["checkouts"] == 1
+    assert snapshot["wait_time_ms"]["histogram"]["+Inf"] == 1
+    assert sum(snapshot["wait_time_ms"]["histogram"].values()) == 1
+
+
+class StaticPool:
+    pass
+
+
+class QueuePool:
+    def __init__(self, metrics=None):
+        if metrics is not None:
+            self.metrics = metrics
+
+    def size(self):
+        return 5
+
+    def checkedin(self):
+        return 3
+
+    def checkedout(self):
+        return 2
+
+    def overflow(self):
+        return -3
+
+
+def test_pool_statistics_report_what_the_pool_has():
+    assert pool_statistics(StaticPool()) == {"pool_class": "StaticPool"}
+    assert pool_statistics(QueuePool()) == {"pool_class": "QueuePool", "size": 5, "checked_in": 3,
+                                            "checked_out": 2, "overflow": -3}
+
+    metrics = PoolMetrics()
+    metrics.observe_wait(0.002)
+    statistics = pool_statistics(QueuePool(metrics))
+    assert statistics["checked_out"] == 2 and statistics["checkouts"] == 1
+    assert statistics["wait_time_ms"]["histogram"]["5"] == 1